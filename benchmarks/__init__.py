@@ -0,0 +1,3 @@
+"""
+Benchmarks for the filter and export stages over synthetic inventories.
+"""
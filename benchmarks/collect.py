@@ -0,0 +1,305 @@
+"""
+End-to-end collection benchmark against a local AWS stand-in.
+
+Starts ``benchmarks.fake_aws.FakeAWSServer`` over a synthetic inventory, points
+boto3 at it through ``AWS_ENDPOINT_URL`` (with throwaway credentials and no
+shared config), and runs the full ``listup_aws_resources.main()`` pipeline
+once per scheduler setting: clients, retries, pagination, scheduling,
+filtering and every export. For each setting it reports the wall time, the
+number of API calls the server answered, the throttled responses (each one
+is a retry by the client) and the task outcome from the run's manifest.
+Responses cut short by a page size that the collector never continued are
+reported too, since those runs under-count resources.
+
+Latency, throttling and page sizes come from a network profile (see
+``benchmarks/network.json``). Outputs written by the runs are removed
+afterwards and ``task_timings.json`` is restored, so every setting starts
+from the same state.
+
+    python -m benchmarks.collect --rows 500 --region ap-northeast-2 us-east-1 \\
+        --setting "--workers 1" --setting "--workers 8" \\
+        --setting "--workers 4 --region-processes 2"
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shlex
+import shutil
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from benchmarks.fake_aws import FakeAWSServer, NetworkProfile, SyntheticInventory
+from resources import RESOURCE_SPECS
+
+# 기본 네트워크 설정 파일
+DEFAULT_NETWORK_PATH = os.path.join(os.path.dirname(__file__), "network.json")
+
+# 기본 스케줄러 설정
+DEFAULT_SETTINGS = ("--workers 1", "--workers 4", "--workers 8")
+
+# 수집 실행 동안 설정하는 환경 변수 (None이면 제거)
+AWS_ENVIRONMENT = {
+    "AWS_ACCESS_KEY_ID": "testing",
+    "AWS_SECRET_ACCESS_KEY": "testing",
+    "AWS_SESSION_TOKEN": None,
+    "AWS_PROFILE": None,
+    "AWS_DEFAULT_PROFILE": None,
+    "AWS_CONFIG_FILE": os.devnull,
+    "AWS_SHARED_CREDENTIALS_FILE": os.devnull,
+    "AWS_EC2_METADATA_DISABLED": "true",
+    # 글로벌 리소스(Route53)는 리전 없이 세션을 만들므로 설정 파일의 기본 리전을 대신합니다
+    "AWS_DEFAULT_REGION": "us-east-1",
+}
+
+
+@dataclass
+class CollectResult:
+    """
+    스케줄러 설정 하나의 측정 결과입니다.
+
+    Attributes:
+        setting: 스케줄러 설정 (main()에 추가한 인자)
+        seconds: 실행 시간 (초)
+        api_calls: 서버가 받은 API 요청 수 (재시도 포함)
+        throttled: 제한(Throttling) 응답 수 (= 클라이언트 재시도 수)
+        tasks: manifest의 작업 결과 (total, succeeded, failed, cancelled, skipped)
+        operations: 작업별 요청 수
+        truncated: 작업별로 다음 페이지를 요청하지 않아 잘린 응답 수
+    """
+
+    setting: str
+    seconds: float
+    api_calls: int
+    throttled: int
+    tasks: dict[str, int]
+    operations: dict[str, int]
+    truncated: dict[str, int]
+
+
+@contextlib.contextmanager
+def aws_environment(endpoint_url: str):
+    """boto3가 endpoint_url의 로컬 서버만 사용하도록 환경 변수를 바꿨다가 되돌립니다."""
+    values = {**AWS_ENVIRONMENT, "AWS_ENDPOINT_URL": endpoint_url}
+    saved = {name: os.environ.get(name) for name in values}
+    try:
+        for name, value in values.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def _snapshot(data_dir: str) -> set[str]:
+    return {
+        os.path.join(root, name)
+        for root, dirs, files in os.walk(data_dir)
+        for name in dirs + files
+    }
+
+
+def _remove_new_paths(data_dir: str, before: set[str]) -> None:
+    """실행 중에 새로 생긴 파일과 디렉터리를 지웁니다."""
+    # 깊은 경로부터 지워야 상위 디렉터리가 비어 있습니다
+    for path in sorted(_snapshot(data_dir) - before, key=len, reverse=True):
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path, ignore_errors=True)
+        elif os.path.exists(path):
+            os.remove(path)
+
+
+def _new_manifest(data_dir: str, before: set[str]) -> dict[str, Any]:
+    manifests = sorted(
+        path
+        for path in _snapshot(data_dir) - before
+        if os.path.basename(path).startswith("aws_resources_manifest_")
+    )
+    if not manifests:
+        return {}
+    with open(manifests[-1], encoding="utf-8") as f:
+        return json.load(f)
+
+
+def run_setting(
+    server: FakeAWSServer,
+    base_args: list[str],
+    setting: str,
+    keep_outputs: bool = False,
+) -> CollectResult:
+    """
+    스케줄러 설정 하나로 main()을 실행하고 결과를 측정합니다.
+
+    Args:
+        server: 실행 중인 FakeAWSServer
+        base_args: 모든 설정에 공통인 main() 인자 (리전, 리소스)
+        setting: 추가할 스케줄러 인자 (예: "--workers 8 --region-processes 2")
+        keep_outputs: 실행이 만든 출력 파일을 남길지 여부
+
+    Returns:
+        CollectResult: 측정 결과
+    """
+    import listup_aws_resources
+
+    data_dir = listup_aws_resources.DATA_DIR
+    timings_path = os.path.join(data_dir, listup_aws_resources.TASK_TIMINGS_NAME)
+    timings = None
+    if os.path.exists(timings_path):
+        with open(timings_path, encoding="utf-8") as f:
+            timings = f.read()
+    before = _snapshot(data_dir)
+
+    server.reset_stats()
+    output = io.StringIO()
+    started = time.perf_counter()
+    try:
+        with aws_environment(server.endpoint_url), contextlib.redirect_stdout(output):
+            listup_aws_resources.main(base_args + shlex.split(setting))
+        seconds = time.perf_counter() - started
+        manifest = _new_manifest(data_dir, before)
+    finally:
+        if not keep_outputs:
+            _remove_new_paths(data_dir, before)
+            # 학습된 작업 시간은 다음 설정의 스케줄링에 영향을 주므로 되돌립니다
+            if timings is not None:
+                with open(timings_path, "w", encoding="utf-8") as f:
+                    f.write(timings)
+
+    tasks = manifest.get("tasks", {})
+    return CollectResult(
+        setting=setting,
+        seconds=round(seconds, 3),
+        api_calls=sum(server.calls.values()),
+        throttled=sum(server.throttled.values()),
+        tasks={
+            key: tasks.get(key, 0)
+            for key in ("total", "succeeded", "failed", "cancelled", "skipped")
+        },
+        operations=dict(sorted(server.calls.items())),
+        truncated=server.unfollowed_pages(),
+    )
+
+
+def print_results(results: list[CollectResult]) -> None:
+    """측정 결과를 표로 출력합니다."""
+    print(
+        f"{'setting':<40}{'seconds':>10}{'calls':>8}{'throttled':>11}"
+        f"{'ok':>6}{'failed':>8}{'skipped':>9}"
+    )
+    for result in results:
+        failed = result.tasks["failed"] + result.tasks["cancelled"]
+        print(
+            f"{result.setting:<40}{result.seconds:>10.2f}{result.api_calls:>8}"
+            f"{result.throttled:>11}{result.tasks['succeeded']:>6}"
+            f"{failed:>8}{result.tasks['skipped']:>9}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.collect",
+        description=(
+            "지연/요청 제한을 흉내 내는 로컬 AWS 서버에 대해 전체 수집을 실행하고 "
+            "스케줄러 설정별 실행 시간, API 호출 수, 재시도 수를 측정합니다."
+        ),
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=200,
+        help="리전별 리소스마다 만들 합성 리소스 수. 기본값: 200",
+    )
+    parser.add_argument(
+        "--region",
+        dest="regions",
+        nargs="+",
+        default=["ap-northeast-2"],
+        help="수집할 리전 (여러 개 가능). 기본값: ap-northeast-2",
+    )
+    parser.add_argument(
+        "--resources",
+        nargs="+",
+        choices=[spec.key for spec in RESOURCE_SPECS],
+        help="수집할 리소스 (기본값: 모든 리소스)",
+    )
+    parser.add_argument(
+        "--network",
+        default=DEFAULT_NETWORK_PATH,
+        help="작업별 지연/제한/페이지 크기 설정 JSON. 기본값: benchmarks/network.json",
+    )
+    parser.add_argument(
+        "--setting",
+        dest="settings",
+        action="append",
+        help=(
+            "측정할 스케줄러 설정 (main() 인자, 여러 번 지정 가능). "
+            f"기본값: {', '.join(repr(s) for s in DEFAULT_SETTINGS)}"
+        ),
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="합성 데이터/지연 난수 시드"
+    )
+    parser.add_argument(
+        "--keep-outputs",
+        action="store_true",
+        help="실행이 만든 Excel/JSON/manifest 파일을 지우지 않습니다.",
+    )
+    parser.add_argument("--report", help="측정 결과를 기록할 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    base_args = ["--region", *args.regions]
+    if args.resources:
+        base_args += ["--resources", *args.resources]
+    settings = args.settings or list(DEFAULT_SETTINGS)
+    network = NetworkProfile.load(args.network)
+
+    results: list[CollectResult] = []
+    unsupported: set[str] = set()
+    truncated: set[str] = set()
+    inventory = SyntheticInventory(args.rows, args.seed)
+    with FakeAWSServer(inventory, network, seed=args.seed) as server:
+        for setting in settings:
+            print(f"⏱️  {setting}...", file=sys.stderr)
+            results.append(run_setting(server, base_args, setting, args.keep_outputs))
+            unsupported.update(server.unsupported)
+            truncated.update(results[-1].truncated)
+    print_results(results)
+    if unsupported:
+        print(f"\n⚠️  응답 데이터가 없는 작업: {', '.join(sorted(unsupported))}")
+    if truncated:
+        print(
+            "\n⚠️  다음 페이지를 요청하지 않아 리소스가 빠진 작업 "
+            f"(network.json의 page_size 확인): {', '.join(sorted(truncated))}"
+        )
+
+    if args.report:
+        report = {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "rows": args.rows,
+            "regions": args.regions,
+            "resources": args.resources,
+            "network": args.network,
+            "results": [asdict(result) for result in results],
+        }
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📄 측정 결과 기록: {args.report}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
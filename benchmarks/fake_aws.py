@@ -0,0 +1,1004 @@
+"""
+A local stand-in for the AWS APIs the collectors call.
+
+``FakeAWSServer`` is a small threaded HTTP server that answers botocore
+requests for every service in ``SERVICES`` from a synthetic inventory
+(``benchmarks.synthetic``). Point the whole run at it with
+``AWS_ENDPOINT_URL=http://127.0.0.1:<port>``.
+
+Requests are identified the way AWS does it: the SigV4 credential scope gives
+the region and signing name, ``X-Amz-Target`` the JSON operation, the
+``Action``/``Version`` form fields the query operation, and the HTTP method
+and path the REST operation. Responses are serialized from the botocore
+service model of the operation (query/EC2/REST-XML documents and JSON/
+REST-JSON bodies), so the client goes through its real parsers.
+
+Per-operation ``Behavior`` adds network realism: a log-normal latency given
+by its median and p99, a random throttle rate, a token-bucket request rate
+per (region, operation), and a page size applied through the operation's
+botocore paginator configuration. The server counts calls and throttled
+responses per operation, and pages it cut short that the client never asked
+to continue (``unfollowed_pages()``): a page size on an operation whose
+collector reads only the first page silently drops resources.
+
+CloudTrail ``LookupEvents`` answers from ``SyntheticInventory.events`` (empty
+unless a test adds ``trail_event()`` records), and the ID filters the modules
+use to re-describe single resources (``instance-id``, ``group-id``, ...) are
+applied, so incremental refreshes can be measured as well.
+"""
+
+import base64
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+from xml.etree import ElementTree
+
+import botocore.session
+
+from benchmarks.synthetic import ACCOUNT_ID, REGION, generate_raw
+
+# 수집 모듈이 사용하는 서비스 (boto3 클라이언트 이름)
+SERVICES = (
+    "autoscaling",
+    "cloudtrail",
+    "dynamodb",
+    "ec2",
+    "ecr",
+    "eks",
+    "elasticache",
+    "elb",
+    "elbv2",
+    "firehose",
+    "globalaccelerator",
+    "glue",
+    "kinesis",
+    "rds",
+    "resourcegroupstaggingapi",
+    "route53",
+    "s3",
+    "secretsmanager",
+    "ses",
+    "sts",
+)
+
+# 프로토콜별 요청 제한 오류 (HTTP 상태 코드, 오류 코드)
+THROTTLE_ERRORS = {
+    "ec2": (503, "RequestLimitExceeded"),
+    "query": (400, "Throttling"),
+    "json": (400, "ThrottlingException"),
+    "rest-json": (429, "ThrottlingException"),
+    "rest-xml": (503, "SlowDown"),
+}
+
+# botocore 페이지네이터 설정이 없지만 모듈이 페이지를 넘기는 작업
+EXTRA_PAGINATION = {
+    ("firehose", "ListDeliveryStreams"): {
+        "result_key": "DeliveryStreamNames",
+        "more_results": "HasMoreDeliveryStreams",
+        "limit_key": "Limit",
+    },
+}
+
+# ID로 다시 조회할 때 사용하는 필터 이름 -> 응답 항목의 필드 (다른 필터는 무시)
+ID_FILTERS = {
+    "instance-id": "InstanceId",
+    "vpc-id": "VpcId",
+    "subnet-id": "SubnetId",
+    "volume-id": "VolumeId",
+    "group-id": "GroupId",
+    "db-instance-id": "DBInstanceIdentifier",
+}
+
+CREDENTIAL_PATTERN = re.compile(r"Credential=[^/]+/\d+/([^/]+)/([^/]+)/aws4_request")
+
+
+@dataclass
+class Behavior:
+    """
+    작업 하나의 네트워크 동작입니다.
+
+    Attributes:
+        median_ms: 응답 지연 시간의 중앙값 (밀리초)
+        p99_ms: 응답 지연 시간의 99 백분위수 (밀리초, 중앙값과 같으면 고정 지연)
+        throttle_rate: 요청을 무작위로 제한(Throttling)할 확률
+        max_rps: (리전, 작업)별 초당 최대 요청 수 (토큰 버킷, None이면 제한 없음)
+        page_size: 한 페이지의 최대 항목 수 (None이면 요청의 limit만 적용)
+    """
+
+    median_ms: float = 20.0
+    p99_ms: float = 20.0
+    throttle_rate: float = 0.0
+    max_rps: float | None = None
+    page_size: int | None = None
+
+    def latency(self, rng: random.Random) -> float:
+        """로그 정규 분포에서 지연 시간(초)을 뽑습니다."""
+        if self.median_ms <= 0:
+            return 0.0
+        # p99 = median × e^(2.326σ)
+        sigma = math.log(max(self.p99_ms, self.median_ms) / self.median_ms) / 2.326
+        return rng.lognormvariate(math.log(self.median_ms), sigma) / 1000
+
+
+class NetworkProfile:
+    """
+    작업별 Behavior 설정입니다. {"default": {...}, "operations": {"ec2.DescribeInstances": {...}}}
+    형태의 dict에서 만들며, 작업 설정은 default 위에 덮어씁니다.
+    """
+
+    def __init__(self, config: dict[str, Any] | None = None) -> None:
+        config = config or {}
+        names = {field.name for field in fields(Behavior)}
+        unknown = {
+            key
+            for values in [
+                config.get("default", {}),
+                *config.get("operations", {}).values(),
+            ]
+            for key in values
+            if key not in names
+        }
+        if unknown:
+            raise ValueError(f"Unknown behavior settings: {', '.join(sorted(unknown))}")
+        self.default = config.get("default", {})
+        self.operations = config.get("operations", {})
+
+    @classmethod
+    def load(cls, path: str) -> "NetworkProfile":
+        """JSON 파일에서 설정을 읽습니다."""
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def behavior(self, service: str, operation: str) -> Behavior:
+        """작업의 Behavior를 반환합니다 (서비스 이름만 지정한 설정도 적용)."""
+        return Behavior(
+            **{
+                **self.default,
+                **self.operations.get(service, {}),
+                **self.operations.get(f"{service}.{operation}", {}),
+            }
+        )
+
+
+class SyntheticInventory:
+    """
+    리전별 합성 원본 데이터를 만들어 보관하고, 작업별 응답 데이터를 제공합니다.
+    같은 리전의 데이터는 한 번만 만듭니다.
+    """
+
+    def __init__(self, rows: int | dict[str, int], seed: int = 0) -> None:
+        """
+        Args:
+            rows: 리소스별 리소스 수 (int이면 모든 리소스에 적용)
+            seed: 난수 시드 (리전별로 다른 시드를 파생)
+        """
+        self.rows = rows
+        self.seed = seed
+        # 리전별 CloudTrail 관리 이벤트 (합성하지 않으며 테스트가 trail_event()로 추가)
+        self.events: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self._data: dict[tuple[str, str], Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, region: str) -> Any:
+        """리전의 리소스 원본 데이터를 반환합니다 ("cloudtrail"은 리전의 이벤트 목록)."""
+        if key == "cloudtrail":
+            return self.events[region]
+        with self._lock:
+            if (key, region) not in self._data:
+                rows = (
+                    self.rows if isinstance(self.rows, int) else self.rows.get(key, 0)
+                )
+                seed = self.seed * 1_000_003 + sum(map(ord, f"{region}/{key}"))
+                self._data[(key, region)] = generate_raw(key, rows, seed)
+            return self._data[(key, region)]
+
+
+def _by(items: list[dict], field: str, value: Any) -> dict:
+    return next((item for item in items if item.get(field) == value), {})
+
+
+def _list_param(params: dict[str, Any], name: str) -> list[Any]:
+    """query 프로토콜의 Name.member.N 목록 인자와 JSON 목록 인자를 모두 읽습니다."""
+    if isinstance(params.get(name), list):
+        return params[name]
+    prefix = f"{name}.member."
+    indexed = [
+        (int(key[len(prefix) :]), value)
+        for key, value in params.items()
+        if key.startswith(prefix) and key[len(prefix) :].isdigit()
+    ]
+    return [value for _, value in sorted(indexed)]
+
+
+def _filter_values(params: dict[str, Any]) -> dict[str, list[str]]:
+    """EC2(Filter.N.Value.M)와 RDS(Filters.Filter.N.Values.Value.M) 형식의 필터 인자를 읽습니다."""
+    names: dict[str, str] = {}
+    values: dict[str, list[tuple[int, str]]] = defaultdict(list)
+    for key, value in params.items():
+        if match := re.fullmatch(r"(?:Filters\.)?Filter\.(\d+)\.Name", key):
+            names[match.group(1)] = value
+        elif match := re.fullmatch(
+            r"(?:Filters\.)?Filter\.(\d+)\.Values?\.(?:Value\.)?(\d+)", key
+        ):
+            values[match.group(1)].append((int(match.group(2)), value))
+    return {
+        name: [v for _, v in sorted(values[index])] for index, name in names.items()
+    }
+
+
+def _filtered(items: list[dict], params: dict[str, Any]) -> list[dict]:
+    """ID_FILTERS에 있는 필터로 항목을 거릅니다."""
+    for name, values in _filter_values(params).items():
+        if name in ID_FILTERS:
+            items = [item for item in items if item.get(ID_FILTERS[name]) in values]
+    return items
+
+
+def _reservations(data: Callable[[str], Any], params: dict[str, Any]) -> dict:
+    """describe_instances 응답: instance-id 필터에 맞는 인스턴스가 있는 예약만 반환합니다."""
+    reservations = []
+    for reservation in data("ec2")["Reservations"]:
+        instances = _filtered(reservation["Instances"], params)
+        if instances:
+            reservations.append({**reservation, "Instances": instances})
+    return {"Reservations": reservations}
+
+
+def trail_event(
+    name: str,
+    source: str,
+    record: dict[str, Any] | None = None,
+    event_time: datetime | None = None,
+    resources: tuple[tuple[str, str], ...] = (),
+    read_only: bool = False,
+) -> dict[str, Any]:
+    """
+    LookupEvents 응답 형식의 CloudTrail 관리 이벤트를 만듭니다.
+
+    Args:
+        name: 이벤트 이름 (예: "RunInstances")
+        source: 이벤트 소스 (예: "ec2.amazonaws.com")
+        record: CloudTrailEvent 레코드에 넣을 필드 (requestParameters, responseElements ...)
+        event_time: 이벤트 시각 (None이면 현재 시각)
+        resources: (리소스 유형, 리소스 이름) 목록
+        read_only: 읽기 전용 이벤트 여부
+    """
+    event_time = event_time or datetime.now(timezone.utc)
+    event_id = str(uuid.uuid4())
+    cloudtrail_event = {
+        "eventVersion": "1.08",
+        "eventTime": event_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "eventSource": source,
+        "eventName": name,
+        "awsRegion": REGION,
+        "readOnly": read_only,
+        "eventID": event_id,
+        "recipientAccountId": ACCOUNT_ID,
+        **(record or {}),
+    }
+    return {
+        "EventId": event_id,
+        "EventName": name,
+        "ReadOnly": "true" if read_only else "false",
+        "EventTime": event_time,
+        "EventSource": source,
+        "Resources": [
+            {"ResourceType": resource_type, "ResourceName": resource_name}
+            for resource_type, resource_name in resources
+        ],
+        "CloudTrailEvent": json.dumps(cloudtrail_event),
+    }
+
+
+def _lookup_events(data: Callable[[str], Any], params: dict[str, Any]) -> dict:
+    """lookup_events 응답: StartTime 이후의 이벤트 중 LookupAttributes(ReadOnly ...)에 맞는 것"""
+    start = params.get("StartTime")
+    attributes = {
+        attribute["AttributeKey"]: attribute["AttributeValue"]
+        for attribute in params.get("LookupAttributes", [])
+    }
+    events = []
+    for event in data("cloudtrail"):
+        if start is not None and event["EventTime"].timestamp() < float(start):
+            continue
+        if attributes.get("ReadOnly", event["ReadOnly"]) != event["ReadOnly"]:
+            continue
+        if attributes.get("EventName", event["EventName"]) != event["EventName"]:
+            continue
+        events.append(event)
+    return {
+        "Events": sorted(events, key=lambda event: event["EventTime"], reverse=True)
+    }
+
+
+def _member_params(operation_model: Any, params: dict[str, Any]) -> dict[str, Any]:
+    """REST 요청의 쿼리 문자열 이름(예: continuation-token)을 입력 멤버 이름으로 바꿉니다."""
+    shape = operation_model.input_shape
+    if shape is None:
+        return params
+    names = {
+        member.serialization.get("name", name): name
+        for name, member in shape.members.items()
+        if member.serialization.get("location") == "querystring"
+    }
+    return {names.get(key, key): value for key, value in params.items()}
+
+
+def _tag_mappings(
+    data: Callable[[str], Any], params: dict[str, Any]
+) -> list[dict[str, Any]]:
+    """
+    get_resources 응답: 인벤토리의 EC2 인스턴스, RDS, EKS, DynamoDB, ELB, Kinesis 리소스의
+    ARN과 태그를 ResourceTypeFilters(서비스[:유형])로 걸러 반환합니다.
+    """
+    resources = [
+        (f"arn:aws:ec2:{REGION}:{ACCOUNT_ID}:instance/{i['InstanceId']}", i["Tags"])
+        for reservation in data("ec2")["Reservations"]
+        for i in reservation["Instances"]
+    ]
+    resources += [
+        (
+            f"arn:aws:rds:{REGION}:{ACCOUNT_ID}:db:{db['DBInstanceIdentifier']}",
+            db["TagList"],
+        )
+        for db in data("rds")["DBInstances"]
+    ]
+    resources += [
+        (cluster["arn"], [{"Key": k, "Value": v} for k, v in cluster["tags"].items()])
+        for cluster in data("eks")["Clusters"]
+    ]
+    named = [table["TableArn"] for table in data("dynamodb")["Tables"]]
+    named += [lb["LoadBalancerArn"] for lb in data("elb")["v2"]]
+    named += [
+        f"arn:aws:elasticloadbalancing:{REGION}:{ACCOUNT_ID}:loadbalancer/"
+        f"{lb['LoadBalancerName']}"
+        for lb in data("elb")["Classic"]
+    ]
+    named += [stream["StreamARN"] for stream in data("kinesis_streams")["Streams"]]
+    resources += [(arn, [{"Key": "Name", "Value": arn}]) for arn in named]
+
+    filters = _list_param(params, "ResourceTypeFilters")
+
+    def selected(arn: str) -> bool:
+        service, resource = arn.split(":")[2], arn.split(":", 5)[5]
+        for value in filters:
+            wanted, _, resource_type = value.partition(":")
+            if wanted == service and (
+                not resource_type or re.match(rf"{resource_type}[/:]", resource)
+            ):
+                return True
+        return not filters
+
+    return [
+        {"ResourceARN": arn, "Tags": tags} for arn, tags in resources if selected(arn)
+    ]
+
+
+# (서비스, 작업) -> (인벤토리 조회 함수, 요청 인자)를 받아 페이지 나누기 전의 응답을 만드는 함수
+Responder = Callable[[Callable[[str], Any], dict[str, Any]], dict[str, Any]]
+
+RESPONDERS: dict[tuple[str, str], Responder] = {
+    ("sts", "GetCallerIdentity"): lambda data, params: {
+        "Account": ACCOUNT_ID,
+        "Arn": f"arn:aws:iam::{ACCOUNT_ID}:user/benchmark",
+        "UserId": "AIDABENCHMARK",
+    },
+    ("ec2", "DescribeInstances"): _reservations,
+    ("ec2", "DescribeVpcs"): lambda data, params: {
+        "Vpcs": _filtered(data("vpc")["Vpcs"], params)
+    },
+    ("ec2", "DescribeSubnets"): lambda data, params: {
+        "Subnets": _filtered(data("subnets")["Subnets"], params)
+    },
+    ("ec2", "DescribeVolumes"): lambda data, params: {
+        "Volumes": _filtered(data("ebs")["Volumes"], params)
+    },
+    ("ec2", "DescribeSnapshots"): lambda data, params: data("ebs_snapshot"),
+    ("ec2", "DescribeImages"): lambda data, params: data("amis"),
+    ("ec2", "DescribeNatGateways"): lambda data, params: data("nat_gateway"),
+    ("ec2", "DescribeVpcEndpoints"): lambda data, params: data("vpc_endpoint"),
+    ("ec2", "DescribeAddresses"): lambda data, params: data("eip"),
+    ("ec2", "DescribeInternetGateways"): lambda data, params: data("internet_gateway"),
+    ("ec2", "DescribeSecurityGroups"): lambda data, params: {
+        "SecurityGroups": _filtered(data("security_groups"), params)
+    },
+    ("ec2", "DescribeSecurityGroupRules"): lambda data, params: {
+        "SecurityGroupRules": _filtered(data("security_group_rules"), params)
+    },
+    ("rds", "DescribeDBInstances"): lambda data, params: {
+        "DBInstances": _filtered(data("rds")["DBInstances"], params)
+    },
+    ("elasticache", "DescribeCacheClusters"): lambda data, params: data("elasticache"),
+    ("elb", "DescribeLoadBalancers"): lambda data, params: {
+        "LoadBalancerDescriptions": data("elb")["Classic"]
+    },
+    ("elbv2", "DescribeLoadBalancers"): lambda data, params: {
+        "LoadBalancers": data("elb")["v2"]
+    },
+    ("autoscaling", "DescribeAutoScalingGroups"): lambda data, params: {
+        "AutoScalingGroups": data("auto_scaling_groups")
+    },
+    ("ecr", "DescribeRepositories"): lambda data, params: {"repositories": data("ecr")},
+    ("secretsmanager", "ListSecrets"): lambda data, params: data("secrets_manager"),
+    ("glue", "GetJobs"): lambda data, params: data("glue_job"),
+    ("glue", "ListJobs"): lambda data, params: {
+        "JobNames": [job["Name"] for job in data("glue_job")["Jobs"]]
+    },
+    ("eks", "ListClusters"): lambda data, params: {
+        "clusters": [cluster["name"] for cluster in data("eks")["Clusters"]]
+    },
+    ("eks", "DescribeCluster"): lambda data, params: {
+        "cluster": _by(data("eks")["Clusters"], "name", params.get("name"))
+    },
+    ("dynamodb", "ListTables"): lambda data, params: {
+        "TableNames": [table["TableName"] for table in data("dynamodb")["Tables"]]
+    },
+    ("dynamodb", "DescribeTable"): lambda data, params: {
+        "Table": _by(data("dynamodb")["Tables"], "TableName", params.get("TableName"))
+    },
+    ("kinesis", "ListStreams"): lambda data, params: {
+        "StreamNames": [
+            stream["StreamName"] for stream in data("kinesis_streams")["Streams"]
+        ],
+        "HasMoreStreams": False,
+    },
+    ("kinesis", "DescribeStream"): lambda data, params: {
+        "StreamDescription": {
+            "HasMoreShards": False,
+            **_by(
+                data("kinesis_streams")["Streams"],
+                "StreamName",
+                params.get("StreamName"),
+            ),
+        }
+    },
+    ("firehose", "ListDeliveryStreams"): lambda data, params: {
+        "DeliveryStreamNames": [
+            stream["DeliveryStreamName"]
+            for stream in data("kinesis_firehose")["DeliveryStreams"]
+        ],
+        "HasMoreDeliveryStreams": False,
+    },
+    ("firehose", "DescribeDeliveryStream"): lambda data, params: {
+        "DeliveryStreamDescription": _by(
+            data("kinesis_firehose")["DeliveryStreams"],
+            "DeliveryStreamName",
+            params.get("DeliveryStreamName"),
+        )
+    },
+    ("globalaccelerator", "ListAccelerators"): lambda data, params: data(
+        "global_accelerator"
+    ),
+    ("globalaccelerator", "DescribeAccelerator"): lambda data, params: {
+        "Accelerator": _by(
+            data("global_accelerator")["Accelerators"],
+            "AcceleratorArn",
+            params.get("AcceleratorArn"),
+        )
+    },
+    ("ses", "ListIdentities"): lambda data, params: {
+        "Identities": data("ses_identity")["Identities"]
+    },
+    ("ses", "GetIdentityVerificationAttributes"): lambda data, params: {
+        "VerificationAttributes": {
+            identity: data("ses_identity")["VerificationAttributes"].get(identity, {})
+            for identity in _list_param(params, "Identities")
+        }
+    },
+    ("s3", "ListBuckets"): lambda data, params: data("s3"),
+    ("route53", "ListHostedZones"): lambda data, params: data("route53"),
+    ("cloudtrail", "LookupEvents"): _lookup_events,
+    ("resourcegroupstaggingapi", "GetResources"): lambda data, params: {
+        "ResourceTagMappingList": _tag_mappings(data, params)
+    },
+}
+
+
+def paginate(
+    response: dict[str, Any],
+    config: dict[str, Any],
+    params: dict[str, Any],
+    page_size: int | None,
+) -> dict[str, Any]:
+    """
+    botocore 페이지네이터 설정에 따라 응답의 목록을 한 페이지로 자릅니다.
+    토큰은 문자열 항목이면 마지막 항목(ExclusiveStart* 방식), 아니면 다음 위치입니다.
+
+    Args:
+        response: 페이지를 나누기 전의 응답
+        config: 페이지네이터 설정 (input_token, output_token, result_key, limit_key ...)
+        params: 요청 인자
+        page_size: 설정된 페이지 크기 (None이면 요청의 limit만 적용)
+    """
+    result_keys = config["result_key"]
+    if isinstance(result_keys, str):
+        result_keys = [result_keys]
+    result_key = next((key for key in result_keys if key in response), None)
+    if result_key is None or not isinstance(response[result_key], list):
+        return response
+    items = response[result_key]
+
+    limits = [page_size] if page_size else []
+    if config.get("limit_key") in params:
+        limits.append(int(params[config["limit_key"]]))
+    if not limits:
+        return response
+    limit = max(min(limits), 1)
+
+    start = 0
+    tokens = (
+        [config.get("input_token")]
+        if isinstance(config.get("input_token"), str)
+        else []
+    )
+    tokens += [key for key in params if key.startswith("ExclusiveStart")]
+    for key in tokens:
+        token = params.get(key)
+        if token in (None, ""):
+            continue
+        if token in items:
+            start = items.index(token) + 1
+        elif str(token).isdigit():
+            start = int(token)
+        break
+
+    page = items[start : start + limit]
+    more = start + limit < len(items)
+    result = {**response, result_key: page}
+    if config.get("output_token"):
+        result.pop(config["output_token"], None)
+        if more:
+            last = page[-1] if page and isinstance(page[-1], str) else None
+            result[config["output_token"]] = last if last else str(start + limit)
+    if config.get("more_results"):
+        result[config["more_results"]] = more
+    return result
+
+
+def _token_keys(config: dict[str, Any], key: str) -> list[str]:
+    tokens = config.get(key) or []
+    return [tokens] if isinstance(tokens, str) else list(tokens)
+
+
+def continues_page(config: dict[str, Any], params: dict[str, Any]) -> bool:
+    """요청이 이전 페이지의 토큰으로 다음 페이지를 요청했는지 확인합니다."""
+    keys = _token_keys(config, "input_token")
+    keys += [key for key in params if key.startswith("ExclusiveStart")]
+    return any(params.get(key) not in (None, "") for key in keys)
+
+
+def has_more_pages(config: dict[str, Any], response: dict[str, Any]) -> bool:
+    """응답 뒤에 가져오지 않은 페이지가 남았는지 확인합니다."""
+    if config.get("more_results") and response.get(config["more_results"]):
+        return True
+    return any(response.get(key) for key in _token_keys(config, "output_token"))
+
+
+def _timestamp_iso(value: Any) -> str:
+    if isinstance(value, datetime):
+        value = value.astimezone(timezone.utc)
+        return (
+            value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
+        )
+    return str(value)
+
+
+def _timestamp_epoch(value: Any) -> Any:
+    return value.timestamp() if isinstance(value, datetime) else value
+
+
+def _xml_scalar(shape, value: Any) -> str:
+    if shape.type_name == "timestamp":
+        return _timestamp_iso(value)
+    if shape.type_name == "boolean":
+        return "true" if value else "false"
+    if shape.type_name == "blob":
+        data = value.encode() if isinstance(value, str) else value
+        return base64.b64encode(data).decode()
+    return str(value)
+
+
+def _xml_member_name(shape, member_name: str) -> str:
+    """botocore XML 파서가 구조체 멤버를 찾는 요소 이름."""
+    if shape.type_name == "list" and shape.serialization.get("flattened"):
+        name = shape.member.serialization.get("name")
+        if name:
+            return name
+    return shape.serialization.get("name", member_name)
+
+
+def _xml_elements(shape, value: Any, name: str) -> list[ElementTree.Element]:
+    """shape에 맞춰 value를 name 요소로 만듭니다 (flattened 목록은 요소 여러 개)."""
+    if shape.type_name == "list" and shape.serialization.get("flattened"):
+        return [
+            element
+            for item in value
+            for element in _xml_elements(shape.member, item, name)
+        ]
+    element = ElementTree.Element(name)
+    if shape.type_name == "structure":
+        for member_name, member_shape in shape.members.items():
+            if member_name not in value or value[member_name] is None:
+                continue
+            if member_shape.serialization.get("location"):
+                continue
+            element.extend(
+                _xml_elements(
+                    member_shape,
+                    value[member_name],
+                    _xml_member_name(member_shape, member_name),
+                )
+            )
+    elif shape.type_name == "list":
+        item_name = shape.member.serialization.get("name", "member")
+        for item in value:
+            element.extend(_xml_elements(shape.member, item, item_name))
+    elif shape.type_name == "map":
+        key_name = shape.key.serialization.get("name", "key")
+        value_name = shape.value.serialization.get("name", "value")
+        for key, item in value.items():
+            entry = ElementTree.SubElement(element, "entry")
+            entry.extend(_xml_elements(shape.key, key, key_name))
+            entry.extend(_xml_elements(shape.value, item, value_name))
+    else:
+        element.text = _xml_scalar(shape, value)
+    return [element]
+
+
+def _json_value(shape, value: Any) -> Any:
+    if shape is None or value is None:
+        return value
+    if shape.type_name == "structure":
+        return {
+            shape.members[name].serialization.get("name", name): _json_value(
+                shape.members[name], item
+            )
+            for name, item in value.items()
+            if name in shape.members
+            and item is not None
+            and not shape.members[name].serialization.get("location")
+        }
+    if shape.type_name == "list":
+        return [_json_value(shape.member, item) for item in value]
+    if shape.type_name == "map":
+        return {key: _json_value(shape.value, item) for key, item in value.items()}
+    if shape.type_name == "timestamp":
+        return _timestamp_epoch(value)
+    if shape.type_name == "blob":
+        data = value.encode() if isinstance(value, str) else value
+        return base64.b64encode(data).decode()
+    return value
+
+
+def serialize_response(
+    operation, data: dict[str, Any], request_id: str
+) -> tuple[str, bytes]:
+    """
+    작업의 출력 shape에 맞춰 응답 본문을 만듭니다.
+
+    Returns:
+        tuple: (Content-Type, 본문)
+    """
+    protocol = operation.metadata["protocol"]
+    shape = operation.output_shape
+    if protocol in ("json", "rest-json"):
+        body = _json_value(shape, data) if shape is not None else {}
+        content_type = (
+            f"application/x-amz-json-{operation.metadata.get('jsonVersion', '1.0')}"
+            if protocol == "json"
+            else "application/json"
+        )
+        return content_type, json.dumps(body).encode()
+
+    root = ElementTree.Element(f"{operation.name}Response")
+    if shape is not None:
+        (content,) = _xml_elements(
+            shape, data, shape.serialization.get("resultWrapper", shape.name)
+        )
+        if protocol == "query":
+            root.append(content)
+        else:
+            root = content
+    if protocol == "query":
+        metadata = ElementTree.SubElement(root, "ResponseMetadata")
+        ElementTree.SubElement(metadata, "RequestId").text = request_id
+    elif protocol == "ec2":
+        ElementTree.SubElement(root, "requestId").text = request_id
+    return "text/xml", ElementTree.tostring(root)
+
+
+def serialize_error(
+    protocol: str, code: str, message: str, request_id: str
+) -> tuple[str, bytes, dict[str, str]]:
+    """
+    프로토콜 형식의 오류 응답을 만듭니다.
+
+    Returns:
+        tuple: (Content-Type, 본문, 추가 헤더)
+    """
+    if protocol in ("json", "rest-json"):
+        body = json.dumps({"__type": code, "message": message}).encode()
+        return "application/x-amz-json-1.1", body, {"x-amzn-ErrorType": code}
+    if protocol == "ec2":
+        root = ElementTree.Element("Response")
+        error = ElementTree.SubElement(ElementTree.SubElement(root, "Errors"), "Error")
+        ElementTree.SubElement(root, "RequestID").text = request_id
+    elif protocol == "query":
+        root = ElementTree.Element("ErrorResponse")
+        error = ElementTree.SubElement(root, "Error")
+        ElementTree.SubElement(error, "Type").text = "Sender"
+        ElementTree.SubElement(root, "RequestId").text = request_id
+    else:
+        root = error = ElementTree.Element("Error")
+        ElementTree.SubElement(root, "RequestId").text = request_id
+    ElementTree.SubElement(error, "Code").text = code
+    ElementTree.SubElement(error, "Message").text = message
+    return "text/xml", ElementTree.tostring(root), {}
+
+
+class ServiceIndex:
+    """요청에서 서비스 모델과 작업 모델을 찾습니다."""
+
+    def __init__(self, services: tuple[str, ...] = SERVICES) -> None:
+        session = botocore.session.get_session()
+        loader = session.get_component("data_loader")
+        self.models = {name: session.get_service_model(name) for name in services}
+        self.by_target: dict[str, str] = {}
+        self.by_signing: dict[tuple[str, str | None], str] = {}
+        self.pagination: dict[tuple[str, str], dict[str, Any]] = dict(EXTRA_PAGINATION)
+        for name, model in self.models.items():
+            metadata = model.metadata
+            signing = metadata.get("signingName") or metadata["endpointPrefix"]
+            if metadata["protocol"] == "json":
+                self.by_target[metadata["targetPrefix"]] = name
+            elif metadata["protocol"] in ("query", "ec2"):
+                self.by_signing[(signing, metadata["apiVersion"])] = name
+            else:
+                self.by_signing[(signing, None)] = name
+            try:
+                paginators = loader.load_service_model(name, "paginators-1")
+            except Exception:
+                continue
+            for operation, config in paginators.get("pagination", {}).items():
+                self.pagination.setdefault((name, operation), config)
+
+    def resolve_rest(self, service: str, method: str, path: str) -> str | None:
+        """REST 프로토콜 요청의 HTTP 메서드와 경로로 작업 이름을 찾습니다."""
+        model = self.models[service]
+        best, best_score = None, -1
+        for name in model.operation_names:
+            http = model.operation_model(name).http
+            if http.get("method") != method:
+                continue
+            template = http.get("requestUri", "/").split("?")[0]
+            pattern = re.sub(r"\\{[^}]+\\}", "[^/]+", re.escape(template))
+            if not re.fullmatch(pattern, path.rstrip("/") or "/"):
+                continue
+            score = len(re.sub(r"\{[^}]+\}", "", template))
+            if score > best_score:
+                best, best_score = name, score
+        return best
+
+
+class FakeAWSServer:
+    """
+    합성 인벤토리로 AWS API에 응답하는 로컬 HTTP 서버입니다.
+
+    Attributes:
+        calls: (서비스.작업) -> 요청 수
+        throttled: (서비스.작업) -> 제한(Throttling) 응답 수
+        unsupported: (서비스.작업) -> 응답 데이터가 없는 작업의 요청 수
+    """
+
+    def __init__(
+        self,
+        inventory: SyntheticInventory,
+        profile: NetworkProfile | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int = 0,
+    ) -> None:
+        """
+        Args:
+            inventory: 응답할 합성 인벤토리
+            profile: 작업별 지연/제한/페이지 크기 설정
+            host: 서버 주소
+            port: 서버 포트 (0이면 임의 포트)
+            seed: 지연/제한 난수 시드
+        """
+        self.inventory = inventory
+        self.profile = profile or NetworkProfile()
+        self.index = ServiceIndex()
+        self.calls: Counter[str] = Counter()
+        self.throttled: Counter[str] = Counter()
+        self.unsupported: Counter[str] = Counter()
+        # 다음 페이지가 남은 응답 수와 다음 페이지 요청 수 (unfollowed_pages)
+        self.truncated: Counter[str] = Counter()
+        self.continued: Counter[str] = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        # (리전, 서비스.작업) -> [남은 토큰, 마지막 갱신 시각]
+        self._buckets: dict[tuple[str, str], list[float]] = {}
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def endpoint_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeAWSServer":
+        """백그라운드 스레드에서 서버를 시작합니다."""
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, name="fake-aws", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """서버를 종료합니다."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def reset_stats(self) -> None:
+        """요청 통계와 토큰 버킷을 초기화합니다."""
+        with self._lock:
+            self.calls.clear()
+            self.throttled.clear()
+            self.unsupported.clear()
+            self.truncated.clear()
+            self.continued.clear()
+            self._buckets.clear()
+
+    def unfollowed_pages(self) -> dict[str, int]:
+        """
+        작업별로 다음 페이지가 남았지만 이어서 요청되지 않은 응답 수를 반환합니다.
+        0이 아니면 그 작업을 호출한 모듈이 첫 페이지만 읽어 리소스가 빠진 것입니다.
+        """
+        with self._lock:
+            return {
+                key: count - self.continued[key]
+                for key, count in sorted(self.truncated.items())
+                if count > self.continued[key]
+            }
+
+    def __enter__(self) -> "FakeAWSServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _admit(self, region: str, key: str, behavior: Behavior) -> tuple[float, bool]:
+        """요청의 지연 시간과 제한 여부를 정하고 통계에 기록합니다."""
+        with self._lock:
+            self.calls[key] += 1
+            delay = behavior.latency(self._rng)
+            throttled = self._rng.random() < behavior.throttle_rate
+            if behavior.max_rps and not throttled:
+                now = time.monotonic()
+                bucket = self._buckets.setdefault(
+                    (region, key), [behavior.max_rps, now]
+                )
+                bucket[0] = min(
+                    behavior.max_rps, bucket[0] + (now - bucket[1]) * behavior.max_rps
+                )
+                bucket[1] = now
+                if bucket[0] >= 1:
+                    bucket[0] -= 1
+                else:
+                    throttled = True
+            if throttled:
+                self.throttled[key] += 1
+        return delay, throttled
+
+    def handle(
+        self, method: str, raw_path: str, headers: Any, body: bytes
+    ) -> tuple[int, str, bytes, dict[str, str]]:
+        """
+        요청 하나에 응답합니다.
+
+        Returns:
+            tuple: (HTTP 상태 코드, Content-Type, 본문, 추가 헤더)
+        """
+        request_id = str(uuid.uuid4())
+        match = CREDENTIAL_PATTERN.search(headers.get("Authorization", ""))
+        region, signing = match.groups() if match else ("us-east-1", "")
+        url = urlsplit(raw_path)
+        params: dict[str, Any] = dict(parse_qsl(url.query))
+
+        service = operation_name = None
+        target = headers.get("X-Amz-Target")
+        if target:
+            prefix, _, operation_name = target.rpartition(".")
+            service = self.index.by_target.get(prefix)
+            params.update(json.loads(body or b"{}"))
+        elif (signing, None) in self.index.by_signing:
+            service = self.index.by_signing[(signing, None)]
+            operation_name = self.index.resolve_rest(service, method, url.path)
+            path_params = url.path.strip("/").split("/")
+            params.setdefault("name", path_params[-1])
+        else:
+            params.update(parse_qsl(body.decode()))
+            service = self.index.by_signing.get((signing, params.get("Version")))
+            operation_name = params.get("Action")
+        if service is None or operation_name is None:
+            return 400, "text/plain", b"Unknown service or operation", {}
+
+        model = self.index.models[service]
+        protocol = model.metadata["protocol"]
+        if protocol in ("rest-json", "rest-xml"):
+            params = _member_params(model.operation_model(operation_name), params)
+        key = f"{service}.{operation_name}"
+        behavior = self.profile.behavior(service, operation_name)
+        delay, throttled = self._admit(region, key, behavior)
+        time.sleep(delay)
+
+        if throttled:
+            status, code = THROTTLE_ERRORS[protocol]
+            content_type, payload, extra = serialize_error(
+                protocol, code, "Rate exceeded", request_id
+            )
+            return status, content_type, payload, extra
+
+        responder = RESPONDERS.get((service, operation_name))
+        if responder is None:
+            with self._lock:
+                self.unsupported[key] += 1
+            content_type, payload, extra = serialize_error(
+                protocol, "InvalidAction", f"{key} is not simulated", request_id
+            )
+            return 400, content_type, payload, extra
+
+        response = responder(
+            lambda resource: self.inventory.get(resource, region), params
+        )
+        config = self.index.pagination.get((service, operation_name))
+        if config:
+            response = paginate(response, config, params, behavior.page_size)
+            with self._lock:
+                self.continued[key] += continues_page(config, params)
+                self.truncated[key] += has_more_pages(config, response)
+        content_type, payload = serialize_response(
+            model.operation_model(operation_name), response, request_id
+        )
+        return 200, content_type, payload, {}
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _respond(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                status, content_type, payload, extra = server.handle(
+                    self.command, self.path, self.headers, body
+                )
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.send_header("x-amzn-RequestId", str(uuid.uuid4()))
+                for name, value in extra.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
@@ -0,0 +1,355 @@
+"""
+Per-stage benchmarks over synthetic inventories.
+
+For every selected resource and row count, a synthetic raw response is
+generated (``benchmarks.synthetic``) and pushed through the same stages a run
+goes through in ``main()``:
+
+- ``filter``: ``get_filtered_data()`` plus the module's ``COLUMN_SCHEMA``
+- ``arrow``: conversion into the ``ResultStore`` Arrow table
+- ``excel``: ``ExcelExporter.write_region()`` and saving the workbook
+- ``filtered_json``: ``ResultStore.write_json()``
+- ``raw_json``: the raw JSON dump
+
+Each stage is timed without tracing, then run again under ``tracemalloc`` for
+its peak Python heap. Arrow buffers live outside the Python heap, so the
+Arrow memory a stage leaves allocated is reported separately. Results are
+printed, optionally written to a JSON report, and can be checked against a
+threshold file; any stage slower or larger than its threshold makes the
+command exit with status 1.
+
+    python -m benchmarks.run --rows 10000 100000 --resources ec2 security_groups
+    python -m benchmarks.run --check benchmarks/thresholds.json
+    python -m benchmarks.run --write-thresholds benchmarks/thresholds.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+import pyarrow as pa
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import REGION, generate_raw
+from listup_aws_resources import DateTimeEncoder
+from resources import RESOURCE_SPECS, RESOURCE_SPECS_BY_KEY, ResourceSpec
+from utils.dtypes import apply_column_schema
+from utils.excel_export import ExcelExporter
+from utils.result_store import GLOBAL_SCOPE, ResultStore, dataframe_to_table
+
+STAGES = ("filter", "arrow", "excel", "filtered_json", "raw_json")
+
+# 기준값 파일을 만들 때 측정값에 곱하는 여유 배수 (실행 환경마다 편차가 큼)
+DEFAULT_HEADROOM = 3.0
+
+# 측정 편차가 큰 짧은 단계에 적용하는 최소 기준값
+MIN_THRESHOLD_SECONDS = 0.05
+MIN_THRESHOLD_MB = 1.0
+
+DEFAULT_THRESHOLDS_PATH = os.path.join(os.path.dirname(__file__), "thresholds.json")
+
+
+@dataclass
+class StageResult:
+    """
+    단계 하나의 측정 결과입니다.
+
+    Attributes:
+        resource: 리소스 이름
+        stage: 단계 이름 (STAGES)
+        rows: 리소스(행) 수
+        seconds: 소요 시간 (초, tracemalloc 없이 측정)
+        peak_mb: tracemalloc로 측정한 최대 메모리 사용량 (MiB, 측정하지 않으면 None)
+        arrow_mb: 단계가 끝난 뒤 늘어난 Arrow 메모리 할당량 (MiB)
+    """
+
+    resource: str
+    stage: str
+    rows: int
+    seconds: float
+    peak_mb: float | None
+    arrow_mb: float = 0.0
+
+    @property
+    def key(self) -> str:
+        return f"{self.resource}/{self.stage}/{self.rows}"
+
+
+def measure(
+    func: Callable[[], Any], memory: bool = True
+) -> tuple[Any, float, float | None]:
+    """
+    func의 소요 시간을 측정하고, memory이면 tracemalloc으로 한 번 더 실행해 최대 메모리를 측정합니다.
+
+    Returns:
+        tuple: (func의 반환값, 소요 시간(초), 최대 메모리(MiB) 또는 None)
+    """
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    if not memory:
+        return result, seconds, None
+    del result
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, seconds, peak / 2**20
+
+
+def benchmark_resource(
+    spec: ResourceSpec,
+    rows: int,
+    stages: tuple[str, ...] = STAGES,
+    memory: bool = True,
+    work_dir: str | None = None,
+) -> list[StageResult]:
+    """
+    리소스 하나의 합성 데이터를 만들어 단계별로 측정합니다.
+    앞 단계의 결과가 필요한 단계는 측정 대상이 아니어도 앞 단계를 실행합니다.
+
+    Args:
+        spec: 측정할 리소스 정의
+        rows: 리소스(행) 수
+        stages: 측정할 단계 목록
+        memory: 최대 메모리도 측정할지 여부
+        work_dir: Excel/JSON 파일을 기록할 디렉터리 (None이면 임시 디렉터리)
+    """
+    module = spec.module
+    scope = GLOBAL_SCOPE if spec.is_global else REGION
+    raw = generate_raw(spec.key, rows)
+    results = []
+
+    def run(stage: str, func: Callable[[], Any]) -> Any:
+        if stage not in stages:
+            return func()
+        arrow_before = pa.total_allocated_bytes()
+        value, seconds, peak_mb = measure(func, memory)
+        arrow_mb = max(pa.total_allocated_bytes() - arrow_before, 0) / 2**20
+        results.append(StageResult(spec.key, stage, rows, seconds, peak_mb, arrow_mb))
+        return value
+
+    df = run(
+        "filter",
+        lambda: apply_column_schema(
+            module.get_filtered_data(raw), module.COLUMN_SCHEMA
+        ),
+    )
+    table = run("arrow", lambda: dataframe_to_table(df))
+    store = ResultStore()
+    if scope != GLOBAL_SCOPE:
+        store.add_region(scope)
+    store.put(scope, spec.result_key, table)
+
+    with tempfile.TemporaryDirectory(dir=work_dir) as tmp_dir:
+
+        def write_excel() -> None:
+            exporter = ExcelExporter(
+                os.path.join(tmp_dir, "benchmark.xlsx"),
+                {spec.result_key: spec.sheet_prefix},
+            )
+            exporter.write_region(store, scope)
+            exporter.close()
+
+        def write_filtered_json() -> None:
+            with open(
+                os.path.join(tmp_dir, "filtered.json"), "w", encoding="utf-8"
+            ) as f:
+                store.write_json(f, cls=DateTimeEncoder)
+
+        def write_raw_json() -> None:
+            with open(os.path.join(tmp_dir, "raw.json"), "w", encoding="utf-8") as f:
+                json.dump(raw, f, ensure_ascii=False, indent=2, cls=DateTimeEncoder)
+
+        for stage, func in (
+            ("excel", write_excel),
+            ("filtered_json", write_filtered_json),
+            ("raw_json", write_raw_json),
+        ):
+            if stage in stages:
+                run(stage, func)
+    return results
+
+
+def check_thresholds(
+    results: list[StageResult], thresholds: dict[str, dict[str, float]]
+) -> list[str]:
+    """
+    측정 결과를 기준값과 비교합니다. 기준값이 없는 항목은 비교하지 않습니다.
+
+    Args:
+        results: 측정 결과 목록
+        thresholds: {"리소스/단계/행 수": {"seconds": 초, "peak_mb": MiB}}
+
+    Returns:
+        list: 기준값을 넘은 항목의 설명 목록 (비어 있으면 통과)
+    """
+    regressions = []
+    for result in results:
+        limit = thresholds.get(result.key)
+        if not limit:
+            continue
+        if "seconds" in limit and result.seconds > limit["seconds"]:
+            regressions.append(
+                f"{result.key}: {result.seconds:.3f}s > {limit['seconds']}s"
+            )
+        if (
+            "peak_mb" in limit
+            and result.peak_mb is not None
+            and result.peak_mb > limit["peak_mb"]
+        ):
+            regressions.append(
+                f"{result.key}: {result.peak_mb:.1f}MiB > {limit['peak_mb']}MiB"
+            )
+    return regressions
+
+
+def thresholds_from(
+    results: list[StageResult], headroom: float = DEFAULT_HEADROOM
+) -> dict[str, dict[str, float]]:
+    """측정 결과에 여유 배수를 곱해 기준값을 만듭니다 (짧은 단계는 최소 기준값 적용)."""
+    thresholds = {}
+    for result in results:
+        limit = {
+            "seconds": round(max(result.seconds * headroom, MIN_THRESHOLD_SECONDS), 3)
+        }
+        if result.peak_mb is not None:
+            limit["peak_mb"] = round(
+                max(result.peak_mb * headroom, MIN_THRESHOLD_MB), 1
+            )
+        thresholds[result.key] = limit
+    return thresholds
+
+
+def load_thresholds(path: str) -> dict[str, dict[str, float]]:
+    """기준값 파일을 읽습니다 (없으면 빈 dict)."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def print_results(results: list[StageResult]) -> None:
+    """측정 결과를 표로 출력합니다."""
+    print(
+        f"{'resource':<22}{'stage':<15}{'rows':>10}{'seconds':>11}"
+        f"{'peak MiB':>11}{'arrow MiB':>11}"
+    )
+    for result in results:
+        peak = "-" if result.peak_mb is None else f"{result.peak_mb:.1f}"
+        print(
+            f"{result.resource:<22}{result.stage:<15}{result.rows:>10}"
+            f"{result.seconds:>11.3f}{peak:>11}{result.arrow_mb:>11.1f}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="합성 인벤토리로 필터링/내보내기 단계별 소요 시간과 최대 메모리를 측정합니다.",
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[10_000],
+        help="리소스별 합성 리소스(행) 수 (여러 개 가능). 기본값: 10000",
+    )
+    parser.add_argument(
+        "--resources",
+        nargs="+",
+        choices=[spec.key for spec in RESOURCE_SPECS],
+        help="측정할 리소스 (기본값: 모든 리소스)",
+    )
+    parser.add_argument(
+        "--stages",
+        nargs="+",
+        choices=STAGES,
+        default=list(STAGES),
+        help="측정할 단계 (기본값: 모든 단계)",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="tracemalloc 최대 메모리 측정을 생략합니다 (단계를 한 번만 실행).",
+    )
+    parser.add_argument("--report", help="측정 결과를 기록할 JSON 파일 경로")
+    parser.add_argument(
+        "--check",
+        nargs="?",
+        const=DEFAULT_THRESHOLDS_PATH,
+        metavar="THRESHOLDS",
+        help=(
+            "기준값 파일과 비교해 초과하는 항목이 있으면 종료 코드 1을 반환합니다. "
+            "기본값: benchmarks/thresholds.json"
+        ),
+    )
+    parser.add_argument(
+        "--write-thresholds",
+        metavar="THRESHOLDS",
+        help="측정값 × --headroom 을 기준값 파일에 기록(기존 항목과 병합)합니다.",
+    )
+    parser.add_argument(
+        "--headroom",
+        type=float,
+        default=DEFAULT_HEADROOM,
+        help=f"--write-thresholds 의 여유 배수. 기본값: {DEFAULT_HEADROOM}",
+    )
+    args = parser.parse_args(argv)
+
+    specs = [
+        RESOURCE_SPECS_BY_KEY[key]
+        for key in args.resources or [spec.key for spec in RESOURCE_SPECS]
+    ]
+    stages = tuple(args.stages)
+    results: list[StageResult] = []
+    for rows in args.rows:
+        for spec in specs:
+            print(f"⏱️  {spec.key} ({rows}행)...", file=sys.stderr)
+            results += benchmark_resource(spec, rows, stages, memory=not args.no_memory)
+    print_results(results)
+
+    if args.report:
+        report = {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": [asdict(result) for result in results],
+        }
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📄 측정 결과 기록: {args.report}")
+
+    if args.write_thresholds:
+        thresholds = load_thresholds(args.write_thresholds)
+        thresholds.update(thresholds_from(results, args.headroom))
+        with open(args.write_thresholds, "w", encoding="utf-8") as f:
+            json.dump(thresholds, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\n📏 기준값 기록: {args.write_thresholds}")
+
+    if args.check:
+        regressions = check_thresholds(results, load_thresholds(args.check))
+        if regressions:
+            print(f"\n❌ 기준값 초과 {len(regressions)}개:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print(f"\n✅ 기준값 이내 ({args.check})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
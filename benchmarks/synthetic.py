@@ -0,0 +1,805 @@
+"""
+Synthetic raw API responses for benchmarking.
+
+``generate_raw(key, rows)`` returns data shaped like the module's
+``get_raw_data()`` result (the same top-level keys, nesting and Python types
+as botocore returns, including ``datetime`` timestamps) with ``rows``
+resources, so ``get_filtered_data()`` and the exporters can be measured at
+10k, 100k or 1M rows without an AWS account.
+
+Resources carry the fields the modules read plus the usual extra fields of
+the real response (block devices, network interfaces, rule descriptions,
+several tags), so raw JSON sizes and ``--raw projected`` savings are
+representative. Output is deterministic for a given seed.
+"""
+
+import random
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+ACCOUNT_ID = "123456789012"
+REGION = "ap-northeast-2"
+AZS = [f"{REGION}{zone}" for zone in "abcd"]
+BASE_TIME = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+ENVIRONMENTS = ["prod", "staging", "dev", "qa"]
+TEAMS = ["platform", "data", "payments", "search", "identity", "growth"]
+INSTANCE_TYPES = ["t3.micro", "t3.large", "m6i.xlarge", "c6g.2xlarge", "r6i.4xlarge"]
+
+
+def _hex(rng: random.Random, digits: int = 17) -> str:
+    return f"{rng.getrandbits(digits * 4):0{digits}x}"
+
+
+def _time(rng: random.Random) -> datetime:
+    """최근 3년 안의 임의 시각 (UTC)."""
+    return BASE_TIME - timedelta(seconds=rng.randrange(3 * 365 * 86400))
+
+
+def _ip(rng: random.Random, prefix: str = "10") -> str:
+    return f"{prefix}.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(1, 255)}"
+
+
+def _tags(rng: random.Random, name: str) -> list[dict[str, str]]:
+    tags = [
+        {"Key": "Name", "Value": name},
+        {"Key": "env", "Value": rng.choice(ENVIRONMENTS)},
+        {"Key": "team", "Value": rng.choice(TEAMS)},
+        {"Key": "cost-center", "Value": f"cc-{rng.randrange(1000):04d}"},
+    ]
+    if rng.random() < 0.3:
+        tags.append({"Key": "kubernetes.io/cluster/main", "Value": "owned"})
+    return tags
+
+
+def _arn(service: str, resource: str) -> str:
+    return f"arn:aws:{service}:{REGION}:{ACCOUNT_ID}:{resource}"
+
+
+def _instance(rng: random.Random, index: int) -> dict[str, Any]:
+    instance_id = f"i-{_hex(rng)}"
+    subnet_id = f"subnet-{_hex(rng)}"
+    vpc_id = f"vpc-{rng.randrange(16):017x}"
+    private_ip = _ip(rng)
+    groups = [
+        {"GroupId": f"sg-{_hex(rng)}", "GroupName": f"{rng.choice(TEAMS)}-{i}"}
+        for i in range(rng.randint(1, 3))
+    ]
+    instance = {
+        "InstanceId": instance_id,
+        "InstanceType": rng.choice(INSTANCE_TYPES),
+        "ImageId": f"ami-{_hex(rng)}",
+        "State": {"Code": 16, "Name": rng.choice(["running"] * 4 + ["stopped"])},
+        "VpcId": vpc_id,
+        "SubnetId": subnet_id,
+        "PrivateIpAddress": private_ip,
+        "PrivateDnsName": f"ip-{private_ip.replace('.', '-')}.ec2.internal",
+        "SecurityGroups": groups,
+        "LaunchTime": _time(rng),
+        "Tags": _tags(rng, f"app-{index}"),
+        "Placement": {"AvailabilityZone": rng.choice(AZS), "Tenancy": "default"},
+        "Monitoring": {"State": "disabled"},
+        "Architecture": "x86_64",
+        "RootDeviceName": "/dev/xvda",
+        "BlockDeviceMappings": [
+            {
+                "DeviceName": f"/dev/xvd{letter}",
+                "Ebs": {
+                    "VolumeId": f"vol-{_hex(rng)}",
+                    "Status": "attached",
+                    "AttachTime": _time(rng),
+                    "DeleteOnTermination": True,
+                },
+            }
+            for letter in "ab"[: rng.randint(1, 2)]
+        ],
+        "NetworkInterfaces": [
+            {
+                "NetworkInterfaceId": f"eni-{_hex(rng)}",
+                "SubnetId": subnet_id,
+                "VpcId": vpc_id,
+                "PrivateIpAddress": private_ip,
+                "Groups": groups,
+                "Status": "in-use",
+            }
+        ],
+        "MetadataOptions": {"HttpTokens": "required", "HttpEndpoint": "enabled"},
+    }
+    if rng.random() < 0.3:
+        instance["PublicIpAddress"] = _ip(rng, "52")
+    return instance
+
+
+def ec2(rng: random.Random, rows: int) -> dict[str, Any]:
+    reservations = []
+    index = 0
+    while index < rows:
+        count = min(rng.randint(1, 4), rows - index)
+        reservations.append(
+            {
+                "ReservationId": f"r-{_hex(rng)}",
+                "OwnerId": ACCOUNT_ID,
+                "Groups": [],
+                "Instances": [_instance(rng, index + i) for i in range(count)],
+            }
+        )
+        index += count
+    return {"Reservations": reservations}
+
+
+def vpc(rng: random.Random, rows: int) -> dict[str, Any]:
+    return {
+        "Vpcs": [
+            {
+                "VpcId": f"vpc-{_hex(rng)}",
+                "State": "available",
+                "CidrBlock": f"10.{i % 256}.0.0/16",
+                "DhcpOptionsId": f"dopt-{_hex(rng)}",
+                "InstanceTenancy": "default",
+                "IsDefault": i == 0,
+                "OwnerId": ACCOUNT_ID,
+                "CidrBlockAssociationSet": [
+                    {
+                        "AssociationId": f"vpc-cidr-assoc-{_hex(rng)}",
+                        "CidrBlock": f"10.{i % 256}.0.0/16",
+                        "CidrBlockState": {"State": "associated"},
+                    }
+                ],
+                "Tags": _tags(rng, f"vpc-{i}"),
+            }
+            for i in range(rows)
+        ]
+    }
+
+
+def subnets(rng: random.Random, rows: int) -> dict[str, Any]:
+    return {
+        "Subnets": [
+            {
+                "SubnetId": f"subnet-{_hex(rng)}",
+                "SubnetArn": _arn("ec2", f"subnet/subnet-{i}"),
+                "VpcId": f"vpc-{rng.randrange(16):017x}",
+                "CidrBlock": f"10.{i // 256 % 256}.{i % 256}.0/24",
+                "AvailabilityZone": rng.choice(AZS),
+                "State": "available",
+                "AvailableIpAddressCount": rng.randrange(251),
+                "DefaultForAz": False,
+                "MapPublicIpOnLaunch": rng.random() < 0.2,
+                "OwnerId": ACCOUNT_ID,
+                "Tags": _tags(rng, f"subnet-{i}"),
+            }
+            for i in range(rows)
+        ]
+    }
+
+
+def rds(rng: random.Random, rows: int) -> dict[str, Any]:
+    return {
+        "DBInstances": [
+            {
+                "DBInstanceIdentifier": f"db-{i}",
+                "DBInstanceClass": rng.choice(["db.t3.medium", "db.r6g.large"]),
+                "Engine": rng.choice(["mysql", "postgres", "aurora-mysql"]),
+                "EngineVersion": "8.0.35",
+                "DBInstanceStatus": "available",
+                "Endpoint": {
+                    "Address": f"db-{i}.abcdefghij.{REGION}.rds.amazonaws.com",
+                    "Port": 3306,
+                    "HostedZoneId": "Z2ZNZBJ6IS4P8V",
+                },
+                "AllocatedStorage": rng.choice([20, 100, 500]),
+                "InstanceCreateTime": _time(rng),
+                "MultiAZ": rng.random() < 0.5,
+                "VpcSecurityGroups": [
+                    {"VpcSecurityGroupId": f"sg-{_hex(rng)}", "Status": "active"}
+                ],
+                "TagList": _tags(rng, f"db-{i}"),
+            }
+            for i in range(rows)
+        ]
+    }
+
+
+def eks(rng: random.Random, rows: int) -> dict[str, Any]:
+    return {
+        "Clusters": [
+            {
+                "name": f"cluster-{i}",
+                "arn": _arn("eks", f"cluster/cluster-{i}"),
+                "status": "ACTIVE",
+                "endpoint": f"https://{_hex(rng, 32)}.gr7.{REGION}.eks.amazonaws.com",
+                "version": rng.choice(["1.29", "1.30", "1.31"]),
+                "createdAt": _time(rng),
+                "roleArn": f"arn:aws:iam::{ACCOUNT_ID}:role/eks-cluster",
+                "resourcesVpcConfig": {
+                    "subnetIds": [f"subnet-{_hex(rng)}" for _ in range(3)],
+                    "endpointPublicAccess": True,
+                },
+                "tags": {tag["Key"]: tag["Value"] for tag in _tags(rng, f"eks-{i}")},
+            }
+            for i in range(rows)
+        ]
+    }
+
+
+def dynamodb(rng: random.Random, rows: int) -> dict[str, Any]:
+    return {
+        "Tables": [
+            {
+                "TableName": f"table-{i}",
+                "TableArn": _arn("dynamodb", f"table/table-{i}"),
+                "TableStatus": "ACTIVE",
+                "CreationDateTime": _time(rng),
+                "ItemCount": rng.randrange(10_000_000),
+                "TableSizeBytes": rng.randrange(10**11),
+                "ProvisionedThroughput": {
+                    "ReadCapacityUnits": rng.choice([0, 5, 100]),
+                    "WriteCapacityUnits": rng.choice([0, 5, 100]),
+                    "NumberOfDecreasesToday": 0,
+                },
+                "KeySchema": [{"AttributeName": "pk", "KeyType": "HASH"}],
+                "AttributeDefinitions": [{"AttributeName": "pk", "AttributeType": "S"}],
+            }
+            for i in range(rows)
+        ]
+    }
+
+
+def elb(rng: random.Random, rows: int) -> dict[str, Any]:
+    classic = rows // 4
+    return {
+        "Classic": [
+            {
+                "LoadBalancerName": f"classic-{i}",
+                "DNSName": f"classic-{i}-{rng.randrange(10**9)}.{REGION}.elb.amazonaws.com",
+                "Scheme": rng.choice(["internet-facing", "internal"]),
+                "VPCId": f"vpc-{rng.randrange(16):017x}",
+                "CreatedTime": _time(rng),
+                "ListenerDescriptions": [
+                    {"Listener": {"Protocol": "HTTP", "LoadBalancerPort": 80}}
+                ],
+                "Instances": [{"InstanceId": f"i-{_hex(rng)}"} for _ in range(2)],
+            }
+            for i in range(classic)
+        ],
+        "v2": [
+            {
+                "LoadBalancerName": f"alb-{i}",
+                "LoadBalancerArn": _arn(
+                    "elasticloadbalancing", f"loadbalancer/app/alb-{i}/{_hex(rng, 16)}"
+                ),
+                "Type": rng.choice(["application", "network"]),
+                "DNSName": f"alb-{i}-{rng.randrange(10**9)}.{REGION}.elb.amazonaws.com",
+                "Scheme": rng.choice(["internet-facing", "internal"]),
+                "VpcId": f"vpc-{rng.randrange(16):017x}",
+                "CreatedTime": _time(rng),
+                "State": {"Code": "active"},
+                "AvailabilityZones": [
+                    {"ZoneName": zone, "SubnetId": f"subnet-{_hex(rng)}"}
+                    for zone in AZS[:2]
+                ],
+                "SecurityGroups": [f"sg-{_hex(rng)}"],
+            }
+            for i in range(rows - classic)
+        ],
+    }
+
+
+def elasticache(rng: random.Random, rows: int) -> dict[str, Any]:
+    return {
+        "CacheClusters": [
+            {
+                "CacheClusterId": f"cache-{i}",
+                "Engine": rng.choice(["redis", "memcached"]),
+                "CacheNodeType": rng.choice(["cache.t3.micro", "cache.r6g.large"]),
+                "EngineVersion": "7.1",
+                "CacheClusterStatus": "available",
+                "NumCacheNodes": rng.randint(1, 3),
+                "PreferredAvailabilityZone": rng.choice(AZS),
+                "CacheClusterCreateTime": _time(rng),
+                "CacheNodes": [
+                    {
+                        "CacheNodeId": "0001",
+                        "CacheNodeStatus": "available",
+                        "Endpoint": {"Address": f"cache-{i}.cache.amazonaws.com"},
+                    }
+                ],
+            }
+            for i in range(rows)
+        ]
+    }
+
+
+def ebs(rng: random.Random, rows: int) -> dict[str, Any]:
+    return {
+        "Volumes": [
+            {
+                "VolumeId": f"vol-{_hex(rng)}",
+                "Size": rng.choice([8, 20, 100, 500]),
+                "VolumeType": rng.choice(["gp3", "gp2", "io2"]),
+                "State": rng.choice(["in-use"] * 3 + ["available"]),
+                "AvailabilityZone": rng.choice(AZS),
+                "CreateTime": _time(rng),
+                "Encrypted": True,
+                "Iops": 3000,
+                "Attachments": [
+                    {
+                        "InstanceId": f"i-{_hex(rng)}",
+                        "Device": "/dev/xvda",
+                        "State": "attached",
+                        "AttachTime": _time(rng),
+                    }
+                ],
+                "Tags": _tags(rng, f"vol-{i}"),
+            }
+            for i in range(rows)
+        ]
+    }
+
+
+def ebs_snapshot(rng: random.Random, rows: int) -> dict[str, Any]:
+    return {
+        "Snapshots": [
+            {
+                "SnapshotId": f"snap-{_hex(rng)}",
+                "VolumeId": f"vol-{_hex(rng)}",
+                "StartTime": _time(rng),
+                "State": "completed",
+                "Progress": "100%",
+                "VolumeSize": rng.choice([8, 20, 100]),
+                "Description": f"Created by CreateImage(i-{_hex(rng)}) for ami-{_hex(rng)}",
+                "OwnerId": ACCOUNT_ID,
+                "Encrypted": True,
+                "StorageTier": "standard",
+                "Tags": _tags(rng, f"snap-{i}"),
+            }
+            for i in range(rows)
+        ]
+    }
+
+
+def amis(rng: random.Random, rows: int) -> dict[str, Any]:
+    return {
+        "Images": [
+            {
+                "ImageId": f"ami-{_hex(rng)}",
+                "Name": f"app-{i}-{_time(rng):%Y%m%d}",
+                # describe_images의 CreationDate는 ISO 문자열
+                "CreationDate": f"{_time(rng):%Y-%m-%dT%H:%M:%S}.000Z",
+                "State": "available",
+                "Public": False,
+                "Architecture": "x86_64",
+                "OwnerId": ACCOUNT_ID,
+                "BlockDeviceMappings": [
+                    {
+                        "DeviceName": "/dev/xvda",
+                        "Ebs": {"SnapshotId": f"snap-{_hex(rng)}", "VolumeSize": 8},
+                    }
+                ],
+                "Tags": _tags(rng, f"ami-{i}"),
+            }
+            for i in range(rows)
+        ]
+    }
+
+
+def nat_gateway(rng: random.Random, rows: int) -> dict[str, Any]:
+    return {
+        "NatGateways": [
+            {
+                "NatGatewayId": f"nat-{_hex(rng)}",
+                "State": "available",
+                "VpcId": f"vpc-{rng.randrange(16):017x}",
+                "SubnetId": f"subnet-{_hex(rng)}",
+                "CreateTime": _time(rng),
+                "ConnectivityType": "public",
+                "NatGatewayAddresses": [
+                    {
+                        "AllocationId": f"eipalloc-{_hex(rng)}",
+                        "PublicIp": _ip(rng, "52"),
+                        "PrivateIp": _ip(rng),
+                    }
+                ],
+                "Tags": _tags(rng, f"nat-{i}"),
+            }
+            for i in range(rows)
+        ]
+    }
+
+
+def vpc_endpoint(rng: random.Random, rows: int) -> dict[str, Any]:
+    return {
+        "VpcEndpoints": [
+            {
+                "VpcEndpointId": f"vpce-{_hex(rng)}",
+                "VpcEndpointType": "Gateway",
+                "VpcId": f"vpc-{rng.randrange(16):017x}",
+                "ServiceName": f"com.amazonaws.{REGION}.{rng.choice(['s3', 'dynamodb'])}",
+                "State": "available",
+                "CreationTimestamp": _time(rng),
+                "RouteTableIds": [f"rtb-{_hex(rng)}" for _ in range(rng.randint(1, 3))],
+                "PolicyDocument": (
+                    '{"Version":"2008-10-17","Statement":[{"Effect":"Allow",'
+                    '"Principal":"*","Action":"*","Resource":"*"}]}'
+                ),
+                "Tags": _tags(rng, f"vpce-{i}"),
+            }
+            for i in range(rows)
+        ]
+    }
+
+
+def kinesis_streams(rng: random.Random, rows: int) -> dict[str, Any]:
+    return {
+        "Streams": [
+            {
+                "StreamName": f"stream-{i}",
+                "StreamARN": _arn("kinesis", f"stream/stream-{i}"),
+                "StreamStatus": "ACTIVE",
+                "RetentionPeriodHours": rng.choice([24, 168]),
+                "OpenShardCount": rng.randint(1, 16),
+                "StreamCreationTimestamp": _time(rng),
+                "Shards": [
+                    {
+                        "ShardId": f"shardId-{shard:012d}",
+                        "HashKeyRange": {"StartingHashKey": "0", "EndingHashKey": "1"},
+                    }
+                    for shard in range(2)
+                ],
+            }
+            for i in range(rows)
+        ]
+    }
+
+
+def glue_job(rng: random.Random, rows: int) -> dict[str, Any]:
+    return {
+        "Jobs": [
+            {
+                "Name": f"job-{i}",
+                "CreatedOn": _time(rng),
+                "LastModifiedOn": _time(rng),
+                "Role": f"arn:aws:iam::{ACCOUNT_ID}:role/glue-{rng.choice(TEAMS)}",
+                "Command": {
+                    "Name": rng.choice(["glueetl", "pythonshell"]),
+                    "ScriptLocation": f"s3://scripts/job-{i}.py",
+                    "PythonVersion": "3",
+                },
+                "DefaultArguments": {"--job-language": "python"},
+                "MaxRetries": 0,
+                "GlueVersion": "4.0",
+            }
+            for i in range(rows)
+        ]
+    }
+
+
+def kinesis_firehose(rng: random.Random, rows: int) -> dict[str, Any]:
+    return {
+        "DeliveryStreams": [
+            {
+                "DeliveryStreamName": f"firehose-{i}",
+                "DeliveryStreamARN": _arn("firehose", f"deliverystream/firehose-{i}"),
+                "DeliveryStreamStatus": "ACTIVE",
+                "DeliveryStreamType": rng.choice(
+                    ["DirectPut", "KinesisStreamAsSource"]
+                ),
+                "VersionId": str(rng.randint(1, 9)),
+                "CreateTimestamp": _time(rng),
+                "Destinations": [
+                    {
+                        "DestinationId": "destinationId-000000000001",
+                        "S3DestinationDescription": {
+                            "BucketARN": f"arn:aws:s3:::logs-{i}",
+                            "BufferingHints": {
+                                "SizeInMBs": 5,
+                                "IntervalInSeconds": 300,
+                            },
+                        },
+                    }
+                ],
+            }
+            for i in range(rows)
+        ]
+    }
+
+
+def secrets_manager(rng: random.Random, rows: int) -> dict[str, Any]:
+    return {
+        "SecretList": [
+            {
+                "ARN": _arn("secretsmanager", f"secret:app/secret-{i}-{_hex(rng, 6)}"),
+                "Name": f"app/secret-{i}",
+                "Description": f"Credentials for {rng.choice(TEAMS)} service {i}",
+                "LastChangedDate": _time(rng),
+                "LastAccessedDate": _time(rng),
+                "SecretVersionsToStages": {_hex(rng, 32): ["AWSCURRENT"]},
+                "Tags": _tags(rng, f"secret-{i}"),
+            }
+            for i in range(rows)
+        ]
+    }
+
+
+def eip(rng: random.Random, rows: int) -> dict[str, Any]:
+    addresses = []
+    for i in range(rows):
+        address = {
+            "PublicIp": _ip(rng, "52"),
+            "AllocationId": f"eipalloc-{_hex(rng)}",
+            "Domain": "vpc",
+            "PublicIpv4Pool": "amazon",
+            "NetworkBorderGroup": REGION,
+            "Tags": _tags(rng, f"eip-{i}"),
+        }
+        if rng.random() < 0.8:
+            address.update(
+                AssociationId=f"eipassoc-{_hex(rng)}",
+                InstanceId=f"i-{_hex(rng)}",
+                NetworkInterfaceId=f"eni-{_hex(rng)}",
+                PrivateIpAddress=_ip(rng),
+            )
+        addresses.append(address)
+    return {"Addresses": addresses}
+
+
+def internet_gateway(rng: random.Random, rows: int) -> dict[str, Any]:
+    return {
+        "InternetGateways": [
+            {
+                "InternetGatewayId": f"igw-{_hex(rng)}",
+                "OwnerId": ACCOUNT_ID,
+                "Attachments": [
+                    {"State": "available", "VpcId": f"vpc-{rng.randrange(16):017x}"}
+                ],
+                "Tags": _tags(rng, f"igw-{i}"),
+            }
+            for i in range(rows)
+        ]
+    }
+
+
+def _permission(rng: random.Random) -> dict[str, Any]:
+    port = rng.choice([22, 80, 443, 3306, 5432, 6379, 8080])
+    permission = {
+        "IpProtocol": rng.choice(["tcp"] * 4 + ["udp", "-1"]),
+        "FromPort": port,
+        "ToPort": port,
+        "IpRanges": [
+            {"CidrIp": f"10.{rng.randrange(256)}.0.0/16", "Description": "internal"}
+            for _ in range(rng.randint(0, 3))
+        ],
+        "Ipv6Ranges": [],
+        "PrefixListIds": [],
+        "UserIdGroupPairs": [
+            {"GroupId": f"sg-{_hex(rng)}", "UserId": ACCOUNT_ID, "Description": "peer"}
+            for _ in range(rng.randint(0, 2))
+        ],
+    }
+    if rng.random() < 0.1:
+        permission["IpRanges"].append({"CidrIp": "0.0.0.0/0"})
+    if rng.random() < 0.05:
+        permission["Ipv6Ranges"].append({"CidrIpv6": "::/0"})
+    if rng.random() < 0.1:
+        permission["PrefixListIds"].append({"PrefixListId": f"pl-{_hex(rng, 8)}"})
+    return permission
+
+
+def security_groups(rng: random.Random, rows: int) -> list[dict[str, Any]]:
+    groups = []
+    for i in range(rows):
+        inbound = [_permission(rng) for _ in range(rng.randint(1, 8))]
+        groups.append(
+            {
+                "GroupId": f"sg-{_hex(rng)}",
+                "GroupName": f"{rng.choice(TEAMS)}-sg-{i}",
+                "VpcId": f"vpc-{rng.randrange(16):017x}",
+                "Description": f"Security group {i}",
+                "OwnerId": ACCOUNT_ID,
+                "IpPermissions": inbound,
+                "IpPermissionsEgress": [
+                    {"IpProtocol": "-1", "IpRanges": [{"CidrIp": "0.0.0.0/0"}]}
+                ],
+                # get_raw_data()가 조회 후 추가하는 필드
+                "HasAnyOpenInbound": any(
+                    ip_range.get("CidrIp") == "0.0.0.0/0"
+                    for rule in inbound
+                    for ip_range in rule["IpRanges"]
+                )
+                or any(rule["Ipv6Ranges"] for rule in inbound),
+                "Tags": _tags(rng, f"sg-{i}"),
+            }
+        )
+    return groups
+
+
+def security_group_rules(rng: random.Random, rows: int) -> list[dict[str, Any]]:
+    rules = []
+    for _ in range(rows):
+        port = rng.choice([22, 80, 443, 3306, 8080])
+        rule = {
+            "SecurityGroupRuleId": f"sgr-{_hex(rng)}",
+            "GroupId": f"sg-{rng.randrange(rows // 5 + 1):017x}",
+            "GroupOwnerId": ACCOUNT_ID,
+            "IsEgress": rng.random() < 0.3,
+            "IpProtocol": rng.choice(["tcp", "udp", "-1"]),
+            "FromPort": port,
+            "ToPort": port,
+            "Description": rng.choice(["", "internal", "peer access"]),
+            "Tags": [],
+        }
+        kind = rng.random()
+        if kind < 0.6:
+            rule["CidrIpv4"] = f"10.{rng.randrange(256)}.0.0/16"
+        elif kind < 0.7:
+            rule["CidrIpv6"] = "::/0"
+        elif kind < 0.8:
+            rule["PrefixListId"] = f"pl-{_hex(rng, 8)}"
+        else:
+            rule["ReferencedGroupInfo"] = {
+                "GroupId": f"sg-{_hex(rng)}",
+                "UserId": ACCOUNT_ID,
+            }
+        rules.append(rule)
+    return rules
+
+
+def ecr(rng: random.Random, rows: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "repositoryName": f"team/repo-{i}",
+            "repositoryArn": _arn("ecr", f"repository/team/repo-{i}"),
+            "repositoryUri": f"{ACCOUNT_ID}.dkr.ecr.{REGION}.amazonaws.com/team/repo-{i}",
+            "registryId": ACCOUNT_ID,
+            "createdAt": _time(rng),
+            "imageTagMutability": rng.choice(["MUTABLE", "IMMUTABLE"]),
+            "imageScanningConfiguration": {"scanOnPush": rng.random() < 0.5},
+            "encryptionConfiguration": {"encryptionType": "AES256"},
+        }
+        for i in range(rows)
+    ]
+
+
+def auto_scaling_groups(rng: random.Random, rows: int) -> list[dict[str, Any]]:
+    groups = []
+    for i in range(rows):
+        size = rng.randint(1, 10)
+        groups.append(
+            {
+                "AutoScalingGroupName": f"asg-{i}",
+                "AutoScalingGroupARN": _arn("autoscaling", f"autoScalingGroup:asg-{i}"),
+                "LaunchConfigurationName": f"lc-{i}",
+                "MinSize": 1,
+                "MaxSize": size * 2,
+                "DesiredCapacity": size,
+                "AvailabilityZones": AZS[: rng.randint(1, 3)],
+                "HealthCheckType": rng.choice(["EC2", "ELB"]),
+                "CreatedTime": _time(rng),
+                "Instances": [
+                    {
+                        "InstanceId": f"i-{_hex(rng)}",
+                        "LifecycleState": "InService",
+                        "HealthStatus": "Healthy",
+                    }
+                    for _ in range(min(size, 3))
+                ],
+                "Tags": [
+                    {**tag, "ResourceId": f"asg-{i}", "PropagateAtLaunch": True}
+                    for tag in _tags(rng, f"asg-{i}")
+                ],
+            }
+        )
+    return groups
+
+
+def ses_identity(rng: random.Random, rows: int) -> dict[str, Any]:
+    identities = [
+        f"user{i}@example.com" if i % 3 else f"mail{i}.example.com" for i in range(rows)
+    ]
+    return {
+        "Identities": identities,
+        "VerificationAttributes": {
+            identity: {"VerificationStatus": rng.choice(["Success", "Pending"])}
+            for identity in identities
+        },
+        "Tags": {identity: _tags(rng, identity)[1:3] for identity in identities},
+    }
+
+
+def s3(rng: random.Random, rows: int) -> dict[str, Any]:
+    return {
+        "Buckets": [
+            {"Name": f"bucket-{i}-{_hex(rng, 8)}", "CreationDate": _time(rng)}
+            for i in range(rows)
+        ],
+        "Owner": {"ID": _hex(rng, 64)},
+    }
+
+
+def global_accelerator(rng: random.Random, rows: int) -> dict[str, Any]:
+    return {
+        "Accelerators": [
+            {
+                "AcceleratorArn": f"arn:aws:globalaccelerator::{ACCOUNT_ID}:accelerator/{_hex(rng, 32)}",
+                "Name": f"accelerator-{i}",
+                "Status": "DEPLOYED",
+                "IpAddressType": "IPV4",
+                "Enabled": True,
+                "CreatedTime": _time(rng),
+                "LastModifiedTime": _time(rng),
+                "DnsName": f"{_hex(rng, 16)}.awsglobalaccelerator.com",
+                "IpSets": [
+                    {
+                        "IpFamily": "IPv4",
+                        "IpAddresses": [_ip(rng, "75"), _ip(rng, "99")],
+                    }
+                ],
+            }
+            for i in range(rows)
+        ]
+    }
+
+
+def route53(rng: random.Random, rows: int) -> dict[str, Any]:
+    return {
+        "HostedZones": [
+            {
+                "Id": f"/hostedzone/Z{_hex(rng, 13).upper()}",
+                "Name": f"zone{i}.example.com.",
+                "CallerReference": _hex(rng, 32),
+                "Config": {"Comment": "", "PrivateZone": rng.random() < 0.3},
+                "ResourceRecordSetCount": rng.randint(2, 500),
+            }
+            for i in range(rows)
+        ],
+        "IsTruncated": False,
+        "MaxItems": "100",
+    }
+
+
+# 리소스 이름 -> (rng, 리소스 수)를 받아 get_raw_data() 형태의 데이터를 만드는 함수
+GENERATORS: dict[str, Callable[[random.Random, int], Any]] = {
+    "ec2": ec2,
+    "vpc": vpc,
+    "rds": rds,
+    "eks": eks,
+    "subnets": subnets,
+    "dynamodb": dynamodb,
+    "elb": elb,
+    "elasticache": elasticache,
+    "ebs": ebs,
+    "ebs_snapshot": ebs_snapshot,
+    "amis": amis,
+    "nat_gateway": nat_gateway,
+    "vpc_endpoint": vpc_endpoint,
+    "kinesis_streams": kinesis_streams,
+    "glue_job": glue_job,
+    "kinesis_firehose": kinesis_firehose,
+    "secrets_manager": secrets_manager,
+    "eip": eip,
+    "internet_gateway": internet_gateway,
+    "security_groups": security_groups,
+    "ecr": ecr,
+    "security_group_rules": security_group_rules,
+    "auto_scaling_groups": auto_scaling_groups,
+    "ses_identity": ses_identity,
+    "s3": s3,
+    "global_accelerator": global_accelerator,
+    "route53": route53,
+}
+
+
+def generate_raw(key: str, rows: int, seed: int = 0) -> Any:
+    """
+    리소스의 get_raw_data() 형태로 rows개 리소스의 합성 원본 데이터를 만듭니다.
+
+    Args:
+        key: 리소스 이름 (예: "ec2")
+        rows: 만들 리소스 수 (필터링 결과의 행 수)
+        seed: 난수 시드 (같은 시드는 같은 데이터를 만듦)
+
+    Raises:
+        KeyError: 생성기가 없는 리소스인 경우
+    """
+    return GENERATORS[key](random.Random(seed), rows)
@@ -1,69 +1,77 @@
 import argparse
+import functools
 import json
 import os
+import sqlite3
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import Future
 from datetime import date, datetime, timezone
 
 import boto3
 import pandas as pd
-
-from resources.amis import get_filtered_data as amis_filtered
-from resources.amis import get_raw_data as amis_raw
-from resources.auto_scaling_groups import (
-    get_filtered_data as auto_scaling_groups_filtered,
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from resources import (
+    GLOBAL_RESOURCE_SPECS,
+    REGIONAL_RESOURCE_SPECS,
+    RESOURCE_SPECS,
+    RESOURCE_SPECS_BY_KEY,
+    ResourceSpec,
+)
+from utils.cassettes import CassetteLibrary
+from utils.checkpoint import (
+    DEFAULT_KEEP_RUNS,
+    RunCheckpoint,
+    latest_run_id,
+    prune_runs,
+)
+from utils.columns import select_columns
+from utils.counting import count_resource, print_counts, write_counts
+from utils.dtypes import apply_column_schema
+from utils.excel_export import EXCEL_LAYOUTS, EXCEL_MAX_ROWS, ExcelExporter
+from utils.filter_pool import FilterPool
+from utils.history_store import HistoryStore
+from utils.incremental import LATEST_RUN, IncrementalCollector, find_changes
+from utils.inventory_db import InventoryDatabase
+from utils.inventory_server import (
+    DEFAULT_REFRESH_INTERVAL,
+    Inventory,
+    InventoryRefresher,
+    create_server,
+)
+from utils.planner import build_plan, print_plan
+from utils.raw_projection import RAW_MODES, retain_raw
+from utils.region_shards import RegionShardScheduler, TaskRunner
+from utils.result_store import GLOBAL_SCOPE, ResultStore, dataframe_to_table
+from utils.run_manifest import (
+    TaskFailure,
+    failure_from_exception,
+    failure_rows,
+    write_manifest,
 )
-from resources.auto_scaling_groups import get_raw_data as auto_scaling_groups_raw
-from resources.dynamodb import get_filtered_data as dynamodb_filtered
-from resources.dynamodb import get_raw_data as dynamodb_raw
-from resources.ebs import get_filtered_data as ebs_filtered
-from resources.ebs import get_raw_data as ebs_raw
-from resources.ebs_snapshot import get_filtered_data as ebs_snapshot_filtered
-from resources.ebs_snapshot import get_raw_data as ebs_snapshot_raw
-from resources.ec2 import get_filtered_data as ec2_filtered
-from resources.ec2 import get_raw_data as ec2_raw
-from resources.ecr import get_filtered_data as ecr_filtered
-from resources.ecr import get_raw_data as ecr_raw
-from resources.eip import get_filtered_data as eip_filtered
-from resources.eip import get_raw_data as eip_raw
-from resources.eks import get_filtered_data as eks_filtered
-from resources.eks import get_raw_data as eks_raw
-from resources.elasticache import get_filtered_data as elasticache_filtered
-from resources.elasticache import get_raw_data as elasticache_raw
-from resources.elb import get_filtered_data as elb_filtered
-from resources.elb import get_raw_data as elb_raw
-from resources.global_accelerator import get_filtered_data as ga_filtered
-from resources.global_accelerator import get_raw_data as ga_raw
-from resources.glue_job import get_filtered_data as glue_job_filtered
-from resources.glue_job import get_raw_data as glue_job_raw
-from resources.internet_gateway import get_filtered_data as internet_gateway_filtered
-from resources.internet_gateway import get_raw_data as internet_gateway_raw
-from resources.kinesis_firehose import get_filtered_data as kinesis_firehose_filtered
-from resources.kinesis_firehose import get_raw_data as kinesis_firehose_raw
-from resources.kinesis_streams import get_filtered_data as kinesis_streams_filtered
-from resources.kinesis_streams import get_raw_data as kinesis_streams_raw
-from resources.nat_gateway import get_filtered_data as nat_gateway_filtered
-from resources.nat_gateway import get_raw_data as nat_gateway_raw
-from resources.rds import get_filtered_data as rds_filtered
-from resources.rds import get_raw_data as rds_raw
-from resources.route53_hostedzone import get_filtered_data as route53_filtered
-from resources.route53_hostedzone import get_raw_data as route53_raw
-from resources.s3_buckets import get_filtered_data as s3_filtered
-from resources.s3_buckets import get_raw_data as s3_raw
-from resources.secrets_manager import get_filtered_data as secrets_filtered
-from resources.secrets_manager import get_raw_data as secrets_raw
-from resources.security_group_rules import (
-    get_filtered_data as security_group_rules_filtered,
+from utils.scheduler import (
+    CollectionTask,
+    DeadlineScheduler,
+    TaskTimings,
+    parse_duration,
+)
+from utils.stage_profiler import (
+    PROFILE_MODES,
+    StageProfiler,
+    print_report,
+    profile_stage,
+)
+from utils.tagging import TagEnricher, raw_columns_without_tags
+from utils.work_queue import (
+    DEFAULT_LEASE_SECONDS,
+    DEFAULT_PROFILE,
+    QueueWorker,
+    open_queue,
+    profile_checkpoint,
 )
-from resources.security_group_rules import get_raw_data as security_group_rules_raw
-from resources.security_groups import get_filtered_data as security_groups_filtered
-from resources.security_groups import get_raw_data as security_groups_raw
-from resources.ses_identity import get_filtered_data as ses_identity_filtered
-from resources.ses_identity import get_raw_data as ses_identity_raw
-from resources.subnets import get_filtered_data as subnets_filtered
-from resources.subnets import get_raw_data as subnets_raw
-from resources.vpc import get_filtered_data as vpc_filtered
-from resources.vpc import get_raw_data as vpc_raw
-from resources.vpc_endpoint import get_filtered_data as vpc_endpoint_filtered
-from resources.vpc_endpoint import get_raw_data as vpc_endpoint_raw
 
 
 class DateTimeEncoder(json.JSONEncoder):
@@ -73,12 +81,12 @@ class DateTimeEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
-def print_security_groups_analysis(all_filtered_data: dict):
+def print_security_groups_analysis(store: ResultStore):
     """
     Security Groups 전용 조회 시 상세한 보안 분석을 출력합니다.
 
     Args:
-        all_filtered_data: 필터링된 데이터 딕셔너리
+        store: 필터링된 데이터가 저장된 ResultStore
     """
     print("\n🔍 Security Groups 보안 분석 결과:")
     print("=" * 50)
@@ -87,38 +95,36 @@ def print_security_groups_analysis(all_filtered_data: dict):
     total_any_open = 0
     any_open_details = []
 
-    # 각 리전별 Security Groups 분석
-    for region, region_data in all_filtered_data.items():
-        if region in ["S3", "GlobalAccelerator", "Route53"]:  # 글로벌 리소스 제외
-            continue
-
-        if "SecurityGroups" in region_data:
-            sg_data = region_data["SecurityGroups"]
-            region_total = len(sg_data)
-            region_any_open = len(
-                [sg for sg in sg_data if sg.get("AnyOpenInbound") == "⚠️ YES"]
-            )
-
-            total_security_groups += region_total
-            total_any_open += region_any_open
-
-            if region_total > 0:
-                print(f"📍 {region}: {region_total}개 Security Groups", end="")
-                if region_any_open > 0:
-                    print(f" (⚠️ {region_any_open}개 AnyOpen)")
-                    # AnyOpen Security Groups 상세 정보 수집
-                    for sg in sg_data:
-                        if sg.get("AnyOpenInbound") == "⚠️ YES":
-                            any_open_details.append(
-                                {
-                                    "region": region,
-                                    "id": sg.get("SecurityGroupId", ""),
-                                    "name": sg.get("SecurityGroupName", ""),
-                                    "vpc": sg.get("VpcId", ""),
-                                }
-                            )
-                else:
-                    print(" (✅ 모두 안전)")
+    # 각 리전별 Security Groups 분석 (글로벌 리소스 제외)
+    for region in store.regions():
+        region_total = store.count(region, "SecurityGroups")
+        any_open = store.filter_equal(
+            region, "SecurityGroups", "AnyOpenInbound", "⚠️ YES"
+        )
+        region_any_open = any_open.num_rows if any_open is not None else 0
+
+        total_security_groups += region_total
+        total_any_open += region_any_open
+
+        if region_total > 0:
+            print(f"📍 {region}: {region_total}개 Security Groups", end="")
+            if region_any_open > 0:
+                print(f" (⚠️ {region_any_open}개 AnyOpen)")
+                # AnyOpen Security Groups 상세 정보 수집
+                details = any_open.select(
+                    ["SecurityGroupId", "SecurityGroupName", "VpcId"]
+                ).to_pylist()
+                for sg in details:
+                    any_open_details.append(
+                        {
+                            "region": region,
+                            "id": sg.get("SecurityGroupId") or "",
+                            "name": sg.get("SecurityGroupName") or "",
+                            "vpc": sg.get("VpcId") or "",
+                        }
+                    )
+            else:
+                print(" (✅ 모두 안전)")
 
     # 전체 요약
     print("\n📊 전체 요약:")
@@ -149,43 +155,1068 @@ def print_security_groups_analysis(all_filtered_data: dict):
 
 def get_available_resources():
     """사용 가능한 AWS 리소스 목록을 반환합니다."""
-    return {
-        "ec2": "EC2 인스턴스",
-        "vpc": "VPC (Virtual Private Cloud)",
-        "rds": "RDS 데이터베이스",
-        "eks": "EKS 클러스터",
-        "subnets": "서브넷",
-        "dynamodb": "DynamoDB 테이블",
-        "elb": "ELB 로드밸런서",
-        "elasticache": "ElastiCache",
-        "ebs": "EBS 볼륨",
-        "ebs_snapshot": "EBS 스냅샷",
-        "amis": "AMI 이미지",
-        "nat_gateway": "NAT 게이트웨이",
-        "vpc_endpoint": "VPC 엔드포인트",
-        "kinesis_streams": "Kinesis Data Streams",
-        "glue_job": "Glue 작업",
-        "kinesis_firehose": "Kinesis Data Firehose",
-        "secrets_manager": "Secrets Manager",
-        "eip": "Elastic IP",
-        "internet_gateway": "인터넷 게이트웨이",
-        "security_groups": "보안 그룹",
-        "ecr": "ECR 레지스트리",
-        "security_group_rules": "보안 그룹 규칙",
-        "auto_scaling_groups": "Auto Scaling 그룹",
-        "ses_identity": "SES Identity",
-        "s3": "S3 버킷 (글로벌)",
-        "global_accelerator": "Global Accelerator (글로벌)",
-        "route53": "Route53 호스팅 영역 (글로벌)",
+    return {spec.key: spec.description for spec in RESOURCE_SPECS}
+
+
+def create_session(region: str | None, profile: str | None = None):
+    """
+    리전의 boto3 세션을 만듭니다 (워커 프로세스에 전달할 수 있는 함수).
+    profile이 주어지면 해당 AWS 프로필의 자격 증명을 사용합니다.
+    """
+    return boto3.Session(region_name=region, profile_name=profile or None)
+
+
+def get_account_id(session) -> str | None:
+    """
+    STS get_caller_identity()로 현재 자격 증명의 AWS 계정 ID를 조회합니다.
+    조회에 실패하면 None을 반환합니다.
+    """
+    try:
+        return session.client("sts").get_caller_identity().get("Account")
+    except Exception as e:
+        print(f"Error fetching AWS account id: {e}")
+        return None
+
+
+def collect_resource(
+    spec: ResourceSpec,
+    session,
+    region: str | None,
+    filter_pool: FilterPool | None = None,
+    raw_mode: str = "full",
+    columns: dict[str, set[str]] | None = None,
+    tags: bool = False,
+) -> tuple[object, pd.DataFrame | Future]:
+    """
+    리소스 하나의 원본 데이터를 조회하고, 필터링 후 모듈의 컬럼 스키마를 적용합니다.
+    filter_pool이 주어지면 필터링은 워커 프로세스에 제출하고 Future를 반환합니다.
+    반환하는 원본 데이터는 raw_mode에 따라 RAW_PROJECTION만 남기거나 버립니다.
+    columns에 리소스의 컬럼이 지정되면 그 컬럼만 남기며, DETAIL_COLUMNS를 선언한 모듈은
+    요청되지 않은 컬럼을 위한 추가 호출을 하지 않습니다.
+    tags(--tags)이면 태그는 나중에 한 번에 붙이므로 태그만 채우는 추가 호출도 하지 않습니다.
+
+    Args:
+        spec: 조회할 리소스 정의
+        session: boto3 세션 객체
+        region: AWS 리전명 (글로벌 리소스는 spec.global_region)
+        filter_pool: 필터링을 실행할 프로세스 풀 (None이면 현재 프로세스에서 실행)
+        raw_mode: 보관할 원본 데이터 ("full", "projected", "none")
+        columns: {리소스 이름: 조회할 컬럼} (--columns, 없는 리소스는 모든 컬럼)
+        tags: 태그를 Resource Groups Tagging API로 붙이는지 여부 (--tags)
+
+    Returns:
+        tuple: (보관할 원본 데이터, 필터링된 DataFrame 또는 필터링 작업의 Future)
+    """
+    module = spec.module
+    scope = region if not spec.is_global else GLOBAL_SCOPE
+    selected = columns.get(spec.key) if columns else None
+    raw_columns = raw_columns_without_tags(module, selected) if tags else selected
+    with profile_stage("api", spec.result_key, scope):
+        if raw_columns is not None and hasattr(module, "DETAIL_COLUMNS"):
+            raw_data = module.get_raw_data(session, region, columns=raw_columns)
+        else:
+            raw_data = module.get_raw_data(session, region)
+    if filter_pool is not None:
+        filtered = filter_pool.submit(spec.module_name, raw_data, selected)
+    else:
+        with profile_stage("filter", spec.result_key, scope):
+            filtered = apply_column_schema(
+                select_columns(module.get_filtered_data(raw_data), selected),
+                module.COLUMN_SCHEMA,
+            )
+    with profile_stage("raw", spec.result_key, scope):
+        retained = retain_raw(raw_data, module, raw_mode)
+    return retained, filtered
+
+
+def build_tasks(
+    selected_resources: set[str], regions: list[str]
+) -> list[CollectionTask]:
+    """선택된 리소스의 리전별 수집 작업과 글로벌 수집 작업 목록을 만듭니다."""
+    tasks = [
+        CollectionTask(spec, region, region)
+        for region in regions
+        for spec in REGIONAL_RESOURCE_SPECS
+        if spec.key in selected_resources
+    ]
+    tasks += [
+        CollectionTask(spec, GLOBAL_SCOPE, spec.global_region)
+        for spec in GLOBAL_RESOURCE_SPECS
+        if spec.key in selected_resources
+    ]
+    return tasks
+
+
+def resolve_filtered(data_filtered: pd.DataFrame | pa.Table | Future) -> pa.Table:
+    """
+    collect_resource()가 반환한 필터링 결과를 Arrow 테이블로 변환합니다.
+    Future인 경우 워커 프로세스의 필터링이 끝나기를 기다리며,
+    리전 프로세스가 보낸 Arrow 테이블은 그대로 반환합니다.
+    """
+    if isinstance(data_filtered, Future):
+        return FilterPool.read(data_filtered)
+    if isinstance(data_filtered, pa.Table):
+        return data_filtered
+    return dataframe_to_table(data_filtered)
+
+
+def write_json_outputs(
+    output_dir: str,
+    timestamp: str,
+    all_raw_data: dict,
+    store: ResultStore,
+    raw_mode: str,
+) -> dict[str, str]:
+    """
+    Raw/Filtered JSON 파일을 기록합니다. raw_mode가 "none"이면 Raw JSON은 만들지 않습니다.
+
+    Returns:
+        dict: {"raw_json": 경로, "filtered_json": 경로}
+    """
+    outputs = {}
+
+    # Raw 데이터 JSON 파일로 저장 (--raw none 이면 생략)
+    if raw_mode != "none":
+        json_raw_path = os.path.join(output_dir, f"aws_resources_raw_{timestamp}.json")
+        with open(json_raw_path, "w", encoding="utf-8") as f, profile_stage("raw_json"):
+            json.dump(
+                all_raw_data, f, ensure_ascii=False, indent=2, cls=DateTimeEncoder
+            )
+        outputs["raw_json"] = json_raw_path
+        print(f"📄 Raw JSON 파일 생성 완료: {json_raw_path}")
+
+    # Filtered 데이터 JSON 파일로 저장
+    json_filtered_path = os.path.join(
+        output_dir, f"aws_resources_filtered_{timestamp}.json"
+    )
+    with open(json_filtered_path, "w", encoding="utf-8") as f:
+        store.write_json(f, cls=DateTimeEncoder)
+    outputs["filtered_json"] = json_filtered_path
+    print(f"📄 Filtered JSON 파일 생성 완료: {json_filtered_path}")
+    return outputs
+
+
+def duration_argument(value: str) -> float:
+    """argparse 용 기간 변환 함수 ("300s", "5m")."""
+    try:
+        return parse_duration(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from e
+
+
+def parse_refresh_intervals(values: list[str]) -> dict[str, int]:
+    """
+    "리소스=초" 형태의 인자 목록을 {리소스: 갱신 주기(초)}로 변환합니다.
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 알 수 없는 리소스인 경우
+    """
+    intervals = {}
+    available_resources = get_available_resources()
+    for value in values:
+        key, found, seconds = value.partition("=")
+        if not found or key not in available_resources or not seconds.isdigit():
+            raise ValueError(f"Invalid refresh interval: {value} (예: ec2=60)")
+        intervals[key] = int(seconds)
+    return intervals
+
+
+def parse_column_selection(values: list[str]) -> dict[str, set[str]]:
+    """
+    "리소스=컬럼,컬럼" 형태의 인자 목록을 {리소스: 조회할 컬럼}으로 변환합니다.
+    리소스의 ID 컬럼(id_column)은 항상 포함합니다.
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 알 수 없는 리소스/컬럼인 경우
+    """
+    selection: dict[str, set[str]] = {}
+    for value in values:
+        key, found, names = value.partition("=")
+        columns = {name.strip() for name in names.split(",") if name.strip()}
+        if not found or key not in RESOURCE_SPECS_BY_KEY or not columns:
+            raise ValueError(
+                f"Invalid column selection: {value} (예: dynamodb=TableName,TableStatus)"
+            )
+        spec = RESOURCE_SPECS_BY_KEY[key]
+        unknown = columns - set(spec.module.COLUMN_SCHEMA)
+        if unknown:
+            raise ValueError(
+                f"Unknown {key} columns: {', '.join(sorted(unknown))} "
+                f"(사용 가능: {', '.join(spec.module.COLUMN_SCHEMA)})"
+            )
+        if spec.id_column:
+            columns.add(spec.id_column)
+        selection.setdefault(key, set()).update(columns)
+    return selection
+
+
+def serve(argv: list[str]):
+    """
+    serve 모드: 세션/클라이언트와 최신 인벤토리를 메모리에 유지하면서 리소스별 주기로
+    백그라운드 갱신하고, HTTP/JSON API로 리전/리소스/태그/ID 조회에 응답합니다.
+    """
+    available_resources = get_available_resources()
+
+    parser = argparse.ArgumentParser(
+        prog="listup_aws_resources.py serve",
+        description="AWS 리소스 인벤토리 서버",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+조회 API:
+  GET /status                                      # 테이블별 갱신 시각/행 수/오류
+  GET /inventory?resource=ec2                      # 리소스별 조회
+  GET /inventory?region=ap-northeast-2&tag=env=prod  # 리전 + 태그 조회
+  GET /inventory?id=i-0123456789abcdef0            # ID 조회
+        """,
+    )
+    parser.add_argument(
+        "--region",
+        dest="regions",
+        nargs="+",
+        default=["ap-northeast-2"],
+        help="조회할 AWS 리전명 (여러 개 가능). 기본값: ap-northeast-2",
+    )
+    parser.add_argument(
+        "--resources",
+        dest="selected_resources",
+        nargs="+",
+        choices=list(available_resources.keys()),
+        help="조회할 AWS 리소스 (여러 개 가능). 지정하지 않으면 모든 리소스를 조회합니다.",
+    )
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="HTTP 서버 주소. 기본값: 127.0.0.1"
+    )
+    parser.add_argument(
+        "--port", type=int, default=8080, help="HTTP 서버 포트. 기본값: 8080"
+    )
+    parser.add_argument(
+        "--interval",
+        type=int,
+        help=(
+            "모든 리소스의 갱신 주기(초). 지정하지 않으면 리소스별 기본값 "
+            f"(대부분 {DEFAULT_REFRESH_INTERVAL}초, AMI/스냅샷 등은 더 길게)을 사용합니다."
+        ),
+    )
+    parser.add_argument(
+        "--refresh",
+        nargs="+",
+        default=[],
+        metavar="RESOURCE=SECONDS",
+        help="특정 리소스의 갱신 주기(초) 지정 (예: --refresh ec2=60 s3=3600)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="동시에 실행할 갱신 작업 수. 기본값: 4",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        refresh_intervals = parse_refresh_intervals(args.refresh)
+    except ValueError as e:
+        parser.error(str(e))
+
+    specs = [
+        spec
+        for spec in RESOURCE_SPECS
+        if not args.selected_resources or spec.key in args.selected_resources
+    ]
+    intervals = {spec.key: args.interval for spec in specs} if args.interval else {}
+    intervals.update(refresh_intervals)
+
+    inventory = Inventory(specs)
+    refresher = InventoryRefresher(
+        inventory,
+        args.regions,
+        collect=lambda spec, session, region: collect_resource(
+            spec, session, region, raw_mode="none"
+        )[1],
+        session_factory=create_session,
+        intervals=intervals,
+        workers=args.workers,
+    )
+    server = create_server(inventory, args.host, args.port, DateTimeEncoder)
+
+    print("🚀 AWS 리소스 인벤토리 서버 시작")
+    print("=" * 50)
+    print(f"🌍 조회 리전: {', '.join(args.regions)}")
+    print(f"📋 조회 리소스: {', '.join(spec.key for spec in specs)}")
+    print(f"🔗 http://{args.host}:{server.server_port}/inventory")
+
+    refresher.start()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 서버를 종료합니다.")
+    finally:
+        server.server_close()
+        refresher.stop()
+
+
+def query(argv: list[str]):
+    """
+    query 모드: data/ 의 filtered JSON 실행 결과를 SQLite 데이터베이스(리소스별 테이블)에
+    적재하고 SQL을 실행합니다. 이미 적재된 실행은 다시 읽지 않습니다.
+    """
+    data_dir = DATA_DIR
+
+    parser = argparse.ArgumentParser(
+        prog="listup_aws_resources.py query",
+        description="수집된 인벤토리에 대한 SQL 조회",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+테이블:
+  <리소스>          모든 실행의 행 (run_id, region 컬럼 포함, 예: ec2, security_groups)
+  <리소스>_latest   가장 최근 실행의 행 (그 실행에서 찾지 못한 리소스는 비어 있음)
+  runs              적재된 실행 목록
+
+사용 예시:
+  python listup_aws_resources.py query                # 새 실행 적재 후 테이블 목록 출력
+  python listup_aws_resources.py query \\
+    "SELECT region, count(*) FROM ec2_latest WHERE InstanceType LIKE 't3.%' GROUP BY region"
+  python listup_aws_resources.py query --format csv "SELECT * FROM runs"
+        """,
+    )
+    parser.add_argument("sql", nargs="?", help="실행할 SQL (생략하면 테이블 목록 출력)")
+    parser.add_argument(
+        "--db",
+        default=os.path.join(data_dir, "inventory.sqlite"),
+        help="SQLite 데이터베이스 경로. 기본값: data/inventory.sqlite",
+    )
+    parser.add_argument(
+        "--data-dir",
+        default=data_dir,
+        help="filtered JSON 실행 결과가 있는 디렉터리. 기본값: data/",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["table", "csv", "json"],
+        default="table",
+        help="출력 형식. 기본값: table",
+    )
+    args = parser.parse_args(argv)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.db)), exist_ok=True)
+    db = InventoryDatabase(args.db)
+    try:
+        new_runs = db.load_directory(args.data_dir)
+        if new_runs:
+            print(
+                f"📥 새 실행 {len(new_runs)}개 적재: {', '.join(new_runs)}",
+                file=sys.stderr,
+            )
+
+        if not args.sql:
+            print("🗄️  테이블 목록:")
+            for name, count in db.tables():
+                print(f"  {name:<25} : {count}행")
+            return
+
+        try:
+            columns, rows = db.query(args.sql)
+        except sqlite3.Error as e:
+            print(f"❌ SQL 오류: {e}", file=sys.stderr)
+            sys.exit(1)
+        print_dataframe(pd.DataFrame(rows, columns=columns), args.format)
+    finally:
+        db.close()
+
+
+def history(argv: list[str]):
+    """
+    history 모드: --history 로 기록한 인벤토리 이력에서 특정 시점의 상태나
+    리소스 하나의 변경 이력을 조회합니다.
+    """
+    available_resources = get_available_resources()
+    data_dir = DATA_DIR
+
+    parser = argparse.ArgumentParser(
+        prog="listup_aws_resources.py history",
+        description="인벤토리 이력 조회",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python listup_aws_resources.py history --as-of 2026-09-01 --account 123456789012
+  python listup_aws_resources.py history --as-of 2026-09-01T09:00:00+09:00 --resources ec2
+  python listup_aws_resources.py history --id i-0123456789abcdef0   # 리소스 변경 이력
+        """,
+    )
+    parser.add_argument(
+        "--as-of",
+        help="조회 시점 (ISO 8601). 날짜만 지정하면 그날 종료 시점의 상태를 조회합니다.",
+    )
+    parser.add_argument("--id", dest="resource_id", help="변경 이력을 조회할 리소스 ID")
+    parser.add_argument("--account", help="AWS 계정 ID")
+    parser.add_argument(
+        "--resources",
+        dest="selected_resources",
+        nargs="+",
+        choices=list(available_resources.keys()),
+        help="조회할 AWS 리소스 (여러 개 가능)",
+    )
+    parser.add_argument("--region", help="리전명 (글로벌 리소스는 global)")
+    parser.add_argument(
+        "--db",
+        default=os.path.join(data_dir, HISTORY_DB_NAME),
+        help=f"이력 데이터베이스 경로. 기본값: data/{HISTORY_DB_NAME}",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["table", "csv", "json"],
+        default="table",
+        help="출력 형식. 기본값: table",
+    )
+    args = parser.parse_args(argv)
+    if not args.as_of and not args.resource_id:
+        parser.error("--as-of 또는 --id 중 하나를 지정해야 합니다.")
+    if not os.path.exists(args.db):
+        parser.error(f"이력 데이터베이스가 없습니다: {args.db} (--history 로 기록)")
+
+    store = HistoryStore(args.db)
+    try:
+        if args.resource_id:
+            rows = store.versions(args.resource_id, args.account)
+        else:
+            try:
+                rows = []
+                for resource in args.selected_resources or [None]:
+                    rows += store.as_of(args.as_of, args.account, resource, args.region)
+            except ValueError as e:
+                parser.error(f"잘못된 시점: {e}")
+    finally:
+        store.close()
+
+    if not rows:
+        print("📭 조회된 이력이 없습니다.")
+        return
+    if args.format == "json":
+        print(json.dumps(rows, ensure_ascii=False, indent=2))
+        return
+    df = pd.DataFrame([{**row, **row["data"]} for row in rows])
+    print_dataframe(df.drop(columns="data", errors="ignore"), args.format)
+
+
+def shared_queue(parser: argparse.ArgumentParser, args: argparse.Namespace):
+    """--queue (없으면 --shared-dir/queue.sqlite)로 작업 큐를 엽니다."""
+    try:
+        return open_queue(args.queue or os.path.join(args.shared_dir, QUEUE_DB_NAME))
+    except ValueError as e:
+        parser.error(str(e))
+
+
+def add_queue_arguments(parser: argparse.ArgumentParser) -> None:
+    """coordinator/worker/merge 하위 명령의 공유 디렉터리와 작업 큐 인자를 추가합니다."""
+    parser.add_argument(
+        "--shared-dir",
+        required=True,
+        help="모든 호스트가 함께 사용하는 디렉터리 (작업 결과가 기록됨)",
+    )
+    parser.add_argument(
+        "--queue",
+        help=(
+            "작업 큐 위치 (backend:경로). "
+            f"기본값: sqlite:<shared-dir>/{QUEUE_DB_NAME}"
+        ),
+    )
+
+
+def coordinator(argv: list[str]):
+    """
+    coordinator 모드: (프로필, 리전, 리소스) 수집 작업을 공유 작업 큐에 넣고
+    실행 ID를 출력합니다. 작업은 여러 호스트의 worker가 나누어 실행합니다.
+    """
+    available_resources = get_available_resources()
+
+    parser = argparse.ArgumentParser(
+        prog="listup_aws_resources.py coordinator",
+        description="분산 수집 작업 등록",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python listup_aws_resources.py coordinator --shared-dir /mnt/inventory \\
+    --profiles prod staging --region ap-northeast-2 us-east-1
+  python listup_aws_resources.py worker --shared-dir /mnt/inventory --workers 4  # 호스트마다 실행
+  python listup_aws_resources.py merge --shared-dir /mnt/inventory
+        """,
+    )
+    add_queue_arguments(parser)
+    parser.add_argument(
+        "--region",
+        dest="regions",
+        nargs="+",
+        default=["ap-northeast-2"],
+        help="조회할 AWS 리전명 (여러 개 가능). 기본값: ap-northeast-2",
+    )
+    parser.add_argument(
+        "--resources",
+        dest="selected_resources",
+        nargs="+",
+        choices=list(available_resources.keys()),
+        help="조회할 AWS 리소스 (여러 개 가능). 지정하지 않으면 모든 리소스를 조회합니다.",
+    )
+    parser.add_argument(
+        "--profiles",
+        nargs="+",
+        default=[DEFAULT_PROFILE],
+        help="조회할 계정의 AWS 프로필 (여러 개 가능). 기본값: 기본 자격 증명",
+    )
+    parser.add_argument(
+        "--raw",
+        choices=RAW_MODES,
+        default="full",
+        help="Raw JSON에 보관할 원본 응답 (full, projected, none). 기본값: full",
+    )
+    parser.add_argument(
+        "--run-id", help="실행 ID. 기본값: 현재 시각 (출력 파일 이름에 사용)"
+    )
+    args = parser.parse_args(argv)
+
+    started_at = datetime.now(timezone.utc)
+    run_id = args.run_id or started_at.strftime("%Y%m%d_%H%M%S_%f")[:-3]
+    selected_resources = (
+        set(args.selected_resources)
+        if args.selected_resources
+        else set(available_resources.keys())
+    )
+    os.makedirs(args.shared_dir, exist_ok=True)
+    task_queue = shared_queue(parser, args)
+
+    # 이전 실행의 소요 시간으로 오래 걸리는 작업부터 임대되게 합니다
+    timings = TaskTimings(os.path.join(args.shared_dir, TASK_TIMINGS_NAME), None)
+    tasks = build_tasks(selected_resources, args.regions)
+    for task in tasks:
+        task.expected = timings.expected(task.scope, task.spec.key)
+    info = {
+        "run_id": run_id,
+        "started_at": started_at.isoformat(),
+        "regions": args.regions,
+        "resources": args.selected_resources,
+        "profiles": args.profiles,
+        "raw": args.raw,
     }
+    added = task_queue.enqueue(
+        run_id, info, [(profile, task) for profile in args.profiles for task in tasks]
+    )
+
+    print(f"🗂️  실행 {run_id}: 작업 {added}개를 큐에 등록했습니다.")
+    print(f"   프로필: {', '.join(profile or 'default' for profile in args.profiles)}")
+    print(f"   리전: {', '.join(args.regions)}")
+    print(
+        f"👷 worker: python listup_aws_resources.py worker --shared-dir "
+        f"{args.shared_dir} --run-id {run_id}"
+    )
+
+
+def worker(argv: list[str]):
+    """
+    worker 모드: 공유 작업 큐에서 작업을 임대해 수집하고 결과를 공유 디렉터리에
+    기록합니다. 실행할 작업이 남지 않으면 종료합니다.
+    """
+    parser = argparse.ArgumentParser(
+        prog="listup_aws_resources.py worker",
+        description="분산 수집 작업 실행",
+    )
+    add_queue_arguments(parser)
+    parser.add_argument("--run-id", help="실행 ID. 기본값: 가장 최근에 등록된 실행")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="이 호스트에서 동시에 실행할 작업 수. 기본값: 1",
+    )
+    parser.add_argument(
+        "--lease",
+        type=duration_argument,
+        default=DEFAULT_LEASE_SECONDS,
+        help=(
+            "작업 임대 시간 (예: 300s, 5m). 워커가 종료되어 임대를 갱신하지 못하면 "
+            f"다른 워커가 작업을 가져갑니다. 기본값: {DEFAULT_LEASE_SECONDS}s"
+        ),
+    )
+    parser.add_argument("--worker-id", help="워커 ID. 기본값: <호스트 이름>-<임의 값>")
+    parser.add_argument(
+        "--circuit-breaker",
+        type=int,
+        default=3,
+        metavar="N",
+        help="리전 회로 차단기의 연속 실패 기준 (0이면 사용 안 함). 기본값: 3",
+    )
+    parser.add_argument(
+        "--task-timeout",
+        type=duration_argument,
+        help="수집 작업 하나의 최대 실행 시간 (예: 120s). 기본값: 제한 없음",
+    )
+    args = parser.parse_args(argv)
+
+    task_queue = shared_queue(parser, args)
+    run_id = args.run_id or task_queue.latest_run()
+    info = task_queue.run_info(run_id) if run_id else None
+    if info is None:
+        parser.error(f"큐에 등록된 실행이 없습니다: {run_id or args.shared_dir}")
+
+    # 프로필마다 세션/회로 차단기를 따로 두고, 계정 ID는 한 번만 조회합니다
+    runners: dict[str, TaskRunner] = {}
+    accounts: dict[str, str | None] = {}
+    lock = threading.Lock()
+
+    def runner_for(profile: str) -> TaskRunner:
+        with lock:
+            if profile not in runners:
+                runners[profile] = TaskRunner(
+                    collect_resource,
+                    functools.partial(create_session, profile=profile),
+                    circuit_breaker=args.circuit_breaker,
+                    task_timeout=args.task_timeout,
+                    raw_mode=info["raw"],
+                )
+            return runners[profile]
+
+    def account_for(profile: str) -> str | None:
+        with lock:
+            if profile not in accounts:
+                accounts[profile] = get_account_id(
+                    create_session(info["regions"][0], profile)
+                )
+            return accounts[profile]
+
+    queue_worker = QueueWorker(
+        task_queue,
+        run_id,
+        args.shared_dir,
+        runner_for,
+        account_for,
+        resolve_filtered,
+        worker_id=args.worker_id,
+        lease_seconds=args.lease,
+        encoder=DateTimeEncoder,
+    )
+    print(f"👷 워커 {queue_worker.worker_id}: 실행 {run_id}의 작업을 처리합니다.")
+    queue_worker.run(args.workers)
+
+    counts = task_queue.counts(run_id)
+    print(
+        f"\n✅ 워커 종료: 이 워커가 완료 {queue_worker.completed}개, "
+        f"실패 {queue_worker.failed}개 (전체 완료 {counts['done']}개, "
+        f"실패 {counts['failed']}개, 남은 작업 {counts['pending'] + counts['leased']}개)"
+    )
+
+
+def merge(argv: list[str]):
+    """
+    merge 모드: worker가 공유 디렉터리에 기록한 결과를 프로필(계정)별 Excel/JSON/Manifest와
+    모든 계정을 합친 리소스별 Parquet 파일로 만듭니다.
+    """
+    parser = argparse.ArgumentParser(
+        prog="listup_aws_resources.py merge",
+        description="분산 수집 결과 병합",
+    )
+    add_queue_arguments(parser)
+    parser.add_argument("--run-id", help="실행 ID. 기본값: 가장 최근에 등록된 실행")
+    parser.add_argument(
+        "--output-dir",
+        help=(
+            "결과 디렉터리 (프로필별 하위 디렉터리와 parquet/ 생성). "
+            f"기본값: <shared-dir>/{MERGED_DIR_NAME}/<run-id>"
+        ),
+    )
+    parser.add_argument(
+        "--excel-layout",
+        choices=EXCEL_LAYOUTS,
+        default="region",
+        help="Excel 시트 구성 (region, resource). 기본값: region",
+    )
+    parser.add_argument(
+        "--excel-max-rows",
+        type=int,
+        default=EXCEL_MAX_ROWS,
+        help=f"시트 하나에 기록할 최대 행 수. 기본값: {EXCEL_MAX_ROWS}",
+    )
+    args = parser.parse_args(argv)
+    if not 0 < args.excel_max_rows <= EXCEL_MAX_ROWS:
+        parser.error(f"--excel-max-rows 는 1에서 {EXCEL_MAX_ROWS} 사이여야 합니다.")
+
+    task_queue = shared_queue(parser, args)
+    run_id = args.run_id or task_queue.latest_run()
+    info = task_queue.run_info(run_id) if run_id else None
+    if info is None:
+        parser.error(f"큐에 등록된 실행이 없습니다: {run_id or args.shared_dir}")
+    output_dir = args.output_dir or os.path.join(
+        args.shared_dir, MERGED_DIR_NAME, run_id
+    )
+    os.makedirs(output_dir, exist_ok=True)
+
+    counts = task_queue.counts(run_id)
+    unfinished = counts["pending"] + counts["leased"]
+    if unfinished:
+        print(f"⚠️  아직 끝나지 않은 작업 {unfinished}개는 결과에서 제외됩니다.")
+
+    regions = info["regions"]
+    scopes = [*regions, GLOBAL_SCOPE]
+    queued = task_queue.tasks(run_id)
+    failures = task_queue.failures(run_id)
+    # 리소스별 Parquet로 합칠 테이블 (AccountId/Region 컬럼 추가)
+    combined: dict[str, list[pa.Table]] = {}
+    # 완료된 작업의 소요 시간/리소스 수를 coordinator 가 다음 실행의 임대 순서에 사용합니다
+    # (coordinator 는 계정을 모르므로 계정 없이 리전/리소스별로 기록)
+    timings = TaskTimings(os.path.join(args.shared_dir, TASK_TIMINGS_NAME), None)
+
+    for profile in info["profiles"]:
+        rows = [row for row in queued if row["profile"] == profile]
+        account_id = next(
+            (row["account_id"] for row in rows if row["account_id"]), None
+        )
+        account_dir = os.path.join(output_dir, profile or "default")
+        os.makedirs(account_dir, exist_ok=True)
+        checkpoint = profile_checkpoint(args.shared_dir, profile, run_id)
+        durations = {
+            (row["scope"], row["resource"]): row["duration"]
+            for row in rows
+            if row["status"] == "done" and row["duration"] is not None
+        }
+
+        all_raw_data = {}
+        store = ResultStore()
+        excel_path = os.path.join(account_dir, f"aws_resources_{run_id}.xlsx")
+        exporter = ExcelExporter(
+            excel_path,
+            {spec.result_key: spec.sheet_prefix for spec in RESOURCE_SPECS},
+            layout=args.excel_layout,
+            account_id=account_id,
+            max_rows=args.excel_max_rows,
+        )
+        for region in regions:
+            store.add_region(region)
+        for scope in scopes:
+            for spec in RESOURCE_SPECS:
+                if not checkpoint.has_task(scope, spec.key):
+                    continue
+                data_raw, table = checkpoint.load_task(scope, spec.key)
+                if (scope, spec.key) in durations:
+                    timings.record(scope, spec.key, durations[scope, spec.key])
+                    timings.record_rows(scope, spec.key, table.num_rows)
+                if scope == GLOBAL_SCOPE:
+                    all_raw_data[spec.result_key] = data_raw
+                else:
+                    all_raw_data.setdefault(scope, {})[spec.result_key] = data_raw
+                store.put(scope, spec.result_key, table)
+                combined.setdefault(spec.key, []).append(
+                    table.append_column(
+                        "AccountId",
+                        pa.array([account_id] * table.num_rows, pa.string()),
+                    ).append_column(
+                        "Region", pa.array([scope] * table.num_rows, pa.string())
+                    )
+                )
+            if scope != GLOBAL_SCOPE:
+                all_raw_data.setdefault(scope, {})
+            exporter.write_region(store, scope)
+        exporter.write_errors(failure_rows(failures.get(profile, [])))
+        exporter.close()
+        print(
+            f"\n📊 [{account_id or profile or 'default'}] Excel 파일 생성 완료: {excel_path}"
+        )
+
+        outputs = {"excel": excel_path}
+        outputs.update(
+            write_json_outputs(account_dir, run_id, all_raw_data, store, info["raw"])
+        )
+        manifest_path = os.path.join(
+            account_dir, f"aws_resources_manifest_{run_id}.json"
+        )
+        write_manifest(
+            manifest_path,
+            run_id=run_id,
+            started_at=datetime.fromisoformat(info["started_at"]),
+            finished_at=datetime.now(timezone.utc),
+            account_id=account_id,
+            regions=regions,
+            resources=sorted(info["resources"] or get_available_resources().keys()),
+            total_tasks=len(rows),
+            failures=failures.get(profile, []),
+            skipped=[
+                {
+                    "resource": row["resource"],
+                    "region": row["scope"],
+                    "expected_seconds": round(row["expected"], 3),
+                    "reason": "unfinished",
+                }
+                for row in rows
+                if row["status"] in ("pending", "leased")
+            ],
+            outputs=outputs,
+        )
+        print(f"📄 Manifest 파일 생성 완료: {manifest_path}")
+    timings.save()
+
+    # 모든 계정/리전의 결과를 리소스별 Parquet 파일 하나로 합칩니다
+    parquet_dir = os.path.join(output_dir, "parquet")
+    os.makedirs(parquet_dir, exist_ok=True)
+    for key, tables in combined.items():
+        path = os.path.join(parquet_dir, f"{key}.parquet")
+        pq.write_table(pa.concat_tables(tables, promote_options="permissive"), path)
+    print(f"\n🧱 Parquet 파일 {len(combined)}개 생성 완료: {parquet_dir}")
 
 
-def main():
+def plan(argv: list[str]):
+    """
+    plan 모드: 계정 × 리전 × 리소스 수집 작업을 실행하지 않고, 이전 실행의 리소스 수와
+    소요 시간으로 API 호출 수, 요청 제한, 예상 소요 시간을 추정합니다.
+    --api-budget 을 넘으면 종료 코드 1로 끝납니다.
+    """
+    available_resources = get_available_resources()
+
+    parser = argparse.ArgumentParser(
+        prog="listup_aws_resources.py plan",
+        description="수집 실행 계획과 API 호출 수 추정",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python listup_aws_resources.py plan --region ap-northeast-2 us-east-1 --workers 8
+  python listup_aws_resources.py plan --profiles prod staging --api-budget 20000
+  python listup_aws_resources.py plan --resources dynamodb --columns dynamodb=TableStatus
+  python listup_aws_resources.py plan --tags --api-budget 20000  # 태그 조회 호출 포함
+        """,
+    )
+    parser.add_argument(
+        "--region",
+        dest="regions",
+        nargs="+",
+        default=["ap-northeast-2"],
+        help="조회할 AWS 리전명 (여러 개 가능). 기본값: ap-northeast-2",
+    )
+    parser.add_argument(
+        "--resources",
+        dest="selected_resources",
+        nargs="+",
+        choices=list(available_resources.keys()),
+        help="조회할 AWS 리소스 (여러 개 가능). 지정하지 않으면 모든 리소스를 조회합니다.",
+    )
+    parser.add_argument(
+        "--profiles",
+        nargs="+",
+        default=[DEFAULT_PROFILE],
+        help="조회할 계정의 AWS 프로필 (여러 개 가능). 기본값: 기본 자격 증명",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="동시에 실행할 수집 작업 수. 기본값: 1",
+    )
+    parser.add_argument(
+        "--max-rps",
+        type=float,
+        help="(리전, 서비스)별 초당 최대 API 요청 수. 기본값: 제한 없음",
+    )
+    parser.add_argument(
+        "--columns",
+        nargs="+",
+        metavar="RESOURCE=COLUMN,...",
+        help="리소스별로 조회할 컬럼 (요청되지 않은 컬럼의 상세 조회는 계산하지 않음)",
+    )
+    parser.add_argument(
+        "--tags",
+        action="store_true",
+        help="--tags 의 리전별 태그 조회(get_resources) 호출도 계산합니다.",
+    )
+    parser.add_argument(
+        "--api-budget",
+        type=int,
+        help="예상 API 호출 수가 이 값을 넘으면 실패로 종료합니다.",
+    )
+    parser.add_argument(
+        "--timings",
+        default=os.path.join(DATA_DIR, TASK_TIMINGS_NAME),
+        help=(
+            "이전 실행의 리소스 수/소요 시간 기록 파일. "
+            f"기본값: data/{TASK_TIMINGS_NAME}"
+        ),
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        column_selection = parse_column_selection(args.columns or [])
+    except ValueError as e:
+        parser.error(str(e))
+    if args.max_rps is not None and args.max_rps <= 0:
+        parser.error("--max-rps 는 0보다 커야 합니다.")
+
+    selected_resources = (
+        set(args.selected_resources)
+        if args.selected_resources
+        else set(available_resources.keys())
+    )
+    # 계정 ID는 STS로만 확인합니다 (기록은 계정별로 저장되어 있음)
+    accounts = {}
+    for profile in args.profiles:
+        account_id = get_account_id(create_session(args.regions[0], profile))
+        accounts[account_id or profile or "default"] = TaskTimings(
+            args.timings, account_id
+        )
+    tasks = build_tasks(selected_resources, args.regions)
+    execution_plan = build_plan(
+        accounts,
+        tasks,
+        workers=args.workers,
+        columns=column_selection,
+        max_rps=args.max_rps,
+        tag_tasks=tasks if args.tags else None,
+    )
+
+    print(f"🗺️  실행 계획: {', '.join(accounts)} × {', '.join(args.regions)}")
+    print_plan(execution_plan)
+    if args.api_budget is not None and execution_plan.total_calls > args.api_budget:
+        print(
+            f"❌ 예상 API 호출 {execution_plan.total_calls}회가 "
+            f"--api-budget {args.api_budget}회를 넘습니다.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+def print_dataframe(df: pd.DataFrame, output_format: str) -> None:
+    """조회 결과를 table/csv/json 형식으로 출력합니다."""
+    if output_format == "csv":
+        df.to_csv(sys.stdout, index=False)
+    elif output_format == "json":
+        print(df.to_json(orient="records", force_ascii=False, indent=2))
+    else:
+        print(df.to_string(index=False))
+
+
+def record_history(
+    path: str,
+    store: ResultStore,
+    tasks: list[CollectionTask],
+    recorded_at: datetime,
+    account_id: str | None,
+) -> None:
+    """
+    이번 실행의 필터링 결과를 이력 데이터베이스에 기록합니다.
+    조회했지만 결과가 없는 리소스도 전달해 사라진 리소스의 유효 기간을 닫습니다.
+    실패하거나 --deadline 으로 건너뛴 작업은 빈 결과가 아니므로 전달하지 않습니다
+    (전달하면 그 리소스가 모두 삭제된 것으로 기록됩니다).
+
+    Args:
+        tasks: 수집했거나 체크포인트에서 불러온 작업 목록
+    """
+    tables = [
+        (task.spec, task.scope, store.get(task.scope, task.spec.result_key))
+        for task in tasks
+    ]
+
+    history_store = HistoryStore(path)
+    try:
+        counts = history_store.record_run(recorded_at, account_id, tables)
+    finally:
+        history_store.close()
+    print(
+        f"🕘 이력 기록 완료: {path} (추가 {counts['added']}, 변경 {counts['changed']}, "
+        f"삭제 {counts['removed']}, 동일 {counts['unchanged']})"
+    )
+
+
+def count_only(
+    tasks: list[CollectionTask],
+    runner: TaskRunner,
+    regions: list[str],
+    workers: int = 1,
+    deadline: float | None = None,
+    timings: TaskTimings | None = None,
+) -> tuple[dict[str, dict[str, int]], list[TaskFailure], list[CollectionTask]]:
+    """
+    --count-only: 각 작업의 리소스 수를 모듈의 COUNT_QUERIES로 셉니다.
+    상세 조회, 필터링, 원본 데이터 보관과 Excel/JSON 출력은 하지 않습니다.
+
+    Args:
+        tasks: 실행할 작업 목록
+        runner: count_resource로 만든 TaskRunner
+        regions: 조회 리전 목록 (결과 정렬 순서)
+        workers: 동시에 실행할 작업 수
+        deadline: 전체 실행 제한 시간 (초)
+        timings: 리소스 수를 기록할 TaskTimings (plan 의 호출 수 추정에 사용)
+
+    Returns:
+        tuple: ({scope: {result_key: 리소스 수}}, 실패한 작업 목록, 건너뛴 작업 목록)
+    """
+    runner.prepare(tasks)
+    # 목록 조회만 하므로 전체 수집의 작업별 소요 시간은 사용/기록하지 않고 리소스 수만 기록합니다
+    scheduler = DeadlineScheduler(tasks, runner, workers=workers, deadline=deadline)
+    found: dict[tuple[str, str], int] = {}
+    failures: list[TaskFailure] = []
+    for task, future in scheduler.run():
+        if future is None:
+            continue
+        try:
+            count = future.result()
+        except Exception as e:
+            failure = failure_from_exception(
+                task.spec.result_key, task.spec.key, task.scope, e, task.duration
+            )
+            print(
+                f"  ❌ {task.spec.result_key} [{task.scope}] 실패: "
+                f"{failure.error_code} ({failure.status})"
+            )
+            failures.append(failure)
+        else:
+            found[(task.scope, task.spec.key)] = count
+            if timings is not None:
+                timings.record_rows(task.scope, task.spec.key, count)
+
+    counts: dict[str, dict[str, int]] = {}
+    for scope in [*regions, GLOBAL_SCOPE]:
+        scope_counts = {
+            spec.result_key: found[(scope, spec.key)]
+            for spec in RESOURCE_SPECS
+            if (scope, spec.key) in found
+        }
+        if scope_counts:
+            counts[scope] = scope_counts
+    return counts, failures, scheduler.skipped
+
+
+# 실행 결과, 체크포인트와 이력을 기록하는 디렉터리
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+# --history 로 기록하는 이력 데이터베이스 파일 이름 (data/ 아래)
+HISTORY_DB_NAME = "history.sqlite"
+
+# 작업별 소요 시간 기록 파일 이름 (data/ 아래)
+TASK_TIMINGS_NAME = "task_timings.json"
+
+# 분산 수집 모드의 작업 큐 파일 이름 (--shared-dir 아래)
+QUEUE_DB_NAME = "queue.sqlite"
+
+# merge 결과를 기록하는 디렉터리 이름 (--shared-dir 아래)
+MERGED_DIR_NAME = "merged"
+
+# 첫 번째 인자로 지정하는 하위 명령
+SUBCOMMANDS = {
+    "serve": serve,
+    "query": query,
+    "history": history,
+    "coordinator": coordinator,
+    "worker": worker,
+    "merge": merge,
+    "plan": plan,
+}
+
+
+def main(argv: list[str] | None = None):
     """
     명령줄 인자로 전달된 리전 목록과 리소스 목록에 대해 AWS 리소스를 수집하여 JSON 및 Excel 파일로 저장합니다.
     글로벌 리소스(S3, Global Accelerator, Route53)는 별도 처리하며,
     선택된 리소스만 조회할 수 있습니다.
+    첫 번째 인자가 하위 명령(serve, query, history, coordinator, worker, merge, plan)이면 해당 모드로 실행합니다.
     """
+    # Check if running in a test environment
+    if argv is None:
+        # Pass empty list to avoid parsing test arguments
+        argv = [] if "pytest" in sys.modules else sys.argv[1:]
+    if argv and argv[0] in SUBCOMMANDS:
+        return SUBCOMMANDS[argv[0]](argv[1:])
+
     available_resources = get_available_resources()
 
     parser = argparse.ArgumentParser(
@@ -202,6 +1233,21 @@ def main():
   python listup_aws_resources.py --region ap-northeast-2 --resources ec2 vpc security_groups  # 특정 리전, 특정 리소스들
   python listup_aws_resources.py --resources security_groups        # Security Groups 전용 (상세 보안 분석 포함)
   python listup_aws_resources.py --resources security_groups --region ap-southeast-1  # 특정 리전 Security Groups 분석
+  python listup_aws_resources.py --region ap-northeast-2 us-east-1 --excel-layout resource  # 리소스 유형별 시트
+  python listup_aws_resources.py serve --region ap-northeast-2 --port 8080  # 인벤토리 서버 모드
+  python listup_aws_resources.py query "SELECT InstanceType, count(*) FROM ec2_latest GROUP BY 1"  # SQL 조회
+  python listup_aws_resources.py --workers 8 --deadline 5m         # 병렬 수집, 제한 시간
+  python listup_aws_resources.py --history                          # 이력 기록
+  python listup_aws_resources.py history --as-of 2026-09-01         # 특정 시점 조회
+  python listup_aws_resources.py --record cassettes/                # API 응답 기록
+  python listup_aws_resources.py --replay cassettes/                # 기록된 응답으로 오프라인 실행
+  python listup_aws_resources.py --count-only --region ap-northeast-2 us-east-1  # 리전/유형별 리소스 수만 조회
+  python listup_aws_resources.py --resources dynamodb --columns dynamodb=TableName  # 필요한 컬럼만 (상세 조회 생략)
+  python listup_aws_resources.py coordinator --shared-dir /mnt/inventory --profiles prod staging  # 분산 수집
+  python listup_aws_resources.py plan --region ap-northeast-2 us-east-1 --workers 8  # API 호출 수/소요 시간 추정
+  python listup_aws_resources.py --workers 8 --api-budget 20000     # 예상 호출 수가 넘으면 실행하지 않음
+  python listup_aws_resources.py --region ap-northeast-2 us-east-1 --tags  # 모든 리소스에 태그 컬럼 추가
+  python listup_aws_resources.py --incremental  # 최근 실행 이후 CloudTrail 이벤트로 바뀐 리소스만 갱신
         """,
     )
 
@@ -221,19 +1267,310 @@ def main():
         help="조회할 AWS 리소스 (여러 개 가능). 지정하지 않으면 모든 리소스를 조회합니다.",
     )
 
+    parser.add_argument(
+        "--excel-layout",
+        choices=EXCEL_LAYOUTS,
+        default="region",
+        help=(
+            "Excel 시트 구성. region: 리소스×리전별 시트 (기본값), "
+            "resource: 리소스 유형별 시트 하나에 Region/AccountId 컬럼 추가"
+        ),
+    )
+
+    parser.add_argument(
+        "--excel-max-rows",
+        type=int,
+        default=EXCEL_MAX_ROWS,
+        help=(
+            "시트 하나에 기록할 최대 행 수. 초과하면 _2, _3 ... 시트로 이어서 기록합니다. "
+            f"기본값: {EXCEL_MAX_ROWS}"
+        ),
+    )
+
+    parser.add_argument(
+        "--filter-workers",
+        type=int,
+        default=0,
+        help=(
+            "get_filtered_data() 단계를 실행할 워커 프로세스 수. "
+            "2 이상이면 API 조회와 필터링이 별도 프로세스에서 병렬로 실행됩니다. 기본값: 0"
+        ),
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "동시에 실행할 수집 작업 수. 작업은 이전 실행의 소요 시간 기준으로 "
+            "오래 걸리는 것부터 시작합니다. 기본값: 1"
+        ),
+    )
+
+    parser.add_argument(
+        "--region-processes",
+        type=int,
+        default=0,
+        metavar="N",
+        help=(
+            "리전(및 글로벌 리소스)을 N개의 워커 프로세스에 나누어 수집합니다. "
+            "각 프로세스는 자체 세션/클라이언트로 응답 파싱과 필터링을 수행하므로 "
+            "EC2처럼 파싱 비용이 큰 계정에서 코어 수만큼 처리량이 늘어납니다. "
+            "--workers 는 프로세스마다 적용됩니다. 기본값: 0 (사용 안 함)"
+        ),
+    )
+
+    parser.add_argument(
+        "--deadline",
+        type=duration_argument,
+        help=(
+            "전체 수집 제한 시간 (예: 300s, 5m). 남은 시간이 부족하면 우선순위가 낮은 "
+            "리소스(AMI, EBS 스냅샷, Glue, SES)를 건너뛰고 목록을 출력합니다."
+        ),
+    )
+
+    parser.add_argument(
+        "--circuit-breaker",
+        type=int,
+        default=3,
+        metavar="N",
+        help=(
+            "한 리전에서 연결 실패/타임아웃/5xx가 연속 N회 발생하면 해당 리전의 "
+            "남은 호출을 중단합니다. 0이면 사용하지 않습니다. 기본값: 3"
+        ),
+    )
+
+    parser.add_argument(
+        "--task-timeout",
+        type=duration_argument,
+        help=(
+            "수집 작업 하나의 최대 실행 시간 (예: 120s). 초과하면 다음 API 호출에서 "
+            "작업을 중단합니다. 기본값: 제한 없음"
+        ),
+    )
+
+    parser.add_argument(
+        "--max-rps",
+        type=float,
+        help="(리전, 서비스)별 초당 최대 API 요청 수 (토큰 버킷). 기본값: 제한 없음",
+    )
+
+    parser.add_argument(
+        "--hedge-budget",
+        type=float,
+        default=0.0,
+        metavar="FRACTION",
+        help=(
+            "읽기 전용 호출이 (리전, 작업)별 p95 응답 시간을 넘기면 중복 요청을 보내고 "
+            "먼저 도착한 응답을 사용합니다. 중복 요청은 호출 수 × FRACTION 이내이며 "
+            "--max-rps 의 남는 토큰만 사용합니다 (예: 0.05). 기본값: 0 (사용 안 함)"
+        ),
+    )
+
+    parser.add_argument(
+        "--history",
+        action="store_true",
+        help=(
+            f"필터링 결과를 data/{HISTORY_DB_NAME} 이력에 기록합니다 "
+            "(변경된 행만 저장, history 하위 명령으로 시점 조회)."
+        ),
+    )
+
+    parser.add_argument(
+        "--raw",
+        choices=RAW_MODES,
+        default="full",
+        help=(
+            "Raw JSON에 보관할 원본 응답. full: API 응답 전체 (기본값), "
+            "projected: 리소스별 RAW_PROJECTION 필드만, none: Raw JSON을 만들지 않음"
+        ),
+    )
+
+    parser.add_argument(
+        "--columns",
+        nargs="+",
+        metavar="RESOURCE=COLUMN,...",
+        help=(
+            "리소스별로 조회할 컬럼 (예: dynamodb=TableName,TableStatus ses_identity=Identity). "
+            "지정한 컬럼과 ID 컬럼만 기록하며, 요청되지 않은 컬럼에만 필요한 상세 조회 "
+            "(DynamoDB describe_table, SES 태그, ElastiCache 노드 정보 등)는 호출하지 않습니다. "
+            "지정하지 않은 리소스는 모든 컬럼을 조회합니다."
+        ),
+    )
+
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help=(
+            "중단되었거나 일부 작업이 실패한 실행을 이어서 수행합니다. "
+            "data/runs/<RUN_ID>/ 체크포인트에 없는 작업만 다시 실행하고 "
+            "같은 출력 파일에 합쳐서 기록합니다 (리전/리소스는 원래 실행의 값 사용)."
+        ),
+    )
+
+    parser.add_argument(
+        "--incremental",
+        nargs="?",
+        const=LATEST_RUN,
+        metavar="RUN_ID",
+        help=(
+            "이전 실행(기본값: 가장 최근 실행)의 체크포인트 이후 CloudTrail 쓰기 이벤트"
+            "(lookup_events)로 바뀐 리소스만 ID로 다시 조회해 이전 결과에 반영합니다. "
+            "바뀌지 않은 작업은 API를 호출하지 않습니다 (리전/리소스/컬럼은 이전 실행의 값, "
+            "Raw JSON은 만들지 않음)."
+        ),
+    )
+    parser.add_argument(
+        "--keep-runs",
+        type=int,
+        default=DEFAULT_KEEP_RUNS,
+        metavar="N",
+        help=(
+            "실행이 끝난 뒤 data/runs/ 에 남겨 둘 최근 체크포인트 수 "
+            "(--resume/--incremental 의 기준). 이번 실행은 항상 남깁니다. "
+            f"기본값: {DEFAULT_KEEP_RUNS}"
+        ),
+    )
+    parser.add_argument(
+        "--events-file",
+        metavar="PATH",
+        help=(
+            "--incremental 에서 lookup_events 대신 저장된 이벤트 파일을 사용합니다 "
+            "(aws cloudtrail lookup-events 출력 또는 CloudTrail 로그 파일의 JSON)."
+        ),
+    )
+
+    cassette_group = parser.add_mutually_exclusive_group()
+    cassette_group.add_argument(
+        "--record",
+        metavar="DIR",
+        help="모든 AWS API 응답을 DIR에 카세트(gzip JSON)로 기록합니다.",
+    )
+    cassette_group.add_argument(
+        "--replay",
+        metavar="DIR",
+        help=(
+            "AWS를 호출하지 않고 DIR에 기록된 카세트로 응답합니다. "
+            "기록되지 않은 호출은 해당 작업의 실패로 처리됩니다."
+        ),
+    )
+    parser.add_argument(
+        "--replay-latency",
+        type=float,
+        default=0.0,
+        metavar="SCALE",
+        help="--replay 에서 기록된 호출 시간 × SCALE 만큼 지연합니다. 기본값: 0 (지연 없음)",
+    )
+
+    parser.add_argument(
+        "--profile-stages",
+        nargs="?",
+        const="all",
+        choices=PROFILE_MODES,
+        help=(
+            "단계별(API 호출/파싱, 필터링, Arrow 변환, Excel, JSON ...) CPU 시간과 최대 메모리, "
+            "상위 함수를 aws_resources_profile_<timestamp>.json 에 기록합니다. "
+            "cpu: 스택 샘플링만, memory: tracemalloc만 (기본값 all). "
+            "tracemalloc은 실행을 느리게 합니다."
+        ),
+    )
+
+    parser.add_argument(
+        "--tags",
+        action="store_true",
+        help=(
+            "리전마다 Resource Groups Tagging API(get_resources)로 태그를 한 번에 조회해 "
+            "모든 리소스 테이블에 Tags 컬럼(Key=Value;...)으로 붙입니다 "
+            "(tag:GetResources 권한 필요, 리소스별 태그 조회는 생략)."
+        ),
+    )
+
+    parser.add_argument(
+        "--api-budget",
+        type=int,
+        help=(
+            "수집 전에 이전 실행의 리소스 수로 API 호출 수를 추정하고, 이 값을 넘으면 "
+            "실행하지 않고 종료합니다 (plan 하위 명령과 같은 추정)."
+        ),
+    )
+
+    parser.add_argument(
+        "--count-only",
+        action="store_true",
+        help=(
+            "리전/유형별 리소스 수만 셉니다. 리소스마다 가장 저렴한 목록 조회(상세 조회 없음, "
+            "최대 페이지 크기)만 호출하고 aws_resources_counts_<timestamp>.json 에 "
+            "기록합니다 (Excel/JSON/체크포인트는 만들지 않음)."
+        ),
+    )
+
     parser.add_argument(
         "--list-resources",
         action="store_true",
         help="사용 가능한 리소스 목록을 출력하고 종료",
     )
 
-    # Check if running in a test environment
-    import sys
+    args = parser.parse_args(argv)
 
-    if "pytest" in sys.modules:
-        args = parser.parse_args([])  # Pass empty list to avoid parsing test arguments
-    else:
-        args = parser.parse_args()
+    if args.region_processes > 1 and args.filter_workers > 1:
+        parser.error(
+            "--region-processes 와 --filter-workers 는 함께 사용할 수 없습니다 "
+            "(리전 프로세스에서 필터링까지 수행)."
+        )
+    if args.profile_stages and (args.region_processes > 1 or args.filter_workers > 1):
+        parser.error(
+            "--profile-stages 는 단계를 현재 프로세스에서 측정하므로 "
+            "--region-processes / --filter-workers 와 함께 사용할 수 없습니다."
+        )
+    if args.count_only:
+        conflicts = [
+            flag
+            for flag, used in [
+                ("--resume", args.resume),
+                ("--incremental", args.incremental),
+                ("--history", args.history),
+                ("--region-processes", args.region_processes > 1),
+                ("--filter-workers", args.filter_workers > 1),
+                ("--profile-stages", args.profile_stages),
+                ("--tags", args.tags),
+            ]
+            if used
+        ]
+        if conflicts:
+            parser.error(
+                f"--count-only 는 {', '.join(conflicts)} 와 함께 사용할 수 없습니다."
+            )
+    if args.events_file and not args.incremental:
+        parser.error("--events-file 은 --incremental 과 함께 사용합니다.")
+    if args.incremental:
+        conflicts = [
+            flag
+            for flag, used in [
+                ("--resume", args.resume),
+                ("--region-processes", args.region_processes > 1),
+                ("--columns", args.columns),
+            ]
+            if used
+        ]
+        if conflicts:
+            parser.error(
+                f"--incremental 은 {', '.join(conflicts)} 와 함께 사용할 수 없습니다 "
+                "(이전 실행의 리전/리소스/컬럼으로 현재 프로세스에서 갱신)."
+            )
+    try:
+        column_selection = parse_column_selection(args.columns or [])
+    except ValueError as e:
+        parser.error(str(e))
+    if args.keep_runs < 1:
+        parser.error("--keep-runs 는 1 이상이어야 합니다.")
+    if not 0 <= args.hedge_budget <= 1:
+        parser.error("--hedge-budget 은 0에서 1 사이여야 합니다.")
+    if not 0 < args.excel_max_rows <= EXCEL_MAX_ROWS:
+        parser.error(f"--excel-max-rows 는 1에서 {EXCEL_MAX_ROWS} 사이여야 합니다.")
+    if args.max_rps is not None and args.max_rps <= 0:
+        parser.error("--max-rps 는 0보다 커야 합니다.")
+    if args.replay and not os.path.isdir(args.replay):
+        parser.error(f"카세트 디렉터리를 찾을 수 없습니다: {args.replay}")
 
     # 리소스 목록 출력 후 종료
     if args.list_resources:
@@ -243,6 +1580,53 @@ def main():
             print(f"  {key:<20} : {desc}")
         return
 
+    data_dir = DATA_DIR
+
+    started_at = datetime.now(timezone.utc)
+    timestamp = started_at.strftime("%Y%m%d_%H%M%S_%f")[:-3]
+    # 이어서 실행할 때는 원래 실행의 리전/리소스와 출력 파일 이름을 사용합니다
+    if args.resume:
+        timestamp = args.resume
+    checkpoint = RunCheckpoint(data_dir, timestamp)
+    run_info = None
+    # 증분 갱신은 이전 실행의 체크포인트 테이블에서 바뀐 리소스만 고쳐 사용합니다
+    base_run = None
+    base_info = None
+    if args.resume:
+        if not checkpoint.exists():
+            parser.error(f"체크포인트를 찾을 수 없습니다: {checkpoint.path}")
+        run_info = base_info = checkpoint.load_info()
+    elif args.incremental:
+        base_id = (
+            latest_run_id(data_dir)
+            if args.incremental == LATEST_RUN
+            else args.incremental
+        )
+        if base_id is None:
+            parser.error("--incremental 로 갱신할 이전 실행의 체크포인트가 없습니다.")
+        base_run = RunCheckpoint(data_dir, base_id)
+        if not base_run.exists():
+            parser.error(f"체크포인트를 찾을 수 없습니다: {base_run.path}")
+        base_info = base_run.load_info()
+    if base_info is not None:
+        args.regions = base_info["regions"]
+        args.selected_resources = base_info["resources"]
+        # 바뀐 리소스의 원본 응답만으로는 이전 Raw JSON을 고칠 수 없어 만들지 않습니다
+        args.raw = base_info.get("raw", "full") if args.resume else "none"
+        # 체크포인트의 테이블에는 태그가 없으므로 이전 실행과 같이 다시 붙입니다
+        args.tags = base_info.get("tags", False)
+        column_selection = {
+            key: set(columns)
+            for key, columns in (base_info.get("columns") or {}).items()
+        }
+    # 이어서 실행/증분 갱신은 이전 실행의 --columns 를 그대로 사용하므로 그 뒤에 확인합니다
+    if column_selection and args.history:
+        parser.error(
+            "--columns 는 --history 와 함께 사용할 수 없습니다 "
+            "(일부 컬럼만 기록하면 이력의 모든 행이 변경된 것으로 기록됨). "
+            "--resume/--incremental 의 기준 실행이 --columns 를 사용한 경우도 포함합니다."
+        )
+
     regions = args.regions
     selected_resources = (
         set(args.selected_resources)
@@ -258,421 +1642,399 @@ def main():
         print(f"🎯 선택된 리소스: {', '.join(sorted(selected_resources))}")
     else:
         print("📋 모든 리소스를 조회합니다.")
+    for key, columns in column_selection.items():
+        print(f"🧮 {key} 컬럼: {', '.join(sorted(columns))}")
+    if args.resume:
+        print(f"🔁 실행 {timestamp}을(를) 체크포인트에서 이어서 수행합니다.")
+    if base_run is not None:
+        print(
+            f"🔄 실행 {base_run.run_id} 이후 바뀐 리소스만 갱신합니다 "
+            f"(기준 시각 {base_info['started_at']})."
+        )
     print()
 
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")[:-3]
-
-    current_dir = os.path.dirname(__file__)
-    data_dir = os.path.join(current_dir, "data")
     if not os.path.exists(data_dir):
         os.makedirs(data_dir)
 
-    all_raw_data = {}
-    all_filtered_data = {}  # 필터링된 데이터를 저장할 딕셔너리
-    excel_path = os.path.join(data_dir, f"aws_resources_{timestamp}.xlsx")
-    writer = pd.ExcelWriter(excel_path, engine="openpyxl")
-
-    for region in regions:
-        print(f"\n=== Collecting resources in region: {region} ===")
-        session = boto3.Session(region_name=region)
-        region_raw_data = {}
-        region_filtered_data = {}
-
-        # --- EC2 ---
-        if "ec2" in selected_resources:
-            print("  🖥️  EC2 조회 중...")
-            ec2_data_raw = ec2_raw(session, region)
-            ec2_data_filtered = ec2_filtered(ec2_data_raw)
-            region_raw_data["EC2"] = ec2_data_raw
-            if not ec2_data_filtered.empty:
-                region_filtered_data["EC2"] = ec2_data_filtered.to_dict("records")
-                sheet_name = f"EC2_{region}"[:31]
-                ec2_data_filtered.to_excel(writer, sheet_name=sheet_name, index=False)
-
-        # --- VPC ---
-        if "vpc" in selected_resources:
-            print("  🌐 VPC 조회 중...")
-            vpc_data_raw = vpc_raw(session, region)
-            vpc_data_filtered = vpc_filtered(vpc_data_raw)
-            region_raw_data["VPC"] = vpc_data_raw
-            if not vpc_data_filtered.empty:
-                region_filtered_data["VPC"] = vpc_data_filtered.to_dict("records")
-                sheet_name = f"VPC_{region}"[:31]
-                vpc_data_filtered.to_excel(writer, sheet_name=sheet_name, index=False)
-
-        # --- RDS ---
-        if "rds" in selected_resources:
-            print("  🗄️  RDS 조회 중...")
-            rds_data_raw = rds_raw(session, region)
-            rds_data_filtered = rds_filtered(rds_data_raw)
-            region_raw_data["RDS"] = rds_data_raw
-            if not rds_data_filtered.empty:
-                region_filtered_data["RDS"] = rds_data_filtered.to_dict("records")
-                sheet_name = f"RDS_{region}"[:31]
-                rds_data_filtered.to_excel(writer, sheet_name=sheet_name, index=False)
-
-        # --- EKS ---
-        if "eks" in selected_resources:
-            print("  ☸️  EKS 조회 중...")
-            eks_data_raw = eks_raw(session, region)
-            eks_data_filtered = eks_filtered(eks_data_raw)
-            region_raw_data["EKS"] = eks_data_raw
-            if not eks_data_filtered.empty:
-                region_filtered_data["EKS"] = eks_data_filtered.to_dict("records")
-                sheet_name = f"EKS_{region}"[:31]
-                eks_data_filtered.to_excel(writer, sheet_name=sheet_name, index=False)
-
-        # --- Subnets ---
-        if "subnets" in selected_resources:
-            print("  🔗 Subnets 조회 중...")
-            subnets_data_raw = subnets_raw(session, region)
-            subnets_data_filtered = subnets_filtered(subnets_data_raw)
-            region_raw_data["Subnets"] = subnets_data_raw
-            if not subnets_data_filtered.empty:
-                region_filtered_data["Subnets"] = subnets_data_filtered.to_dict(
-                    "records"
-                )
-                sheet_name = f"Subnets_{region}"[:31]
-                subnets_data_filtered.to_excel(
-                    writer, sheet_name=sheet_name, index=False
-                )
-
-        # --- DynamoDB ---
-        if "dynamodb" in selected_resources:
-            print("  📊 DynamoDB 조회 중...")
-            dynamodb_data_raw = dynamodb_raw(session, region)
-            dynamodb_data_filtered = dynamodb_filtered(dynamodb_data_raw)
-            region_raw_data["DynamoDB"] = dynamodb_data_raw
-            if not dynamodb_data_filtered.empty:
-                region_filtered_data["DynamoDB"] = dynamodb_data_filtered.to_dict(
-                    "records"
-                )
-                sheet_name = f"DynamoDB_{region}"[:31]
-                dynamodb_data_filtered.to_excel(
-                    writer, sheet_name=sheet_name, index=False
-                )
-
-        # --- ELB (Classic, ALB, NLB) ---
-        if "elb" in selected_resources:
-            print("  ⚖️  ELB 조회 중...")
-            elb_data_raw = elb_raw(session, region)
-            elb_data_filtered = elb_filtered(elb_data_raw)
-            region_raw_data["ELB"] = elb_data_raw
-            if not elb_data_filtered.empty:
-                region_filtered_data["ELB"] = elb_data_filtered.to_dict("records")
-                sheet_name = f"ELB_{region}"[:31]
-                elb_data_filtered.to_excel(writer, sheet_name=sheet_name, index=False)
-
-        # --- ElastiCache ---
-        if "elasticache" in selected_resources:
-            print("  🚀 ElastiCache 조회 중...")
-            elasticache_data_raw = elasticache_raw(session, region)
-            elasticache_data_filtered = elasticache_filtered(elasticache_data_raw)
-            region_raw_data["ElastiCache"] = elasticache_data_raw
-            if not elasticache_data_filtered.empty:
-                region_filtered_data["ElastiCache"] = elasticache_data_filtered.to_dict(
-                    "records"
-                )
-                sheet_name = f"ElastiCache_{region}"[:31]
-                elasticache_data_filtered.to_excel(
-                    writer, sheet_name=sheet_name, index=False
-                )
-
-        # --- EBS Volumes ---
-        if "ebs" in selected_resources:
-            print("  💾 EBS Volumes 조회 중...")
-            ebs_data_raw = ebs_raw(session, region)
-            ebs_data_filtered = ebs_filtered(ebs_data_raw)
-            region_raw_data["EBS_Volumes"] = ebs_data_raw
-            if not ebs_data_filtered.empty:
-                region_filtered_data["EBS_Volumes"] = ebs_data_filtered.to_dict(
-                    "records"
-                )
-                sheet_name = f"EBS_Volumes_{region}"[:31]
-                ebs_data_filtered.to_excel(writer, sheet_name=sheet_name, index=False)
-
-        # --- EBS Snapshot ---
-        if "ebs_snapshot" in selected_resources:
-            print("  📸 EBS Snapshots 조회 중...")
-            ebs_snapshot_data_raw = ebs_snapshot_raw(session, region)
-            ebs_snapshot_data_filtered = ebs_snapshot_filtered(ebs_snapshot_data_raw)
-            region_raw_data["EBS_Snapshot"] = ebs_snapshot_data_raw
-            if not ebs_snapshot_data_filtered.empty:
-                region_filtered_data["EBS_Snapshot"] = (
-                    ebs_snapshot_data_filtered.to_dict("records")
-                )
-                sheet_name = f"EBS_Snapshot_{region}"[:31]
-                ebs_snapshot_data_filtered.to_excel(
-                    writer, sheet_name=sheet_name, index=False
-                )
-
-        # --- AMIs (Owner=self) ---
-        if "amis" in selected_resources:
-            print("  🖼️  AMIs 조회 중...")
-            amis_data_raw = amis_raw(session, region)
-            amis_data_filtered = amis_filtered(amis_data_raw)
-            region_raw_data["AMIs"] = amis_data_raw
-            if not amis_data_filtered.empty:
-                region_filtered_data["AMIs"] = amis_data_filtered.to_dict("records")
-                sheet_name = f"AMIs_{region}"[:31]
-                amis_data_filtered.to_excel(writer, sheet_name=sheet_name, index=False)
-
-        # --- NAT Gateway ---
-        if "nat_gateway" in selected_resources:
-            print("  🌉 NAT Gateway 조회 중...")
-            nat_gateway_data_raw = nat_gateway_raw(session, region)
-            nat_gateway_data_filtered = nat_gateway_filtered(nat_gateway_data_raw)
-            region_raw_data["NAT_Gateway"] = nat_gateway_data_raw
-            if not nat_gateway_data_filtered.empty:
-                region_filtered_data["NAT_Gateway"] = nat_gateway_data_filtered.to_dict(
-                    "records"
-                )
-                sheet_name = f"NAT_{region}"[:31]
-                nat_gateway_data_filtered.to_excel(
-                    writer, sheet_name=sheet_name, index=False
-                )
-
-        # --- VPC Endpoints ---
-        if "vpc_endpoint" in selected_resources:
-            print("  🔌 VPC Endpoints 조회 중...")
-            vpc_endpoint_data_raw = vpc_endpoint_raw(session, region)
-            vpc_endpoint_data_filtered = vpc_endpoint_filtered(vpc_endpoint_data_raw)
-            region_raw_data["VPC_Endpoints"] = vpc_endpoint_data_raw
-            if not vpc_endpoint_data_filtered.empty:
-                region_filtered_data["VPC_Endpoints"] = (
-                    vpc_endpoint_data_filtered.to_dict("records")
-                )
-                sheet_name = f"VpcEP_{region}"[:31]
-                vpc_endpoint_data_filtered.to_excel(
-                    writer, sheet_name=sheet_name, index=False
-                )
-
-        # --- Kinesis Data Streams ---
-        if "kinesis_streams" in selected_resources:
-            print("  🌊 Kinesis Streams 조회 중...")
-            kinesis_streams_data_raw = kinesis_streams_raw(session, region)
-            kinesis_streams_data_filtered = kinesis_streams_filtered(
-                kinesis_streams_data_raw
+    # 필터링 프로세스 풀은 boto3 세션/스레드가 생기기 전에 만듭니다
+    filter_pool = FilterPool(args.filter_workers) if args.filter_workers > 1 else None
+    # 수집 중 예외가 발생해도 필터링 워커 프로세스가 남지 않도록 종료합니다
+    try:
+        all_raw_data = {}
+        store = ResultStore()  # 필터링된 데이터를 Arrow 테이블로 저장
+        excel_path = os.path.join(data_dir, f"aws_resources_{timestamp}.xlsx")
+        # --record/--replay 는 모든 세션(리전 프로세스 포함)에 카세트를 연결합니다
+        session_factory = create_session
+        if args.record or args.replay:
+            cassettes = CassetteLibrary(
+                args.record or args.replay,
+                "record" if args.record else "replay",
+                args.replay_latency,
             )
-            region_raw_data["KinesisStreams"] = kinesis_streams_data_raw
-            if not kinesis_streams_data_filtered.empty:
-                region_filtered_data["KinesisStreams"] = (
-                    kinesis_streams_data_filtered.to_dict("records")
-                )
-                sheet_name = f"KinesisStreams_{region}"[:31]
-                kinesis_streams_data_filtered.to_excel(
-                    writer, sheet_name=sheet_name, index=False
-                )
-
-        # --- Glue Job ---
-        if "glue_job" in selected_resources:
-            print("  🔧 Glue Jobs 조회 중...")
-            glue_job_data_raw = glue_job_raw(session, region)
-            glue_job_data_filtered = glue_job_filtered(glue_job_data_raw)
-            region_raw_data["GlueJob"] = glue_job_data_raw
-            if not glue_job_data_filtered.empty:
-                region_filtered_data["GlueJob"] = glue_job_data_filtered.to_dict(
-                    "records"
-                )
-                sheet_name = f"GlueJob_{region}"[:31]
-                glue_job_data_filtered.to_excel(
-                    writer, sheet_name=sheet_name, index=False
-                )
-
-        # --- Kinesis Data Firehose ---
-        if "kinesis_firehose" in selected_resources:
-            print("  🚒 Kinesis Firehose 조회 중...")
-            kinesis_firehose_data_raw = kinesis_firehose_raw(session, region)
-            kinesis_firehose_data_filtered = kinesis_firehose_filtered(
-                kinesis_firehose_data_raw
+            session_factory = cassettes.session_factory(create_session)
+            print(f"🎞️  카세트 {cassettes.mode}: {cassettes.directory}")
+        profiler = None
+        if args.profile_stages:
+            profiler = StageProfiler(args.profile_stages).start()
+            print(f"🔬 단계별 프로파일링 ({profiler.mode})")
+        account_id = get_account_id(session_factory(regions[0]))
+
+        # 리소스 수만 세는 모드 (--count-only)
+        if args.count_only:
+            tasks = build_tasks(selected_resources, regions)
+            print(f"🔢 리소스 수만 셉니다 (목록 조회 작업 {len(tasks)}개).")
+            runner = TaskRunner(
+                count_resource,
+                session_factory,
+                circuit_breaker=args.circuit_breaker,
+                task_timeout=args.task_timeout,
+                max_rps=args.max_rps,
+                hedge_budget=args.hedge_budget,
             )
-            region_raw_data["KinesisFirehose"] = kinesis_firehose_data_raw
-            if not kinesis_firehose_data_filtered.empty:
-                region_filtered_data["KinesisFirehose"] = (
-                    kinesis_firehose_data_filtered.to_dict("records")
-                )
-                sheet_name = f"KinesisFirehose_{region}"[:31]
-                kinesis_firehose_data_filtered.to_excel(
-                    writer, sheet_name=sheet_name, index=False
-                )
-
-        # --- Secrets Manager ---
-        if "secrets_manager" in selected_resources:
-            print("  🔐 Secrets Manager 조회 중...")
-            secrets_data_raw = secrets_raw(session, region)
-            secrets_data_filtered = secrets_filtered(secrets_data_raw)
-            region_raw_data["SecretsManager"] = secrets_data_raw
-            if not secrets_data_filtered.empty:
-                region_filtered_data["SecretsManager"] = secrets_data_filtered.to_dict(
-                    "records"
-                )
-                sheet_name = f"Secrets_{region}"[:31]
-                secrets_data_filtered.to_excel(
-                    writer, sheet_name=sheet_name, index=False
-                )
-
-        # --- Elastic IP ---
-        if "eip" in selected_resources:
-            print("  🌐 Elastic IP 조회 중...")
-            eip_data_raw = eip_raw(session, region)
-            eip_data_filtered = eip_filtered(eip_data_raw)
-            region_raw_data["EIP"] = eip_data_raw
-            if not eip_data_filtered.empty:
-                region_filtered_data["EIP"] = eip_data_filtered.to_dict("records")
-                sheet_name = f"EIP_{region}"[:31]
-                eip_data_filtered.to_excel(writer, sheet_name=sheet_name, index=False)
-
-        # --- Internet Gateway ---
-        if "internet_gateway" in selected_resources:
-            print("  🌍 Internet Gateway 조회 중...")
-            internet_gateway_data_raw = internet_gateway_raw(session, region)
-            internet_gateway_data_filtered = internet_gateway_filtered(
-                internet_gateway_data_raw
+            timings = TaskTimings(os.path.join(data_dir, TASK_TIMINGS_NAME), account_id)
+            counts, failures, skipped = count_only(
+                tasks,
+                runner,
+                regions,
+                workers=args.workers,
+                deadline=args.deadline,
+                timings=timings,
             )
-            region_raw_data["InternetGateway"] = internet_gateway_data_raw
-            if not internet_gateway_data_filtered.empty:
-                region_filtered_data["InternetGateway"] = (
-                    internet_gateway_data_filtered.to_dict("records")
-                )
-                sheet_name = f"IGW_{region}"[:31]
-                internet_gateway_data_filtered.to_excel(
-                    writer, sheet_name=sheet_name, index=False
-                )
-
-        # --- Security Groups ---
-        if "security_groups" in selected_resources:
-            print("  🛡️  Security Groups 조회 중...")
-            security_groups_data_raw = security_groups_raw(session, region)
-            security_groups_data_filtered = security_groups_filtered(
-                security_groups_data_raw
+            timings.save()
+            if runner.hedger is not None:
+                runner.hedger.shutdown()
+            counts_path = os.path.join(
+                data_dir, f"aws_resources_counts_{timestamp}.json"
             )
-            region_raw_data["SecurityGroups"] = security_groups_data_raw
-            if not security_groups_data_filtered.empty:
-                region_filtered_data["SecurityGroups"] = (
-                    security_groups_data_filtered.to_dict("records")
-                )
-                sheet_name = f"SG_{region}"[:31]
-                security_groups_data_filtered.to_excel(
-                    writer, sheet_name=sheet_name, index=False
-                )
+            write_counts(
+                counts_path,
+                run_id=timestamp,
+                account_id=account_id,
+                regions=regions,
+                counts=counts,
+                failures=failure_rows(failures),
+            )
+            print("\n✅ AWS 리소스 수 조회 완료!")
+            print_counts(counts)
+            print(f"📄 Counts 파일 생성 완료: {counts_path}")
+            if failures:
+                print(f"\n⚠️  실패하거나 중단된 작업: {len(failures)}개")
+                for failure in failures:
+                    print(
+                        f"  - {failure.resource} [{failure.region}] {failure.status}: "
+                        f"{failure.error_code} - {failure.message}"
+                    )
+            if skipped:
+                print(f"\n⏭️  --deadline 으로 건너뛴 작업: {len(skipped)}개")
+            return
+
+        if (
+            base_info is not None
+            and base_info["account_id"]
+            and account_id
+            and base_info["account_id"] != account_id
+        ):
+            parser.error(
+                f"체크포인트의 계정({base_info['account_id']})과 현재 자격 증명의 "
+                f"계정({account_id})이 다릅니다."
+            )
+        if run_info is None:
+            checkpoint.start(
+                started_at,
+                account_id,
+                regions,
+                args.selected_resources,
+                args.raw,
+                {key: sorted(columns) for key, columns in column_selection.items()}
+                or None,
+                args.tags,
+            )
+        exporter = ExcelExporter(
+            excel_path,
+            {spec.result_key: spec.sheet_prefix for spec in RESOURCE_SPECS},
+            layout=args.excel_layout,
+            account_id=account_id,
+            max_rows=args.excel_max_rows,
+        )
 
-        # --- ECR ---
-        if "ecr" in selected_resources:
-            print("  📦 ECR 조회 중...")
-            ecr_data_raw = ecr_raw(session, region)
-            ecr_data_filtered = ecr_filtered(ecr_data_raw)
-            region_raw_data["ECR"] = ecr_data_raw
-            if not ecr_data_filtered.empty:
-                region_filtered_data["ECR"] = ecr_data_filtered.to_dict("records")
-                sheet_name = f"ECR_{region}"[:31]
-                ecr_data_filtered.to_excel(writer, sheet_name=sheet_name, index=False)
-
-        # --- Security Group Rules ---
-        if "security_group_rules" in selected_resources:
-            print("  📋 Security Group Rules 조회 중...")
-            security_group_rules_data_raw = security_group_rules_raw(session, region)
-            security_group_rules_data_filtered = security_group_rules_filtered(
-                security_group_rules_data_raw
+        tasks = build_tasks(selected_resources, regions)
+        # 리전(및 글로벌) 단위로 모든 작업이 끝나면 등록 순서대로 저장/기록합니다
+        scopes = [*regions, GLOBAL_SCOPE]
+        results: dict[str, dict[str, tuple]] = {scope: {} for scope in scopes}
+        # 이어서 실행할 때는 체크포인트에 결과가 있는 작업을 불러오고 나머지만 실행합니다
+        changes = None
+        if base_run is not None:
+            changes = find_changes(
+                tasks,
+                base_run,
+                datetime.fromisoformat(base_info["started_at"]),
+                session_factory=session_factory,
+                events_file=args.events_file,
             )
-            region_raw_data["SecurityGroupRules"] = security_group_rules_data_raw
-            if not security_group_rules_data_filtered.empty:
-                region_filtered_data["SecurityGroupRules"] = (
-                    security_group_rules_data_filtered.to_dict("records")
+            for region, error in changes.failed_regions.items():
+                print(
+                    f"  ⚠️  [{region}] CloudTrail 이벤트 조회 실패 (전체 다시 수집): {error}"
                 )
-                sheet_name = f"SGRules_{region}"[:31]
-                security_group_rules_data_filtered.to_excel(
-                    writer, sheet_name=sheet_name, index=False
+        resumed: list[CollectionTask] = []
+        pending_tasks: list[CollectionTask] = []
+        for task in tasks:
+            if run_info is not None and checkpoint.has_task(task.scope, task.spec.key):
+                results[task.scope][task.spec.key] = checkpoint.load_task(
+                    task.scope, task.spec.key
                 )
+                resumed.append(task)
+            elif changes is not None and not changes.changed(task):
+                # 바뀌지 않은 작업은 이전 테이블을 그대로 쓰고, 다음 갱신의 기준이 되도록
+                # 이번 실행의 체크포인트에도 기록합니다
+                table = base_run.load_table(task.scope, task.spec.key)
+                results[task.scope][task.spec.key] = (None, table)
+                checkpoint.save_task(task.scope, task.spec.key, None, table)
+                resumed.append(task)
+            else:
+                pending_tasks.append(task)
+        if run_info is not None:
+            print(
+                f"📦 체크포인트에서 {len(resumed)}개 작업을 불러왔습니다. "
+                f"남은 작업: {len(pending_tasks)}개"
+            )
+        if changes is not None:
+            patched = sum(changes.keys(task) is not None for task in pending_tasks)
+            print(
+                f"📜 CloudTrail 쓰기 이벤트 {changes.events}개: 바뀌지 않은 작업 "
+                f"{len(resumed)}개는 이전 결과를 사용하고, {patched}개는 바뀐 리소스만 "
+                f"ID로, {len(pending_tasks) - patched}개는 전체를 다시 수집합니다."
+            )
 
-        # --- Auto Scaling Groups ---
-        if "auto_scaling_groups" in selected_resources:
-            print("  📈 Auto Scaling Groups 조회 중...")
-            auto_scaling_groups_data_raw = auto_scaling_groups_raw(session, region)
-            auto_scaling_groups_data_filtered = auto_scaling_groups_filtered(
-                auto_scaling_groups_data_raw
+        timings = TaskTimings(os.path.join(data_dir, TASK_TIMINGS_NAME), account_id)
+        if args.api_budget is not None:
+            execution_plan = build_plan(
+                {account_id or "default": timings},
+                pending_tasks,
+                workers=args.workers,
+                columns=column_selection,
+                max_rps=args.max_rps,
+                # 태그는 체크포인트에서 불러온 작업에도 붙이고, 이벤트 조회는 이미 실행했습니다
+                tag_tasks=tasks if args.tags else None,
+                lookups=changes.lookups if changes is not None else None,
             )
-            region_raw_data["AutoScalingGroups"] = auto_scaling_groups_data_raw
-            if not auto_scaling_groups_data_filtered.empty:
-                region_filtered_data["AutoScalingGroups"] = (
-                    auto_scaling_groups_data_filtered.to_dict("records")
-                )
-                sheet_name = f"ASG_{region}"[:31]
-                auto_scaling_groups_data_filtered.to_excel(
-                    writer, sheet_name=sheet_name, index=False
+            if execution_plan.total_calls > args.api_budget:
+                print_plan(execution_plan)
+                print(
+                    f"❌ 예상 API 호출 {execution_plan.total_calls}회가 "
+                    f"--api-budget {args.api_budget}회를 넘어 수집하지 않습니다.",
+                    file=sys.stderr,
                 )
+                sys.exit(1)
+            print(
+                f"💰 예상 API 호출 {execution_plan.total_calls}회 "
+                f"(--api-budget {args.api_budget}회)"
+            )
+        # --columns/--tags 는 작업마다 collect_resource()에 전달합니다 (리전 프로세스 포함)
+        collect = (
+            functools.partial(
+                collect_resource, columns=column_selection, tags=args.tags
+            )
+            if column_selection or args.tags
+            else collect_resource
+        )
+        if changes is not None:
+            collect = IncrementalCollector(collect, base_run, changes, column_selection)
+        runner = TaskRunner(
+            collect,
+            session_factory,
+            circuit_breaker=args.circuit_breaker,
+            task_timeout=args.task_timeout,
+            raw_mode=args.raw,
+            filter_pool=filter_pool,
+            max_rps=args.max_rps,
+            hedge_budget=args.hedge_budget,
+        )
+        if args.region_processes > 1:
+            # 리전(및 글로벌) 단위로 워커 프로세스에 나누어 수집/필터링합니다
+            scheduler = RegionShardScheduler(
+                pending_tasks,
+                runner,
+                args.region_processes,
+                workers=args.workers,
+                deadline=args.deadline,
+                timings=timings,
+            )
+            print(
+                f"🧩 리전을 워커 프로세스 {len(scheduler.shards)}개에 나누어 수집합니다: "
+                + " | ".join(", ".join(shard) for shard in scheduler.shards)
+            )
+        else:
+            runner.prepare(pending_tasks)
+            scheduler = DeadlineScheduler(
+                pending_tasks,
+                runner,
+                workers=args.workers,
+                deadline=args.deadline,
+                # ID로 갱신한 작업의 소요 시간은 전체 수집의 예상 시간으로 쓰지 않습니다
+                timings=timings if changes is None else None,
+            )
+        if args.workers > 1 or args.deadline is not None:
+            print(
+                f"🗓️  작업 {len(pending_tasks)}개를 예상 소요 시간이 긴 순서로 실행합니다."
+            )
 
-        # --- SES Identity (Email) ---
-        if "ses_identity" in selected_resources:
-            print("  📧 SES Identity 조회 중...")
-            ses_identity_data_raw = ses_identity_raw(session, region)
-            ses_identity_data_filtered = ses_identity_filtered(ses_identity_data_raw)
-            region_raw_data["SESIdentity"] = ses_identity_data_raw
-            if not ses_identity_data_filtered.empty:
-                region_filtered_data["SESIdentity"] = (
-                    ses_identity_data_filtered.to_dict("records")
-                )
-                sheet_name = f"SESIdentity_{region}"[:31]
-                ses_identity_data_filtered.to_excel(
-                    writer, sheet_name=sheet_name, index=False
-                )
+        # 태그는 수집과 함께 리전마다 한 번에 조회하고, 리전 결과를 저장할 때 붙입니다
+        tag_enricher = None
+        if args.tags:
+            tag_enricher = TagEnricher(
+                session_factory,
+                regions,
+                [spec for spec in RESOURCE_SPECS if spec.key in selected_resources],
+            )
+            print(
+                f"🏷️  Resource Groups Tagging API로 태그를 조회합니다 "
+                f"(리소스 유형 {len(tag_enricher.resource_types)}개)."
+            )
 
-        all_raw_data[region] = region_raw_data
-        all_filtered_data[region] = region_filtered_data
-
-    # --- S3 Buckets (Global) ---
-    if "s3" in selected_resources:
-        print("\n🪣 S3 Buckets (글로벌) 조회 중...")
-        s3_session = boto3.Session(region_name="us-east-1")
-        s3_data_raw = s3_raw(s3_session)
-        s3_data_filtered = s3_filtered(s3_data_raw)
-        all_raw_data["S3"] = s3_data_raw
-        if not s3_data_filtered.empty:
-            all_filtered_data["S3"] = s3_data_filtered.to_dict("records")
-            s3_data_filtered.to_excel(writer, sheet_name="S3", index=False)
-
-    # --- Global Accelerator (Global) ---
-    if "global_accelerator" in selected_resources:
-        print("\n🚀 Global Accelerator (글로벌) 조회 중...")
-        ga_session = boto3.Session(region_name="us-west-2")
-        ga_data_raw = ga_raw(ga_session, "us-west-2")
-        ga_data_filtered = ga_filtered(ga_data_raw)
-        all_raw_data["GlobalAccelerator"] = ga_data_raw
-        if not ga_data_filtered.empty:
-            all_filtered_data["GlobalAccelerator"] = ga_data_filtered.to_dict("records")
-            ga_data_filtered.to_excel(
-                writer, sheet_name="GlobalAccelerator", index=False
+        for region in regions:
+            store.add_region(region)
+        remaining = Counter(task.scope for task in pending_tasks)
+        next_scope = 0
+
+        def flush_finished_scopes() -> None:
+            nonlocal next_scope
+            while next_scope < len(scopes) and remaining[scopes[next_scope]] <= 0:
+                scope = scopes[next_scope]
+                for spec in RESOURCE_SPECS:
+                    if spec.key not in results[scope]:
+                        continue
+                    data_raw, table = results[scope].pop(spec.key)
+                    if tag_enricher is not None:
+                        table = tag_enricher.join(spec, scope, table)
+                    if scope == GLOBAL_SCOPE:
+                        all_raw_data[spec.result_key] = data_raw
+                    else:
+                        all_raw_data.setdefault(scope, {})[spec.result_key] = data_raw
+                    store.put(scope, spec.result_key, table)
+                if scope != GLOBAL_SCOPE:
+                    all_raw_data.setdefault(scope, {})
+                exporter.write_region(store, scope)
+                next_scope += 1
+
+        # 작업 하나의 실패는 기록만 하고 나머지 결과는 그대로 저장/출력합니다.
+        # 성공한 작업은 끝나는 즉시 체크포인트에 기록해 --resume 에서 다시 실행하지 않습니다.
+        failures: list[TaskFailure] = []
+        collected = list(resumed)
+        flush_finished_scopes()
+        for task, future in scheduler.run():
+            if future is not None:
+                try:
+                    data_raw, data_filtered = future.result()
+                    with profile_stage("arrow", task.spec.result_key, task.scope):
+                        table = resolve_filtered(data_filtered)
+                except Exception as e:
+                    failure = failure_from_exception(
+                        task.spec.result_key,
+                        task.spec.key,
+                        task.scope,
+                        e,
+                        task.duration,
+                    )
+                    print(
+                        f"  ❌ {task.spec.result_key} [{task.scope}] 실패: "
+                        f"{failure.error_code} ({failure.status})"
+                    )
+                    failures.append(failure)
+                else:
+                    results[task.scope][task.spec.key] = (data_raw, table)
+                    collected.append(task)
+                    timings.record_rows(task.scope, task.spec.key, table.num_rows)
+                    try:
+                        with profile_stage(
+                            "checkpoint", task.spec.result_key, task.scope
+                        ):
+                            checkpoint.save_task(
+                                task.scope,
+                                task.spec.key,
+                                data_raw,
+                                table,
+                                cls=DateTimeEncoder,
+                            )
+                    except (OSError, TypeError, ValueError) as e:
+                        print(
+                            f"  ⚠️  {task.spec.result_key} [{task.scope}] "
+                            f"체크포인트 기록 실패: {e}"
+                        )
+            remaining[task.scope] -= 1
+            flush_finished_scopes()
+        timings.save()
+        if tag_enricher is not None:
+            tag_enricher.shutdown()
+
+        if args.history:
+            record_history(
+                os.path.join(data_dir, HISTORY_DB_NAME),
+                store,
+                collected,
+                started_at,
+                account_id,
             )
+    finally:
+        if filter_pool is not None:
+            filter_pool.shutdown()
+    if runner.hedger is not None:
+        runner.hedger.shutdown()
+        print(
+            f"🪁 중복 요청: {runner.hedger.hedged}회 / 읽기 호출 {runner.hedger.calls}회 "
+            f"(먼저 도착 {runner.hedger.wins}회, 예산/요청 제한으로 생략 {runner.hedger.skipped}회)"
+        )
 
-    # --- Route53 HostedZone (global) ---
-    if "route53" in selected_resources:
-        print("\n🌐 Route53 HostedZones (글로벌) 조회 중...")
-        route53_session = boto3.Session()  # 글로벌 서비스
-        route53_data_raw = route53_raw(route53_session, None)
-        route53_data_filtered = route53_filtered(route53_data_raw)
-        all_raw_data["Route53"] = route53_data_raw
-        if not route53_data_filtered.empty:
-            all_filtered_data["Route53"] = route53_data_filtered.to_dict("records")
-            sheet_name = "Route53"
-            route53_data_filtered.to_excel(writer, sheet_name=sheet_name, index=False)
-
-    writer.close()
+    exporter.write_errors(failure_rows(failures))
+    with profile_stage("excel_save"):
+        exporter.close()
     print(f"\n📊 Excel 파일 생성 완료: {excel_path}")
 
-    # Raw 데이터 JSON 파일로 저장
-    json_raw_path = os.path.join(data_dir, f"aws_resources_raw_{timestamp}.json")
-    with open(json_raw_path, "w", encoding="utf-8") as f:
-        json.dump(all_raw_data, f, ensure_ascii=False, indent=2, cls=DateTimeEncoder)
-    print(f"📄 Raw JSON 파일 생성 완료: {json_raw_path}")
+    outputs = {"excel": excel_path}
+    outputs.update(
+        write_json_outputs(data_dir, timestamp, all_raw_data, store, args.raw)
+    )
 
-    # Filtered 데이터 JSON 파일로 저장
-    json_filtered_path = os.path.join(
-        data_dir, f"aws_resources_filtered_{timestamp}.json"
+    # 단계별 CPU/메모리 프로파일 (--profile-stages)
+    if profiler is not None:
+        profiler.stop()
+        profile_path = os.path.join(data_dir, f"aws_resources_profile_{timestamp}.json")
+        print("\n🔬 단계별 프로파일:")
+        print_report(profiler.write(profile_path))
+        outputs["profile"] = profile_path
+        print(f"📄 Profile 파일 생성 완료: {profile_path}")
+
+    # 실행 결과 요약 (실패/중단/건너뛴 작업, 출력 파일)
+    manifest_path = os.path.join(data_dir, f"aws_resources_manifest_{timestamp}.json")
+    write_manifest(
+        manifest_path,
+        run_id=timestamp,
+        started_at=started_at,
+        finished_at=datetime.now(timezone.utc),
+        account_id=account_id,
+        regions=regions,
+        resources=sorted(selected_resources),
+        total_tasks=len(tasks),
+        resumed_tasks=len(resumed),
+        failures=failures,
+        skipped=[
+            {
+                "resource": task.spec.key,
+                "region": task.scope,
+                "expected_seconds": round(task.expected, 3),
+                "reason": "deadline",
+            }
+            for task in scheduler.skipped
+        ],
+        outputs=outputs,
     )
-    with open(json_filtered_path, "w", encoding="utf-8") as f:
-        json.dump(
-            all_filtered_data, f, ensure_ascii=False, indent=2, cls=DateTimeEncoder
+    print(f"📄 Manifest 파일 생성 완료: {manifest_path}")
+
+    # 실행마다 인벤토리 전체가 체크포인트로 남으므로 오래된 실행을 정리합니다
+    pruned = prune_runs(data_dir, args.keep_runs, current=timestamp)
+    if pruned:
+        print(
+            f"🧹 오래된 체크포인트 {len(pruned)}개 삭제 (--keep-runs {args.keep_runs})"
         )
-    print(f"📄 Filtered JSON 파일 생성 완료: {json_filtered_path}")
 
     # 요약 정보 출력
     print("\n✅ AWS 리소스 조회 완료!")
@@ -684,27 +2046,44 @@ def main():
 
     # 각 리전별 조회된 리소스 수 계산
     total_resources = 0
-    for region, region_data in all_filtered_data.items():
-        if region not in ["S3", "GlobalAccelerator", "Route53"]:  # 글로벌 리소스 제외
-            resource_count = sum(len(resources) for resources in region_data.values())
-            if resource_count > 0:
-                print(f"  📍 {region}: {resource_count}개 리소스")
-                total_resources += resource_count
+    for region in store.regions():  # 글로벌 리소스 제외
+        resource_count = store.count(region)
+        if resource_count > 0:
+            print(f"  📍 {region}: {resource_count}개 리소스")
+            total_resources += resource_count
 
     # 글로벌 리소스 수 계산
     global_resources = 0
-    for global_service in ["S3", "GlobalAccelerator", "Route53"]:
-        if global_service in all_filtered_data:
-            count = len(all_filtered_data[global_service])
-            if count > 0:
-                print(f"  🌐 {global_service}: {count}개 리소스")
-                global_resources += count
+    for global_service, table in store.items(GLOBAL_SCOPE):
+        print(f"  🌐 {global_service}: {table.num_rows}개 리소스")
+        global_resources += table.num_rows
 
     print(f"📊 총 조회된 리소스: {total_resources + global_resources}개")
 
+    if failures:
+        print(
+            f"\n⚠️  실패하거나 중단된 작업: {len(failures)}개 (Errors 시트/Manifest 참고)"
+        )
+        for failure in failures:
+            print(
+                f"  - {failure.resource} [{failure.region}] {failure.status}: "
+                f"{failure.error_code} - {failure.message}"
+            )
+
+    if scheduler.skipped:
+        print(f"\n⏭️  --deadline 으로 건너뛴 작업: {len(scheduler.skipped)}개")
+        for task in scheduler.skipped:
+            print(f"  - {task.spec.key} [{task.scope}] (예상 {task.expected:.1f}초)")
+
+    if failures or scheduler.skipped:
+        print(
+            "\n🔁 실패하거나 건너뛴 작업만 다시 실행하려면: "
+            f"python listup_aws_resources.py --resume {timestamp}"
+        )
+
     # Security Groups만 선택된 경우 상세 보안 분석 출력
     if selected_resources == {"security_groups"}:
-        print_security_groups_analysis(all_filtered_data)
+        print_security_groups_analysis(store)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,384 @@
+"""
+AWS resource modules and their registry.
+
+Every module in this package exposes ``get_raw_data(session, region)``,
+``get_filtered_data(raw_data)``, a ``COLUMN_SCHEMA`` for the filtered frame and
+a ``RAW_PROJECTION`` of the raw fields kept with ``--raw projected`` and
+``COUNT_QUERIES``, the cheapest listing calls that count it for
+``--count-only``. Modules that make a call per listed resource also declare
+``DETAIL_CALLS`` for the ``plan`` estimate, and ``TAG_SOURCE`` tells ``--tags`` how to join
+Resource Groups Tagging API results onto its table. ``TRAIL_SOURCE`` maps
+CloudTrail management events to the resources ``--incremental`` refreshes;
+modules that can re-describe resources by ID also expose
+``get_raw_data_by_ids(session, region, ids)``. ``RESOURCE_SPECS`` describes how the main script collects
+and exports each one.
+"""
+
+import importlib
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Any
+
+
+@dataclass(frozen=True)
+class CountQuery:
+    """
+    --count-only 에서 리소스 수를 세는 목록 조회 호출 하나입니다.
+    상세 조회 없이 가장 큰 페이지 크기로 목록만 조회합니다.
+
+    Attributes:
+        service: boto3 클라이언트 서비스 이름 (예: "dynamodb")
+        operation: 목록 조회 메서드 이름 (예: "list_tables")
+        expression: 한 페이지의 응답에서 리소스 목록을 가리키는 JMESPath
+        params: 호출에 항상 전달할 인자 (예: {"OwnerIds": ["self"]})
+        page_size: 한 페이지에 요청할 최대 항목 수 (None이면 서비스 기본값)
+        pagination: botocore에 페이지네이터가 없는 작업의 페이지네이터 설정
+    """
+
+    service: str
+    operation: str
+    expression: str
+    params: dict[str, Any] = field(default_factory=dict)
+    page_size: int | None = None
+    pagination: dict[str, Any] | None = None
+
+
+@dataclass(frozen=True)
+class DetailCall:
+    """
+    목록 조회 뒤에 추가로 하는 상세 조회 호출 하나입니다 (plan 의 호출 수 추정에 사용).
+
+    Attributes:
+        service: boto3 클라이언트 서비스 이름 (예: "dynamodb")
+        operation: 호출하는 메서드 이름 (예: "describe_table")
+        per_resource: 목록의 리소스마다 호출하면 True, 작업마다 한 번 호출하면 False
+    """
+
+    service: str
+    operation: str
+    per_resource: bool = True
+
+
+# ARN의 마지막 경로(/ 또는 :) 요소 (예: ...:instance/i-0123 -> i-0123)
+ARN_LAST_SEGMENT = r"[:/]([^:/]+)$"
+
+
+@dataclass(frozen=True)
+class TagSource:
+    """
+    --tags 에서 Resource Groups Tagging API의 ARN을 리소스 테이블의 행과 연결하는 방법입니다.
+
+    Attributes:
+        resource_type: ResourceTypeFilters 값 (예: "ec2:instance", "s3")
+        id_pattern: ARN에서 id_column 값을 추출하는 정규식 (그룹 1). None이면 ARN 전체
+        id_prefix: 추출한 값 앞에 붙일 문자열 (예: Route53 "/hostedzone/")
+    """
+
+    resource_type: str
+    id_pattern: str | None = ARN_LAST_SEGMENT
+    id_prefix: str = ""
+
+
+@dataclass(frozen=True)
+class TrailSource:
+    """
+    --incremental 에서 CloudTrail 관리 이벤트를 이 리소스의 변경으로 연결하는 방법입니다.
+
+    Attributes:
+        event_source: 이벤트 소스 (예: "ec2.amazonaws.com")
+        id_events: {이벤트 이름: 이벤트 레코드에서 변경된 리소스 키를 찾는 JMESPath}
+        task_events: 리소스 키를 알 수 없어 작업 전체를 다시 수집하는 이벤트 이름
+        resource_type: 이벤트의 Resources 항목 중 이 리소스의 유형 (예: "AWS::EC2::Instance")
+        id_prefix: 이 리소스의 키로 볼 ID 접두어 (예: CreateTags의 "i-")
+        key_column: 키와 비교할 컬럼 (None이면 spec.id_column)
+    """
+
+    event_source: str
+    id_events: dict[str, str] = field(default_factory=dict)
+    task_events: tuple[str, ...] = ()
+    resource_type: str | None = None
+    id_prefix: str = ""
+    key_column: str | None = None
+
+
+@dataclass(frozen=True)
+class ResourceSpec:
+    """
+    리소스 하나를 수집/저장하는 방법을 정의합니다.
+
+    Attributes:
+        key: CLI에서 사용하는 리소스 이름 (예: "ec2")
+        module_name: resources 패키지 내 모듈 이름
+        result_key: 결과 JSON에서 사용하는 키 (예: "EC2")
+        sheet_prefix: Excel 시트 이름 접두어
+        description: --list-resources 에 표시할 설명
+        label: 조회 중 출력할 진행 메시지
+        is_global: 글로벌 리소스 여부 (리전 루프 밖에서 한 번만 조회)
+        global_region: 글로벌 리소스 조회 시 사용할 리전
+        id_column: 필터링된 데이터에서 리소스를 식별하는 컬럼
+        low_priority: --deadline 으로 시간이 부족할 때 뒤로 미루거나 건너뛸 수 있는 리소스
+    """
+
+    key: str
+    module_name: str
+    result_key: str
+    sheet_prefix: str
+    description: str
+    label: str
+    is_global: bool = False
+    global_region: str | None = None
+    id_column: str | None = None
+    low_priority: bool = False
+
+    @property
+    def module(self) -> ModuleType:
+        return importlib.import_module(f"resources.{self.module_name}")
+
+
+RESOURCE_SPECS = [
+    ResourceSpec(
+        "ec2", "ec2", "EC2", "EC2", "EC2 인스턴스", "🖥️  EC2", id_column="InstanceId"
+    ),
+    ResourceSpec(
+        "vpc",
+        "vpc",
+        "VPC",
+        "VPC",
+        "VPC (Virtual Private Cloud)",
+        "🌐 VPC",
+        id_column="VpcId",
+    ),
+    ResourceSpec(
+        "rds",
+        "rds",
+        "RDS",
+        "RDS",
+        "RDS 데이터베이스",
+        "🗄️  RDS",
+        id_column="DBInstanceIdentifier",
+    ),
+    ResourceSpec(
+        "eks", "eks", "EKS", "EKS", "EKS 클러스터", "☸️  EKS", id_column="Name"
+    ),
+    ResourceSpec(
+        "subnets",
+        "subnets",
+        "Subnets",
+        "Subnets",
+        "서브넷",
+        "🔗 Subnets",
+        id_column="SubnetId",
+    ),
+    ResourceSpec(
+        "dynamodb",
+        "dynamodb",
+        "DynamoDB",
+        "DynamoDB",
+        "DynamoDB 테이블",
+        "📊 DynamoDB",
+        id_column="TableName",
+    ),
+    ResourceSpec(
+        "elb",
+        "elb",
+        "ELB",
+        "ELB",
+        "ELB 로드밸런서",
+        "⚖️  ELB",
+        id_column="LoadBalancerName",
+    ),
+    ResourceSpec(
+        "elasticache",
+        "elasticache",
+        "ElastiCache",
+        "ElastiCache",
+        "ElastiCache",
+        "🚀 ElastiCache",
+        id_column="CacheClusterId",
+    ),
+    ResourceSpec(
+        "ebs",
+        "ebs",
+        "EBS_Volumes",
+        "EBS_Volumes",
+        "EBS 볼륨",
+        "💾 EBS Volumes",
+        id_column="VolumeId",
+    ),
+    ResourceSpec(
+        "ebs_snapshot",
+        "ebs_snapshot",
+        "EBS_Snapshot",
+        "EBS_Snapshot",
+        "EBS 스냅샷",
+        "📸 EBS Snapshots",
+        id_column="SnapshotId",
+        low_priority=True,
+    ),
+    ResourceSpec(
+        "amis",
+        "amis",
+        "AMIs",
+        "AMIs",
+        "AMI 이미지",
+        "🖼️  AMIs",
+        id_column="ImageId",
+        low_priority=True,
+    ),
+    ResourceSpec(
+        "nat_gateway",
+        "nat_gateway",
+        "NAT_Gateway",
+        "NAT",
+        "NAT 게이트웨이",
+        "🌉 NAT Gateway",
+        id_column="NatGatewayId",
+    ),
+    ResourceSpec(
+        "vpc_endpoint",
+        "vpc_endpoint",
+        "VPC_Endpoints",
+        "VpcEP",
+        "VPC 엔드포인트",
+        "🔌 VPC Endpoints",
+        id_column="VpcEndpointId",
+    ),
+    ResourceSpec(
+        "kinesis_streams",
+        "kinesis_streams",
+        "KinesisStreams",
+        "KinesisStreams",
+        "Kinesis Data Streams",
+        "🌊 Kinesis Streams",
+        id_column="StreamName",
+    ),
+    ResourceSpec(
+        "glue_job",
+        "glue_job",
+        "GlueJob",
+        "GlueJob",
+        "Glue 작업",
+        "🔧 Glue Jobs",
+        id_column="JobName",
+        low_priority=True,
+    ),
+    ResourceSpec(
+        "kinesis_firehose",
+        "kinesis_firehose",
+        "KinesisFirehose",
+        "KinesisFirehose",
+        "Kinesis Data Firehose",
+        "🚒 Kinesis Firehose",
+        id_column="DeliveryStreamName",
+    ),
+    ResourceSpec(
+        "secrets_manager",
+        "secrets_manager",
+        "SecretsManager",
+        "Secrets",
+        "Secrets Manager",
+        "🔐 Secrets Manager",
+        id_column="ARN",
+    ),
+    ResourceSpec(
+        "eip",
+        "eip",
+        "EIP",
+        "EIP",
+        "Elastic IP",
+        "🌐 Elastic IP",
+        id_column="AllocationId",
+    ),
+    ResourceSpec(
+        "internet_gateway",
+        "internet_gateway",
+        "InternetGateway",
+        "IGW",
+        "인터넷 게이트웨이",
+        "🌍 Internet Gateway",
+        id_column="InternetGatewayId",
+    ),
+    ResourceSpec(
+        "security_groups",
+        "security_groups",
+        "SecurityGroups",
+        "SG",
+        "보안 그룹",
+        "🛡️  Security Groups",
+        id_column="SecurityGroupId",
+    ),
+    ResourceSpec(
+        "ecr",
+        "ecr",
+        "ECR",
+        "ECR",
+        "ECR 레지스트리",
+        "📦 ECR",
+        id_column="RepositoryArn",
+    ),
+    ResourceSpec(
+        "security_group_rules",
+        "security_group_rules",
+        "SecurityGroupRules",
+        "SGRules",
+        "보안 그룹 규칙",
+        "📋 Security Group Rules",
+        id_column="SecurityGroupRuleId",
+    ),
+    ResourceSpec(
+        "auto_scaling_groups",
+        "auto_scaling_groups",
+        "AutoScalingGroups",
+        "ASG",
+        "Auto Scaling 그룹",
+        "📈 Auto Scaling Groups",
+        id_column="AutoScalingGroupName",
+    ),
+    ResourceSpec(
+        "ses_identity",
+        "ses_identity",
+        "SESIdentity",
+        "SESIdentity",
+        "SES Identity",
+        "📧 SES Identity",
+        id_column="Identity",
+        low_priority=True,
+    ),
+    ResourceSpec(
+        "s3",
+        "s3_buckets",
+        "S3",
+        "S3",
+        "S3 버킷 (글로벌)",
+        "🪣 S3 Buckets (글로벌)",
+        is_global=True,
+        global_region="us-east-1",
+        id_column="BucketName",
+    ),
+    ResourceSpec(
+        "global_accelerator",
+        "global_accelerator",
+        "GlobalAccelerator",
+        "GlobalAccelerator",
+        "Global Accelerator (글로벌)",
+        "🚀 Global Accelerator (글로벌)",
+        is_global=True,
+        global_region="us-west-2",
+        id_column="AcceleratorArn",
+    ),
+    ResourceSpec(
+        "route53",
+        "route53_hostedzone",
+        "Route53",
+        "Route53",
+        "Route53 호스팅 영역 (글로벌)",
+        "🌐 Route53 HostedZones (글로벌)",
+        is_global=True,
+        id_column="Id",
+    ),
+]
+
+RESOURCE_SPECS_BY_KEY = {spec.key: spec for spec in RESOURCE_SPECS}
+RESOURCE_SPECS_BY_RESULT_KEY = {spec.result_key: spec for spec in RESOURCE_SPECS}
+REGIONAL_RESOURCE_SPECS = [spec for spec in RESOURCE_SPECS if not spec.is_global]
+GLOBAL_RESOURCE_SPECS = [spec for spec in RESOURCE_SPECS if spec.is_global]
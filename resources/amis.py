@@ -2,6 +2,38 @@ from datetime import datetime
 
 import pandas as pd
 
+from resources import CountQuery, TagSource, TrailSource
+
+COLUMN_SCHEMA = {
+    "Name": "string",
+    "ImageId": "string",
+    "CreationDate": "date",
+    "State": "category",
+    "Public": "bool",
+}
+
+RAW_PROJECTION = {"Images": ["ImageId", "Name", "CreationDate", "State", "Public"]}
+
+COUNT_QUERIES = (
+    CountQuery(
+        "ec2", "describe_images", "Images", {"Owners": ["self"]}, page_size=1000
+    ),
+)
+
+TAG_SOURCE = TagSource("ec2:image")
+
+TRAIL_SOURCE = TrailSource(
+    "ec2.amazonaws.com",
+    id_events={
+        "CreateImage": "responseElements.imageId",
+        "RegisterImage": "responseElements.imageId",
+        "CopyImage": "responseElements.imageId",
+        "DeregisterImage": "requestParameters.imageId",
+        "ModifyImageAttribute": "requestParameters.imageId",
+    },
+    id_prefix="ami-",
+)
+
 
 def get_raw_data(session, region):
     """
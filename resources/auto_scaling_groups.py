@@ -1,6 +1,53 @@
 import pandas as pd
 from botocore.exceptions import ClientError
 
+from resources import CountQuery, TagSource, TrailSource
+
+COLUMN_SCHEMA = {
+    "AutoScalingGroupName": "string",
+    "LaunchConfigurationName": "string",
+    "MinSize": "int",
+    "MaxSize": "int",
+    "DesiredCapacity": "int",
+    "AvailabilityZones": "category",
+    "HealthCheckType": "category",
+    "CreatedTime": "datetime",
+}
+
+RAW_PROJECTION = [
+    "AutoScalingGroupName",
+    "LaunchConfigurationName",
+    "MinSize",
+    "MaxSize",
+    "DesiredCapacity",
+    "AvailabilityZones",
+    "HealthCheckType",
+    "CreatedTime",
+]
+
+COUNT_QUERIES = (
+    CountQuery(
+        "autoscaling",
+        "describe_auto_scaling_groups",
+        "AutoScalingGroups",
+        page_size=100,
+    ),
+)
+
+TAG_SOURCE = TagSource("autoscaling:autoScalingGroup")
+
+TRAIL_SOURCE = TrailSource(
+    "autoscaling.amazonaws.com",
+    task_events=(
+        "CreateAutoScalingGroup",
+        "UpdateAutoScalingGroup",
+        "DeleteAutoScalingGroup",
+        "SetDesiredCapacity",
+        "AttachInstances",
+        "DetachInstances",
+    ),
+)
+
 
 def get_raw_data(session, region):
     """
@@ -1,10 +1,66 @@
 import pandas as pd
 
+from resources import CountQuery, DetailCall, TagSource, TrailSource
+from utils.columns import needs_detail
 
-def get_raw_data(session, region):
+COLUMN_SCHEMA = {
+    "TableName": "string",
+    "TableStatus": "category",
+    "CreationDateTime": "date",
+    "ItemCount": "int",
+    "TableSizeBytes": "int",
+    "ReadCapacityUnits": "int",
+    "WriteCapacityUnits": "int",
+}
+
+RAW_PROJECTION = {
+    "Tables": [
+        "TableName",
+        "TableArn",
+        "TableStatus",
+        "CreationDateTime",
+        "ItemCount",
+        "TableSizeBytes",
+        "ProvisionedThroughput",
+    ]
+}
+
+COUNT_QUERIES = (CountQuery("dynamodb", "list_tables", "TableNames", page_size=100),)
+
+TAG_SOURCE = TagSource("dynamodb:table")
+
+TRAIL_SOURCE = TrailSource(
+    "dynamodb.amazonaws.com",
+    id_events={
+        "CreateTable": "requestParameters.tableName",
+        "UpdateTable": "requestParameters.tableName",
+        "DeleteTable": "requestParameters.tableName",
+        "RestoreTableFromBackup": "requestParameters.targetTableName",
+        "RestoreTableToPointInTime": "requestParameters.targetTableName",
+    },
+)
+
+# --columns: 추가 호출과 그 호출로만 채울 수 있는 컬럼
+DETAIL_COLUMNS = {
+    "describe_table": (
+        "TableStatus",
+        "CreationDateTime",
+        "ItemCount",
+        "TableSizeBytes",
+        "ReadCapacityUnits",
+        "WriteCapacityUnits",
+    ),
+}
+
+# plan: DETAIL_COLUMNS의 호출마다 실제로 보내는 API 요청 (리소스마다 한 번)
+DETAIL_CALLS = {"describe_table": (DetailCall("dynamodb", "describe_table"),)}
+
+
+def get_raw_data(session, region, columns=None):
     """
     DynamoDB 테이블 목록과 각 테이블의 상세 정보를 조회
     {"Tables": [table_detail, ...]} 형태로 반환
+    columns에 상세 정보 컬럼이 없으면 describe_table()을 호출하지 않고 테이블 이름만 반환
     """
     client = session.client("dynamodb", region_name=region)
 
@@ -18,6 +74,9 @@ def get_raw_data(session, region):
         )
         table_names.extend(response.get("TableNames", []))
 
+    if not needs_detail(columns, DETAIL_COLUMNS["describe_table"]):
+        return {"Tables": [{"TableName": name} for name in table_names]}
+
     tables = []
     for table_name in table_names:
         detail_response = client.describe_table(TableName=table_name)
@@ -27,6 +86,22 @@ def get_raw_data(session, region):
     return {"Tables": tables}
 
 
+def get_raw_data_by_ids(session, region, ids):
+    """
+    지정한 DynamoDB 테이블만 describe_table()로 조회합니다 (--incremental)
+    이미 삭제된 테이블은 결과에서 빠집니다.
+    """
+    client = session.client("dynamodb", region_name=region)
+    tables = []
+    for table_name in ids:
+        try:
+            detail_response = client.describe_table(TableName=table_name)
+        except client.exceptions.ResourceNotFoundException:
+            continue
+        tables.append(detail_response.get("Table", {}))
+    return {"Tables": tables}
+
+
 def get_filtered_data(raw_data):
     """
     DynamoDB 테이블 상세 정보에서 주요 필드만 추출해 DataFrame으로 반환
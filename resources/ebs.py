@@ -1,7 +1,52 @@
 import pandas as pd
 
+from resources import CountQuery, TagSource, TrailSource
 from utils.name_tag import extract_name_tag
 
+COLUMN_SCHEMA = {
+    "Name": "string",
+    "VolumeId": "string",
+    "Size": "int",
+    "VolumeType": "category",
+    "State": "category",
+    "AvailabilityZone": "category",
+    "CreateTime": "date",
+    "Tags": "string",
+}
+
+RAW_PROJECTION = {
+    "Volumes": [
+        "VolumeId",
+        "Size",
+        "VolumeType",
+        "State",
+        "AvailabilityZone",
+        "CreateTime",
+        "Tags",
+    ]
+}
+
+COUNT_QUERIES = (CountQuery("ec2", "describe_volumes", "Volumes", page_size=500),)
+
+TAG_SOURCE = TagSource("ec2:volume")
+
+TRAIL_SOURCE = TrailSource(
+    "ec2.amazonaws.com",
+    id_events={
+        "CreateVolume": "responseElements.volumeId",
+        "DeleteVolume": "requestParameters.volumeId",
+        "AttachVolume": "requestParameters.volumeId",
+        "DetachVolume": "requestParameters.volumeId",
+        "ModifyVolume": "requestParameters.volumeId",
+        "CreateTags": "requestParameters.resourcesSet.items[].resourceId",
+        "DeleteTags": "requestParameters.resourcesSet.items[].resourceId",
+    },
+    # 인스턴스의 루트 볼륨은 볼륨 ID 없이 생성/삭제됩니다
+    task_events=("RunInstances", "TerminateInstances"),
+    resource_type="AWS::EC2::Volume",
+    id_prefix="vol-",
+)
+
 
 def get_raw_data(session, region):
     """
@@ -12,6 +57,18 @@ def get_raw_data(session, region):
     return response
 
 
+def get_raw_data_by_ids(session, region, ids):
+    """
+    지정한 EBS Volume만 조회합니다 (--incremental).
+    응답이 여러 페이지로 나뉘어도 NextToken을 따라 모든 페이지를 합칩니다.
+    """
+    ec2_client = session.client("ec2", region_name=region)
+    paginator = ec2_client.get_paginator("describe_volumes")
+    return paginator.paginate(
+        Filters=[{"Name": "volume-id", "Values": ids}]
+    ).build_full_result()
+
+
 def get_filtered_data(raw_data):
     """
     원본 JSON 응답에서 EBS Volume의 주요 필드를 추출하여 DataFrame으로 반환합니다.
@@ -1,7 +1,51 @@
 import pandas as pd
 
+from resources import CountQuery, TagSource, TrailSource
 from utils.name_tag import extract_name_tag
 
+COLUMN_SCHEMA = {
+    "Name": "string",
+    "SnapshotId": "string",
+    "VolumeId": "string",
+    "StartTime": "date",
+    "State": "category",
+    "VolumeSize": "int",
+    "Description": "string",
+}
+
+RAW_PROJECTION = {
+    "Snapshots": [
+        "SnapshotId",
+        "VolumeId",
+        "StartTime",
+        "State",
+        "VolumeSize",
+        "Description",
+        "Tags",
+    ]
+}
+
+COUNT_QUERIES = (
+    CountQuery(
+        "ec2", "describe_snapshots", "Snapshots", {"OwnerIds": ["self"]}, page_size=1000
+    ),
+)
+
+TAG_SOURCE = TagSource("ec2:snapshot")
+
+TRAIL_SOURCE = TrailSource(
+    "ec2.amazonaws.com",
+    id_events={
+        "CreateSnapshot": "responseElements.snapshotId",
+        "CopySnapshot": "responseElements.snapshotId",
+        "DeleteSnapshot": "requestParameters.snapshotId",
+        "CreateTags": "requestParameters.resourcesSet.items[].resourceId",
+        "DeleteTags": "requestParameters.resourcesSet.items[].resourceId",
+    },
+    task_events=("CreateSnapshots",),
+    id_prefix="snap-",
+)
+
 
 def get_raw_data(session, region):
     """
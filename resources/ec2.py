@@ -9,9 +9,66 @@ from typing import Any
 import pandas as pd
 from botocore.exceptions import ClientError
 
+from resources import CountQuery, TagSource, TrailSource
 from utils.datetime_format import format_datetime
 from utils.name_tag import extract_name_tag
 
+COLUMN_SCHEMA = {
+    "Name": "string",
+    "InstanceId": "string",
+    "InstanceType": "category",
+    "State": "category",
+    "PublicIp": "string",
+    "PrivateIp": "string",
+    "SecurityGroupIds": "string",
+    "SecurityGroupNames": "string",
+    "LaunchTime": "date",
+}
+
+RAW_PROJECTION = {
+    "Reservations": {
+        "Instances": [
+            "InstanceId",
+            "InstanceType",
+            "ImageId",
+            "State",
+            "VpcId",
+            "SubnetId",
+            "PublicIpAddress",
+            "PrivateIpAddress",
+            "SecurityGroups",
+            "LaunchTime",
+            "Tags",
+        ]
+    }
+}
+
+COUNT_QUERIES = (
+    CountQuery(
+        "ec2", "describe_instances", "Reservations[].Instances[]", page_size=1000
+    ),
+)
+
+TAG_SOURCE = TagSource("ec2:instance")
+
+TRAIL_SOURCE = TrailSource(
+    "ec2.amazonaws.com",
+    id_events={
+        "RunInstances": "responseElements.instancesSet.items[].instanceId",
+        "StartInstances": "requestParameters.instancesSet.items[].instanceId",
+        "StopInstances": "requestParameters.instancesSet.items[].instanceId",
+        "TerminateInstances": "requestParameters.instancesSet.items[].instanceId",
+        "ModifyInstanceAttribute": "requestParameters.instanceId",
+        "AssociateAddress": "requestParameters.instanceId",
+        "CreateTags": "requestParameters.resourcesSet.items[].resourceId",
+        "DeleteTags": "requestParameters.resourcesSet.items[].resourceId",
+    },
+    # 탄력적 IP 연결 해제와 ENI 보안 그룹 변경은 인스턴스 ID를 남기지 않습니다
+    task_events=("DisassociateAddress", "ModifyNetworkInterfaceAttribute"),
+    resource_type="AWS::EC2::Instance",
+    id_prefix="i-",
+)
+
 
 def get_raw_data(session: Any, region: str) -> dict[str, Any]:
     """
@@ -36,6 +93,27 @@ def get_raw_data(session: Any, region: str) -> dict[str, Any]:
         return {"Reservations": []}
 
 
+def get_raw_data_by_ids(session: Any, region: str, ids: list[str]) -> dict[str, Any]:
+    """
+    지정한 EC2 인스턴스만 describe_instances() 결과(원본 JSON)로 반환 (--incremental)
+    instance-id 필터를 사용하므로 이미 사라진 인스턴스는 오류 없이 빠집니다.
+    응답이 여러 페이지로 나뉘어도 NextToken을 따라 모든 페이지를 합칩니다.
+
+    Args:
+        session: boto3 세션 객체
+        region: AWS 리전명
+        ids: 인스턴스 ID 목록
+
+    Returns:
+        dict: EC2 인스턴스 원시 데이터
+    """
+    ec2_client = session.client("ec2", region_name=region)
+    paginator = ec2_client.get_paginator("describe_instances")
+    return paginator.paginate(
+        Filters=[{"Name": "instance-id", "Values": ids}]
+    ).build_full_result()
+
+
 def get_filtered_data(raw_data: dict[str, Any]) -> pd.DataFrame:
     """
     원본 JSON에서 주요 필드만 추출해 DataFrame으로 반환
@@ -1,6 +1,42 @@
 import pandas as pd
 from botocore.exceptions import ClientError
 
+from resources import CountQuery, TagSource, TrailSource
+
+COLUMN_SCHEMA = {
+    "RepositoryName": "string",
+    "RepositoryArn": "string",
+    "RepositoryUri": "string",
+    "CreatedAt": "datetime",
+    "ImageTagMutability": "category",
+    "ImageScanningConfiguration": "bool",
+}
+
+RAW_PROJECTION = [
+    "repositoryName",
+    "repositoryArn",
+    "repositoryUri",
+    "createdAt",
+    "imageTagMutability",
+    "imageScanningConfiguration",
+]
+
+COUNT_QUERIES = (
+    CountQuery("ecr", "describe_repositories", "repositories", page_size=1000),
+)
+
+TAG_SOURCE = TagSource("ecr:repository", id_pattern=None)
+
+TRAIL_SOURCE = TrailSource(
+    "ecr.amazonaws.com",
+    task_events=(
+        "CreateRepository",
+        "DeleteRepository",
+        "PutImageTagMutability",
+        "PutImageScanningConfiguration",
+    ),
+)
+
 
 def get_raw_data(session, region):
     """
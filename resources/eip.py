@@ -1,7 +1,49 @@
 import pandas as pd
 
+from resources import CountQuery, TagSource, TrailSource
 from utils.name_tag import extract_name_tag
 
+COLUMN_SCHEMA = {
+    "Name": "string",
+    "PublicIp": "string",
+    "AllocationId": "string",
+    "AssociationId": "string",
+    "Domain": "category",
+    "InstanceId": "string",
+    "NetworkInterfaceId": "string",
+    "PrivateIpAddress": "string",
+}
+
+RAW_PROJECTION = {
+    "Addresses": [
+        "PublicIp",
+        "AllocationId",
+        "AssociationId",
+        "Domain",
+        "InstanceId",
+        "NetworkInterfaceId",
+        "PrivateIpAddress",
+        "Tags",
+    ]
+}
+
+COUNT_QUERIES = (CountQuery("ec2", "describe_addresses", "Addresses"),)
+
+TAG_SOURCE = TagSource("ec2:elastic-ip")
+
+TRAIL_SOURCE = TrailSource(
+    "ec2.amazonaws.com",
+    id_events={
+        "AllocateAddress": "responseElements.allocationId",
+        "ReleaseAddress": "requestParameters.allocationId",
+        "AssociateAddress": "requestParameters.allocationId",
+        "CreateTags": "requestParameters.resourcesSet.items[].resourceId",
+        "DeleteTags": "requestParameters.resourcesSet.items[].resourceId",
+    },
+    task_events=("DisassociateAddress",),
+    id_prefix="eipalloc-",
+)
+
 
 def get_raw_data(session, region):
     """
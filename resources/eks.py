@@ -1,13 +1,53 @@
 import pandas as pd
 
+from resources import CountQuery, DetailCall, TagSource, TrailSource
+from utils.columns import needs_detail
 
-def get_raw_data(session, region):
+COLUMN_SCHEMA = {
+    "Name": "string",
+    "Status": "category",
+    "Endpoint": "string",
+    "Version": "category",
+    "CreatedAt": "date",
+}
+
+RAW_PROJECTION = {
+    "Clusters": ["name", "arn", "status", "endpoint", "version", "createdAt"]
+}
+
+COUNT_QUERIES = (CountQuery("eks", "list_clusters", "clusters", page_size=100),)
+
+TAG_SOURCE = TagSource("eks:cluster")
+
+TRAIL_SOURCE = TrailSource(
+    "eks.amazonaws.com",
+    id_events={
+        "CreateCluster": "requestParameters.name",
+        "DeleteCluster": "requestParameters.name",
+        "UpdateClusterVersion": "requestParameters.name",
+        "UpdateClusterConfig": "requestParameters.name",
+    },
+)
+
+# --columns: 추가 호출과 그 호출로만 채울 수 있는 컬럼
+DETAIL_COLUMNS = {"describe_cluster": ("Status", "Endpoint", "Version", "CreatedAt")}
+
+# plan: DETAIL_COLUMNS의 호출마다 실제로 보내는 API 요청 (리소스마다 한 번)
+DETAIL_CALLS = {"describe_cluster": (DetailCall("eks", "describe_cluster"),)}
+
+
+def get_raw_data(session, region, columns=None):
     """
     EKS 클러스터 전체 목록 list_clusters() + describe_cluster()
     {"Clusters": [cluster_detail, ...]} 형태로 반환
+    columns에 상세 정보 컬럼이 없으면 describe_cluster()를 호출하지 않고 이름만 반환
     """
     eks_client = session.client("eks", region_name=region)
     cluster_list = eks_client.list_clusters()
+    if not needs_detail(columns, DETAIL_COLUMNS["describe_cluster"]):
+        return {
+            "Clusters": [{"name": name} for name in cluster_list.get("clusters", [])]
+        }
     clusters = []
     for name in cluster_list.get("clusters", []):
         detail = eks_client.describe_cluster(name=name)
@@ -15,6 +55,22 @@ def get_raw_data(session, region):
     return {"Clusters": clusters}
 
 
+def get_raw_data_by_ids(session, region, ids):
+    """
+    지정한 EKS 클러스터만 describe_cluster()로 조회합니다 (--incremental)
+    이미 삭제된 클러스터는 결과에서 빠집니다.
+    """
+    eks_client = session.client("eks", region_name=region)
+    clusters = []
+    for name in ids:
+        try:
+            detail = eks_client.describe_cluster(name=name)
+        except eks_client.exceptions.ResourceNotFoundException:
+            continue
+        clusters.append(detail.get("cluster", {}))
+    return {"Clusters": clusters}
+
+
 def get_filtered_data(raw_data):
     """
     원본 JSON에서 주요 필드만 추출해 DataFrame으로 반환
@@ -1,13 +1,68 @@
 import pandas as pd
 
+from resources import CountQuery, TagSource, TrailSource
+from utils.columns import needs_detail
 
-def get_raw_data(session, region):
+COLUMN_SCHEMA = {
+    "CacheClusterId": "string",
+    "Engine": "category",
+    "CacheNodeType": "category",
+    "EngineVersion": "category",
+    "CacheClusterStatus": "category",
+    "NumCacheNodes": "int",
+    "PreferredAvailabilityZone": "category",
+    "CreatedTime": "date",
+}
+
+RAW_PROJECTION = {
+    "CacheClusters": [
+        "CacheClusterId",
+        "Engine",
+        "CacheNodeType",
+        "EngineVersion",
+        "CacheClusterStatus",
+        "NumCacheNodes",
+        "PreferredAvailabilityZone",
+        "CacheClusterCreateTime",
+    ]
+}
+
+COUNT_QUERIES = (
+    CountQuery(
+        "elasticache", "describe_cache_clusters", "CacheClusters", page_size=100
+    ),
+)
+
+TAG_SOURCE = TagSource("elasticache:cluster")
+
+TRAIL_SOURCE = TrailSource(
+    "elasticache.amazonaws.com",
+    task_events=(
+        "CreateCacheCluster",
+        "ModifyCacheCluster",
+        "RebootCacheCluster",
+        "DeleteCacheCluster",
+        "CreateReplicationGroup",
+        "ModifyReplicationGroup",
+        "DeleteReplicationGroup",
+    ),
+)
+
+# --columns: 추가 조회와 그 조회로만 채울 수 있는 컬럼.
+# 노드 정보(CacheNodes)는 원본 데이터에만 남고 필터링된 컬럼에는 쓰이지 않으므로
+# 컬럼을 지정하지 않은 실행에서만 조회합니다
+DETAIL_COLUMNS = {"ShowCacheNodeInfo": ()}
+
+
+def get_raw_data(session, region, columns=None):
     """
     ElastiCache 클러스터 정보 조회
-    ShowCacheNodeInfo=True로 추가 정보를 포함시킴
+    ShowCacheNodeInfo=True로 추가 정보를 포함시킴 (columns가 주어지면 제외)
     """
     client = session.client("elasticache", region_name=region)
-    response = client.describe_cache_clusters(ShowCacheNodeInfo=True)
+    response = client.describe_cache_clusters(
+        ShowCacheNodeInfo=needs_detail(columns, DETAIL_COLUMNS["ShowCacheNodeInfo"])
+    )
     return response
 
 
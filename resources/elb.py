@@ -1,5 +1,57 @@
 import pandas as pd
 
+from resources import CountQuery, TagSource, TrailSource
+
+COLUMN_SCHEMA = {
+    "LoadBalancerName": "string",
+    "Type": "category",
+    "DNSName": "string",
+    "Scheme": "category",
+    "VpcId": "category",
+    "CreatedDate": "date",
+    "State": "category",
+}
+
+RAW_PROJECTION = {
+    "Classic": ["LoadBalancerName", "DNSName", "Scheme", "VPCId", "CreatedTime"],
+    "v2": [
+        "LoadBalancerName",
+        "LoadBalancerArn",
+        "Type",
+        "DNSName",
+        "Scheme",
+        "VpcId",
+        "CreatedTime",
+        "State",
+    ],
+}
+
+COUNT_QUERIES = (
+    CountQuery(
+        "elb", "describe_load_balancers", "LoadBalancerDescriptions", page_size=400
+    ),
+    CountQuery("elbv2", "describe_load_balancers", "LoadBalancers", page_size=400),
+)
+
+# --tags: 태그 API의 ARN에서 로드 밸런서 이름을 추출합니다
+# (Classic: loadbalancer/<이름>, ALB/NLB/GWLB: loadbalancer/app|net|gwy/<이름>/<ID>)
+TAG_SOURCE = TagSource(
+    "elasticloadbalancing:loadbalancer", r"loadbalancer/(?:app/|net/|gwy/)?([^/]+)"
+)
+
+TRAIL_SOURCE = TrailSource(
+    "elasticloadbalancing.amazonaws.com",
+    task_events=(
+        "CreateLoadBalancer",
+        "DeleteLoadBalancer",
+        "SetSecurityGroups",
+        "SetSubnets",
+        "AttachLoadBalancerToSubnets",
+        "DetachLoadBalancerFromSubnets",
+        "ModifyLoadBalancerAttributes",
+    ),
+)
+
 
 def get_raw_data(session, region):
     """
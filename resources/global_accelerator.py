@@ -1,14 +1,67 @@
 import pandas as pd
 
+from resources import CountQuery, DetailCall, TagSource, TrailSource
+from utils.columns import needs_detail
 
-def get_raw_data(session, region):
+COLUMN_SCHEMA = {
+    "AcceleratorArn": "string",
+    "Name": "string",
+    "Status": "category",
+    "IpAddressType": "category",
+    "Enabled": "bool",
+    "CreatedTime": "date",
+    "LastModifiedTime": "date",
+}
+
+RAW_PROJECTION = {
+    "Accelerators": [
+        "AcceleratorArn",
+        "Name",
+        "Status",
+        "IpAddressType",
+        "Enabled",
+        "CreatedTime",
+        "LastModifiedTime",
+    ]
+}
+
+COUNT_QUERIES = (
+    CountQuery("globalaccelerator", "list_accelerators", "Accelerators", page_size=100),
+)
+
+TAG_SOURCE = TagSource("globalaccelerator:accelerator", id_pattern=None)
+
+TRAIL_SOURCE = TrailSource(
+    "globalaccelerator.amazonaws.com",
+    task_events=(
+        "CreateAccelerator",
+        "UpdateAccelerator",
+        "DeleteAccelerator",
+    ),
+)
+
+# --columns: 추가 호출과 그 호출로만 채울 수 있는 컬럼.
+# list_accelerators()가 모든 컬럼을 반환하므로 describe_accelerator()는
+# 컬럼을 지정하지 않은 실행(원본 데이터 전체)에서만 호출합니다
+DETAIL_COLUMNS = {"describe_accelerator": ()}
+
+# plan: DETAIL_COLUMNS의 호출마다 실제로 보내는 API 요청 (리소스마다 한 번)
+DETAIL_CALLS = {
+    "describe_accelerator": (DetailCall("globalaccelerator", "describe_accelerator"),)
+}
+
+
+def get_raw_data(session, region, columns=None):
     """
     Global Accelerator(Global)의 전체 목록을 조회
     list_accelerators()로 Accelerator 목록을 조회하고, 각 Accelerator의 상세 정보를 describe_accelerator()로 조회하여 반환
+    columns가 주어지면 describe_accelerator() 없이 목록 응답을 그대로 반환
     """
     client = session.client("globalaccelerator", region_name=region)
     response = client.list_accelerators()
     accelerators = response.get("Accelerators", [])
+    if not needs_detail(columns, DETAIL_COLUMNS["describe_accelerator"]):
+        return {"Accelerators": accelerators}
 
     details = []
     for acc in accelerators:
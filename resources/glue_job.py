@@ -1,5 +1,30 @@
 import pandas as pd
 
+from resources import CountQuery, TagSource, TrailSource
+
+COLUMN_SCHEMA = {
+    "JobName": "string",
+    "CreatedOn": "date",
+    "LastModifiedOn": "date",
+    "Role": "category",
+    "Command": "category",
+}
+
+RAW_PROJECTION = {"Jobs": ["Name", "CreatedOn", "LastModifiedOn", "Role", "Command"]}
+
+COUNT_QUERIES = (CountQuery("glue", "list_jobs", "JobNames", page_size=1000),)
+
+TAG_SOURCE = TagSource("glue:job")
+
+TRAIL_SOURCE = TrailSource(
+    "glue.amazonaws.com",
+    task_events=(
+        "CreateJob",
+        "UpdateJob",
+        "DeleteJob",
+    ),
+)
+
 
 def get_raw_data(session, region):
     """
@@ -1,8 +1,37 @@
 import botocore  # Import botocore for exception handling
 import pandas as pd
 
+from resources import CountQuery, TagSource, TrailSource
 from utils.name_tag import extract_name_tag
 
+COLUMN_SCHEMA = {
+    "Name": "string",
+    "InternetGatewayId": "string",
+    "VpcId": "string",
+    "State": "category",
+}
+
+RAW_PROJECTION = {"InternetGateways": ["InternetGatewayId", "Attachments", "Tags"]}
+
+COUNT_QUERIES = (
+    CountQuery("ec2", "describe_internet_gateways", "InternetGateways", page_size=1000),
+)
+
+TAG_SOURCE = TagSource("ec2:internet-gateway")
+
+TRAIL_SOURCE = TrailSource(
+    "ec2.amazonaws.com",
+    id_events={
+        "CreateInternetGateway": "responseElements.internetGateway.internetGatewayId",
+        "DeleteInternetGateway": "requestParameters.internetGatewayId",
+        "AttachInternetGateway": "requestParameters.internetGatewayId",
+        "DetachInternetGateway": "requestParameters.internetGatewayId",
+        "CreateTags": "requestParameters.resourcesSet.items[].resourceId",
+        "DeleteTags": "requestParameters.resourcesSet.items[].resourceId",
+    },
+    id_prefix="igw-",
+)
+
 
 def get_raw_data(session, region):
     """
@@ -1,10 +1,77 @@
 import pandas as pd
 
+from resources import CountQuery, DetailCall, TagSource, TrailSource
+from utils.columns import needs_detail
 
-def get_raw_data(session, region):
+COLUMN_SCHEMA = {
+    "DeliveryStreamName": "string",
+    "DeliveryStreamStatus": "category",
+    "DeliveryStreamType": "category",
+    "VersionId": "string",
+    "DeliveryStreamArn": "string",
+}
+
+RAW_PROJECTION = {
+    "DeliveryStreams": [
+        "DeliveryStreamName",
+        "DeliveryStreamStatus",
+        "DeliveryStreamType",
+        "VersionId",
+        "DeliveryStreamARN",
+    ]
+}
+
+# --count-only: botocore에 페이지네이터가 없어 get_raw_data()와 같은 방식으로 페이지를 넘깁니다
+COUNT_QUERIES = (
+    CountQuery(
+        "firehose",
+        "list_delivery_streams",
+        "DeliveryStreamNames",
+        page_size=10000,
+        pagination={
+            "input_token": "ExclusiveStartDeliveryStreamName",
+            "output_token": "DeliveryStreamNames[-1]",
+            "more_results": "HasMoreDeliveryStreams",
+            "limit_key": "Limit",
+            "result_key": "DeliveryStreamNames",
+        },
+    ),
+)
+
+TAG_SOURCE = TagSource("firehose:deliverystream")
+
+TRAIL_SOURCE = TrailSource(
+    "firehose.amazonaws.com",
+    task_events=(
+        "CreateDeliveryStream",
+        "DeleteDeliveryStream",
+        "UpdateDestination",
+        "StartDeliveryStreamEncryption",
+        "StopDeliveryStreamEncryption",
+    ),
+)
+
+# --columns: 추가 호출과 그 호출로만 채울 수 있는 컬럼
+DETAIL_COLUMNS = {
+    "describe_delivery_stream": (
+        "DeliveryStreamStatus",
+        "DeliveryStreamType",
+        "VersionId",
+        "DeliveryStreamArn",
+    ),
+}
+
+# plan: DETAIL_COLUMNS의 호출마다 실제로 보내는 API 요청 (리소스마다 한 번)
+DETAIL_CALLS = {
+    "describe_delivery_stream": (DetailCall("firehose", "describe_delivery_stream"),)
+}
+
+
+def get_raw_data(session, region, columns=None):
     """
     Kinesis Firehose의 전체 목록을 조회
     list_delivery_streams()로 Delivery Stream 목록을 조회하고, 각 Delivery Stream의 상세 정보를 describe_delivery_stream()로 조회하여 반환
+    columns에 상세 정보 컬럼이 없으면 describe_delivery_stream()을 호출하지 않고 이름만 반환
     """
     client = session.client("firehose", region_name=region)
     stream_names = []
@@ -16,6 +83,11 @@ def get_raw_data(session, region):
         )
         stream_names.extend(response.get("DeliveryStreamNames", []))
 
+    if not needs_detail(columns, DETAIL_COLUMNS["describe_delivery_stream"]):
+        return {
+            "DeliveryStreams": [{"DeliveryStreamName": name} for name in stream_names]
+        }
+
     streams = []
     for name in stream_names:
         detail_response = client.describe_delivery_stream(DeliveryStreamName=name)
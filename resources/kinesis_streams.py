@@ -1,10 +1,63 @@
 import pandas as pd
 
+from resources import CountQuery, DetailCall, TagSource, TrailSource
+from utils.columns import needs_detail
 
-def get_raw_data(session, region):
+COLUMN_SCHEMA = {
+    "StreamName": "string",
+    "StreamStatus": "category",
+    "RetentionPeriodHours": "int",
+    "OpenShardCount": "int",
+    "StreamARN": "string",
+}
+
+RAW_PROJECTION = {
+    "Streams": [
+        "StreamName",
+        "StreamStatus",
+        "RetentionPeriodHours",
+        "OpenShardCount",
+        "StreamARN",
+    ]
+}
+
+COUNT_QUERIES = (CountQuery("kinesis", "list_streams", "StreamNames", page_size=100),)
+
+TAG_SOURCE = TagSource("kinesis:stream")
+
+TRAIL_SOURCE = TrailSource(
+    "kinesis.amazonaws.com",
+    task_events=(
+        "CreateStream",
+        "DeleteStream",
+        "UpdateShardCount",
+        "UpdateStreamMode",
+        "IncreaseStreamRetentionPeriod",
+        "DecreaseStreamRetentionPeriod",
+        "StartStreamEncryption",
+        "StopStreamEncryption",
+    ),
+)
+
+# --columns: 추가 호출과 그 호출로만 채울 수 있는 컬럼
+DETAIL_COLUMNS = {
+    "describe_stream": (
+        "StreamStatus",
+        "RetentionPeriodHours",
+        "OpenShardCount",
+        "StreamARN",
+    ),
+}
+
+# plan: DETAIL_COLUMNS의 호출마다 실제로 보내는 API 요청 (리소스마다 한 번)
+DETAIL_CALLS = {"describe_stream": (DetailCall("kinesis", "describe_stream"),)}
+
+
+def get_raw_data(session, region, columns=None):
     """
     Kinesis Streams의 전체 목록을 조회
     list_streams()로 Stream 목록을 조회하고, 각 Stream의 상세 정보를 describe_stream()로 조회하여 반환
+    columns에 상세 정보 컬럼이 없으면 describe_stream()을 호출하지 않고 이름만 반환
     """
     client = session.client("kinesis", region_name=region)
     stream_names = []
@@ -15,6 +68,9 @@ def get_raw_data(session, region):
         response = client.list_streams(ExclusiveStartStreamName=stream_names[-1])
         stream_names.extend(response.get("StreamNames", []))
 
+    if not needs_detail(columns, DETAIL_COLUMNS["describe_stream"]):
+        return {"Streams": [{"StreamName": name} for name in stream_names]}
+
     streams = []
     for name in stream_names:
         detail_response = client.describe_stream(StreamName=name)
@@ -1,5 +1,33 @@
 import pandas as pd
 
+from resources import CountQuery, TagSource, TrailSource
+
+COLUMN_SCHEMA = {
+    "NatGatewayId": "string",
+    "State": "category",
+    "VpcId": "category",
+    "SubnetId": "category",
+    "CreateTime": "date",
+}
+
+RAW_PROJECTION = {
+    "NatGateways": ["NatGatewayId", "State", "VpcId", "SubnetId", "CreateTime"]
+}
+
+COUNT_QUERIES = (
+    CountQuery("ec2", "describe_nat_gateways", "NatGateways", page_size=1000),
+)
+
+TAG_SOURCE = TagSource("ec2:natgateway")
+
+TRAIL_SOURCE = TrailSource(
+    "ec2.amazonaws.com",
+    task_events=(
+        "CreateNatGateway",
+        "DeleteNatGateway",
+    ),
+)
+
 
 def get_raw_data(session, region):
     """
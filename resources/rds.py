@@ -1,5 +1,57 @@
 import pandas as pd
 
+from resources import CountQuery, TagSource, TrailSource
+
+COLUMN_SCHEMA = {
+    "DBInstanceIdentifier": "string",
+    "DBInstanceClass": "category",
+    "Engine": "category",
+    "DBInstanceStatus": "category",
+    "Endpoint": "string",
+    "AllocatedStorage": "int",
+}
+
+RAW_PROJECTION = {
+    "DBInstances": [
+        "DBInstanceIdentifier",
+        "DBInstanceClass",
+        "Engine",
+        "DBInstanceStatus",
+        "Endpoint",
+        "AllocatedStorage",
+    ]
+}
+
+COUNT_QUERIES = (
+    CountQuery("rds", "describe_db_instances", "DBInstances", page_size=100),
+)
+
+TAG_SOURCE = TagSource("rds:db")
+
+# 이름을 바꾸는 ModifyDBInstance는 이전 이름과 새 이름을 모두 갱신합니다
+DB_INSTANCE_IDS = (
+    "[requestParameters.dBInstanceIdentifier, "
+    "requestParameters.newDBInstanceIdentifier]"
+)
+
+TRAIL_SOURCE = TrailSource(
+    "rds.amazonaws.com",
+    id_events=dict.fromkeys(
+        (
+            "CreateDBInstance",
+            "CreateDBInstanceReadReplica",
+            "RestoreDBInstanceFromDBSnapshot",
+            "RestoreDBInstanceToPointInTime",
+            "ModifyDBInstance",
+            "RebootDBInstance",
+            "StartDBInstance",
+            "StopDBInstance",
+            "DeleteDBInstance",
+        ),
+        DB_INSTANCE_IDS,
+    ),
+)
+
 
 def get_raw_data(session, region):
     """
@@ -10,6 +62,18 @@ def get_raw_data(session, region):
     return response
 
 
+def get_raw_data_by_ids(session, region, ids):
+    """
+    지정한 RDS 인스턴스만 조회합니다 (--incremental)
+    한 페이지는 최대 100개(MaxRecords)이므로 Marker를 따라 모든 페이지를 합칩니다.
+    """
+    rds_client = session.client("rds", region_name=region)
+    paginator = rds_client.get_paginator("describe_db_instances")
+    return paginator.paginate(
+        Filters=[{"Name": "db-instance-id", "Values": ids}]
+    ).build_full_result()
+
+
 def get_filtered_data(raw_data):
     """
     원본 JSON에서 주요 필드만 추출해 DataFrame으로 반환
@@ -1,5 +1,42 @@
 import pandas as pd
 
+from resources import CountQuery, TagSource, TrailSource
+
+COLUMN_SCHEMA = {
+    "Name": "string",
+    "Id": "string",
+    "CallerReference": "string",
+    "ResourceRecordSetCount": "int",
+}
+
+RAW_PROJECTION = {
+    "HostedZones": [
+        "Name",
+        "Id",
+        "CallerReference",
+        "ResourceRecordSetCount",
+        "Config",
+    ]
+}
+
+COUNT_QUERIES = (
+    CountQuery("route53", "list_hosted_zones", "HostedZones", page_size=100),
+)
+
+# 호스팅 영역 Id는 "/hostedzone/<ID>" 형태입니다
+TAG_SOURCE = TagSource("route53:hostedzone", id_prefix="/hostedzone/")
+
+# ResourceRecordSetCount 컬럼 때문에 레코드 변경도 다시 수집합니다
+TRAIL_SOURCE = TrailSource(
+    "route53.amazonaws.com",
+    task_events=(
+        "CreateHostedZone",
+        "DeleteHostedZone",
+        "UpdateHostedZoneComment",
+        "ChangeResourceRecordSets",
+    ),
+)
+
 
 def get_raw_data(session, region=None):
     """
@@ -9,8 +9,28 @@ from typing import Any
 import pandas as pd
 from botocore.exceptions import ClientError
 
+from resources import CountQuery, TagSource, TrailSource
 from utils.datetime_format import format_datetime
 
+COLUMN_SCHEMA = {
+    "BucketName": "string",
+    "CreationDate": "date",
+}
+
+RAW_PROJECTION = {"Buckets": ["Name", "CreationDate"]}
+
+COUNT_QUERIES = (CountQuery("s3", "list_buckets", "Buckets", page_size=10000),)
+
+TAG_SOURCE = TagSource("s3")
+
+TRAIL_SOURCE = TrailSource(
+    "s3.amazonaws.com",
+    task_events=(
+        "CreateBucket",
+        "DeleteBucket",
+    ),
+)
+
 
 def get_raw_data(session: Any, region: str | None = None) -> dict[str, Any]:
     """
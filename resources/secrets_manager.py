@@ -1,7 +1,40 @@
 import pandas as pd
 
+from resources import CountQuery, TagSource, TrailSource
 from utils.name_tag import extract_name_tag
 
+COLUMN_SCHEMA = {
+    "Name": "string",
+    "ARN": "string",
+    "Description": "string",
+    "LastChangedDate": "date",
+    "Tags": "string",
+}
+
+RAW_PROJECTION = {
+    "SecretList": ["ARN", "Name", "Description", "LastChangedDate", "Tags"]
+}
+
+COUNT_QUERIES = (
+    CountQuery("secretsmanager", "list_secrets", "SecretList", page_size=100),
+)
+
+TAG_SOURCE = TagSource("secretsmanager:secret", id_pattern=None)
+
+TRAIL_SOURCE = TrailSource(
+    "secretsmanager.amazonaws.com",
+    task_events=(
+        "CreateSecret",
+        "UpdateSecret",
+        "PutSecretValue",
+        "RotateSecret",
+        "DeleteSecret",
+        "RestoreSecret",
+        "TagResource",
+        "UntagResource",
+    ),
+)
+
 
 def get_raw_data(session, region):
     """
@@ -9,6 +9,69 @@ from typing import Any
 import pandas as pd
 from botocore.exceptions import ClientError
 
+from resources import CountQuery, TagSource, TrailSource
+
+COLUMN_SCHEMA = {
+    "SecurityGroupRuleId": "string",
+    "GroupId": "category",
+    "Direction": "category",
+    "Protocol": "category",
+    "PortRange": "category",
+    "Source/Destination": "category",
+    "AnyOpen": "category",
+    "Description": "string",
+    "Tags": "string",
+}
+
+RAW_PROJECTION = [
+    "SecurityGroupRuleId",
+    "GroupId",
+    "IsEgress",
+    "IpProtocol",
+    "FromPort",
+    "ToPort",
+    "CidrIpv4",
+    "CidrIpv6",
+    "ReferencedGroupInfo",
+    "PrefixListId",
+    "Description",
+    "Tags",
+]
+
+COUNT_QUERIES = (
+    CountQuery(
+        "ec2", "describe_security_group_rules", "SecurityGroupRules", page_size=1000
+    ),
+)
+
+TAG_SOURCE = TagSource("ec2:security-group-rule")
+
+# 규칙 이벤트에는 규칙 ID 대신 보안 그룹 ID가 남으므로 그룹 단위로 갱신합니다
+TRAIL_SOURCE = TrailSource(
+    "ec2.amazonaws.com",
+    id_events={
+        "CreateSecurityGroup": "responseElements.groupId",
+        "DeleteSecurityGroup": "requestParameters.groupId",
+        "AuthorizeSecurityGroupIngress": "requestParameters.groupId",
+        "AuthorizeSecurityGroupEgress": "requestParameters.groupId",
+        "RevokeSecurityGroupIngress": "requestParameters.groupId",
+        "RevokeSecurityGroupEgress": "requestParameters.groupId",
+        "ModifySecurityGroupRules": "requestParameters.groupId",
+        "UpdateSecurityGroupRuleDescriptionsIngress": "requestParameters.groupId",
+        "UpdateSecurityGroupRuleDescriptionsEgress": "requestParameters.groupId",
+    },
+    task_events=(
+        "CreateVpc",
+        "CreateDefaultVpc",
+        "DeleteVpc",
+        "CreateTags",
+        "DeleteTags",
+    ),
+    resource_type="AWS::EC2::SecurityGroup",
+    id_prefix="sg-",
+    key_column="GroupId",
+)
+
 
 def get_raw_data(session: Any, region: str) -> list[dict[str, Any]]:
     """
@@ -42,6 +105,32 @@ def get_raw_data(session: Any, region: str) -> list[dict[str, Any]]:
         return []
 
 
+def get_raw_data_by_ids(
+    session: Any, region: str, ids: list[str]
+) -> list[dict[str, Any]]:
+    """
+    지정한 보안 그룹의 Security Group Rules만 조회합니다 (--incremental).
+
+    Args:
+        session: boto3 세션 객체
+        region: AWS 리전명
+        ids: 보안 그룹 ID 목록 (TRAIL_SOURCE.key_column)
+
+    Returns:
+        list: Security Group Rules 리소스 정보 목록
+    """
+    ec2_client = session.client("ec2", region_name=region)
+    filters = [{"Name": "group-id", "Values": ids}]
+    response = ec2_client.describe_security_group_rules(Filters=filters)
+    security_group_rules = response.get("SecurityGroupRules", [])
+    while "NextToken" in response:
+        response = ec2_client.describe_security_group_rules(
+            Filters=filters, NextToken=response["NextToken"]
+        )
+        security_group_rules.extend(response.get("SecurityGroupRules", []))
+    return security_group_rules
+
+
 def get_filtered_data(raw_data: list[dict[str, Any]]) -> pd.DataFrame:
     """
     원시 Security Group Rules 데이터를 필터링하여 필요한 정보만 추출합니다.
@@ -9,6 +9,55 @@ from typing import Any
 import pandas as pd
 from botocore.exceptions import ClientError
 
+from resources import CountQuery, TagSource, TrailSource
+
+COLUMN_SCHEMA = {
+    "SecurityGroupId": "string",
+    "SecurityGroupName": "string",
+    "VpcId": "category",
+    "Description": "string",
+    "AnyOpenInbound": "category",
+    "Tags": "string",
+}
+
+RAW_PROJECTION = [
+    "GroupId",
+    "GroupName",
+    "VpcId",
+    "Description",
+    "HasAnyOpenInbound",
+    "IpPermissions",
+    "IpPermissionsEgress",
+    "Tags",
+]
+
+COUNT_QUERIES = (
+    CountQuery("ec2", "describe_security_groups", "SecurityGroups", page_size=1000),
+)
+
+TAG_SOURCE = TagSource("ec2:security-group")
+
+TRAIL_SOURCE = TrailSource(
+    "ec2.amazonaws.com",
+    id_events={
+        "CreateSecurityGroup": "responseElements.groupId",
+        "DeleteSecurityGroup": "requestParameters.groupId",
+        "AuthorizeSecurityGroupIngress": "requestParameters.groupId",
+        "AuthorizeSecurityGroupEgress": "requestParameters.groupId",
+        "RevokeSecurityGroupIngress": "requestParameters.groupId",
+        "RevokeSecurityGroupEgress": "requestParameters.groupId",
+        "ModifySecurityGroupRules": "requestParameters.groupId",
+        "UpdateSecurityGroupRuleDescriptionsIngress": "requestParameters.groupId",
+        "UpdateSecurityGroupRuleDescriptionsEgress": "requestParameters.groupId",
+        "CreateTags": "requestParameters.resourcesSet.items[].resourceId",
+        "DeleteTags": "requestParameters.resourcesSet.items[].resourceId",
+    },
+    # VPC를 만들면 default 보안 그룹이 ID 없이 함께 생성됩니다
+    task_events=("CreateVpc", "CreateDefaultVpc", "DeleteVpc"),
+    resource_type="AWS::EC2::SecurityGroup",
+    id_prefix="sg-",
+)
+
 
 def get_raw_data(session: Any, region: str) -> list[dict[str, Any]]:
     """
@@ -46,6 +95,32 @@ def get_raw_data(session: Any, region: str) -> list[dict[str, Any]]:
         return []
 
 
+def get_raw_data_by_ids(
+    session: Any, region: str, ids: list[str]
+) -> list[dict[str, Any]]:
+    """
+    지정한 Security Group만 조회합니다 (--incremental).
+    응답이 여러 페이지로 나뉘어도 NextToken을 따라 모든 페이지를 합칩니다.
+
+    Args:
+        session: boto3 세션 객체
+        region: AWS 리전명
+        ids: 보안 그룹 ID 목록
+
+    Returns:
+        list: Security Group 리소스 정보 목록
+    """
+    ec2_client = session.client("ec2", region_name=region)
+    paginator = ec2_client.get_paginator("describe_security_groups")
+    response = paginator.paginate(
+        Filters=[{"Name": "group-id", "Values": ids}]
+    ).build_full_result()
+    security_groups = response.get("SecurityGroups", [])
+    for sg in security_groups:
+        sg["HasAnyOpenInbound"] = _check_any_open_inbound(sg)
+    return security_groups
+
+
 def _check_any_open_inbound(sg: dict[str, Any]) -> bool:
     """
     보안 그룹에 0.0.0.0/0 또는 ::/0 인바운드 규칙이 있는지 확인합니다.
@@ -2,14 +2,64 @@ from typing import Any
 
 import pandas as pd
 
-
-def get_raw_data(session: Any, region: str) -> dict[str, Any]:
+from resources import CountQuery, DetailCall, TagSource, TrailSource
+from utils.columns import needs_detail
+
+COLUMN_SCHEMA = {
+    "Identity": "string",
+    "IdentityType": "category",
+    "IdentityStatus": "category",
+    "Tags": "string",
+}
+
+RAW_PROJECTION = ["Identities", "VerificationAttributes", "Tags"]
+
+COUNT_QUERIES = (CountQuery("ses", "list_identities", "Identities", page_size=1000),)
+
+TAG_SOURCE = TagSource("ses:identity")
+
+TRAIL_SOURCE = TrailSource(
+    "ses.amazonaws.com",
+    task_events=(
+        "VerifyEmailIdentity",
+        "VerifyDomainIdentity",
+        "DeleteIdentity",
+        "CreateEmailIdentity",
+        "DeleteEmailIdentity",
+        "TagResource",
+        "UntagResource",
+    ),
+)
+
+# --columns: 추가 호출과 그 호출로만 채울 수 있는 컬럼
+DETAIL_COLUMNS = {
+    "get_identity_verification_attributes": ("IdentityStatus",),
+    "list_tags_for_resource": ("Tags",),
+}
+
+# plan: DETAIL_COLUMNS의 호출마다 실제로 보내는 API 요청.
+# 태그 조회는 자격 증명마다 ARN을 만들기 위해 계정 ID도 조회합니다
+DETAIL_CALLS = {
+    "get_identity_verification_attributes": (
+        DetailCall("ses", "get_identity_verification_attributes", per_resource=False),
+    ),
+    "list_tags_for_resource": (
+        DetailCall("ses", "list_tags_for_resource"),
+        DetailCall("sts", "get_caller_identity"),
+    ),
+}
+
+
+def get_raw_data(
+    session: Any, region: str, columns: set[str] | None = None
+) -> dict[str, Any]:
     """
     SES Identity 전체 목록 및 상세 정보를 조회하여 반환
 
     1. list_identities로 모든 자격 증명 목록 조회
     2. get_identity_verification_attributes로 각 자격 증명의 확인 상태 조회
     3. 각 자격 증명의 태그 정보 조회
+    columns가 주어지면 요청된 컬럼(IdentityStatus, Tags)에 필요한 호출만 수행
     """
     ses_client = session.client("ses", region_name=region)
 
@@ -25,20 +75,23 @@ def get_raw_data(session: Any, region: str) -> dict[str, Any]:
         }
 
     # 확인 상태 조회
-    verification_attributes = ses_client.get_identity_verification_attributes(
-        Identities=identities
-    ).get("VerificationAttributes", {})
+    verification_attributes = {}
+    if needs_detail(columns, DETAIL_COLUMNS["get_identity_verification_attributes"]):
+        verification_attributes = ses_client.get_identity_verification_attributes(
+            Identities=identities
+        ).get("VerificationAttributes", {})
 
     # 태그 정보 조회
     tags = {}
-    for identity in identities:
-        try:
-            tag_response = ses_client.list_tags_for_resource(
-                ResourceArn=f"arn:aws:ses:{region}:{session.client('sts').get_caller_identity().get('Account')}:identity/{identity}"
-            )
-            tags[identity] = tag_response.get("Tags", [])
-        except Exception:
-            tags[identity] = []
+    if needs_detail(columns, DETAIL_COLUMNS["list_tags_for_resource"]):
+        for identity in identities:
+            try:
+                tag_response = ses_client.list_tags_for_resource(
+                    ResourceArn=f"arn:aws:ses:{region}:{session.client('sts').get_caller_identity().get('Account')}:identity/{identity}"
+                )
+                tags[identity] = tag_response.get("Tags", [])
+            except Exception:
+                tags[identity] = []
 
     return {
         "Identities": identities,
@@ -1,7 +1,56 @@
 import pandas as pd
 
+from resources import CountQuery, TagSource, TrailSource
 from utils.name_tag import extract_name_tag
 
+COLUMN_SCHEMA = {
+    "Name": "string",
+    "SubnetId": "string",
+    "VpcId": "category",
+    "CidrBlock": "string",
+    "AvailabilityZone": "category",
+    "State": "category",
+    "AvailableIpAddressCount": "int",
+    "DefaultForAz": "bool",
+    "MapPublicIpOnLaunch": "bool",
+    "Tags": "string",
+}
+
+RAW_PROJECTION = {
+    "Subnets": [
+        "SubnetId",
+        "VpcId",
+        "CidrBlock",
+        "AvailabilityZone",
+        "State",
+        "AvailableIpAddressCount",
+        "DefaultForAz",
+        "MapPublicIpOnLaunch",
+        "Tags",
+    ]
+}
+
+COUNT_QUERIES = (CountQuery("ec2", "describe_subnets", "Subnets", page_size=1000),)
+
+TAG_SOURCE = TagSource("ec2:subnet")
+
+TRAIL_SOURCE = TrailSource(
+    "ec2.amazonaws.com",
+    id_events={
+        "CreateSubnet": "responseElements.subnet.subnetId",
+        "DeleteSubnet": "requestParameters.subnetId",
+        "ModifySubnetAttribute": "requestParameters.subnetId",
+        # 인스턴스가 생기면 서브넷의 AvailableIpAddressCount가 바뀝니다
+        "RunInstances": "responseElements.instancesSet.items[].subnetId",
+        "CreateTags": "requestParameters.resourcesSet.items[].resourceId",
+        "DeleteTags": "requestParameters.resourcesSet.items[].resourceId",
+    },
+    # 종료되거나 삭제되는 ENI의 서브넷은 이벤트에 남지 않습니다
+    task_events=("TerminateInstances", "DeleteNetworkInterface"),
+    resource_type="AWS::EC2::Subnet",
+    id_prefix="subnet-",
+)
+
 
 def get_raw_data(session, region):
     """
@@ -12,6 +61,18 @@ def get_raw_data(session, region):
     return response
 
 
+def get_raw_data_by_ids(session, region, ids):
+    """
+    지정한 Subnet만 describe_subnets() 결과(원본 JSON)로 반환 (--incremental)
+    응답이 여러 페이지로 나뉘어도 NextToken을 따라 모든 페이지를 합칩니다.
+    """
+    ec2_client = session.client("ec2", region_name=region)
+    paginator = ec2_client.get_paginator("describe_subnets")
+    return paginator.paginate(
+        Filters=[{"Name": "subnet-id", "Values": ids}]
+    ).build_full_result()
+
+
 def get_filtered_data(raw_data):
     """
     원본 JSON에서 주요 필드만 추출해 DataFrame으로 반환
@@ -1,7 +1,37 @@
 import pandas as pd
 
+from resources import CountQuery, TagSource, TrailSource
 from utils.name_tag import extract_name_tag
 
+COLUMN_SCHEMA = {
+    "Name": "string",
+    "VpcId": "string",
+    "State": "category",
+    "CidrBlock": "string",
+    "IsDefault": "bool",
+}
+
+RAW_PROJECTION = {"Vpcs": ["VpcId", "State", "CidrBlock", "IsDefault", "Tags"]}
+
+COUNT_QUERIES = (CountQuery("ec2", "describe_vpcs", "Vpcs", page_size=1000),)
+
+TAG_SOURCE = TagSource("ec2:vpc")
+
+TRAIL_SOURCE = TrailSource(
+    "ec2.amazonaws.com",
+    id_events={
+        "CreateVpc": "responseElements.vpc.vpcId",
+        "CreateDefaultVpc": "responseElements.vpc.vpcId",
+        "DeleteVpc": "requestParameters.vpcId",
+        "ModifyVpcAttribute": "requestParameters.vpcId",
+        "AssociateVpcCidrBlock": "requestParameters.vpcId",
+        "CreateTags": "requestParameters.resourcesSet.items[].resourceId",
+        "DeleteTags": "requestParameters.resourcesSet.items[].resourceId",
+    },
+    resource_type="AWS::EC2::VPC",
+    id_prefix="vpc-",
+)
+
 
 def get_raw_data(session, region):
     """
@@ -12,6 +42,18 @@ def get_raw_data(session, region):
     return response
 
 
+def get_raw_data_by_ids(session, region, ids):
+    """
+    지정한 VPC만 describe_vpcs() 결과(원본 JSON)로 반환 (--incremental)
+    응답이 여러 페이지로 나뉘어도 NextToken을 따라 모든 페이지를 합칩니다.
+    """
+    ec2_client = session.client("ec2", region_name=region)
+    paginator = ec2_client.get_paginator("describe_vpcs")
+    return paginator.paginate(
+        Filters=[{"Name": "vpc-id", "Values": ids}]
+    ).build_full_result()
+
+
 def get_filtered_data(raw_data):
     """
     원본 JSON에서 주요 필드만 추출해 DataFrame으로 반환
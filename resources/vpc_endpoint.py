@@ -1,7 +1,52 @@
 import pandas as pd
 
+from resources import CountQuery, TagSource, TrailSource
 from utils.name_tag import extract_name_tag
 
+COLUMN_SCHEMA = {
+    "Name": "string",
+    "VpcEndpointId": "string",
+    "VpcId": "category",
+    "ServiceName": "category",
+    "State": "category",
+    "CreationDate": "date",
+    "RouteTableIds": "string",
+    "PolicyDocument": "string",
+}
+
+RAW_PROJECTION = {
+    "VpcEndpoints": [
+        "VpcEndpointId",
+        "VpcId",
+        "ServiceName",
+        "State",
+        "CreationTimestamp",
+        "RouteTableIds",
+        "PolicyDocument",
+        "Tags",
+    ]
+}
+
+COUNT_QUERIES = (
+    CountQuery("ec2", "describe_vpc_endpoints", "VpcEndpoints", page_size=1000),
+)
+
+TAG_SOURCE = TagSource("ec2:vpc-endpoint")
+
+TRAIL_SOURCE = TrailSource(
+    "ec2.amazonaws.com",
+    id_events={
+        "CreateTags": "requestParameters.resourcesSet.items[].resourceId",
+        "DeleteTags": "requestParameters.resourcesSet.items[].resourceId",
+    },
+    task_events=(
+        "CreateVpcEndpoint",
+        "ModifyVpcEndpoint",
+        "DeleteVpcEndpoints",
+    ),
+    id_prefix="vpce-",
+)
+
 
 def get_raw_data(session, region):
     """
@@ -0,0 +1,19 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import sys
+
+import pytest
+
+sys.path.insert(0, ".")
+
+import listup_aws_resources
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    """Point every run's outputs, checkpoints and timings at a temporary directory."""
+    path = tmp_path / "data"
+    monkeypatch.setattr(listup_aws_resources, "DATA_DIR", str(path))
+    return path
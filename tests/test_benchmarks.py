@@ -0,0 +1,67 @@
+"""
+Tests for the synthetic inventory generators and the benchmark runner.
+"""
+
+import sys
+
+import pytest
+
+sys.path.insert(0, ".")
+
+from benchmarks.run import (
+    STAGES,
+    StageResult,
+    benchmark_resource,
+    check_thresholds,
+    thresholds_from,
+)
+from benchmarks.synthetic import GENERATORS, generate_raw
+from resources import RESOURCE_SPECS, RESOURCE_SPECS_BY_KEY
+from utils.dtypes import apply_column_schema
+
+
+def test_generators_cover_every_resource():
+    """Test that every registered resource has a generator."""
+    assert set(GENERATORS) == {spec.key for spec in RESOURCE_SPECS}
+
+
+@pytest.mark.parametrize("spec", RESOURCE_SPECS, ids=lambda spec: spec.key)
+def test_generated_raw_data_filters_to_requested_rows(spec):
+    """Test that synthetic raw data goes through get_filtered_data() unchanged."""
+    df = apply_column_schema(
+        spec.module.get_filtered_data(generate_raw(spec.key, 25)),
+        spec.module.COLUMN_SCHEMA,
+    )
+    assert len(df) == 25
+
+
+def test_generate_raw_is_deterministic():
+    """Test that the same seed produces the same data."""
+    assert generate_raw("ec2", 10, seed=1) == generate_raw("ec2", 10, seed=1)
+    assert generate_raw("ec2", 10, seed=1) != generate_raw("ec2", 10, seed=2)
+
+
+def test_benchmark_resource_measures_stages(tmp_path):
+    """Test that every stage is measured for a small inventory."""
+    results = benchmark_resource(
+        RESOURCE_SPECS_BY_KEY["security_groups"], 20, work_dir=str(tmp_path)
+    )
+
+    assert [result.stage for result in results] == list(STAGES)
+    assert all(result.seconds >= 0 for result in results)
+    assert all(result.peak_mb is not None for result in results)
+    assert not list(tmp_path.iterdir())
+
+
+def test_check_thresholds():
+    """Test that only measurements above their thresholds are reported."""
+    results = [
+        StageResult("ec2", "filter", 100, 0.5, 10.0),
+        StageResult("ec2", "excel", 100, 2.0, None),
+        StageResult("s3", "filter", 100, 9.0, 99.0),
+    ]
+    thresholds = thresholds_from(results[:2], headroom=2.0)
+    assert thresholds["ec2/filter/100"] == {"seconds": 1.0, "peak_mb": 20.0}
+
+    thresholds["ec2/excel/100"]["seconds"] = 1.5
+    assert check_thresholds(results, thresholds) == ["ec2/excel/100: 2.000s > 1.5s"]
@@ -0,0 +1,101 @@
+"""
+Tests for recording and replaying AWS API cassettes.
+"""
+
+import sys
+from datetime import datetime, timezone
+
+import boto3
+import pytest
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+sys.path.insert(0, ".")
+
+from benchmarks.fake_aws import FakeAWSServer, NetworkProfile, SyntheticInventory
+from utils.cassettes import CassetteLibrary, CassetteMissError, decode, encode
+
+INSTANT = {"median_ms": 0, "p99_ms": 0}
+
+
+def make_session(region="ap-northeast-2"):
+    return boto3.Session(
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        region_name=region,
+    )
+
+
+def test_encode_round_trip():
+    """Test that datetimes and bytes survive the JSON encoding."""
+    value = {
+        "LaunchTime": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "Blob": b"\x00\x01",
+        "Items": [{"Name": "a", "Count": 1}],
+    }
+    assert decode(encode(value)) == value
+
+
+def test_record_then_replay_offline(tmp_path):
+    """Test that recorded responses are replayed without the endpoint."""
+    profile = NetworkProfile({"default": {**INSTANT, "page_size": 2}})
+    recorder = CassetteLibrary(str(tmp_path), "record")
+    with FakeAWSServer(SyntheticInventory(5), profile) as server:
+        session = recorder.attach(make_session())
+        ec2 = session.client("ec2", endpoint_url=server.endpoint_url)
+        recorded = [
+            page["Reservations"]
+            for page in ec2.get_paginator("describe_instances").paginate()
+        ]
+        table = session.client("dynamodb", endpoint_url=server.endpoint_url)
+        name = table.list_tables()["TableNames"][1]
+        described = table.describe_table(TableName=name)["Table"]
+    assert list(tmp_path.glob("ec2/ap-northeast-2/DescribeInstances-*.json.gz"))
+
+    replayer = CassetteLibrary(str(tmp_path), "replay")
+    session = replayer.attach(make_session())
+    ec2 = session.client("ec2", endpoint_url="http://127.0.0.1:9")
+    replayed = [
+        page["Reservations"]
+        for page in ec2.get_paginator("describe_instances").paginate()
+    ]
+    table = session.client("dynamodb", endpoint_url="http://127.0.0.1:9")
+    assert replayed == recorded
+    assert table.describe_table(TableName=name)["Table"] == described
+
+    with pytest.raises(CassetteMissError):
+        table.describe_table(TableName="not-recorded")
+
+
+def test_error_responses_are_replayed(tmp_path):
+    """Test that a recorded error response raises the same ClientError on replay."""
+    profile = NetworkProfile({"default": {**INSTANT, "throttle_rate": 1.0}})
+    config = Config(retries={"total_max_attempts": 1, "mode": "standard"})
+    with FakeAWSServer(SyntheticInventory(1), profile) as server:
+        rds = (
+            CassetteLibrary(str(tmp_path), "record")
+            .attach(make_session())
+            .client("rds", endpoint_url=server.endpoint_url, config=config)
+        )
+        with pytest.raises(ClientError):
+            rds.describe_db_instances()
+
+    rds = (
+        CassetteLibrary(str(tmp_path), "replay")
+        .attach(make_session())
+        .client("rds", endpoint_url="http://127.0.0.1:9")
+    )
+    with pytest.raises(ClientError) as error:
+        rds.describe_db_instances()
+    assert error.value.response["Error"]["Code"] == "Throttling"
+
+
+def test_session_factory_attaches_in_every_session(tmp_path):
+    """Test that the wrapped session factory attaches the cassettes to each session."""
+    factory = CassetteLibrary(str(tmp_path), "replay").session_factory(make_session)
+    sts = factory("us-east-1").client("sts", endpoint_url="http://127.0.0.1:9")
+
+    with pytest.raises(CassetteMissError, match="GetCallerIdentity"):
+        sts.get_caller_identity()
+    with pytest.raises(ValueError):
+        CassetteLibrary(str(tmp_path), "rewind")
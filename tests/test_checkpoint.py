@@ -0,0 +1,75 @@
+"""
+Tests for per-task run checkpoints.
+"""
+
+import sys
+from datetime import datetime, timezone
+
+import pyarrow as pa
+
+sys.path.insert(0, ".")
+
+from utils.checkpoint import RunCheckpoint, prune_runs
+
+
+def test_start_and_load_info(tmp_path):
+    """Test that the run information round-trips."""
+    checkpoint = RunCheckpoint(str(tmp_path), "20261001_000000_000")
+    assert not checkpoint.exists()
+
+    checkpoint.start(
+        datetime(2026, 10, 1, tzinfo=timezone.utc),
+        "123",
+        ["us-east-1"],
+        None,
+        tags=True,
+    )
+
+    assert checkpoint.exists()
+    info = RunCheckpoint(str(tmp_path), "20261001_000000_000").load_info()
+    assert info["account_id"] == "123"
+    assert info["regions"] == ["us-east-1"]
+    assert info["resources"] is None
+    assert info["tags"] is True
+
+
+def test_save_and_load_task(tmp_path):
+    """Test that raw data and the filtered table are restored."""
+    checkpoint = RunCheckpoint(str(tmp_path), "run")
+    table = pa.table(
+        {
+            "InstanceId": ["i-1", "i-2"],
+            "State": pa.array(["running", "stopped"]).dictionary_encode(),
+        }
+    )
+    raw = {"Reservations": [{"Instances": [{"InstanceId": "i-1"}]}]}
+
+    assert not checkpoint.has_task("us-east-1", "ec2")
+    checkpoint.save_task("us-east-1", "ec2", raw, table)
+
+    assert checkpoint.has_task("us-east-1", "ec2")
+    assert not checkpoint.has_task("global", "ec2")
+    loaded_raw, loaded_table = checkpoint.load_task("us-east-1", "ec2")
+    assert loaded_raw == raw
+    assert loaded_table.equals(table)
+    assert not list((tmp_path / "runs" / "run" / "tasks" / "us-east-1").glob("*.tmp"))
+
+
+def test_prune_runs_keeps_recent_and_current_runs(tmp_path):
+    """Test that only the newest runs and the current run are kept."""
+    run_ids = [f"2026100{day}_000000_000" for day in range(1, 6)]
+    for run_id in run_ids:
+        RunCheckpoint(str(tmp_path), run_id).start(
+            datetime(2026, 10, 1, tzinfo=timezone.utc), "123", ["us-east-1"], None
+        )
+    # 실행 정보 없이 중단된 실행도 정리합니다
+    (tmp_path / "runs" / "20260930_000000_000").mkdir()
+
+    removed = prune_runs(str(tmp_path), 2, current=run_ids[0])
+
+    assert removed == ["20260930_000000_000", *run_ids[1:3]]
+    assert sorted(path.name for path in (tmp_path / "runs").iterdir()) == [
+        run_ids[0],
+        *run_ids[3:],
+    ]
+    assert prune_runs(str(tmp_path / "missing"), 1) == []
@@ -0,0 +1,113 @@
+"""
+Tests for pooled clients, timeout policies and the region circuit breaker.
+"""
+
+import sys
+import time
+from unittest.mock import MagicMock
+
+import boto3
+import pytest
+from botocore.config import Config
+from botocore.exceptions import EndpointConnectionError
+
+sys.path.insert(0, ".")
+
+from utils.clients import (
+    TIMEOUT_POLICIES,
+    ClientPoolSession,
+    RegionCircuitBreaker,
+    RegionUnavailableError,
+    client_config,
+    operation_deadline,
+)
+
+
+def _session() -> boto3.Session:
+    return boto3.Session(
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        region_name="us-east-1",
+    )
+
+
+def test_client_pool_session_reuses_clients():
+    """Test that clients are created once per service and region."""
+    session = MagicMock()
+    pooled = ClientPoolSession(session)
+
+    first = pooled.client("ec2", region_name="us-east-1")
+    second = pooled.client("ec2", region_name="us-east-1")
+    pooled.client("s3")
+
+    assert first is second
+    assert session.client.call_count == 2
+    assert pooled.region_name is session.region_name
+
+
+def test_service_timeout_policy_is_applied():
+    """Test that clients get the connect/read timeouts of their service."""
+    pooled = ClientPoolSession(_session())
+
+    config = pooled.client("ec2", region_name="us-east-1").meta.config
+
+    assert config.read_timeout == TIMEOUT_POLICIES["ec2"].read
+    assert config.connect_timeout == TIMEOUT_POLICIES["ec2"].connect
+    assert client_config("lambda").read_timeout == 30
+
+
+def test_explicit_config_is_merged():
+    """Test that a caller's Config overrides the policy values it sets."""
+    pooled = ClientPoolSession(_session())
+
+    client = pooled.client("ec2", config=Config(read_timeout=1))
+
+    assert client.meta.config.read_timeout == 1
+    assert client.meta.config.connect_timeout == TIMEOUT_POLICIES["ec2"].connect
+
+
+def test_circuit_breaker_opens_after_consecutive_failures():
+    """Test that a region is cut off after N connection failures."""
+    breaker = RegionCircuitBreaker(threshold=2)
+    pooled = ClientPoolSession(_session(), breaker)
+    client = pooled.client(
+        "ec2",
+        endpoint_url="http://127.0.0.1:9",
+        config=Config(retries={"max_attempts": 1}, connect_timeout=1),
+    )
+
+    for _ in range(2):
+        with pytest.raises(EndpointConnectionError):
+            client.describe_instances()
+    with pytest.raises(RegionUnavailableError):
+        client.describe_instances()
+    with pytest.raises(RegionUnavailableError):
+        breaker.check("us-east-1")
+    breaker.check("eu-west-1")
+
+
+def test_success_resets_failure_count():
+    """Test that only consecutive failures open the circuit."""
+    breaker = RegionCircuitBreaker(threshold=2)
+
+    breaker.record_failure("us-east-1", "ReadTimeoutError")
+    breaker.record_success("us-east-1")
+    breaker.record_failure("us-east-1", "ReadTimeoutError")
+    breaker.check("us-east-1")
+
+    disabled = RegionCircuitBreaker(threshold=0)
+    for _ in range(5):
+        disabled.record_failure("us-east-1", "ReadTimeoutError")
+    disabled.check("us-east-1")
+
+
+def test_operation_deadline():
+    """Test that calls after a task's deadline are cancelled."""
+    breaker = RegionCircuitBreaker(threshold=3)
+
+    with operation_deadline(0.01):
+        breaker.check("us-east-1")
+        time.sleep(0.02)
+        with pytest.raises(RegionUnavailableError):
+            breaker.check("us-east-1")
+    breaker.check("us-east-1")
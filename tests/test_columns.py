@@ -0,0 +1,108 @@
+"""
+Tests for demand-driven column selection (--columns).
+"""
+
+import sys
+from datetime import datetime, timezone
+
+import boto3
+import pytest
+
+sys.path.insert(0, ".")
+
+from benchmarks.collect import aws_environment
+from benchmarks.fake_aws import FakeAWSServer, NetworkProfile, SyntheticInventory
+from listup_aws_resources import collect_resource, main, parse_column_selection
+from resources import RESOURCE_SPECS_BY_KEY
+from utils.checkpoint import RunCheckpoint
+from utils.columns import needs_detail
+from utils.filter_pool import filter_to_table
+
+REGION = "ap-northeast-2"
+
+
+@pytest.fixture
+def server():
+    profile = NetworkProfile({"default": {"median_ms": 0, "p99_ms": 0}})
+    with FakeAWSServer(SyntheticInventory(5), profile) as server:
+        with aws_environment(server.endpoint_url):
+            yield server
+
+
+def test_needs_detail():
+    """Test that a detail call is needed only for requested columns or no selection."""
+    assert needs_detail(None, ())
+    assert needs_detail({"TableName", "ItemCount"}, ("ItemCount",))
+    assert not needs_detail({"TableName"}, ("ItemCount",))
+
+
+def test_parse_column_selection():
+    """Test that the ID column is always kept and unknown names are rejected."""
+    selection = parse_column_selection(["dynamodb=TableStatus", "eks=Status,Version"])
+    assert selection == {
+        "dynamodb": {"TableName", "TableStatus"},
+        "eks": {"Name", "Status", "Version"},
+    }
+    with pytest.raises(ValueError, match="ItemCnt"):
+        parse_column_selection(["dynamodb=ItemCnt"])
+    with pytest.raises(ValueError):
+        parse_column_selection(["dynamodb"])
+
+
+def test_unrequested_columns_make_no_detail_calls(server):
+    """Test that detail calls are made only for the columns that need them."""
+    session = boto3.Session(region_name=REGION)
+    spec = RESOURCE_SPECS_BY_KEY["dynamodb"]
+
+    _, df = collect_resource(spec, session, REGION, columns={"dynamodb": {"TableName"}})
+    assert list(df.columns) == ["TableName"] and len(df) == 5
+    assert "dynamodb.DescribeTable" not in server.calls
+
+    _, df = collect_resource(
+        spec, session, REGION, columns={"dynamodb": {"TableName", "ItemCount"}}
+    )
+    assert list(df.columns) == ["TableName", "ItemCount"]
+    assert df["ItemCount"].notna().all()
+    assert server.calls["dynamodb.DescribeTable"] == 5
+
+    ses = RESOURCE_SPECS_BY_KEY["ses_identity"]
+    _, df = collect_resource(
+        ses, session, REGION, columns={"ses_identity": {"Identity", "IdentityType"}}
+    )
+    assert set(df.columns) == {"Identity", "IdentityType"}
+    assert "ses.GetIdentityVerificationAttributes" not in server.calls
+    assert "ses.ListTagsForResource" not in server.calls
+
+
+def test_filter_pool_keeps_selected_columns():
+    """Test that the filter worker applies the same column selection."""
+    from benchmarks.synthetic import generate_raw
+
+    table = filter_to_table("ec2", generate_raw("ec2", 3), {"InstanceId", "State"})
+    assert table.column_names == ["InstanceId", "State"]
+
+
+def test_main_rejects_columns_with_history(capsys):
+    """Test that partial rows are never written into the history."""
+    with pytest.raises(SystemExit):
+        main(["--columns", "ec2=State", "--history"])
+
+    assert "--history" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("option", ["--resume", "--incremental"])
+def test_main_rejects_history_on_a_columns_base_run(option, data_dir, capsys):
+    """Test that --history is refused when the base run used --columns."""
+    run_id = "20240101_000000_000"
+    RunCheckpoint(str(data_dir), run_id).start(
+        datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "123456789012",
+        [REGION],
+        ["ec2"],
+        columns={"ec2": ["State"]},
+    )
+
+    with pytest.raises(SystemExit):
+        main([option, run_id, "--history"])
+
+    assert "--history" in capsys.readouterr().err
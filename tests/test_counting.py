@@ -0,0 +1,71 @@
+"""
+Tests for the count-only listing calls.
+"""
+
+import sys
+from unittest.mock import patch
+
+import boto3
+import pytest
+
+sys.path.insert(0, ".")
+
+from benchmarks.collect import aws_environment
+from benchmarks.fake_aws import FakeAWSServer, NetworkProfile, SyntheticInventory
+from listup_aws_resources import main
+from resources import RESOURCE_SPECS
+from utils.counting import count_resource, count_totals
+
+REGION = "ap-northeast-2"
+
+# 목록이 여러 페이지로 나뉘도록 페이지 크기보다 많은 리소스를 만듭니다
+PROFILE = {"default": {"median_ms": 0, "p99_ms": 0, "page_size": 3}}
+
+
+@pytest.fixture
+def server():
+    with FakeAWSServer(SyntheticInventory(7), NetworkProfile(PROFILE)) as server:
+        with aws_environment(server.endpoint_url):
+            yield server
+
+
+def test_counts_match_filtered_inventory(server):
+    """Test that every resource's listing calls count the rows a full collection yields."""
+    for spec in RESOURCE_SPECS:
+        region = spec.global_region if spec.is_global else REGION
+        session = boto3.Session(region_name=region or "us-east-1")
+        raw_data = server.inventory.get(spec.key, region or "us-east-1")
+
+        expected = len(spec.module.get_filtered_data(raw_data))
+        assert count_resource(spec, session, region) == expected, spec.key
+
+    # 상세 조회는 호출하지 않고 목록은 최대 페이지 크기로 요청합니다
+    assert not {
+        operation
+        for operation in server.calls
+        if operation.split(".")[1]
+        in ("DescribeTable", "DescribeStream", "DescribeCluster", "GetJobs")
+    }
+    assert server.calls["dynamodb.ListTables"] == 3
+
+
+@patch("json.dump")
+def test_main_count_only(mock_json_dump, server):
+    """Test that --count-only writes counts per region and type without exports."""
+    main(["--count-only", "--region", REGION, "--resources", "ec2", "dynamodb", "s3"])
+
+    report = mock_json_dump.call_args.args[0]
+    assert set(report["counts"]) == {REGION, "global"}
+    assert report["counts"][REGION]["DynamoDB"] == 7
+    assert report["totals"] == count_totals(report["counts"])
+    assert not report["failures"]
+    assert "ec2.DescribeInstances" in server.calls
+    assert "dynamodb.DescribeTable" not in server.calls
+
+
+def test_count_only_rejects_full_collection_flags(capsys):
+    """Test that --count-only cannot be combined with flags that need full results."""
+    with pytest.raises(SystemExit):
+        main(["--count-only", "--history", "--region-processes", "2"])
+
+    assert "--history, --region-processes" in capsys.readouterr().err
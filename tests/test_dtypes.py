@@ -0,0 +1,96 @@
+"""
+Tests for column dtype schema utility functions.
+"""
+
+import sys
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, ".")
+
+from resources import RESOURCE_SPECS
+from utils.dtypes import COLUMN_KINDS, apply_column_schema, convert_column
+
+
+class TestApplyColumnSchema:
+    """Test cases for apply_column_schema."""
+
+    def test_converts_declared_columns(self):
+        """Test that each kind is converted to its compact dtype."""
+        df = pd.DataFrame(
+            [
+                {
+                    "Id": "vol-1",
+                    "State": "in-use",
+                    "Size": 8,
+                    "Public": True,
+                    "CreateTime": "2023-05-15",
+                    "CreatedAt": datetime(2023, 5, 15, 12, 30),
+                },
+                {
+                    "Id": "vol-2",
+                    "State": "in-use",
+                    "Size": None,
+                    "Public": False,
+                    "CreateTime": "N/A",
+                    "CreatedAt": datetime(2023, 5, 16, 8, 0),
+                },
+            ]
+        )
+        schema = {
+            "Id": "string",
+            "State": "category",
+            "Size": "int",
+            "Public": "bool",
+            "CreateTime": "date",
+            "CreatedAt": "datetime",
+        }
+
+        result = apply_column_schema(df, schema)
+
+        assert result["Id"].dtype == "string"
+        assert isinstance(result["State"].dtype, pd.CategoricalDtype)
+        assert str(result["Size"].dtype) == "Int64"
+        assert str(result["Public"].dtype) == "boolean"
+        assert pd.api.types.is_datetime64_any_dtype(result["CreatedAt"])
+        records = result.to_dict("records")
+        assert records[0]["CreateTime"] == date(2023, 5, 15)
+        assert records[1]["CreateTime"] is None
+        assert records[1]["Size"] is None
+
+    def test_ignores_missing_and_undeclared_columns(self):
+        """Test that columns outside the schema are left untouched."""
+        df = pd.DataFrame([{"Name": "a", "Config": {"PrivateZone": False}}])
+
+        result = apply_column_schema(df, {"Name": "string", "Missing": "int"})
+
+        assert list(result.columns) == ["Name", "Config"]
+        assert result["Config"].dtype == object
+
+    def test_keeps_column_when_conversion_fails(self):
+        """Test that an unconvertible column keeps its original dtype."""
+        df = pd.DataFrame([{"Flag": "maybe"}, {"Flag": "yes"}])
+
+        result = apply_column_schema(df, {"Flag": "bool"})
+
+        assert result["Flag"].tolist() == ["maybe", "yes"]
+
+    def test_empty_dataframe(self):
+        """Test that an empty DataFrame is returned as is."""
+        df = pd.DataFrame()
+        assert apply_column_schema(df, {"Name": "string"}) is df
+
+    def test_unknown_kind(self):
+        """Test that convert_column rejects unknown kinds."""
+        with pytest.raises(ValueError):
+            convert_column(pd.Series(["a"]), "float")
+
+
+def test_resource_schemas_use_known_kinds():
+    """Test that every resource module declares a valid COLUMN_SCHEMA."""
+    for spec in RESOURCE_SPECS:
+        schema = spec.module.COLUMN_SCHEMA
+        assert schema, spec.key
+        assert set(schema.values()) <= set(COLUMN_KINDS), spec.key
@@ -0,0 +1,161 @@
+"""
+Tests for the Excel exporter.
+"""
+
+import sys
+
+import openpyxl
+import pandas as pd
+import pytest
+
+sys.path.insert(0, ".")
+
+from utils.excel_export import ExcelExporter
+from utils.result_store import GLOBAL_SCOPE, ResultStore
+
+SHEET_PREFIXES = {"EC2": "EC2", "S3": "S3", "KinesisFirehose": "KinesisFirehose"}
+
+
+def _store() -> ResultStore:
+    store = ResultStore()
+    store.put("us-east-1", "EC2", pd.DataFrame([{"InstanceId": "i-1"}]))
+    store.put(
+        "ap-northeast-2",
+        "EC2",
+        pd.DataFrame([{"InstanceId": "i-2"}, {"InstanceId": "i-3"}]),
+    )
+    store.put(GLOBAL_SCOPE, "S3", pd.DataFrame([{"BucketName": "b"}]))
+    return store
+
+
+def _read(path) -> dict[str, list[list]]:
+    workbook = openpyxl.load_workbook(path)
+    return {
+        ws.title: [[cell.value for cell in row] for row in ws.iter_rows()]
+        for ws in workbook
+    }
+
+
+def test_region_layout(tmp_path):
+    """Test one sheet per resource and region."""
+    path = tmp_path / "out.xlsx"
+    store = _store()
+    exporter = ExcelExporter(str(path), SHEET_PREFIXES)
+    for region in store.regions(include_global=True):
+        exporter.write_region(store, region)
+    exporter.close()
+
+    sheets = _read(path)
+
+    assert list(sheets) == ["EC2_us-east-1", "EC2_ap-northeast-2", "S3"]
+    assert sheets["EC2_ap-northeast-2"] == [["InstanceId"], ["i-2"], ["i-3"]]
+
+
+def test_resource_layout(tmp_path):
+    """Test one sheet per resource with Region and AccountId columns."""
+    path = tmp_path / "out.xlsx"
+    store = _store()
+    exporter = ExcelExporter(
+        str(path), SHEET_PREFIXES, layout="resource", account_id="123456789012"
+    )
+    for region in store.regions(include_global=True):
+        exporter.write_region(store, region)
+    exporter.close()
+
+    sheets = _read(path)
+
+    assert list(sheets) == ["EC2", "S3"]
+    assert sheets["EC2"] == [
+        ["Region", "AccountId", "InstanceId"],
+        ["us-east-1", "123456789012", "i-1"],
+        ["ap-northeast-2", "123456789012", "i-2"],
+        ["ap-northeast-2", "123456789012", "i-3"],
+    ]
+    assert sheets["S3"][1] == [GLOBAL_SCOPE, "123456789012", "b"]
+
+
+def test_truncated_sheet_names_do_not_collide(tmp_path):
+    """Test that names truncated to 31 characters get a unique suffix."""
+    path = tmp_path / "out.xlsx"
+    store = ResultStore()
+    for region in ["ap-southeast-1xy", "ap-southeast-1xz"]:
+        store.put(region, "KinesisFirehose", pd.DataFrame([{"Name": region}]))
+    exporter = ExcelExporter(str(path), SHEET_PREFIXES)
+    for region in store.regions():
+        exporter.write_region(store, region)
+    exporter.close()
+
+    sheets = _read(path)
+
+    assert list(sheets) == [
+        "KinesisFirehose_ap-southeast-1x",
+        "KinesisFirehose_ap-southeast-~2",
+    ]
+
+
+def test_unknown_layout(tmp_path):
+    """Test that an unknown layout is rejected."""
+    with pytest.raises(ValueError):
+        ExcelExporter(str(tmp_path / "out.xlsx"), SHEET_PREFIXES, layout="account")
+
+
+def test_tables_over_max_rows_continue_on_numbered_sheets(tmp_path):
+    """Test that rows beyond max_rows are written to continuation sheets."""
+    path = tmp_path / "out.xlsx"
+    store = ResultStore()
+    store.put("us-east-1", "EC2", pd.DataFrame({"InstanceId": ["i-1", "i-2", "i-3"]}))
+    store.put("us-west-2", "EC2", pd.DataFrame({"InstanceId": ["i-4", "i-5"]}))
+    exporter = ExcelExporter(
+        str(path), SHEET_PREFIXES, layout="resource", max_rows=2, chunk_rows=1
+    )
+    for region in store.regions():
+        exporter.write_region(store, region)
+    exporter.close()
+
+    sheets = _read(path)
+
+    assert list(sheets) == ["EC2", "EC2_2", "EC2_3"]
+    assert [row[2] for row in sheets["EC2"]] == ["InstanceId", "i-1", "i-2"]
+    assert [row[2] for row in sheets["EC2_2"]] == ["InstanceId", "i-3", "i-4"]
+    assert sheets["EC2_3"] == [
+        ["Region", "AccountId", "InstanceId"],
+        ["us-west-2", None, "i-5"],
+    ]
+
+
+def test_continuation_sheet_names_fit_31_characters(tmp_path):
+    """Test that the shard suffix survives sheet name truncation."""
+    path = tmp_path / "out.xlsx"
+    store = ResultStore()
+    store.put(
+        "ap-southeast-1", "KinesisFirehose", pd.DataFrame({"Name": ["a", "b", "c"]})
+    )
+    exporter = ExcelExporter(str(path), SHEET_PREFIXES, max_rows=2)
+    exporter.write_region(store, "ap-southeast-1")
+    exporter.close()
+
+    assert list(_read(path)) == [
+        "KinesisFirehose_ap-southeast-1",
+        "KinesisFirehose_ap-southeast-_2",
+    ]
+
+
+def test_invalid_max_rows(tmp_path):
+    """Test that max_rows is limited to the Excel row cap."""
+    with pytest.raises(ValueError):
+        ExcelExporter(str(tmp_path / "out.xlsx"), SHEET_PREFIXES, max_rows=2_000_000)
+
+
+def test_errors_sheet(tmp_path):
+    """Test that failed tasks are written to an Errors sheet only when present."""
+    path = tmp_path / "out.xlsx"
+    exporter = ExcelExporter(str(path), SHEET_PREFIXES)
+    exporter.write_region(_store(), GLOBAL_SCOPE)
+    exporter.write_errors([])
+    exporter.write_errors([{"Service": "RDS", "Region": "us-east-1"}])
+    exporter.close()
+
+    sheets = _read(path)
+
+    assert list(sheets) == ["S3", "Errors"]
+    assert sheets["Errors"] == [["Service", "Region"], ["RDS", "us-east-1"]]
@@ -0,0 +1,175 @@
+"""
+Tests for the local AWS stand-in and the end-to-end collection benchmark.
+"""
+
+import json
+import os
+import sys
+
+import boto3
+import pytest
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+sys.path.insert(0, ".")
+
+from benchmarks.collect import DEFAULT_NETWORK_PATH, _snapshot, run_setting
+from benchmarks.fake_aws import (
+    Behavior,
+    FakeAWSServer,
+    NetworkProfile,
+    SyntheticInventory,
+    paginate,
+)
+
+INSTANT = {"median_ms": 0, "p99_ms": 0}
+
+
+@pytest.fixture
+def server():
+    profile = NetworkProfile({"default": {**INSTANT, "page_size": 3}})
+    with FakeAWSServer(SyntheticInventory(7), profile) as server:
+        yield server
+
+
+def client(server, service, **kwargs):
+    return boto3.Session(
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        region_name="ap-northeast-2",
+    ).client(service, endpoint_url=server.endpoint_url, **kwargs)
+
+
+def test_ec2_pages_follow_page_size(server):
+    """Test that EC2 responses are paged and the paginator sees every instance."""
+    ec2 = client(server, "ec2")
+    first = ec2.describe_instances()
+    pages = list(ec2.get_paginator("describe_instances").paginate())
+
+    reservations = server.inventory.get("ec2", "ap-northeast-2")["Reservations"]
+
+    assert len(first["Reservations"]) == 3 and first["NextToken"]
+    assert sum(len(page["Reservations"]) for page in pages) == len(reservations)
+    assert server.calls["ec2.DescribeInstances"] == 1 + len(pages)
+
+
+def test_json_and_rest_protocols(server):
+    """Test list/describe pairs over the JSON, REST-JSON and REST-XML protocols."""
+    dynamodb = client(server, "dynamodb")
+    tables = [
+        name
+        for page in dynamodb.get_paginator("list_tables").paginate()
+        for name in page["TableNames"]
+    ]
+    assert len(tables) == 7
+    assert (
+        dynamodb.describe_table(TableName=tables[4])["Table"]["TableName"] == tables[4]
+    )
+
+    eks = client(server, "eks")
+    name = eks.list_clusters()["clusters"][0]
+    assert eks.describe_cluster(name=name)["cluster"]["name"] == name
+
+    buckets = client(server, "s3").list_buckets()["Buckets"]
+    assert buckets and "CreationDate" in buckets[0]
+    zones = client(server, "route53").list_hosted_zones()
+    assert zones["IsTruncated"] and len(zones["HostedZones"]) == 3
+
+
+def test_throttling_is_returned_as_aws_error(server):
+    """Test that throttled requests fail with the protocol's throttling error."""
+    server.profile = NetworkProfile({"default": {**INSTANT, "throttle_rate": 1.0}})
+    no_retries = Config(retries={"total_max_attempts": 1, "mode": "standard"})
+
+    with pytest.raises(ClientError) as error:
+        client(server, "ec2", config=no_retries).describe_vpcs()
+    assert error.value.response["Error"]["Code"] == "RequestLimitExceeded"
+    with pytest.raises(ClientError) as error:
+        client(server, "dynamodb", config=no_retries).list_tables()
+    assert error.value.response["Error"]["Code"] == "ThrottlingException"
+    assert server.throttled == {"ec2.DescribeVpcs": 1, "dynamodb.ListTables": 1}
+
+
+def test_token_bucket_limits_request_rate(server):
+    """Test that requests beyond max_rps are throttled and retried by the client."""
+    server.profile = NetworkProfile({"default": {**INSTANT, "max_rps": 1}})
+    rds = client(server, "rds")
+    for _ in range(3):
+        rds.describe_db_instances()
+
+    assert server.throttled["rds.DescribeDBInstances"] >= 1
+    assert server.calls["rds.DescribeDBInstances"] > 3
+
+
+def test_network_profile_merges_overrides():
+    """Test that service and operation settings override the defaults."""
+    profile = NetworkProfile(
+        {
+            "default": {"median_ms": 10, "page_size": 50},
+            "operations": {
+                "ec2": {"median_ms": 30},
+                "ec2.DescribeImages": {"p99_ms": 90},
+            },
+        }
+    )
+    assert profile.behavior("ec2", "DescribeImages") == Behavior(
+        median_ms=30, p99_ms=90, page_size=50
+    )
+    assert profile.behavior("rds", "DescribeDBInstances").median_ms == 10
+    with pytest.raises(ValueError, match="latency_ms"):
+        NetworkProfile({"default": {"latency_ms": 10}})
+
+
+def test_paginate_with_name_tokens():
+    """Test ExclusiveStart* style tokens that name the last item of the previous page."""
+    config = {
+        "input_token": "ExclusiveStartTableName",
+        "output_token": "LastEvaluatedTableName",
+        "limit_key": "Limit",
+        "result_key": "TableNames",
+    }
+    response = {"TableNames": ["a", "b", "c", "d"]}
+
+    first = paginate(response, config, {"Limit": 2}, None)
+    assert first == {"TableNames": ["a", "b"], "LastEvaluatedTableName": "b"}
+    last = paginate(response, config, {"ExclusiveStartTableName": "b"}, 2)
+    assert last == {"TableNames": ["c", "d"]}
+    assert paginate(response, config, {}, None) == response
+
+
+def test_run_setting_collects_through_main(data_dir):
+    """Test a full main() run against the fake endpoint and its cleanup."""
+    before = _snapshot(str(data_dir))
+    profile = NetworkProfile({"default": {**INSTANT, "page_size": 4}})
+
+    with FakeAWSServer(SyntheticInventory(10), profile) as server:
+        result = run_setting(
+            server,
+            ["--region", "ap-northeast-2", "--resources", "ec2", "dynamodb", "route53"],
+            "--workers 2",
+        )
+
+    assert result.tasks["succeeded"] == result.tasks["total"] == 3
+    assert result.operations["dynamodb.DescribeTable"] == 10
+    assert result.api_calls == sum(result.operations.values())
+    # ec2/route53 모듈은 첫 페이지만 읽으므로 잘린 응답으로 보고됩니다
+    assert result.truncated == {
+        "ec2.DescribeInstances": 1,
+        "route53.ListHostedZones": 1,
+    }
+    assert _snapshot(str(data_dir)) == before
+
+
+def test_network_profile_pages_only_paginated_operations():
+    """Test that the shipped profile never truncates a module that reads one page."""
+    with open(DEFAULT_NETWORK_PATH, encoding="utf-8") as f:
+        config = json.load(f)
+    for behavior in [config["default"], *config["operations"].values()]:
+        behavior.update(INSTANT, throttle_rate=0.0, max_rps=None)
+
+    with FakeAWSServer(SyntheticInventory(120), NetworkProfile(config)) as server:
+        result = run_setting(server, ["--region", "ap-northeast-2"], "--workers 8")
+
+    assert result.tasks["succeeded"] == result.tasks["total"]
+    assert result.operations["firehose.ListDeliveryStreams"] > 1
+    assert result.truncated == {}
@@ -0,0 +1,80 @@
+"""
+Tests for the process-pool filter stage.
+"""
+
+import sys
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+sys.path.insert(0, ".")
+
+from utils import filter_pool
+from utils.filter_pool import FilterPool, filter_to_table
+
+RAW_INSTANCES = {
+    "Reservations": [
+        {
+            "Instances": [
+                {
+                    "InstanceId": f"i-{index}",
+                    "InstanceType": "t3.micro",
+                    "State": {"Name": "running"},
+                    "LaunchTime": "2024-01-01T00:00:00+00:00",
+                    "Tags": [{"Key": "Name", "Value": f"web-{index}"}],
+                }
+                for index in range(3)
+            ]
+        }
+    ]
+}
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = FilterPool(1)
+    yield pool
+    pool.shutdown()
+
+
+def test_pool_matches_inline_filter(pool):
+    """Test that the worker result equals filtering in-process."""
+    expected = filter_to_table("ec2", RAW_INSTANCES)
+
+    table = FilterPool.read(pool.submit("ec2", RAW_INSTANCES))
+
+    assert table.equals(expected)
+
+
+def test_empty_raw_data(pool):
+    """Test that an empty result survives the round trip."""
+    table = FilterPool.read(pool.submit("ec2", {}))
+
+    assert table.num_rows == 0
+
+
+def test_bytes_fallback(monkeypatch):
+    """Test that results are sent through the pipe when shared memory is full."""
+    monkeypatch.setattr(filter_pool, "_shm_has_room", lambda size: False)
+    expected = filter_to_table("ec2", RAW_INSTANCES)
+    payload = filter_pool.pickle.dumps(RAW_INSTANCES)
+
+    result = filter_pool._filter_worker("ec2", payload)
+
+    assert result[0] == "bytes"
+    assert filter_pool._read_result(result).equals(expected)
+
+
+def test_shutdown_unlinks_unread_segments():
+    """Test that results never read do not leave segments in shared memory."""
+    pool = FilterPool(1)
+    read = pool.submit("ec2", RAW_INSTANCES)
+    unread = pool.submit("ec2", RAW_INSTANCES)
+    FilterPool.read(read)
+    kind, name, _ = unread.result()
+
+    pool.shutdown()
+
+    assert kind == "shm"
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=name, track=False)
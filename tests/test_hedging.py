@@ -0,0 +1,187 @@
+"""
+Tests for hedged requests and the per-(region, service) rate limiter.
+"""
+
+import inspect
+import pickle
+import sys
+import time
+
+import boto3
+import pytest
+from botocore.client import BaseClient
+from botocore.config import Config
+from botocore.exceptions import EndpointConnectionError
+from botocore.retries.standard import ThrottledRetryableChecker
+
+sys.path.insert(0, ".")
+
+from benchmarks.fake_aws import (
+    Behavior,
+    FakeAWSServer,
+    NetworkProfile,
+    SyntheticInventory,
+)
+from utils.hedging import (
+    MIN_SAMPLES,
+    THROTTLING_ERROR_CODES,
+    Hedger,
+    LatencyTracker,
+    RateLimiter,
+)
+from utils.region_shards import TaskRunner
+
+REGION = "ap-northeast-2"
+KEY = (REGION, "dynamodb.ListTables")
+
+
+class FirstCallSlow(NetworkProfile):
+    """The first request of every operation takes a second, later ones are instant."""
+
+    def __init__(self):
+        super().__init__()
+        self.seen = set()
+
+    def behavior(self, service, operation):
+        if (service, operation) in self.seen:
+            return Behavior(median_ms=0, p99_ms=0)
+        self.seen.add((service, operation))
+        return Behavior(median_ms=1000, p99_ms=1000)
+
+
+def dynamodb_client(server, *policies):
+    client = boto3.Session(
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        region_name=REGION,
+    ).client("dynamodb", endpoint_url=server.endpoint_url)
+    for policy in policies:
+        policy.attach(client)
+    return client
+
+
+def warm_up(hedger, seconds=0.01):
+    for _ in range(MIN_SAMPLES):
+        hedger.latency.record(KEY, seconds)
+
+
+def test_rate_limiter_token_bucket():
+    """Test that the bucket allows a burst and then refills at the configured rate."""
+    limiter = RateLimiter(rate=20, burst=2)
+    assert limiter.try_acquire(("r", "ec2"))
+    assert limiter.try_acquire(("r", "ec2"))
+    assert not limiter.try_acquire(("r", "ec2"))
+    assert limiter.try_acquire(("other", "ec2"))
+
+    started = time.monotonic()
+    limiter.acquire(("r", "ec2"))
+    assert time.monotonic() - started >= 0.03
+
+
+def test_latency_tracker_p95():
+    """Test that p95 needs enough samples and ignores the slowest 5%."""
+    tracker = LatencyTracker(min_samples=20)
+    for value in range(19):
+        tracker.record(KEY, value / 100)
+    assert tracker.p95(KEY) is None
+
+    for value in range(19, 100):
+        tracker.record(KEY, value / 100)
+    assert tracker.p95(KEY) == 0.94
+
+
+def test_slow_call_is_hedged():
+    """Test that a call slower than p95 is duplicated and the fast duplicate wins."""
+    hedger = Hedger(budget=1.0)
+    warm_up(hedger)
+    with FakeAWSServer(SyntheticInventory(3), FirstCallSlow()) as server:
+        client = dynamodb_client(server, hedger)
+        started = time.monotonic()
+        tables = client.list_tables()["TableNames"]
+        elapsed = time.monotonic() - started
+    hedger.shutdown()
+
+    assert len(tables) == 3
+    assert elapsed < 0.8
+    assert (hedger.hedged, hedger.wins) == (1, 1)
+    assert server.calls["dynamodb.ListTables"] == 2
+
+
+def test_hedges_respect_budget_rate_limit_and_throttling():
+    """Test that hedges are skipped without budget, tokens or after throttling."""
+    limiter = RateLimiter(rate=0.1, burst=1)
+    hedger = Hedger(budget=1.0, limiter=limiter)
+    warm_up(hedger)
+    with FakeAWSServer(SyntheticInventory(3), FirstCallSlow()) as server:
+        # 클라이언트 호출이 버킷의 유일한 토큰을 가져가므로 중복 요청은 생략됩니다
+        dynamodb_client(server, limiter, hedger).list_tables()
+    assert (hedger.hedged, hedger.skipped) == (0, 1)
+
+    hedger = Hedger(budget=1.0)
+    warm_up(hedger)
+    hedger.record_throttle((REGION, "dynamodb"))
+    with FakeAWSServer(SyntheticInventory(3), FirstCallSlow()) as server:
+        dynamodb_client(server, hedger).list_tables()
+    assert (hedger.hedged, hedger.skipped) == (0, 1)
+
+    hedger = Hedger(budget=0.0)
+    warm_up(hedger)
+    with FakeAWSServer(SyntheticInventory(3), FirstCallSlow()) as server:
+        dynamodb_client(server, hedger).list_tables()
+    assert hedger.hedged == 0
+
+
+def test_botocore_sends_calls_through_make_request():
+    """Test that the botocore send step Hedger wraps has not changed."""
+    source = inspect.getsource(BaseClient._make_api_call)
+    # 압축/체크섬 적용 뒤 _make_request 한 곳으로 요청을 보내야 합니다
+    assert source.count("self._make_request(") == 1
+    assert source.index("apply_request_checksum(") < source.index("self._make_request(")
+    assert list(inspect.signature(BaseClient._make_request).parameters) == [
+        "self",
+        "operation_model",
+        "request_dict",
+        "request_context",
+    ]
+    assert THROTTLING_ERROR_CODES == set(
+        ThrottledRetryableChecker._THROTTLED_ERROR_CODES
+    )
+
+
+def test_failed_call_emits_after_call_error_per_request():
+    """Test that botocore reports each failed request of a hedged call once."""
+    hedger = Hedger(budget=1.0)
+    warm_up(hedger)
+    errors = []
+    with FakeAWSServer(SyntheticInventory(3), FirstCallSlow()) as server:
+        endpoint_url = server.endpoint_url
+    client = boto3.Session(
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        region_name=REGION,
+    ).client(
+        "dynamodb",
+        endpoint_url=endpoint_url,
+        config=Config(retries={"max_attempts": 1, "mode": "standard"}),
+    )
+    hedger.attach(client)
+    client.meta.events.register(
+        "after-call-error", lambda exception, **kwargs: errors.append(exception)
+    )
+
+    with pytest.raises(EndpointConnectionError) as raised:
+        client.list_tables()
+    hedger.shutdown()
+
+    assert raised.value in errors
+    assert len(errors) == 1 + hedger.hedged
+
+
+def test_task_runner_recreates_policies_after_pickling():
+    """Test that the limiter and hedger are rebuilt in each worker process."""
+    runner = TaskRunner(print, str, max_rps=5, hedge_budget=0.1)
+    copy = pickle.loads(pickle.dumps(runner))
+
+    assert copy.limiter is not runner.limiter and copy.limiter.rate == 5
+    assert copy.hedger.budget == 0.1 and copy.hedger.limiter is copy.limiter
+    assert TaskRunner(print, str).hedger is None
@@ -0,0 +1,143 @@
+"""
+Tests for the inventory history store.
+"""
+
+import sys
+from datetime import date, datetime, timezone
+
+import pyarrow as pa
+import pytest
+
+sys.path.insert(0, ".")
+
+from resources import RESOURCE_SPECS_BY_KEY
+from utils.history_store import UNKNOWN_ACCOUNT, HistoryStore, to_timestamp
+
+EC2 = RESOURCE_SPECS_BY_KEY["ec2"]
+S3 = RESOURCE_SPECS_BY_KEY["s3"]
+
+DAY1 = datetime(2026, 9, 1, 12, tzinfo=timezone.utc)
+DAY2 = datetime(2026, 9, 2, 12, tzinfo=timezone.utc)
+DAY3 = datetime(2026, 9, 3, 12, tzinfo=timezone.utc)
+
+
+def _instances(*rows: tuple[str, str]) -> pa.Table:
+    return pa.Table.from_pylist(
+        [{"InstanceId": iid, "InstanceType": itype} for iid, itype in rows]
+    )
+
+
+def _store() -> HistoryStore:
+    store = HistoryStore(":memory:")
+    store.record_run(
+        DAY1,
+        "111111111111",
+        [
+            (EC2, "us-east-1", _instances(("i-1", "t3.micro"), ("i-2", "t3.small"))),
+            (S3, "global", pa.Table.from_pylist([{"BucketName": "b"}])),
+        ],
+    )
+    store.record_run(
+        DAY2,
+        "111111111111",
+        [(EC2, "us-east-1", _instances(("i-1", "t3.micro"), ("i-2", "m5.large")))],
+    )
+    store.record_run(
+        DAY3,
+        "111111111111",
+        [(EC2, "us-east-1", _instances(("i-2", "m5.large"), ("i-3", "t3.nano")))],
+    )
+    return store
+
+
+class TestHistoryStore:
+    """Test cases for HistoryStore."""
+
+    def test_record_counts(self):
+        """Test the added/changed/removed/unchanged counts of each run."""
+        store = HistoryStore(":memory:")
+        tables = [(EC2, "us-east-1", _instances(("i-1", "t3.micro")))]
+
+        assert store.record_run(DAY1, None, tables) == {
+            "added": 1,
+            "changed": 0,
+            "removed": 0,
+            "unchanged": 0,
+        }
+        assert store.record_run(DAY2, None, tables)["unchanged"] == 1
+        assert store.record_run(DAY3, None, [(EC2, "us-east-1", None)]) == {
+            "added": 0,
+            "changed": 0,
+            "removed": 1,
+            "unchanged": 0,
+        }
+        assert store.as_of(DAY2)[0]["account_id"] == UNKNOWN_ACCOUNT
+
+    def test_unchanged_rows_are_not_duplicated(self):
+        """Test that storage grows with changes, not with runs."""
+        store = _store()
+
+        history_rows = store.conn.execute("SELECT count(*) FROM history").fetchone()
+        content_rows = store.conn.execute("SELECT count(*) FROM contents").fetchone()
+
+        # i-1, i-2(t3.small), i-2(m5.large), i-3, b
+        assert history_rows == (5,)
+        assert content_rows == (5,)
+
+    def test_as_of(self):
+        """Test point-in-time queries between and after runs."""
+        store = _store()
+
+        def state(when):
+            return {
+                row["resource_id"]: row["data"].get("InstanceType")
+                for row in store.as_of(when, "111111111111", "ec2")
+            }
+
+        assert state(datetime(2026, 8, 31, tzinfo=timezone.utc)) == {}
+        assert state(DAY1) == {"i-1": "t3.micro", "i-2": "t3.small"}
+        assert state("2026-09-02") == {"i-1": "t3.micro", "i-2": "m5.large"}
+        assert state(DAY3) == {"i-2": "m5.large", "i-3": "t3.nano"}
+
+    def test_unvisited_resources_stay_open(self):
+        """Test that resources missing from a run's tables keep their interval."""
+        store = _store()
+
+        rows = store.as_of(DAY3, resource="s3")
+
+        assert [row["resource_id"] for row in rows] == ["b"]
+        assert rows[0]["valid_to"] is None
+        assert store.as_of(DAY3, account_id="222222222222") == []
+
+    def test_versions(self):
+        """Test the change history of a single resource."""
+        versions = _store().versions("i-2")
+
+        assert [row["data"]["InstanceType"] for row in versions] == [
+            "t3.small",
+            "m5.large",
+        ]
+        assert versions[0]["valid_to"] == versions[1]["valid_from"]
+
+    def test_as_of_uses_indexes(self):
+        """Test that point-in-time queries are answered from indexes."""
+        store = _store()
+        sql = (
+            "EXPLAIN QUERY PLAN SELECT * FROM history WHERE account_id = ? "
+            "AND resource = ? AND valid_to > ?"
+        )
+
+        plan = store.conn.execute(sql, ("1", "ec2", "x")).fetchall()
+
+        assert "idx_history_closed" in plan[0][-1]
+
+
+def test_to_timestamp():
+    """Test timestamp normalization."""
+    assert to_timestamp("2026-09-01") == "2026-09-01T23:59:59.999999+00:00"
+    assert to_timestamp(date(2026, 9, 1)) == "2026-09-01T23:59:59.999999+00:00"
+    assert (
+        to_timestamp("2026-09-01T09:00:00+09:00") == "2026-09-01T00:00:00.000000+00:00"
+    )
+    with pytest.raises(ValueError):
+        to_timestamp("yesterday")
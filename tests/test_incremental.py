@@ -0,0 +1,257 @@
+"""
+Tests for the CloudTrail-driven incremental refresh (--incremental).
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import boto3
+import pyarrow as pa
+import pytest
+
+sys.path.insert(0, ".")
+
+from benchmarks.collect import aws_environment
+from benchmarks.fake_aws import (
+    FakeAWSServer,
+    NetworkProfile,
+    SyntheticInventory,
+    trail_event,
+)
+from listup_aws_resources import main
+from resources import RESOURCE_SPECS_BY_KEY
+from utils.checkpoint import latest_run_id
+from utils.incremental import (
+    event_keys,
+    load_events_file,
+    normalize_event,
+    patch_table,
+    task_keys,
+)
+from utils.result_store import ResultStore
+
+REGION = "ap-northeast-2"
+
+
+@pytest.fixture
+def server():
+    profile = NetworkProfile({"default": {"median_ms": 0, "p99_ms": 0}})
+    with FakeAWSServer(SyntheticInventory(5), profile) as server:
+        with aws_environment(server.endpoint_url):
+            yield server
+
+
+def _source(key):
+    return RESOURCE_SPECS_BY_KEY[key].module.TRAIL_SOURCE
+
+
+def _event(name, source="ec2.amazonaws.com", **record):
+    return normalize_event(trail_event(name, source, record))
+
+
+def _main_tables(argv):
+    with patch.object(ResultStore, "put", autospec=True, side_effect=ResultStore.put):
+        main(argv)
+        return {call.args[2]: call.args[3] for call in ResultStore.put.call_args_list}
+
+
+def test_event_keys_follow_each_trail_source():
+    """Test that events map onto the keys of the resources they change."""
+    run = _event(
+        "RunInstances",
+        responseElements={
+            "instancesSet": {"items": [{"instanceId": "i-1", "subnetId": "subnet-1"}]}
+        },
+    )
+    tags = _event(
+        "CreateTags",
+        requestParameters={
+            "resourcesSet": {"items": [{"resourceId": "i-2"}, {"resourceId": "vpc-1"}]}
+        },
+    )
+    rename = _event(
+        "ModifyDBInstance",
+        "rds.amazonaws.com",
+        requestParameters={"dBInstanceIdentifier": "a", "newDBInstanceIdentifier": "b"},
+    )
+    ingress = _event(
+        "AuthorizeSecurityGroupIngress", requestParameters={"groupId": "sg-1"}
+    )
+
+    assert event_keys(_source("ec2"), run) == {"i-1"}
+    assert event_keys(_source("subnets"), run) == {"subnet-1"}
+    # 루트 볼륨은 ID 없이 생성되므로 EBS는 전체를 다시 수집합니다
+    assert event_keys(_source("ebs"), run) is None
+    assert event_keys(_source("ec2"), tags) == {"i-2"}
+    assert event_keys(_source("vpc"), tags) == {"vpc-1"}
+    assert event_keys(_source("rds"), rename) == {"a", "b"}
+    assert event_keys(_source("security_group_rules"), ingress) == {"sg-1"}
+    assert event_keys(_source("dynamodb"), ingress) == set()
+    # 키를 찾을 수 없는 이벤트는 작업 전체를 다시 수집합니다
+    assert event_keys(_source("ec2"), _event("TerminateInstances")) is None
+
+
+def test_task_keys_fall_back_to_full_collection():
+    """Test the full re-collect for modules without lookups by ID and large changes."""
+    created = _event("CreateTags", requestParameters={"resourcesSet": {"items": []}})
+    assert task_keys(RESOURCE_SPECS_BY_KEY["ec2"], []) == set()
+    assert task_keys(RESOURCE_SPECS_BY_KEY["ec2"], [created]) is None
+
+    igw = _event(
+        "AttachInternetGateway", requestParameters={"internetGatewayId": "igw-1"}
+    )
+    assert task_keys(RESOURCE_SPECS_BY_KEY["internet_gateway"], [igw]) is None
+
+    many = [
+        _event("StopInstances", requestParameters={"instanceId": f"i-{i}"})
+        for i in range(3)
+    ]
+    with (
+        patch.dict(
+            _source("ec2").id_events, {"StopInstances": "requestParameters.instanceId"}
+        ),
+        patch("utils.incremental.MAX_REFRESH_IDS", 2),
+    ):
+        assert task_keys(RESOURCE_SPECS_BY_KEY["ec2"], many) is None
+
+
+def test_load_events_file_formats(tmp_path):
+    """Test lookup-events output and CloudTrail log files with the write filter."""
+    since = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    lookup = {
+        "Events": [
+            trail_event("DeleteVpc", "ec2.amazonaws.com", event_time=since),
+            trail_event(
+                "DescribeVpcs", "ec2.amazonaws.com", event_time=since, read_only=True
+            ),
+        ]
+    }
+    records = {
+        "Records": [
+            {
+                "eventName": "CreateVolume",
+                "eventSource": "ec2.amazonaws.com",
+                "eventTime": "2026-10-02T00:00:00Z",
+                "awsRegion": "us-east-1",
+                "responseElements": {"volumeId": "vol-1"},
+            },
+            {
+                "eventName": "DeleteVolume",
+                "eventSource": "ec2.amazonaws.com",
+                "eventTime": "2026-10-02T00:00:00Z",
+                "errorCode": "InvalidVolume.NotFound",
+            },
+            {
+                "eventName": "CreateVolume",
+                "eventSource": "ec2.amazonaws.com",
+                "eventTime": "2026-09-01T00:00:00Z",
+            },
+        ]
+    }
+    for name, document in [("lookup.json", lookup), ("trail.json", records)]:
+        with open(tmp_path / name, "w", encoding="utf-8") as f:
+            json.dump(document, f, default=str)
+
+    [deleted] = load_events_file(str(tmp_path / "lookup.json"))
+    assert (deleted.name, deleted.region) == ("DeleteVpc", REGION)
+    [created] = load_events_file(str(tmp_path / "trail.json"), since)
+    assert (created.region, event_keys(_source("ebs"), created)) == (
+        "us-east-1",
+        {"vol-1"},
+    )
+
+
+def test_patch_table_replaces_changed_rows():
+    """Test that changed keys are replaced and deleted resources drop out."""
+    base = pa.table(
+        {
+            "VolumeId": ["vol-1", "vol-2", "vol-3"],
+            "State": pa.array(["in-use", "available", "in-use"]).dictionary_encode(),
+        }
+    )
+    rows = pa.table(
+        {
+            "VolumeId": ["vol-2", "vol-4"],
+            "State": pa.array(["in-use", "creating"]).dictionary_encode(),
+        }
+    )
+
+    patched = patch_table(base, "VolumeId", {"vol-2", "vol-3", "vol-4"}, rows)
+
+    assert patched.to_pydict() == {
+        "VolumeId": ["vol-1", "vol-2", "vol-4"],
+        "State": ["in-use", "in-use", "creating"],
+    }
+    assert patched.column("State").num_chunks == 1
+
+
+@pytest.mark.parametrize(
+    "key", ["ec2", "ebs", "rds", "subnets", "vpc", "security_groups"]
+)
+def test_raw_data_by_ids_follows_every_page(key):
+    """Test that fetching more IDs than one page holds returns all of them."""
+    spec = RESOURCE_SPECS_BY_KEY[key]
+    key_column = spec.module.TRAIL_SOURCE.key_column or spec.id_column
+    inventory = SyntheticInventory(150)
+    ids = list(spec.module.get_filtered_data(inventory.get(key, REGION))[key_column])
+    profile = NetworkProfile(
+        {"default": {"median_ms": 0, "p99_ms": 0, "page_size": 100}}
+    )
+
+    with FakeAWSServer(inventory, profile) as server:
+        with aws_environment(server.endpoint_url):
+            raw_data = spec.module.get_raw_data_by_ids(boto3.Session(), REGION, ids)
+
+    rows = spec.module.get_filtered_data(raw_data)
+    assert sorted(rows[key_column]) == sorted(ids)
+
+
+def test_main_incremental_quiet_account_makes_no_describe_calls(server, data_dir):
+    """Test that an incremental run without events only reads CloudTrail."""
+    argv = ["--region", REGION, "--resources", "ec2", "vpc", "s3"]
+    full = _main_tables(argv)
+    server.reset_stats()
+
+    refreshed = _main_tables(["--incremental", latest_run_id(str(data_dir))])
+
+    assert refreshed.keys() == full.keys()
+    for key, table in full.items():
+        assert refreshed[key].equals(table), key
+    # 리전과 S3의 글로벌 리전에서 이벤트만 조회합니다
+    assert dict(server.calls) == {
+        "sts.GetCallerIdentity": 1,
+        "cloudtrail.LookupEvents": 2,
+    }
+
+
+def test_main_incremental_refreshes_only_changed_resources(server):
+    """Test describe-by-ID patches, task re-collects and untouched tasks."""
+    main(["--region", REGION, "--resources", "ec2", "vpc", "elb"])
+    instance = server.inventory.get("ec2", REGION)["Reservations"][0]["Instances"][0]
+    instance["State"] = {"Code": 80, "Name": "stopped"}
+    items = {"items": [{"instanceId": instance["InstanceId"]}]}
+    yesterday = datetime.now(timezone.utc) - timedelta(days=1)
+    server.inventory.events[REGION] += [
+        trail_event("StopInstances", "ec2.amazonaws.com", {"requestParameters": items}),
+        trail_event("CreateLoadBalancer", "elasticloadbalancing.amazonaws.com"),
+        # 이전 실행보다 오래된 이벤트는 무시합니다
+        trail_event("DeleteVpc", "ec2.amazonaws.com", event_time=yesterday),
+    ]
+    server.reset_stats()
+
+    tables = _main_tables(["--incremental"])
+
+    states = dict(
+        zip(
+            tables["EC2"].column("InstanceId").to_pylist(),
+            tables["EC2"].column("State").to_pylist(),
+            strict=True,
+        )
+    )
+    assert states[instance["InstanceId"]] == "stopped"
+    assert tables["EC2"].num_rows == 5
+    assert server.calls["ec2.DescribeInstances"] == 1
+    assert server.calls["elbv2.DescribeLoadBalancers"] == 1
+    assert "ec2.DescribeVpcs" not in server.calls
@@ -0,0 +1,194 @@
+"""
+Tests for the SQLite query layer over filtered JSON runs.
+"""
+
+import json
+import sys
+
+sys.path.insert(0, ".")
+
+from utils.inventory_db import InventoryDatabase, run_id_from_path
+
+
+def _run(instance_types: list[str]) -> dict:
+    return {
+        "ap-northeast-2": {
+            "EC2": [
+                {"InstanceId": f"i-{index}", "InstanceType": instance_type}
+                for index, instance_type in enumerate(instance_types)
+            ],
+            "SecurityGroups": [
+                {
+                    "SecurityGroupId": "sg-1",
+                    "VpcId": "vpc-1",
+                    "InboundRules": ["tcp:22 from 0.0.0.0/0"],
+                }
+            ],
+        },
+        "us-east-1": {},
+        "S3": [{"BucketName": "b", "CreationDate": "2023-05-15"}],
+    }
+
+
+def _write(tmp_path, run_id: str, data: dict) -> None:
+    path = tmp_path / f"aws_resources_filtered_{run_id}.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def _write_manifest(tmp_path, run_id: str, resources: list[str], **tasks) -> None:
+    manifest = {
+        "run_id": run_id,
+        "regions": ["ap-northeast-2", "us-east-1"],
+        "resources": resources,
+        "failures": tasks.get("failures", []),
+        "skipped": tasks.get("skipped", []),
+    }
+    path = tmp_path / f"aws_resources_manifest_{run_id}.json"
+    path.write_text(json.dumps(manifest), encoding="utf-8")
+
+
+class TestInventoryDatabase:
+    """Test cases for InventoryDatabase."""
+
+    def test_load_run_creates_resource_tables(self):
+        """Test one table per resource with run_id and region columns."""
+        db = InventoryDatabase(":memory:")
+
+        total = db.load_run("20260101_000000_000", _run(["t3.micro", "m5.large"]))
+
+        assert total == 4
+        assert dict(db.tables()) == {"ec2": 2, "s3": 1, "security_groups": 1}
+        columns, rows = db.query(
+            "SELECT region, InstanceType FROM ec2 WHERE InstanceType LIKE 't3.%'"
+        )
+        assert columns == ["region", "InstanceType"]
+        assert rows == [("ap-northeast-2", "t3.micro")]
+        _, rows = db.query("SELECT region, BucketName FROM s3")
+        assert rows == [("global", "b")]
+        _, rows = db.query("SELECT InboundRules FROM security_groups")
+        assert json.loads(rows[0][0]) == ["tcp:22 from 0.0.0.0/0"]
+
+    def test_latest_view(self):
+        """Test that <resource>_latest only returns the most recent run."""
+        db = InventoryDatabase(":memory:")
+        db.load_run("20260101_000000_000", _run(["t3.micro"]))
+        db.load_run("20260102_000000_000", _run(["t3.micro", "t3.small"]))
+
+        _, rows = db.query("SELECT count(*) FROM ec2")
+        assert rows == [(3,)]
+        _, rows = db.query("SELECT DISTINCT run_id FROM ec2_latest")
+        assert rows == [("20260102_000000_000",)]
+
+    def test_latest_view_empties_when_resource_disappears(self, tmp_path):
+        """Test that <resource>_latest is empty once the latest run found none."""
+        path = str(tmp_path / "inventory.sqlite")
+        db = InventoryDatabase(path)
+        db.load_run("20260101_000000_000", _run(["t3.micro", "t3.small"]))
+        db.load_run("20260102_000000_000", _run([]))
+
+        _, rows = db.query("SELECT count(*) FROM ec2_latest")
+        assert rows == [(0,)]
+        _, rows = db.query("SELECT count(*) FROM security_groups_latest")
+        assert rows == [(1,)]
+
+        db.close()
+        db = InventoryDatabase(path)
+        _, rows = db.query("SELECT count(*) FROM ec2_latest")
+        assert rows == [(0,)]
+
+    def test_latest_view_follows_runs_that_collected_the_resource(self, tmp_path):
+        """Test that partial runs leave the rows of resources they did not collect."""
+        resources = ["ec2", "s3", "security_groups"]
+        _write(tmp_path, "20260101_000000_000", _run(["t3.micro", "t3.small"]))
+        _write_manifest(tmp_path, "20260101_000000_000", resources)
+        # EC2 실패, S3는 --deadline 으로 건너뜀
+        partial = _run([])
+        del partial["ap-northeast-2"]["EC2"], partial["S3"]
+        _write(tmp_path, "20260102_000000_000", partial)
+        _write_manifest(
+            tmp_path,
+            "20260102_000000_000",
+            resources,
+            failures=[{"resource": "ec2", "region": "ap-northeast-2"}],
+            skipped=[{"resource": "s3", "region": "global"}],
+        )
+        # 더 좁은 --resources 실행
+        _write(tmp_path, "20260103_000000_000", {"ap-northeast-2": {}})
+        _write_manifest(tmp_path, "20260103_000000_000", ["s3"])
+        db = InventoryDatabase(":memory:")
+        db.load_directory(str(tmp_path))
+
+        _, rows = db.query("SELECT DISTINCT run_id FROM ec2_latest")
+        assert rows == [("20260101_000000_000",)]
+        _, rows = db.query("SELECT run_id FROM security_groups_latest")
+        assert rows == [("20260102_000000_000",)]
+        # 버킷이 0개가 된 실행 이후에는 이전 버킷을 반환하지 않습니다
+        _, rows = db.query("SELECT count(*) FROM s3_latest")
+        assert rows == [(0,)]
+
+        # 이후 EC2를 수집한 실행에서 0개면 비어 있습니다
+        _write(tmp_path, "20260104_000000_000", {"ap-northeast-2": {}})
+        _write_manifest(tmp_path, "20260104_000000_000", ["ec2"])
+        db.load_directory(str(tmp_path))
+        _, rows = db.query("SELECT count(*) FROM ec2_latest")
+        assert rows == [(0,)]
+
+    def test_databases_without_run_resources_are_backfilled(self, tmp_path):
+        """Test that runs loaded by an earlier version keep their latest views."""
+        path = str(tmp_path / "inventory.sqlite")
+        db = InventoryDatabase(path)
+        db.load_run("20260101_000000_000", _run(["t3.micro", "t3.small"]))
+        db.conn.execute("DROP TABLE run_resources")
+        db.conn.commit()
+        db.close()
+
+        db = InventoryDatabase(path)
+
+        _, rows = db.query("SELECT count(*) FROM ec2_latest")
+        assert rows == [(2,)]
+        assert dict(db.tables()) == {"ec2": 2, "s3": 1, "security_groups": 1}
+
+    def test_id_lookup_uses_index(self):
+        """Test that ID lookups are answered from a persisted index."""
+        db = InventoryDatabase(":memory:")
+        db.load_run("20260101_000000_000", _run(["t3.micro"]))
+
+        _, plan = db.query(
+            "EXPLAIN QUERY PLAN SELECT * FROM ec2 WHERE InstanceId = 'i-0'"
+        )
+
+        assert "idx_ec2_InstanceId" in plan[0][-1]
+
+    def test_new_columns_are_added(self):
+        """Test that columns missing from COLUMN_SCHEMA are added on demand."""
+        db = InventoryDatabase(":memory:")
+        data = {"us-east-1": {"EC2": [{"InstanceId": "i-1", "Extra": 1}]}}
+
+        db.load_run("20260101_000000_000", data)
+
+        _, rows = db.query("SELECT Extra FROM ec2")
+        assert rows == [(1,)]
+
+    def test_load_directory_skips_loaded_runs(self, tmp_path):
+        """Test that runs already in the database are not parsed again."""
+        _write(tmp_path, "20260101_000000_000", _run(["t3.micro"]))
+        db_path = str(tmp_path / "inventory.sqlite")
+
+        db = InventoryDatabase(db_path)
+        assert db.load_directory(str(tmp_path)) == ["20260101_000000_000"]
+        db.close()
+
+        _write(tmp_path, "20260102_000000_000", _run(["m5.large"]))
+        db = InventoryDatabase(db_path)
+        assert db.load_directory(str(tmp_path)) == ["20260102_000000_000"]
+        assert db.load_directory(str(tmp_path)) == []
+        _, rows = db.query("SELECT run_id, rows FROM runs ORDER BY run_id")
+        assert rows == [("20260101_000000_000", 3), ("20260102_000000_000", 3)]
+
+
+def test_run_id_from_path():
+    """Test extracting the run timestamp from an output file name."""
+    path = "data/aws_resources_filtered_20261019_121931_422.json"
+
+    assert run_id_from_path(path) == "20261019_121931_422"
+    assert run_id_from_path("data/other.json") is None
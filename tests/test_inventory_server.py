@@ -0,0 +1,169 @@
+"""
+Tests for the inventory server used by serve mode.
+"""
+
+import json
+import sys
+import threading
+import urllib.error
+import urllib.request
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, ".")
+
+from listup_aws_resources import DateTimeEncoder
+from resources import RESOURCE_SPECS_BY_KEY
+from utils.inventory_server import (
+    Inventory,
+    InventoryRefresher,
+    RefreshTask,
+    create_server,
+)
+from utils.name_tag import parse_tag_string
+from utils.result_store import GLOBAL_SCOPE
+
+EC2 = RESOURCE_SPECS_BY_KEY["ec2"]
+S3 = RESOURCE_SPECS_BY_KEY["s3"]
+SECURITY_GROUPS = RESOURCE_SPECS_BY_KEY["security_groups"]
+
+
+def _inventory() -> Inventory:
+    inventory = Inventory([EC2, S3, SECURITY_GROUPS])
+    inventory.update(
+        EC2,
+        "us-east-1",
+        pd.DataFrame(
+            [
+                {"Name": "web", "InstanceId": "i-1", "State": "running"},
+                {"Name": "N/A", "InstanceId": "i-2", "State": "stopped"},
+            ]
+        ),
+    )
+    inventory.update(
+        SECURITY_GROUPS,
+        "us-east-1",
+        pd.DataFrame([{"SecurityGroupId": "sg-1", "Tags": "env=prod, team=a"}]),
+    )
+    inventory.update(S3, GLOBAL_SCOPE, pd.DataFrame([{"BucketName": "b"}]))
+    return inventory
+
+
+class TestInventory:
+    """Test cases for Inventory queries."""
+
+    def test_query_by_resource_and_region(self):
+        """Test filtering by resource and region."""
+        items = _inventory().query(resource="ec2", region="us-east-1")
+
+        assert [item["InstanceId"] for item in items] == ["i-1", "i-2"]
+        assert items[0]["Region"] == "us-east-1"
+        assert items[0]["Resource"] == "ec2"
+
+    def test_query_by_id(self):
+        """Test lookups through the id_column index."""
+        inventory = _inventory()
+
+        assert inventory.query(resource_id="i-2")[0]["State"] == "stopped"
+        assert inventory.query(resource_id="b")[0]["Region"] == GLOBAL_SCOPE
+        assert inventory.query(resource_id="missing") == []
+
+    def test_query_by_tag(self):
+        """Test that the Tags and Name columns are indexed as tags."""
+        inventory = _inventory()
+
+        assert inventory.query(tag=("env", "prod"))[0]["SecurityGroupId"] == "sg-1"
+        assert inventory.query(tag=("Name", "web"))[0]["InstanceId"] == "i-1"
+        assert inventory.query(tag=("Name", "N/A")) == []
+        assert inventory.query(tag=("Name", "web"), resource_id="i-2") == []
+
+    def test_query_limit(self):
+        """Test that the result is limited."""
+        assert len(_inventory().query(limit=2)) == 2
+
+    def test_update_replaces_table(self):
+        """Test that a refresh replaces the previous table and index."""
+        inventory = _inventory()
+        inventory.update(EC2, "us-east-1", pd.DataFrame())
+
+        assert inventory.query(resource="ec2") == []
+        assert inventory.query(resource_id="i-1") == []
+
+    def test_error_keeps_previous_table(self):
+        """Test that a failed refresh keeps serving the last table."""
+        inventory = _inventory()
+        inventory.mark_error(EC2, "us-east-1", "throttled")
+
+        status = {(row["region"], row["resource"]): row for row in inventory.status()}
+        assert status[("us-east-1", "ec2")]["count"] == 2
+        assert status[("us-east-1", "ec2")]["error"] == "throttled"
+
+
+def test_refresher_reschedules_and_records_errors():
+    """Test that a refresh reschedules itself even when collection fails."""
+    inventory = Inventory([EC2])
+    sessions = []
+
+    def collect(spec, session, region):
+        raise RuntimeError("boom")
+
+    refresher = InventoryRefresher(
+        inventory,
+        ["us-east-1"],
+        collect=collect,
+        session_factory=lambda region: sessions.append(region) or MagicMock(),
+        intervals={"ec2": 60},
+    )
+    task = refresher._queue[0]
+
+    refresher.refresh(RefreshTask(task.due, task.key, task.region))
+    refresher._executor.shutdown()
+
+    assert inventory.status()[0]["error"] == "boom"
+    assert sessions == ["us-east-1"]
+    assert [queued.key for queued in refresher._queue] == ["ec2", "ec2"]
+    assert max(queued.due for queued in refresher._queue) >= task.due + 60
+
+
+@pytest.fixture
+def server():
+    server = create_server(_inventory(), "127.0.0.1", 0, DateTimeEncoder)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def _get(url: str) -> tuple[int, dict]:
+    try:
+        with urllib.request.urlopen(url) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_http_api(server):
+    """Test the /inventory and /status endpoints."""
+    status, body = _get(f"{server}/inventory?resource=security_groups&tag=team=a")
+    assert status == 200
+    assert body["count"] == 1
+
+    status, body = _get(f"{server}/status")
+    assert status == 200
+    assert len(body["tables"]) == 3
+
+    assert _get(f"{server}/inventory?resource=unknown")[0] == 400
+    assert _get(f"{server}/inventory?tag=env")[0] == 400
+    assert _get(f"{server}/unknown")[0] == 404
+
+
+def test_parse_tag_string():
+    """Test the Tags column formats used by the resource modules."""
+    assert parse_tag_string("a=1;b=2") == {"a": "1", "b": "2"}
+    assert parse_tag_string("a=1, b=x=y") == {"a": "1", "b": "x=y"}
+    assert parse_tag_string("team:a, env:prod") == {"team": "a", "env": "prod"}
+    assert parse_tag_string("No tags") == {}
+    assert parse_tag_string(None) == {}
@@ -7,6 +7,7 @@ import pytest
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from listup_aws_resources import main
+from utils.scheduler import DEFAULT_EXPECTED_SECONDS, TaskTimings
 
 
 @patch("json.dump")
@@ -30,3 +31,194 @@ def test_main(mock_session, mock_excel_writer, mock_json_dump):
         main()
     except Exception as e:
         pytest.fail(f"main() raised an exception: {e}")
+
+
+@patch("json.dump")
+@patch("listup_aws_resources.ExcelExporter")
+@patch("boto3.Session")
+def test_main_isolates_task_failures(mock_session, mock_exporter, mock_json_dump):
+    """A failing resource module is recorded instead of aborting the run."""
+    from botocore.exceptions import ClientError
+
+    mock_client = MagicMock()
+    mock_client.describe_db_instances.side_effect = ClientError(
+        {"Error": {"Code": "AccessDenied", "Message": "denied"}},
+        "DescribeDBInstances",
+    )
+    mock_session.return_value.client.return_value = mock_client
+
+    main(["--resources", "rds", "--region", "us-east-1"])
+
+    manifest = next(
+        call.args[0]
+        for call in mock_json_dump.call_args_list
+        if isinstance(call.args[0], dict) and "failures" in call.args[0]
+    )
+    assert manifest["tasks"]["failed"] == 1
+    assert manifest["failures"][0]["error_code"] == "AccessDenied"
+    assert manifest["failures"][0]["operation"] == "DescribeDBInstances"
+    errors = mock_exporter.return_value.write_errors.call_args.args[0]
+    assert errors[0]["Service"] == "RDS"
+
+
+def test_main_resume_requires_checkpoint(capsys):
+    """--resume with an unknown run id exits before collecting anything."""
+    with pytest.raises(SystemExit):
+        main(["--resume", "19700101_000000_000"])
+
+    assert "체크포인트를 찾을 수 없습니다" in capsys.readouterr().err
+
+
+@patch("json.dump")
+@patch("listup_aws_resources.ExcelExporter")
+@patch("boto3.Session")
+def test_main_profile_stages(mock_session, mock_exporter, mock_json_dump):
+    """--profile-stages writes a per-stage report and lists it in the manifest."""
+    mock_client = MagicMock()
+    mock_client.describe_vpcs.return_value = {
+        "Vpcs": [{"VpcId": "vpc-1", "CidrBlock": "10.0.0.0/16", "IsDefault": True}]
+    }
+    mock_session.return_value.client.return_value = mock_client
+
+    main(["--resources", "vpc", "--region", "us-east-1", "--profile-stages"])
+
+    dumped = [call.args[0] for call in mock_json_dump.call_args_list]
+    report = next(value for value in dumped if "stages" in value)
+    manifest = next(value for value in dumped if "failures" in value)
+    assert {"api", "filter", "arrow"} <= set(report["stages"])
+    assert report["stages"]["api"]["calls"] == 1
+    assert manifest["outputs"]["profile"].endswith(".json")
+
+
+def test_main_profile_stages_requires_single_process(capsys):
+    """--profile-stages cannot measure stages that run in other processes."""
+    with pytest.raises(SystemExit):
+        main(["--profile-stages", "--region-processes", "2"])
+
+    assert "--profile-stages" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("value", ["0", "1048577"])
+def test_main_rejects_invalid_excel_max_rows(value, capsys):
+    """--excel-max-rows outside the sheet limit is rejected while parsing."""
+    with pytest.raises(SystemExit):
+        main(["--excel-max-rows", value])
+    assert "--excel-max-rows" in capsys.readouterr().err
+
+    with pytest.raises(SystemExit):
+        main(["merge", "--shared-dir", ".", "--excel-max-rows", value])
+    assert "--excel-max-rows" in capsys.readouterr().err
+
+
+@patch("boto3.Session")
+def test_main_distributed_run(mock_session, tmp_path):
+    """coordinator → worker → merge produces per-profile outputs and Parquet files."""
+    import pyarrow.parquet as pq
+
+    mock_client = MagicMock()
+    mock_client.get_caller_identity.return_value = {"Account": "123456789012"}
+    mock_client.list_buckets.return_value = {"Buckets": [{"Name": "b1"}]}
+    mock_session.return_value.client.return_value = mock_client
+    shared = str(tmp_path)
+
+    main(
+        ["coordinator", "--shared-dir", shared, "--profiles", "prod", "staging"]
+        + ["--resources", "s3", "--run-id", "r1"]
+    )
+    main(["worker", "--shared-dir", shared])
+    main(["merge", "--shared-dir", shared])
+
+    merged = tmp_path / "merged" / "r1"
+    assert (merged / "prod" / "aws_resources_r1.xlsx").exists()
+    assert (merged / "staging" / "aws_resources_filtered_r1.json").exists()
+    table = pq.read_table(merged / "parquet" / "s3.parquet")
+    assert table.num_rows == 2
+    assert set(table.column("AccountId").to_pylist()) == {"123456789012"}
+
+    # merge 가 기록한 소요 시간으로 다음 실행의 임대 순서를 정합니다
+    timings = TaskTimings(str(tmp_path / "task_timings.json"), None)
+    assert timings.rows("global", "s3") == 1
+    assert timings.expected("global", "s3") != DEFAULT_EXPECTED_SECONDS
+
+
+def test_main_history_keeps_failed_and_skipped_tasks_open(data_dir, capsys):
+    """Failed and --deadline-skipped tasks do not close their history rows."""
+    import sqlite3
+
+    from botocore.exceptions import ClientError
+
+    from benchmarks.collect import aws_environment
+    from benchmarks.fake_aws import (
+        ACCOUNT_ID,
+        FakeAWSServer,
+        NetworkProfile,
+        SyntheticInventory,
+    )
+    from resources import RESOURCE_SPECS_BY_KEY
+    from utils.scheduler import TaskTimings
+
+    region = "ap-northeast-2"
+    argv = ["--region", region, "--resources", "vpc", "amis", "--history"]
+    profile = NetworkProfile({"default": {"median_ms": 0, "p99_ms": 0}})
+    with FakeAWSServer(SyntheticInventory(3), profile) as server:
+        with aws_environment(server.endpoint_url):
+            main(argv)
+            # AMI 수집이 제한 시간보다 오래 걸린다고 기록해 건너뛰게 합니다
+            timings = TaskTimings(str(data_dir / "task_timings.json"), ACCOUNT_ID)
+            timings.timings.clear()
+            timings.record(region, "amis", 3600)
+            timings.save()
+            denied = ClientError(
+                {"Error": {"Code": "AccessDenied", "Message": "denied"}},
+                "DescribeVpcs",
+            )
+            with patch.object(
+                RESOURCE_SPECS_BY_KEY["vpc"].module, "get_raw_data", side_effect=denied
+            ):
+                capsys.readouterr()
+                main([*argv, "--deadline", "60s"])
+
+    output = capsys.readouterr().out
+    assert "--deadline 으로 건너뛴 작업: 1개" in output
+    assert "삭제 0" in output
+    with sqlite3.connect(data_dir / "history.sqlite") as conn:
+        open_rows = dict(
+            conn.execute(
+                "SELECT resource, count(*) FROM history WHERE valid_to IS NULL "
+                "GROUP BY resource"
+            ).fetchall()
+        )
+    assert open_rows == {"vpc": 3, "amis": 3}
+
+
+@patch("listup_aws_resources.get_account_id", side_effect=RuntimeError("boom"))
+@patch("listup_aws_resources.FilterPool")
+def test_main_shuts_down_filter_pool_on_error(mock_pool, mock_account_id):
+    """The filter worker processes are stopped when the collection raises."""
+    with pytest.raises(RuntimeError):
+        main(["--resources", "vpc", "--filter-workers", "2"])
+
+    mock_pool.return_value.shutdown.assert_called_once()
+
+
+def test_main_keep_runs_prunes_old_checkpoints(data_dir):
+    """Only the --keep-runs newest checkpoints remain after a run."""
+    from benchmarks.collect import aws_environment
+    from benchmarks.fake_aws import FakeAWSServer, NetworkProfile, SyntheticInventory
+
+    argv = ["--region", "ap-northeast-2", "--resources", "vpc", "--keep-runs", "2"]
+    profile = NetworkProfile({"default": {"median_ms": 0, "p99_ms": 0}})
+    with FakeAWSServer(SyntheticInventory(1), profile) as server:
+        with aws_environment(server.endpoint_url):
+            for _ in range(3):
+                main(argv)
+
+    assert len(list((data_dir / "runs").iterdir())) == 2
+
+
+def test_main_rejects_invalid_keep_runs(capsys):
+    """--keep-runs must keep at least the run that just finished."""
+    with pytest.raises(SystemExit):
+        main(["--keep-runs", "0"])
+
+    assert "--keep-runs" in capsys.readouterr().err
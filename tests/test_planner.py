@@ -0,0 +1,116 @@
+"""
+Tests for the dry-run execution planner (plan, --api-budget).
+"""
+
+import sys
+
+import pytest
+
+sys.path.insert(0, ".")
+
+from benchmarks.collect import aws_environment
+from benchmarks.fake_aws import FakeAWSServer, NetworkProfile, SyntheticInventory
+from listup_aws_resources import build_tasks, main
+from resources import RESOURCE_SPECS_BY_KEY
+from utils.planner import build_plan, estimate_calls
+from utils.scheduler import TaskTimings
+
+REGION = "ap-northeast-2"
+
+
+@pytest.fixture
+def server():
+    profile = NetworkProfile({"default": {"median_ms": 0, "p99_ms": 0}})
+    with FakeAWSServer(SyntheticInventory(5), profile) as server:
+        with aws_environment(server.endpoint_url):
+            yield server
+
+
+def test_estimate_calls_counts_detail_calls():
+    """Test that listing pages and per-resource detail calls are estimated."""
+    dynamodb = RESOURCE_SPECS_BY_KEY["dynamodb"]
+    assert estimate_calls(dynamodb, 250) == {"dynamodb": 3 + 250}
+    assert estimate_calls(dynamodb, 250, {"TableName"}) == {"dynamodb": 3}
+    assert estimate_calls(dynamodb, None) == {"dynamodb": 1}
+
+    ses = RESOURCE_SPECS_BY_KEY["ses_identity"]
+    assert estimate_calls(ses, 10) == {"ses": 1 + 1 + 10, "sts": 10}
+    assert estimate_calls(RESOURCE_SPECS_BY_KEY["vpc"], 40) == {"ec2": 1}
+
+
+def test_build_plan_schedules_accounts_and_throttling(tmp_path):
+    """Test wall time over workers and throttling of a busy (account, region, service)."""
+    path = str(tmp_path / "timings.json")
+    accounts = {}
+    for account in ("111", "222"):
+        timings = TaskTimings(path, account)
+        timings.record(REGION, "dynamodb", 10.0)
+        timings.record_rows(REGION, "dynamodb", 1000)
+        timings.record(REGION, "eks", 2.0)
+        accounts[account] = timings
+    tasks = build_tasks({"dynamodb", "eks"}, [REGION])
+
+    plan = build_plan(accounts, tasks, workers=2)
+
+    assert plan.total_calls == 2 * (10 + 1000 + 1)
+    assert plan.unknown_rows == 2
+    assert plan.schedule_seconds == 12.0
+    # DynamoDB 1010회를 10초 안에 보내야 하므로 계정마다 요청 제한에 걸립니다
+    assert plan.throttled == {
+        ("111", REGION, "dynamodb"): 910,
+        ("222", REGION, "dynamodb"): 910,
+    }
+    assert plan.wall_seconds == pytest.approx(101.0)
+
+    limited = build_plan(accounts, tasks, workers=2, max_rps=5)
+    assert not limited.throttled and limited.wall_seconds == pytest.approx(202.0)
+
+
+def test_plan_subcommand_api_budget(server, tmp_path, capsys):
+    """Test that the plan makes no collection calls and enforces --api-budget."""
+    path = str(tmp_path / "timings.json")
+    argv = ["plan", "--timings", path, "--region", REGION, "--resources", "dynamodb"]
+
+    main(argv)
+    assert "예상 API 호출 1회" in capsys.readouterr().out
+
+    timings = TaskTimings(path, "123456789012")
+    timings.record_rows(REGION, "dynamodb", 50)
+    timings.save()
+    with pytest.raises(SystemExit) as excinfo:
+        main([*argv, "--api-budget", "20"])
+    assert excinfo.value.code == 1
+    assert "--api-budget 20" in capsys.readouterr().err
+    main([*argv, "--api-budget", "20", "--columns", "dynamodb=TableName"])
+
+    assert not {operation for operation in server.calls if "dynamodb" in operation}
+
+
+def test_main_api_budget_aborts_before_collection(server):
+    """Test that a run over its API budget stops before any collection call."""
+    with pytest.raises(SystemExit):
+        main(["--region", REGION, "--resources", "dynamodb", "--api-budget", "0"])
+
+    assert not {operation for operation in server.calls if "dynamodb" in operation}
+
+
+def test_build_plan_counts_tag_and_lookup_calls(tmp_path):
+    """Test that --tags pages and --incremental lookups are part of the total."""
+    timings = TaskTimings(str(tmp_path / "timings.json"), "111")
+    timings.record_rows(REGION, "ec2", 250)
+    timings.record_rows("global", "s3", 30)
+    tasks = build_tasks({"ec2", "s3"}, [REGION])
+    base = build_plan({"111": timings}, tasks)
+
+    plan = build_plan(
+        {"111": timings}, tasks, tag_tasks=tasks, lookups={REGION: 2, "us-east-1": 1}
+    )
+
+    # 태그는 ap-northeast-2의 EC2 250개(3페이지)와 us-east-1의 S3 30개(1페이지)
+    assert plan.extra_calls == {
+        ("111", REGION, "resourcegroupstaggingapi"): 3,
+        ("111", "us-east-1", "resourcegroupstaggingapi"): 1,
+        ("111", REGION, "cloudtrail"): 2,
+        ("111", "us-east-1", "cloudtrail"): 1,
+    }
+    assert plan.total_calls == base.total_calls + 7
@@ -0,0 +1,100 @@
+"""
+Tests for raw-response projection.
+"""
+
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+sys.path.insert(0, ".")
+
+from resources import RESOURCE_SPECS, ec2, elasticache, security_groups
+from utils.raw_projection import project_raw, retain_raw
+
+EC2_RAW = {
+    "Reservations": [
+        {
+            "ReservationId": "r-1",
+            "Instances": [
+                {
+                    "InstanceId": "i-1",
+                    "InstanceType": "t3.micro",
+                    "State": {"Code": 16, "Name": "running"},
+                    "PrivateIpAddress": "10.0.0.1",
+                    "SecurityGroups": [{"GroupId": "sg-1", "GroupName": "web"}],
+                    "LaunchTime": datetime(2024, 1, 2, tzinfo=timezone.utc),
+                    "Tags": [{"Key": "Name", "Value": "web-1"}],
+                    "BlockDeviceMappings": [{"DeviceName": "/dev/xvda"}],
+                    "NetworkInterfaces": [{"NetworkInterfaceId": "eni-1"}],
+                }
+            ],
+        }
+    ],
+    "ResponseMetadata": {"RequestId": "req"},
+}
+
+
+def test_project_raw_keeps_named_fields():
+    """Test nested dicts, lists of items and dropped fields."""
+    projected = project_raw(EC2_RAW, ec2.RAW_PROJECTION)
+
+    instance = projected["Reservations"][0]["Instances"][0]
+    assert "ResponseMetadata" not in projected
+    assert "ReservationId" not in projected["Reservations"][0]
+    assert "BlockDeviceMappings" not in instance
+    assert "NetworkInterfaces" not in instance
+    assert instance["State"] == {"Code": 16, "Name": "running"}
+    assert "PublicIpAddress" not in instance
+
+
+def test_projection_preserves_filtered_data():
+    """Filtering the projected raw data gives the same rows as the full response."""
+    cache_raw = {
+        "CacheClusters": [
+            {
+                "CacheClusterId": "c-1",
+                "Engine": "redis",
+                "CacheClusterCreateTime": datetime(2024, 1, 1, tzinfo=timezone.utc),
+                "CacheNodes": [{"CacheNodeId": "0001", "Endpoint": {"Port": 6379}}],
+            }
+        ]
+    }
+    sg_raw = [
+        {
+            "GroupId": "sg-1",
+            "GroupName": "web",
+            "OwnerId": "123",
+            "IpPermissions": [
+                {
+                    "IpProtocol": "tcp",
+                    "FromPort": 22,
+                    "ToPort": 22,
+                    "IpRanges": [{"CidrIp": "0.0.0.0/0"}],
+                }
+            ],
+        }
+    ]
+
+    for module, raw in (
+        (ec2, EC2_RAW),
+        (elasticache, cache_raw),
+        (security_groups, sg_raw),
+    ):
+        projected = project_raw(raw, module.RAW_PROJECTION)
+        assert module.get_filtered_data(projected).equals(module.get_filtered_data(raw))
+
+
+def test_retain_raw_modes():
+    """Test the --raw modes."""
+    assert retain_raw(EC2_RAW, ec2, "full") is EC2_RAW
+    assert retain_raw(EC2_RAW, ec2, "none") is None
+    assert "ResponseMetadata" not in retain_raw(EC2_RAW, ec2, "projected")
+    with pytest.raises(ValueError):
+        retain_raw(EC2_RAW, ec2, "partial")
+
+
+def test_every_resource_declares_projection():
+    """Every registered resource module declares a RAW_PROJECTION."""
+    for spec in RESOURCE_SPECS:
+        assert isinstance(spec.module.RAW_PROJECTION, dict | list), spec.key
@@ -0,0 +1,137 @@
+"""
+Tests for multi-process region sharding.
+"""
+
+import os
+import sys
+
+import boto3
+import pandas as pd
+import pyarrow as pa
+import pytest
+from botocore.config import Config
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+sys.path.insert(0, ".")
+
+from resources import RESOURCE_SPECS_BY_KEY
+from utils.clients import RegionUnavailableError
+from utils.region_shards import RegionShardScheduler, TaskRunner, shard_scopes
+from utils.scheduler import CollectionTask
+
+
+def fake_session(region):
+    return {"region": region}
+
+
+def fake_collect(spec, session, region, filter_pool, raw_mode):
+    if spec.key == "rds":
+        raise ClientError(
+            {"Error": {"Code": "AccessDenied", "Message": "denied"}},
+            "DescribeDBInstances",
+        )
+    if spec.key == "eks" and region == "me-south-1":
+        os._exit(3)
+    return {"region": region, "pid": os.getpid()}, pd.DataFrame({"Id": [region]})
+
+
+def _task(key, scope, expected=1.0):
+    spec = RESOURCE_SPECS_BY_KEY[key]
+    region = spec.global_region if spec.is_global else scope
+    return CollectionTask(spec, scope, region, expected)
+
+
+def _run(tasks, processes):
+    runner = TaskRunner(fake_collect, fake_session)
+    scheduler = RegionShardScheduler(tasks, runner, processes)
+    return scheduler, {
+        (task.scope, task.spec.key): future for task, future in scheduler.run()
+    }
+
+
+def test_shard_scopes_balances_expected_time():
+    """Scopes are kept whole and spread by their expected total."""
+    tasks = [
+        _task("ec2", "us-east-1", 10),
+        _task("vpc", "us-east-1", 5),
+        _task("ec2", "us-west-2", 8),
+        _task("ec2", "eu-west-1", 4),
+        _task("s3", "global", 3),
+    ]
+
+    assert shard_scopes(tasks, 2) == [
+        ["us-east-1"],
+        ["us-west-2", "eu-west-1", "global"],
+    ]
+    assert shard_scopes(tasks, 8) == [
+        ["us-east-1"],
+        ["us-west-2"],
+        ["eu-west-1"],
+        ["global"],
+    ]
+
+
+def test_results_and_errors_stream_back_from_processes():
+    """Tables, raw data and AWS errors come back from separate processes."""
+    tasks = [
+        _task("ec2", "us-east-1"),
+        _task("rds", "us-east-1"),
+        _task("ec2", "us-west-2"),
+        _task("s3", "global"),
+    ]
+
+    _, futures = _run(tasks, 2)
+
+    assert set(futures) == {(t.scope, t.spec.key) for t in tasks}
+    raw, table = futures[("us-east-1", "ec2")].result()
+    assert isinstance(table, pa.Table)
+    assert table.column("Id").to_pylist() == ["us-east-1"]
+    assert raw["pid"] != os.getpid()
+    error = futures[("us-east-1", "rds")].exception()
+    assert isinstance(error, ClientError)
+    assert error.operation_name == "DescribeDBInstances"
+    assert all(task.duration is not None for task in tasks)
+
+
+def test_exited_process_fails_its_remaining_tasks():
+    """Tasks of a process that dies without reporting are returned as failures."""
+    tasks = [_task("eks", "me-south-1"), _task("ec2", "us-east-1")]
+
+    _, futures = _run(tasks, 2)
+
+    assert "exited with code 3" in str(futures[("me-south-1", "eks")].exception())
+    assert futures[("us-east-1", "ec2")].exception() is None
+
+
+def test_global_failures_do_not_open_the_regional_breaker():
+    """Global resources call us-east-1 but trip only the global scope's breaker."""
+
+    def unreachable_collect(spec, session, region, filter_pool, raw_mode):
+        client = session.client(
+            "s3",
+            endpoint_url="http://127.0.0.1:9",
+            config=Config(retries={"max_attempts": 1}, connect_timeout=1),
+        )
+        return client.list_buckets(), pd.DataFrame()
+
+    runner = TaskRunner(
+        unreachable_collect,
+        lambda region: boto3.Session(
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+            region_name=region,
+        ),
+        circuit_breaker=1,
+    )
+    task = _task("s3", "global")
+    assert task.region == "us-east-1"
+
+    with pytest.raises(EndpointConnectionError):
+        runner(task)
+
+    with pytest.raises(RegionUnavailableError):
+        runner(task)
+    runner.breaker.check("us-east-1")
+    assert runner.session("global", "us-east-1") is not runner.session(
+        "us-east-1", "us-east-1"
+    )
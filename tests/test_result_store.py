@@ -0,0 +1,127 @@
+"""
+Tests for the columnar result store.
+"""
+
+import io
+import json
+import sys
+from datetime import date
+
+import pandas as pd
+
+sys.path.insert(0, ".")
+
+from utils.dtypes import apply_column_schema
+from utils.result_store import GLOBAL_SCOPE, ResultStore, dataframe_to_table
+
+
+def _security_groups() -> pd.DataFrame:
+    df = pd.DataFrame(
+        [
+            {
+                "SecurityGroupId": "sg-1",
+                "VpcId": "vpc-1",
+                "AnyOpenInbound": "⚠️ YES",
+                "InboundRules": ["tcp:22 from 0.0.0.0/0"],
+            },
+            {
+                "SecurityGroupId": "sg-2",
+                "VpcId": "vpc-1",
+                "AnyOpenInbound": "No",
+                "InboundRules": [],
+            },
+        ]
+    )
+    return apply_column_schema(
+        df,
+        {
+            "SecurityGroupId": "string",
+            "VpcId": "category",
+            "AnyOpenInbound": "category",
+        },
+    )
+
+
+class TestResultStore:
+    """Test cases for ResultStore."""
+
+    def test_put_and_count(self):
+        """Test storing tables and counting rows per region."""
+        store = ResultStore()
+        store.put("ap-northeast-2", "SecurityGroups", _security_groups())
+        store.put("ap-northeast-2", "EC2", pd.DataFrame())
+        store.put(GLOBAL_SCOPE, "S3", pd.DataFrame([{"BucketName": "b"}]))
+
+        assert store.regions() == ["ap-northeast-2"]
+        assert store.regions(include_global=True) == ["ap-northeast-2", GLOBAL_SCOPE]
+        assert store.count("ap-northeast-2") == 2
+        assert store.count("ap-northeast-2", "EC2") == 0
+        assert store.get("ap-northeast-2", "EC2") is None
+        assert store.count(GLOBAL_SCOPE, "S3") == 1
+
+    def test_filter_equal_on_category_column(self):
+        """Test filtering a dictionary-encoded column."""
+        store = ResultStore()
+        store.put("us-east-1", "SecurityGroups", _security_groups())
+
+        result = store.filter_equal(
+            "us-east-1", "SecurityGroups", "AnyOpenInbound", "⚠️ YES"
+        )
+
+        assert result.num_rows == 1
+        assert result.column("SecurityGroupId").to_pylist() == ["sg-1"]
+        assert store.filter_equal("us-east-1", "EC2", "State", "running") is None
+
+    def test_to_pandas_preserves_dtypes(self):
+        """Test that DataFrame conversion restores the schema dtypes."""
+        store = ResultStore()
+        store.put("us-east-1", "SecurityGroups", _security_groups())
+
+        df = store.to_pandas("us-east-1", "SecurityGroups")
+
+        assert isinstance(df["VpcId"].dtype, pd.CategoricalDtype)
+        assert df["InboundRules"].tolist()[0] == ["tcp:22 from 0.0.0.0/0"]
+
+    def test_write_json(self):
+        """Test that the JSON output keeps the region/resource layout."""
+        store = ResultStore()
+        store.add_region("us-west-2")
+        store.put("us-east-1", "SecurityGroups", _security_groups())
+        store.put(
+            GLOBAL_SCOPE,
+            "S3",
+            apply_column_schema(
+                pd.DataFrame([{"BucketName": "b", "CreationDate": "2023-05-15"}]),
+                {"CreationDate": "date"},
+            ),
+        )
+
+        class Encoder(json.JSONEncoder):
+            def default(self, obj):
+                if isinstance(obj, date):
+                    return obj.isoformat()
+                return super().default(obj)
+
+        buffer = io.StringIO()
+        store.write_json(buffer, cls=Encoder)
+        data = json.loads(buffer.getvalue())
+
+        assert data["us-west-2"] == {}
+        assert data["us-east-1"]["SecurityGroups"][1]["AnyOpenInbound"] == "No"
+        assert data["us-east-1"]["SecurityGroups"][1]["InboundRules"] == []
+        assert data["S3"] == [{"BucketName": "b", "CreationDate": "2023-05-15"}]
+
+    def test_write_json_empty(self):
+        """Test that an empty store writes an empty object."""
+        buffer = io.StringIO()
+        ResultStore().write_json(buffer)
+        assert json.loads(buffer.getvalue()) == {}
+
+
+def test_dataframe_to_table_with_mixed_object_column():
+    """Test that mixed-type object columns are converted to strings."""
+    df = pd.DataFrame([{"MinSize": 1}, {"MinSize": ""}])
+
+    table = dataframe_to_table(df)
+
+    assert table.column("MinSize").to_pylist() == ["1", ""]
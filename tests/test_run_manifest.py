@@ -0,0 +1,95 @@
+"""
+Tests for task failure records and the run manifest.
+"""
+
+import json
+import sys
+from datetime import datetime, timezone
+
+from botocore.exceptions import ClientError
+
+sys.path.insert(0, ".")
+
+from utils.clients import RegionUnavailableError
+from utils.run_manifest import failure_from_exception, failure_rows, write_manifest
+
+
+def _access_denied() -> ClientError:
+    return ClientError(
+        {"Error": {"Code": "AccessDenied", "Message": "denied"}}, "ListClusters"
+    )
+
+
+def test_failure_from_client_error():
+    """Test that the AWS error code and operation are extracted."""
+    failure = failure_from_exception(
+        "EKS", "eks", "us-east-1", _access_denied(), 1.23456
+    )
+
+    assert failure.status == "failed"
+    assert failure.error_code == "AccessDenied"
+    assert failure.operation == "ListClusters"
+    assert failure.duration_seconds == 1.235
+
+
+def test_failure_from_other_exceptions():
+    """Test generic exceptions and region cancellations."""
+    failure = failure_from_exception("VPC", "vpc", "us-east-1", KeyError("Vpcs"))
+    cancelled = failure_from_exception(
+        "VPC", "vpc", "me-south-1", RegionUnavailableError("down")
+    )
+
+    assert failure.error_code == "KeyError"
+    assert failure.operation is None
+    assert cancelled.status == "cancelled"
+
+
+def test_failure_rows():
+    """Test the Errors sheet columns."""
+    rows = failure_rows([failure_from_exception("EKS", "eks", "r", _access_denied())])
+
+    assert list(rows[0]) == [
+        "Service",
+        "Region",
+        "Status",
+        "ErrorCode",
+        "Operation",
+        "DurationSeconds",
+        "Message",
+    ]
+
+
+def test_write_manifest(tmp_path):
+    """Test the manifest task counts."""
+    path = tmp_path / "manifest.json"
+    now = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    failures = [
+        failure_from_exception("EKS", "eks", "us-east-1", _access_denied()),
+        failure_from_exception("EKS", "eks", "r", RegionUnavailableError("down")),
+    ]
+
+    write_manifest(
+        str(path),
+        run_id="20261001_000000_000",
+        started_at=now,
+        finished_at=now,
+        account_id=None,
+        regions=["us-east-1", "r"],
+        resources=["eks", "amis"],
+        total_tasks=5,
+        resumed_tasks=1,
+        failures=failures,
+        skipped=[{"resource": "amis", "region": "r", "reason": "deadline"}],
+        outputs={"excel": "out.xlsx"},
+    )
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+
+    assert manifest["tasks"] == {
+        "total": 5,
+        "succeeded": 2,
+        "failed": 1,
+        "cancelled": 1,
+        "skipped": 1,
+        "resumed": 1,
+    }
+    assert manifest["failures"][0]["error_code"] == "AccessDenied"
@@ -0,0 +1,135 @@
+"""
+Tests for the deadline-aware collection scheduler.
+"""
+
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, ".")
+
+from resources import RESOURCE_SPECS_BY_KEY
+from utils.scheduler import (
+    DEFAULT_EXPECTED_SECONDS,
+    CollectionTask,
+    DeadlineScheduler,
+    TaskTimings,
+    order_tasks,
+    parse_duration,
+)
+
+EC2 = RESOURCE_SPECS_BY_KEY["ec2"]
+AMIS = RESOURCE_SPECS_BY_KEY["amis"]
+EBS_SNAPSHOT = RESOURCE_SPECS_BY_KEY["ebs_snapshot"]
+
+
+def _task(spec, scope="us-east-1", expected=1.0) -> CollectionTask:
+    return CollectionTask(spec, scope, scope, expected)
+
+
+class TestTaskTimings:
+    """Test cases for TaskTimings."""
+
+    def test_record_and_reload(self, tmp_path):
+        """Test that durations are smoothed and persisted per account."""
+        path = str(tmp_path / "timings.json")
+        timings = TaskTimings(path, "111111111111")
+        timings.record("us-east-1", "ec2", 10.0)
+        timings.record("us-east-1", "ec2", 20.0)
+        timings.save()
+
+        reloaded = TaskTimings(path, "111111111111")
+
+        assert reloaded.expected("us-east-1", "ec2") == 15.0
+        assert reloaded.timings["111111111111/us-east-1/ec2"]["runs"] == 2
+
+    def test_expected_fallbacks(self, tmp_path):
+        """Test the cross-region average and the default estimate."""
+        timings = TaskTimings(str(tmp_path / "timings.json"), None)
+        timings.record("us-east-1", "ec2", 4.0)
+        timings.record("eu-west-1", "ec2", 8.0)
+
+        assert timings.expected("ap-northeast-2", "ec2") == 6.0
+        assert timings.expected("us-east-1", "rds") == DEFAULT_EXPECTED_SECONDS
+
+    def test_rows_are_kept_with_durations(self, tmp_path):
+        """Test that resource counts are recorded next to durations and averaged."""
+        timings = TaskTimings(str(tmp_path / "timings.json"), "1")
+        timings.record_rows("us-east-1", "dynamodb", 40)
+        timings.record("us-east-1", "dynamodb", 3.0)
+        timings.record_rows("eu-west-1", "dynamodb", 20)
+
+        assert timings.rows("us-east-1", "dynamodb") == 40
+        assert timings.rows("ap-northeast-2", "dynamodb") == 30
+        assert timings.rows("us-east-1", "eks") is None
+        # 리소스 수만 기록된 작업은 예상 시간에 영향을 주지 않습니다
+        assert timings.expected("eu-west-1", "dynamodb") == 3.0
+        assert timings.timings["1/us-east-1/dynamodb"]["runs"] == 1
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        """Test that an unreadable timings file starts empty."""
+        path = tmp_path / "timings.json"
+        path.write_text("{", encoding="utf-8")
+
+        assert TaskTimings(str(path), None).timings == {}
+
+
+def test_order_tasks_longest_first():
+    """Test longest-first ordering and low-priority deferral."""
+    tasks = [_task(EC2, expected=1), _task(AMIS, expected=9), _task(EC2, "b", 5)]
+
+    assert [t.expected for t in order_tasks(tasks)] == [9, 5, 1]
+    deferred = order_tasks(tasks, defer_low_priority=True)
+    assert [t.spec.key for t in deferred] == ["ec2", "ec2", "amis"]
+
+
+def test_scheduler_runs_in_parallel_and_records_timings(tmp_path):
+    """Test that tasks run concurrently and their durations are recorded."""
+    timings = TaskTimings(str(tmp_path / "timings.json"), "1")
+    barrier = threading.Barrier(2, timeout=5)
+
+    def run_task(task):
+        barrier.wait()
+        return task.scope
+
+    scheduler = DeadlineScheduler(
+        [_task(EC2, "a"), _task(EC2, "b")], run_task, workers=2, timings=timings
+    )
+    results = {task.scope: future.result() for task, future in scheduler.run()}
+
+    assert results == {"a": "a", "b": "b"}
+    assert set(timings.timings) == {"1/a/ec2", "1/b/ec2"}
+
+
+def test_deadline_skips_low_priority_tasks():
+    """Test that low-priority tasks are skipped once the budget is exhausted."""
+    started = []
+
+    def run_task(task):
+        started.append(task.spec.key)
+        time.sleep(0.05)
+
+    scheduler = DeadlineScheduler(
+        [_task(AMIS, expected=0.01), _task(EBS_SNAPSHOT, expected=60), _task(EC2)],
+        run_task,
+        workers=1,
+        deadline=0.02,
+    )
+    finished = [(task.spec.key, future is None) for task, future in scheduler.run()]
+
+    # 보통 우선순위 작업은 제한 시간을 넘겨도 실행하고, 낮은 우선순위 작업은 건너뜀
+    assert started == ["ec2"]
+    assert [task.spec.key for task in scheduler.skipped] == ["ebs_snapshot", "amis"]
+    assert ("ebs_snapshot", True) in finished
+
+
+def test_parse_duration():
+    """Test the --deadline duration formats."""
+    assert parse_duration("300") == 300
+    assert parse_duration("300s") == 300
+    assert parse_duration("5m") == 300
+    assert parse_duration("1.5h") == 5400
+    with pytest.raises(ValueError):
+        parse_duration("soon")
@@ -0,0 +1,82 @@
+"""
+Tests for per-stage CPU and memory profiling.
+"""
+
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, ".")
+
+from utils.stage_profiler import StageProfiler, profile_stage
+
+
+def spin_cpu(seconds):
+    """Busy loop for about seconds of CPU time."""
+    end = time.thread_time() + seconds
+    total = 0
+    while time.thread_time() < end:
+        total += 1
+    return total
+
+
+def test_profile_stage_without_profiler_is_noop():
+    """Test that stages are not recorded when no profiler is active."""
+    profiler = StageProfiler()
+    with profile_stage("filter", "EC2"):
+        pass
+    assert profiler.stats == {}
+
+
+def test_stage_cpu_memory_and_samples():
+    """Test that CPU time, peak memory and sampled functions are attributed per stage."""
+    profiler = StageProfiler(interval=0.001).start()
+    try:
+        with profile_stage("filter", "EC2", "ap-northeast-2"):
+            spin_cpu(0.2)
+        with profile_stage("excel", "EC2", "ap-northeast-2"):
+            block = bytearray(16 * 1024 * 1024)
+            del block
+        with profile_stage("excel", "VPC", "ap-northeast-2"):
+            pass
+    finally:
+        profiler.stop()
+    report = profiler.report()
+
+    assert report["stages"]["filter"]["cpu_seconds"] >= 0.15
+    assert report["stages"]["filter"]["top_self"][0]["function"].startswith("spin_cpu")
+    assert report["stages"]["excel"]["calls"] == 2
+    assert report["stages"]["excel"]["peak_mb"] >= 15
+    assert report["stages"]["filter"]["peak_mb"] < 15
+    excel = {
+        row["resource"]: row for row in report["resources"] if row["stage"] == "excel"
+    }
+    assert excel["EC2"]["peak_mb"] >= 15 and excel["VPC"]["peak_mb"] < 1
+
+
+def test_samples_follow_each_thread_innermost_stage():
+    """Test that concurrent threads are sampled into their own innermost stage."""
+    profiler = StageProfiler(mode="cpu", interval=0.001).start()
+
+    def work():
+        with profile_stage("api", "RDS"), profile_stage("filter", "RDS"):
+            spin_cpu(0.1)
+
+    try:
+        threads = [threading.Thread(target=work) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        profiler.stop()
+    report = profiler.report()
+
+    assert report["stages"]["filter"]["calls"] == 2
+    assert report["stages"]["filter"]["samples"] > 0
+    assert report["stages"]["api"]["samples"] <= report["stages"]["filter"]["samples"]
+    assert report["stages"]["filter"]["peak_mb"] == 0
+    with pytest.raises(ValueError):
+        StageProfiler(mode="wall")
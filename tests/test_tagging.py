@@ -0,0 +1,134 @@
+"""
+Tests for the Resource Groups Tagging API enrichment (--tags).
+"""
+
+import os
+import sys
+from unittest.mock import patch
+
+import boto3
+import pyarrow as pa
+import pytest
+
+sys.path.insert(0, ".")
+
+from benchmarks.collect import aws_environment
+from benchmarks.fake_aws import FakeAWSServer, NetworkProfile, SyntheticInventory
+from listup_aws_resources import collect_resource, main
+from resources import RESOURCE_SPECS_BY_KEY
+from utils.checkpoint import latest_run_id
+from utils.result_store import ResultStore
+from utils.tagging import TagEnricher, join_tags, tags_by_id
+
+REGION = "ap-northeast-2"
+ACCOUNT = "123456789012"
+
+# 태그 조회가 여러 페이지로 나뉘도록 페이지 크기를 줄입니다
+PROFILE = {"default": {"median_ms": 0, "p99_ms": 0, "page_size": 4}}
+
+
+@pytest.fixture
+def server():
+    with FakeAWSServer(SyntheticInventory(6), NetworkProfile(PROFILE)) as server:
+        with aws_environment(server.endpoint_url):
+            yield server
+
+
+def _source(key):
+    return RESOURCE_SPECS_BY_KEY[key].module.TAG_SOURCE
+
+
+def test_tags_by_id_reads_ids_from_arns():
+    """Test that each resource type maps its ARNs onto its ID column values."""
+    tags = {
+        f"arn:aws:ec2:{REGION}:{ACCOUNT}:instance/i-1": "env=prod",
+        f"arn:aws:ec2:{REGION}:{ACCOUNT}:security-group-rule/sgr-1": "rule=1",
+        f"arn:aws:ec2:{REGION}:{ACCOUNT}:security-group/sg-1": "sg=1",
+        f"arn:aws:elasticloadbalancing:{REGION}:{ACCOUNT}:loadbalancer/web": "a=1",
+        f"arn:aws:elasticloadbalancing:{REGION}:{ACCOUNT}:loadbalancer/app/api/50dc6c": "b=2",
+        f"arn:aws:elasticloadbalancing:{REGION}:{ACCOUNT}:targetgroup/api/73e2d6": "c=3",
+        f"arn:aws:secretsmanager:{REGION}:{ACCOUNT}:secret:db-AbCdEf": "d=4",
+        "arn:aws:route53:::hostedzone/Z123": "e=5",
+        "arn:aws:s3:::logs-bucket": "f=6",
+    }
+
+    assert tags_by_id(_source("ec2"), tags) == {"i-1": "env=prod"}
+    assert tags_by_id(_source("security_groups"), tags) == {"sg-1": "sg=1"}
+    assert tags_by_id(_source("elb"), tags) == {"web": "a=1", "api": "b=2"}
+    assert tags_by_id(_source("secrets_manager"), tags) == {
+        f"arn:aws:secretsmanager:{REGION}:{ACCOUNT}:secret:db-AbCdEf": "d=4"
+    }
+    assert tags_by_id(_source("route53"), tags) == {"/hostedzone/Z123": "e=5"}
+    assert tags_by_id(_source("s3"), tags) == {"logs-bucket": "f=6"}
+
+
+def test_join_tags_keeps_module_tags_for_unknown_rows():
+    """Test that the join adds a Tags column or fills the module's own one."""
+    table = pa.table({"VolumeId": ["vol-1", "vol-2"], "Tags": [None, "own=1"]})
+    joined = join_tags(table, "VolumeId", {"vol-1": "env=dev"})
+    assert joined.column("Tags").to_pylist() == ["env=dev", "own=1"]
+
+    table = pa.table({"TableName": ["a", "b"]})
+    joined = join_tags(table, "TableName", {"b": "team=data"})
+    assert joined.column_names == ["TableName", "Tags"]
+    assert joined.column("Tags").to_pylist() == [None, "team=data"]
+
+
+def test_enricher_pages_once_per_region(server):
+    """Test that one paginated tag sweep per region covers every resource table."""
+    specs = [RESOURCE_SPECS_BY_KEY[key] for key in ("ec2", "dynamodb", "elb", "eks")]
+    enricher = TagEnricher(
+        lambda region: boto3.Session(region_name=region), [REGION], specs
+    )
+    session = boto3.Session(region_name=REGION)
+    try:
+        for spec in specs:
+            _, df = collect_resource(spec, session, REGION)
+            table = enricher.join(spec, REGION, pa.Table.from_pandas(df))
+            assert all(table.column("Tags").to_pylist()), spec.key
+    finally:
+        enricher.shutdown()
+
+    # 리소스 6개 × 4종(ELB는 Classic/ALB 합계 6개)을 페이지 크기 4로 조회합니다
+    assert server.calls["resourcegroupstaggingapi.GetResources"] == 6
+
+
+def test_tags_skip_per_identity_tag_calls(server):
+    """Test that --tags drops the SES tag call per identity but keeps the rest."""
+    spec = RESOURCE_SPECS_BY_KEY["ses_identity"]
+    session = boto3.Session(region_name=REGION)
+
+    _, df = collect_resource(spec, session, REGION, tags=True)
+
+    assert "Tags" in df.columns
+    assert "ses.ListTagsForResource" not in server.calls
+    assert server.calls["ses.GetIdentityVerificationAttributes"] == 1
+
+
+def test_main_tags_joins_every_table(server):
+    """Test that --tags writes a Tags column into each stored table."""
+    with patch.object(ResultStore, "put", autospec=True, side_effect=ResultStore.put):
+        main(["--region", REGION, "--resources", "rds", "kinesis_streams", "--tags"])
+        stored = {call.args[2]: call.args[3] for call in ResultStore.put.call_args_list}
+
+    assert set(stored) == {"RDS", "KinesisStreams"}
+    for table in stored.values():
+        assert all(table.column("Tags").to_pylist())
+
+
+def test_main_resume_restores_tags(server, data_dir):
+    """Test that --resume tags its tables like the run it continues."""
+    main(["--region", REGION, "--resources", "rds", "ses_identity", "--tags"])
+    run_id = latest_run_id(str(data_dir))
+    # SES 작업이 끝나지 않은 채 중단된 실행으로 만듭니다
+    os.remove(data_dir / "runs" / run_id / "tasks" / REGION / "ses_identity.arrow")
+    server.reset_stats()
+
+    with patch.object(ResultStore, "put", autospec=True, side_effect=ResultStore.put):
+        main(["--resume", run_id])
+        stored = {call.args[2]: call.args[3] for call in ResultStore.put.call_args_list}
+
+    assert set(stored) == {"RDS", "SESIdentity"}
+    for table in stored.values():
+        assert all(table.column("Tags").to_pylist())
+    assert "ses.ListTagsForResource" not in server.calls
@@ -0,0 +1,182 @@
+"""
+Tests for the distributed work queue.
+"""
+
+import sys
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+from botocore.exceptions import ClientError
+
+sys.path.insert(0, ".")
+
+from resources import RESOURCE_SPECS_BY_KEY
+from utils.run_manifest import TaskFailure
+from utils.scheduler import CollectionTask
+from utils.work_queue import (
+    QueueWorker,
+    SQLiteTaskQueue,
+    open_queue,
+    profile_checkpoint,
+)
+
+
+def _task(key, scope, expected=1.0):
+    spec = RESOURCE_SPECS_BY_KEY[key]
+    region = spec.global_region if spec.is_global else scope
+    return CollectionTask(spec, scope, region, expected)
+
+
+def _failure(status):
+    return TaskFailure("EC2", "ec2", "us-east-1", status, "Error", None, "boom")
+
+
+def _queue(tmp_path, tasks):
+    task_queue = SQLiteTaskQueue(str(tmp_path / "queue.sqlite"))
+    task_queue.enqueue("run", {"raw": "full"}, tasks)
+    return task_queue
+
+
+def test_enqueue_and_claim_longest_first(tmp_path):
+    """Test that enqueueing is idempotent and claims start with the longest task."""
+    tasks = [("prod", _task("ec2", "us-east-1", 1.0)), ("", _task("s3", "global", 9.0))]
+    task_queue = _queue(tmp_path, tasks)
+
+    assert task_queue.enqueue("run", {"raw": "full"}, tasks) == 0
+    assert task_queue.run_info("run") == {"raw": "full"}
+    assert task_queue.latest_run() == "run"
+
+    first = task_queue.claim("run", "w1", 60)
+    second = task_queue.claim("run", "w2", 60)
+    assert (first.profile, first.task.spec.key, first.task.region) == (
+        "",
+        "s3",
+        "us-east-1",
+    )
+    assert (second.profile, second.task.scope) == ("prod", "us-east-1")
+    assert task_queue.claim("run", "w3", 60) is None
+    assert task_queue.counts("run")["leased"] == 2
+
+
+def test_expired_lease_is_reclaimed(tmp_path):
+    """Test that a task whose lease expired goes to another worker."""
+    task_queue = _queue(tmp_path, [("", _task("ec2", "us-east-1"))])
+
+    stale = task_queue.claim("run", "dead", -1)
+    reclaimed = task_queue.claim("run", "alive", 60)
+
+    assert reclaimed.id == stale.id
+    assert reclaimed.attempts == 2
+    assert not task_queue.complete(stale.id, "dead", "123", 1.0)
+    assert task_queue.complete(reclaimed.id, "alive", "123", 1.0)
+    assert task_queue.counts("run")["done"] == 1
+
+
+def test_expired_leases_count_toward_attempts(tmp_path):
+    """Test that a task that keeps crashing its worker ends up failed."""
+    task_queue = _queue(tmp_path, [("", _task("ec2", "us-east-1"))])
+
+    first = task_queue.claim("run", "dead-1", -1, max_attempts=2)
+    second = task_queue.claim("run", "dead-2", -1, max_attempts=2)
+
+    assert second.id == first.id and second.attempts == 2
+    assert task_queue.claim("run", "alive", 60, max_attempts=2) is None
+    assert task_queue.counts("run")["failed"] == 1
+    [failure] = task_queue.failures("run")[""]
+    assert (failure.status, failure.error_code) == ("cancelled", "LeaseExpired")
+
+
+def test_fail_reports_lost_lease(tmp_path):
+    """Test that a failure is not recorded once another worker holds the task."""
+    task_queue = _queue(tmp_path, [("", _task("ec2", "us-east-1"))])
+
+    stale = task_queue.claim("run", "slow", -1)
+    task_queue.claim("run", "alive", 60)
+
+    assert task_queue.fail(stale.id, "slow", _failure("failed")) is None
+    assert task_queue.counts("run")["leased"] == 1
+
+
+def test_cancelled_tasks_are_retried(tmp_path):
+    """Test that cancelled tasks are retried up to the limit and errors are final."""
+    task_queue = _queue(
+        tmp_path, [("", _task("ec2", "us-east-1")), ("", _task("ec2", "eu-west-1"))]
+    )
+
+    queued = task_queue.claim("run", "w", 60)
+    assert task_queue.fail(queued.id, "w", _failure("cancelled"), max_attempts=2) == (
+        "pending"
+    )
+    queued = task_queue.claim("run", "w", 60)
+    assert task_queue.fail(queued.id, "w", _failure("cancelled"), max_attempts=2) == (
+        "failed"
+    )
+    queued = task_queue.claim("run", "w", 60)
+    assert task_queue.fail(queued.id, "w", _failure("failed")) == "failed"
+
+    assert task_queue.counts("run")["failed"] == 2
+    assert [failure.status for failure in task_queue.failures("run")[""]] == [
+        "cancelled",
+        "failed",
+    ]
+
+
+def test_queue_worker_writes_results(tmp_path, monkeypatch):
+    """Test that a worker drains the queue into per-profile checkpoints."""
+    monkeypatch.setattr("utils.work_queue.IDLE_POLL_SECONDS", 0.05)
+    task_queue = _queue(
+        tmp_path,
+        [
+            ("prod", _task("ec2", "us-east-1")),
+            ("staging", _task("ec2", "us-east-1")),
+            ("prod", _task("rds", "us-east-1")),
+        ],
+    )
+
+    def runner_for(profile):
+        def run(task):
+            if task.spec.key == "rds":
+                raise ClientError(
+                    {"Error": {"Code": "AccessDenied", "Message": "denied"}},
+                    "DescribeDBInstances",
+                )
+            return {"profile": profile}, pd.DataFrame({"InstanceId": [profile]})
+
+        return run
+
+    worker = QueueWorker(
+        task_queue,
+        "run",
+        str(tmp_path),
+        runner_for,
+        account_for=lambda profile: f"{profile}-account",
+        resolve=pa.Table.from_pandas,
+        lease_seconds=60,
+    )
+    worker.run(threads=2)
+
+    assert (worker.completed, worker.failed) == (2, 1)
+    assert task_queue.counts("run") == {
+        "pending": 0,
+        "leased": 0,
+        "done": 2,
+        "failed": 1,
+    }
+    raw, table = profile_checkpoint(str(tmp_path), "staging", "run").load_task(
+        "us-east-1", "ec2"
+    )
+    assert raw == {"profile": "staging"}
+    assert table.column("InstanceId").to_pylist() == ["staging"]
+    done = task_queue.tasks("run", "done")
+    assert {row["account_id"] for row in done} == {"prod-account", "staging-account"}
+    assert task_queue.failures("run")["prod"][0].error_code == "AccessDenied"
+
+
+def test_open_queue_backends(tmp_path):
+    """Test backend selection from the queue location."""
+    path = str(tmp_path / "queue.sqlite")
+    assert isinstance(open_queue(path), SQLiteTaskQueue)
+    assert open_queue(f"sqlite:{path}").path == path
+    with pytest.raises(ValueError):
+        open_queue("redis://localhost")
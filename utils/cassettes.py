@@ -0,0 +1,180 @@
+"""
+Record/replay cassettes of AWS API responses.
+
+``CassetteLibrary`` hooks into botocore's event system on every session it is
+attached to. In ``record`` mode the ``after-call`` event writes each parsed
+response (including error responses) to a gzip-compressed cassette under
+``<dir>/<service>/<region>/<Operation>-<hash>.json.gz``, keyed by the
+operation and its API parameters. In ``replay`` mode the ``before-call`` event
+answers the call from the matching cassette without touching the network,
+optionally sleeping for the recorded duration (scaled), and a call without a
+cassette fails with ``CassetteMissError``.
+
+Datetimes and bytes are tagged in the JSON so replayed responses match what
+botocore parsed while recording.
+"""
+
+import base64
+import functools
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+
+CASSETTE_MODES = ("record", "replay")
+
+# 리전이 없는 클라이언트(글로벌 서비스)의 카세트 디렉터리 이름
+NO_REGION = "_default"
+
+# 요청 컨텍스트에 카세트 키와 호출 시작 시각을 기록하는 이름
+CONTEXT_KEY = "cassette_key"
+CONTEXT_STARTED = "cassette_started"
+
+
+class CassetteMissError(Exception):
+    """재생 모드에서 호출에 맞는 카세트가 없을 때 발생합니다."""
+
+    def __init__(self, operation: str, path: str) -> None:
+        super().__init__(f"No cassette recorded for {operation}: {path}")
+        self.operation_name = operation
+
+
+def encode(value: Any) -> Any:
+    """datetime/bytes를 태그가 붙은 dict로 바꿔 JSON으로 저장할 수 있게 합니다."""
+    if isinstance(value, dict):
+        return {key: encode(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [encode(item) for item in value]
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, bytes):
+        return {"__bytes__": base64.b64encode(value).decode()}
+    return value
+
+
+def decode(value: Any) -> Any:
+    """encode()로 저장한 값을 원래 형태로 되돌립니다."""
+    if isinstance(value, dict):
+        if len(value) == 1 and "__datetime__" in value:
+            return datetime.fromisoformat(value["__datetime__"])
+        if len(value) == 1 and "__bytes__" in value:
+            return base64.b64decode(value["__bytes__"])
+        return {key: decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [decode(item) for item in value]
+    return value
+
+
+def cassette_key(params: dict[str, Any]) -> str:
+    """API 인자로 카세트 키(정렬된 JSON의 해시)를 만듭니다."""
+    canonical = json.dumps(encode(params), sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+class CassetteLibrary:
+    """
+    카세트 디렉터리 하나를 기록 또는 재생 모드로 사용합니다.
+    세션 팩토리에 연결하면 워커 프로세스에 전달되어도 같은 모드로 동작합니다.
+    """
+
+    def __init__(self, directory: str, mode: str, latency_scale: float = 0.0) -> None:
+        """
+        Args:
+            directory: 카세트 디렉터리
+            mode: "record" 또는 "replay"
+            latency_scale: 재생 시 기록된 호출 시간에 곱할 배수 (0이면 지연 없음)
+        """
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.directory = directory
+        self.mode = mode
+        self.latency_scale = latency_scale
+
+    def path(self, model: Any, context: dict[str, Any]) -> str:
+        """작업과 요청 컨텍스트의 카세트 경로를 반환합니다."""
+        return os.path.join(
+            self.directory,
+            model.service_model.service_name,
+            context.get("client_region") or NO_REGION,
+            f"{model.name}-{context[CONTEXT_KEY]}.json.gz",
+        )
+
+    def attach(self, session: Any) -> Any:
+        """boto3 세션에 기록/재생 이벤트 핸들러를 등록하고 세션을 반환합니다."""
+        events = session.events
+        events.register(
+            "before-parameter-build", self._on_params, unique_id="cassette-params"
+        )
+        if self.mode == "record":
+            events.register("before-call", self._on_start, unique_id="cassette-start")
+            events.register("after-call", self._on_record, unique_id="cassette-record")
+        else:
+            events.register("before-call", self._on_replay, unique_id="cassette-replay")
+        return session
+
+    def session_factory(
+        self, factory: Callable[[str | None], Any]
+    ) -> Callable[[str | None], Any]:
+        """factory가 만든 세션에 카세트를 연결하는 세션 팩토리를 반환합니다."""
+        return functools.partial(_attached_session, self, factory)
+
+    def _on_params(self, params: dict[str, Any], context: dict[str, Any], **kwargs):
+        context[CONTEXT_KEY] = cassette_key(params)
+
+    def _on_start(self, context: dict[str, Any], **kwargs):
+        context[CONTEXT_STARTED] = time.perf_counter()
+
+    def _on_record(
+        self,
+        http_response: Any,
+        parsed: dict[str, Any],
+        model: Any,
+        context: dict[str, Any],
+        **kwargs,
+    ):
+        # 스트리밍 응답(본문을 한 번만 읽을 수 있음)은 기록하지 않습니다
+        if model.has_streaming_output or CONTEXT_KEY not in context:
+            return
+        path = self.path(model, context)
+        started = context.get(CONTEXT_STARTED)
+        cassette = {
+            "service": model.service_model.service_name,
+            "operation": model.name,
+            "region": context.get("client_region"),
+            "status_code": http_response.status_code,
+            "duration_seconds": (
+                None if started is None else round(time.perf_counter() - started, 6)
+            ),
+            "response": encode(parsed),
+        }
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(cassette, f)
+        os.replace(tmp_path, path)
+
+    def _on_replay(self, model: Any, context: dict[str, Any], **kwargs):
+        path = self.path(model, context)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                cassette = json.load(f)
+        except FileNotFoundError:
+            raise CassetteMissError(model.name, path) from None
+        if self.latency_scale and cassette.get("duration_seconds"):
+            time.sleep(cassette["duration_seconds"] * self.latency_scale)
+        http_response = SimpleNamespace(
+            status_code=cassette["status_code"], headers={}, content=b""
+        )
+        return http_response, decode(cassette["response"])
+
+
+def _attached_session(
+    library: CassetteLibrary, factory: Callable[[str | None], Any], region: str | None
+) -> Any:
+    return library.attach(factory(region))
@@ -0,0 +1,210 @@
+"""
+Per-task checkpoints for resuming interrupted runs.
+
+Every completed (region, resource) task is written to
+``data/runs/<run-id>/tasks/<scope>/`` as soon as it finishes: the raw API
+response as JSON and the filtered table as an Arrow IPC file. ``run.json``
+holds the run's account, regions, resources and ``--raw`` mode.
+
+``--resume <run-id>`` reloads the saved tasks, re-executes only the tasks
+that are missing (failed, skipped or never started) and writes the merged
+results to the run's original output files. ``--incremental`` uses the tables
+of a finished run as the snapshot a new run patches.
+
+Every run holds a full copy of the inventory, so ``prune_runs()`` keeps only
+the most recent runs (``--keep-runs``) once a run has finished.
+"""
+
+import json
+import os
+import shutil
+from datetime import datetime
+from typing import Any
+
+import pyarrow as pa
+
+# 실행별 체크포인트 디렉터리 (data/ 아래)
+RUNS_DIR_NAME = "runs"
+
+# 실행 정보를 기록하는 파일 이름
+RUN_INFO_NAME = "run.json"
+
+# 실행이 끝난 뒤 남겨 둘 최근 체크포인트 수 (--keep-runs)
+DEFAULT_KEEP_RUNS = 3
+
+
+def _replace_atomic(path: str, write) -> None:
+    """임시 파일에 기록한 뒤 이름을 바꿔, 중단되더라도 반쯤 쓰인 파일이 남지 않게 합니다."""
+    tmp_path = f"{path}.tmp"
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def latest_run_id(data_dir: str) -> str | None:
+    """실행 정보 파일이 있는 가장 최근 실행의 ID를 반환합니다 (없으면 None)."""
+    runs_dir = os.path.join(data_dir, RUNS_DIR_NAME)
+    if not os.path.isdir(runs_dir):
+        return None
+    # 실행 ID는 시작 시각의 타임스탬프이므로 이름 순서가 시간 순서입니다
+    run_ids = [
+        run_id
+        for run_id in os.listdir(runs_dir)
+        if os.path.exists(os.path.join(runs_dir, run_id, RUN_INFO_NAME))
+    ]
+    return max(run_ids, default=None)
+
+
+def prune_runs(data_dir: str, keep: int, current: str | None = None) -> list[str]:
+    """
+    가장 최근 keep개 실행과 current 실행의 체크포인트만 남기고 나머지를 삭제합니다.
+
+    Args:
+        data_dir: data 디렉터리 경로
+        keep: 남겨 둘 최근 실행 수
+        current: 순서와 관계없이 남겨 둘 실행 ID (방금 끝난 실행)
+
+    Returns:
+        list: 삭제한 실행 ID 목록
+    """
+    runs_dir = os.path.join(data_dir, RUNS_DIR_NAME)
+    if not os.path.isdir(runs_dir):
+        return []
+    # 실행 정보 파일 없이 중단된 디렉터리도 정리 대상입니다
+    run_ids = sorted(
+        run_id
+        for run_id in os.listdir(runs_dir)
+        if os.path.isdir(os.path.join(runs_dir, run_id))
+    )
+    removed = [
+        run_id for run_id in run_ids[: max(len(run_ids) - keep, 0)] if run_id != current
+    ]
+    for run_id in removed:
+        shutil.rmtree(os.path.join(runs_dir, run_id), ignore_errors=True)
+    return removed
+
+
+class RunCheckpoint:
+    """
+    실행 하나의 작업별 결과를 data/runs/<run-id>/ 아래에 기록하고 다시 읽습니다.
+    """
+
+    def __init__(self, data_dir: str, run_id: str) -> None:
+        """
+        Args:
+            data_dir: data 디렉터리 경로
+            run_id: 실행 ID (출력 파일 이름의 타임스탬프)
+        """
+        self.run_id = run_id
+        self.path = os.path.join(data_dir, RUNS_DIR_NAME, run_id)
+
+    def exists(self) -> bool:
+        """실행 정보 파일이 있는지 확인합니다."""
+        return os.path.exists(os.path.join(self.path, RUN_INFO_NAME))
+
+    def start(
+        self,
+        started_at: datetime,
+        account_id: str | None,
+        regions: list[str],
+        resources: list[str] | None,
+        raw_mode: str = "full",
+        columns: dict[str, list[str]] | None = None,
+        tags: bool = False,
+    ) -> None:
+        """
+        새 실행의 정보를 기록합니다.
+
+        Args:
+            started_at: 실행 시작 시각
+            account_id: AWS 계정 ID
+            regions: 조회할 리전 목록
+            resources: 선택된 리소스 목록 (None이면 모든 리소스)
+            raw_mode: 원본 데이터 보관 방식 (--raw)
+            columns: 리소스별 조회할 컬럼 (--columns, None이면 모든 컬럼)
+            tags: Resource Groups Tagging API로 태그를 붙였는지 여부 (--tags)
+        """
+        os.makedirs(self.path, exist_ok=True)
+        info = {
+            "run_id": self.run_id,
+            "started_at": started_at.isoformat(),
+            "account_id": account_id,
+            "regions": regions,
+            "resources": resources,
+            "raw": raw_mode,
+            "columns": columns,
+            "tags": tags,
+        }
+
+        def write(path: str) -> None:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(info, f, ensure_ascii=False, indent=2)
+
+        _replace_atomic(os.path.join(self.path, RUN_INFO_NAME), write)
+
+    def load_info(self) -> dict[str, Any]:
+        """
+        실행 정보를 읽습니다.
+
+        Raises:
+            FileNotFoundError: 체크포인트가 없는 경우
+        """
+        with open(os.path.join(self.path, RUN_INFO_NAME), encoding="utf-8") as f:
+            return json.load(f)
+
+    def _task_path(self, scope: str, resource: str, suffix: str) -> str:
+        return os.path.join(self.path, "tasks", scope, f"{resource}.{suffix}")
+
+    def save_task(
+        self,
+        scope: str,
+        resource: str,
+        raw_data: Any,
+        table: pa.Table,
+        cls: type[json.JSONEncoder] | None = None,
+    ) -> None:
+        """
+        완료된 작업의 원본 데이터와 필터링된 테이블을 기록합니다.
+        테이블 파일을 마지막에 기록하므로 테이블 파일이 있으면 완료된 작업입니다.
+
+        Args:
+            scope: 리전명 또는 GLOBAL_SCOPE
+            resource: 리소스 이름 (예: "ec2")
+            raw_data: get_raw_data()가 반환한 원본 데이터
+            table: 필터링된 Arrow 테이블
+            cls: 날짜 등을 직렬화할 JSONEncoder 클래스
+        """
+        os.makedirs(
+            os.path.dirname(self._task_path(scope, resource, "")), exist_ok=True
+        )
+
+        def write_raw(path: str) -> None:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(raw_data, f, ensure_ascii=False, cls=cls)
+
+        def write_table(path: str) -> None:
+            with pa.OSFile(path, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+
+        _replace_atomic(self._task_path(scope, resource, "raw.json"), write_raw)
+        _replace_atomic(self._task_path(scope, resource, "arrow"), write_table)
+
+    def has_task(self, scope: str, resource: str) -> bool:
+        """작업의 체크포인트가 완료된 상태로 있는지 확인합니다."""
+        return os.path.exists(self._task_path(scope, resource, "arrow"))
+
+    def load_task(self, scope: str, resource: str) -> tuple[Any, pa.Table]:
+        """
+        저장된 작업 결과를 읽습니다.
+
+        Returns:
+            tuple: (원본 데이터, 필터링된 Arrow 테이블). 원본 데이터의 날짜는 ISO 문자열
+        """
+        with open(self._task_path(scope, resource, "raw.json"), encoding="utf-8") as f:
+            raw_data = json.load(f)
+        return raw_data, self.load_table(scope, resource)
+
+    def load_table(self, scope: str, resource: str) -> pa.Table:
+        """저장된 작업의 필터링된 Arrow 테이블만 읽습니다 (원본 데이터는 읽지 않음)."""
+        with pa.OSFile(self._task_path(scope, resource, "arrow")) as source:
+            return pa.ipc.open_file(source).read_all()
@@ -0,0 +1,241 @@
+"""
+Shared boto3 client handling: pooled clients, per-service timeouts and a
+per-region circuit breaker.
+
+``ClientPoolSession`` wraps a boto3 session so every (service, region) client
+is created once and shared across threads. Each client gets the connect/read
+timeouts and retry budget of its service from ``TIMEOUT_POLICIES``, which
+bounds how long a stalled endpoint can hold a task.
+
+``RegionCircuitBreaker`` hooks into botocore's ``before-call`` /
+``after-call`` / ``after-call-error`` events. After ``threshold`` consecutive
+connection failures, timeouts or 5xx responses in a scope, the scope is
+declared unhealthy and every later call through its clients (including calls
+from tasks already in flight) fails fast with ``RegionUnavailableError``. A
+scope is a region or ``GLOBAL_SCOPE``: global resources call
+``spec.global_region`` (us-east-1) but count toward their own scope, so their
+failures never cut off the regional us-east-1 tasks.
+``operation_deadline`` applies the same cooperative check to a single task's
+total running time.
+"""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from botocore.config import Config
+from botocore.exceptions import (
+    ConnectionError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    ReadTimeoutError,
+)
+
+
+@dataclass(frozen=True)
+class TimeoutPolicy:
+    """
+    서비스별 클라이언트 타임아웃 정책입니다.
+
+    Attributes:
+        connect: 연결 타임아웃 (초)
+        read: 응답 읽기 타임아웃 (초)
+        max_attempts: 재시도를 포함한 최대 시도 횟수
+    """
+
+    connect: float = 5
+    read: float = 30
+    max_attempts: int = 3
+
+
+DEFAULT_TIMEOUT_POLICY = TimeoutPolicy()
+
+# 응답이 큰 API(스냅샷/AMI 목록 등)나 호출이 가벼운 API에 맞춘 서비스별 정책
+TIMEOUT_POLICIES = {
+    "ec2": TimeoutPolicy(read=60),
+    "rds": TimeoutPolicy(read=45),
+    "sts": TimeoutPolicy(connect=3, read=10),
+    "s3": TimeoutPolicy(read=20),
+    "route53": TimeoutPolicy(read=20),
+}
+
+# 회로 차단기가 장애로 계산하는 예외 (연결 실패, 타임아웃)
+FAILURE_EXCEPTIONS = (
+    ConnectionError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    ReadTimeoutError,
+)
+
+
+class RegionUnavailableError(Exception):
+    """회로 차단기가 열린 리전에 대한 호출이나 제한 시간을 넘긴 작업의 호출을 중단합니다."""
+
+
+def client_config(service_name: str) -> Config:
+    """서비스의 타임아웃 정책으로 botocore Config를 만듭니다."""
+    policy = TIMEOUT_POLICIES.get(service_name, DEFAULT_TIMEOUT_POLICY)
+    return Config(
+        connect_timeout=policy.connect,
+        read_timeout=policy.read,
+        retries={"max_attempts": policy.max_attempts, "mode": "standard"},
+    )
+
+
+# 현재 스레드에서 실행 중인 작업의 종료 기한 (time.monotonic() 기준)
+_task_state = threading.local()
+
+
+@contextmanager
+def operation_deadline(seconds: float | None) -> Iterator[None]:
+    """
+    현재 스레드의 작업이 seconds를 넘기면 이후의 API 호출을 RegionUnavailableError로
+    중단합니다. 페이지네이션처럼 호출이 여러 번인 작업의 전체 실행 시간을 제한합니다.
+    """
+    previous = getattr(_task_state, "deadline", None)
+    _task_state.deadline = None if seconds is None else time.monotonic() + seconds
+    try:
+        yield
+    finally:
+        _task_state.deadline = previous
+
+
+class RegionCircuitBreaker:
+    """
+    리전별 연속 실패 횟수를 세어 threshold에 도달하면 해당 리전의 호출을 차단합니다.
+    """
+
+    def __init__(self, threshold: int) -> None:
+        """
+        Args:
+            threshold: 리전을 장애로 판단할 연속 실패 횟수 (0이면 차단하지 않음)
+        """
+        self.threshold = threshold
+        self._failures: dict[str, int] = {}
+        self._open: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def check(self, region: str | None) -> None:
+        """
+        리전이 차단되었거나 현재 작업의 제한 시간이 지났으면 RegionUnavailableError를 발생시킵니다.
+        """
+        if region in self._open:
+            raise RegionUnavailableError(
+                f"Region {region} is unavailable: {self._open[region]}"
+            )
+        check_operation_deadline()
+
+    def record_success(self, region: str | None) -> None:
+        """성공한 호출로 연속 실패 횟수를 초기화합니다."""
+        with self._lock:
+            self._failures[region] = 0
+
+    def record_failure(self, region: str | None, reason: str) -> None:
+        """실패한 호출을 기록하고 threshold에 도달하면 리전을 차단합니다."""
+        with self._lock:
+            count = self._failures.get(region, 0) + 1
+            self._failures[region] = count
+            if self.threshold and count >= self.threshold and region not in self._open:
+                self._open[region] = f"{count} consecutive failures ({reason})"
+                print(f"🚫 {region}: 연속 {count}회 실패로 리전 호출을 중단합니다.")
+
+    def attach(self, client: Any, scope: str | None = None) -> None:
+        """
+        클라이언트의 botocore 이벤트에 회로 차단기를 연결합니다.
+
+        Args:
+            client: boto3 클라이언트
+            scope: 실패를 기록할 범위 (리전명 또는 GLOBAL_SCOPE, None이면 클라이언트의 리전)
+        """
+        region = scope if scope is not None else client.meta.region_name
+
+        def before_call(**kwargs):
+            self.check(region)
+
+        def after_call(http_response, **kwargs):
+            if http_response.status_code >= 500:
+                self.record_failure(region, f"HTTP {http_response.status_code}")
+            else:
+                self.record_success(region)
+
+        def after_call_error(exception, **kwargs):
+            if isinstance(exception, FAILURE_EXCEPTIONS):
+                self.record_failure(region, type(exception).__name__)
+
+        client.meta.events.register("before-call", before_call)
+        client.meta.events.register("after-call", after_call)
+        client.meta.events.register("after-call-error", after_call_error)
+
+
+def check_operation_deadline() -> None:
+    """현재 스레드 작업의 제한 시간이 지났으면 RegionUnavailableError를 발생시킵니다."""
+    deadline = getattr(_task_state, "deadline", None)
+    if deadline is not None and time.monotonic() > deadline:
+        raise RegionUnavailableError("Task exceeded its operation deadline")
+
+
+class ClientPoolSession:
+    """
+    boto3 세션을 감싸 (서비스, 리전)별 클라이언트를 한 번만 만들고 재사용합니다.
+    boto3 클라이언트는 스레드 간에 공유할 수 있지만 세션은 그렇지 않으므로
+    클라이언트 생성은 잠금 안에서 수행합니다.
+    """
+
+    def __init__(
+        self,
+        session: Any,
+        breaker: RegionCircuitBreaker | None = None,
+        limiter: Any = None,
+        hedger: Any = None,
+        scope: str | None = None,
+    ) -> None:
+        """
+        Args:
+            session: boto3 세션 객체
+            breaker: 클라이언트에 연결할 리전 회로 차단기
+            limiter: 클라이언트에 연결할 요청 제한기 (utils.hedging.RateLimiter)
+            hedger: 클라이언트에 연결할 중복 요청 처리기 (utils.hedging.Hedger)
+            scope: 회로 차단기가 실패를 기록할 범위 (None이면 클라이언트의 리전)
+        """
+        self._session = session
+        self._breaker = breaker
+        self._scope = scope
+        self._limiter = limiter
+        self._hedger = hedger
+        self._clients: dict[tuple[str, str | None], Any] = {}
+        self._lock = threading.Lock()
+
+    def client(self, service_name: str, region_name: str | None = None, **kwargs):
+        """
+        session.client()와 같지만 같은 (서비스, 리전)의 클라이언트를 재사용하고
+        서비스별 타임아웃 정책을 적용합니다.
+        """
+        if kwargs:
+            with self._lock:
+                return self._create(service_name, region_name, **kwargs)
+        key = (service_name, region_name)
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = self._create(service_name, region_name)
+            return self._clients[key]
+
+    def _create(self, service_name: str, region_name: str | None, **kwargs):
+        config = client_config(service_name)
+        if kwargs.get("config") is not None:
+            config = config.merge(kwargs["config"])
+        kwargs["config"] = config
+        client = self._session.client(service_name, region_name=region_name, **kwargs)
+        # 회로 차단기 확인과 요청 제한이 중복 요청 처리보다 먼저 실행됩니다
+        if self._breaker is not None:
+            self._breaker.attach(client, self._scope)
+        if self._limiter is not None:
+            self._limiter.attach(client)
+        if self._hedger is not None:
+            self._hedger.attach(client)
+        return client
+
+    def __getattr__(self, name: str):
+        return getattr(self._session, name)
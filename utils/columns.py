@@ -0,0 +1,33 @@
+"""
+Demand-driven column selection (``--columns``).
+
+Resource modules whose columns need extra calls (a detail call per resource,
+tags per identity, node info ...) declare ``DETAIL_COLUMNS``: each enrichment
+call mapped to the columns it fills. Their ``get_raw_data(session, region,
+columns)`` makes a call only when ``needs_detail`` says one of its columns was
+requested, so columns nobody asked for cost no API calls. Without a selection
+(``columns is None``) every call is made as before.
+"""
+
+from collections.abc import Iterable
+
+import pandas as pd
+
+
+def needs_detail(columns: set[str] | None, detail_columns: Iterable[str]) -> bool:
+    """
+    조회할 컬럼에 detail_columns 중 하나라도 있으면 True를 반환합니다.
+    columns가 None(모든 컬럼)이면 항상 True입니다.
+
+    Args:
+        columns: 요청된 컬럼 (None이면 모든 컬럼)
+        detail_columns: 추가 호출로만 채울 수 있는 컬럼
+    """
+    return columns is None or not columns.isdisjoint(detail_columns)
+
+
+def select_columns(df: pd.DataFrame, columns: set[str] | None) -> pd.DataFrame:
+    """필터링된 DataFrame에서 요청된 컬럼만 남깁니다 (None이면 그대로 반환)."""
+    if columns is None or df.empty:
+        return df
+    return df[[column for column in df.columns if column in columns]]
@@ -0,0 +1,116 @@
+"""
+Resource counts from the cheapest listing calls (``--count-only``).
+
+Every resource module declares ``COUNT_QUERIES``: the listing calls that
+enumerate it without detail calls (``list_tables`` instead of
+``describe_table`` per table, ``list_jobs`` instead of ``get_jobs`` ...),
+with the largest page size the API accepts. ``count_resource`` pages through
+them and only counts the items of each page, so nothing is filtered or
+retained and a full census takes one or a few calls per (region, resource).
+"""
+
+import json
+from typing import Any
+
+import jmespath
+from botocore.paginate import Paginator
+
+from resources import CountQuery, ResourceSpec
+from utils.result_store import GLOBAL_SCOPE
+
+
+def _pages(client: Any, query: CountQuery):
+    """query의 목록 조회 응답을 페이지 단위로 반환합니다."""
+    if query.pagination is not None:
+        operation_name = client.meta.method_to_api_mapping[query.operation]
+        paginator = Paginator(
+            getattr(client, query.operation),
+            query.pagination,
+            client.meta.service_model.operation_model(operation_name),
+        )
+    elif client.can_paginate(query.operation):
+        paginator = client.get_paginator(query.operation)
+    else:
+        # 페이지를 나누지 않는 작업 (예: describe_addresses)은 한 번만 호출합니다
+        yield getattr(client, query.operation)(**query.params)
+        return
+    config = {"PageSize": query.page_size} if query.page_size else {}
+    yield from paginator.paginate(**query.params, PaginationConfig=config)
+
+
+def count_query(client: Any, query: CountQuery) -> int:
+    """query의 목록 조회로 리소스 수를 셉니다."""
+    expression = jmespath.compile(query.expression)
+    return sum(len(expression.search(page) or []) for page in _pages(client, query))
+
+
+def count_resource(
+    spec: ResourceSpec,
+    session: Any,
+    region: str | None,
+    filter_pool: Any = None,
+    raw_mode: str = "none",
+) -> int:
+    """
+    리소스 하나의 수를 모듈의 COUNT_QUERIES로 셉니다.
+    TaskRunner의 collect 함수로 사용할 수 있도록 collect_resource()와 같은 인자를 받으며,
+    filter_pool과 raw_mode는 사용하지 않습니다.
+
+    Args:
+        spec: 셀 리소스 정의
+        session: boto3 세션 객체
+        region: AWS 리전명 (글로벌 리소스는 spec.global_region)
+
+    Returns:
+        int: 리소스 수
+    """
+    return sum(
+        count_query(session.client(query.service, region_name=region), query)
+        for query in spec.module.COUNT_QUERIES
+    )
+
+
+def count_totals(counts: dict[str, dict[str, int]]) -> dict[str, int]:
+    """scope별 리소스 수를 리소스(result_key)별로 합산합니다."""
+    totals: dict[str, int] = {}
+    for scope_counts in counts.values():
+        for result_key, count in scope_counts.items():
+            totals[result_key] = totals.get(result_key, 0) + count
+    return totals
+
+
+def print_counts(counts: dict[str, dict[str, int]]) -> None:
+    """리전(및 글로벌)별 리소스 수와 유형별 내역을 출력합니다."""
+    for scope, scope_counts in counts.items():
+        icon = "🌐" if scope == GLOBAL_SCOPE else "📍"
+        details = ", ".join(
+            f"{result_key} {count}" for result_key, count in scope_counts.items()
+        )
+        print(f"  {icon} {scope}: {sum(scope_counts.values())}개 리소스 ({details})")
+    print(f"📊 총 리소스: {sum(count_totals(counts).values())}개")
+
+
+def write_counts(
+    path: str,
+    *,
+    run_id: str,
+    account_id: str | None,
+    regions: list[str],
+    counts: dict[str, dict[str, int]],
+    failures: list[dict[str, Any]],
+) -> None:
+    """리전/유형별 리소스 수를 JSON 파일로 기록합니다."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "run_id": run_id,
+                "account_id": account_id,
+                "regions": regions,
+                "counts": counts,
+                "totals": count_totals(counts),
+                "failures": failures,
+            },
+            f,
+            ensure_ascii=False,
+            indent=2,
+        )
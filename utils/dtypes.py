@@ -0,0 +1,87 @@
+"""
+Utility functions for applying compact column dtypes to filtered DataFrames.
+
+Each resource module declares a ``COLUMN_SCHEMA`` mapping column names to one of
+the kinds in ``COLUMN_KINDS``; the pipeline applies it right after
+``get_filtered_data`` so repetitive values are not stored as separate Python
+objects.
+"""
+
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+
+STRING_DTYPE = pd.StringDtype("pyarrow")
+DATE_DTYPE = pd.ArrowDtype(pa.date32())
+
+COLUMN_KINDS = ("category", "string", "int", "bool", "date", "datetime")
+
+
+def _to_datetime(series: pd.Series) -> pd.Series:
+    """
+    문자열("YYYY-MM-DD", "N/A" 등) 또는 datetime 객체 컬럼을 timezone 없는 datetime64로 변환합니다.
+    변환할 수 없는 값은 NaT가 됩니다.
+    """
+    converted = pd.to_datetime(series, errors="coerce", format="ISO8601", utc=True)
+    return converted.dt.tz_localize(None)
+
+
+def convert_column(series: pd.Series, kind: str) -> pd.Series:
+    """
+    단일 컬럼을 지정한 kind의 dtype으로 변환합니다.
+
+    Args:
+        series: 변환할 컬럼
+        kind: COLUMN_KINDS 중 하나
+
+    Returns:
+        Series: 변환된 컬럼
+
+    Raises:
+        ValueError: 알 수 없는 kind인 경우
+    """
+    if kind == "category":
+        return series.astype("category")
+    if kind == "string":
+        return series.astype(STRING_DTYPE)
+    if kind == "int":
+        return pd.to_numeric(series, errors="coerce").astype("Int64")
+    if kind == "bool":
+        return series.astype("boolean")
+    if kind == "date":
+        return _to_datetime(series).astype(DATE_DTYPE)
+    if kind == "datetime":
+        return _to_datetime(series)
+    raise ValueError(f"Unknown column kind: {kind}")
+
+
+def apply_column_schema(df: pd.DataFrame, schema: dict[str, str]) -> pd.DataFrame:
+    """
+    리소스 모듈이 선언한 컬럼 스키마를 DataFrame에 적용합니다.
+
+    스키마에 없는 컬럼이나 DataFrame에 없는 컬럼은 그대로 두며,
+    변환에 실패한 컬럼은 원래 dtype을 유지합니다.
+
+    Args:
+        df: get_filtered_data()가 반환한 DataFrame
+        schema: {컬럼명: kind} 형태의 스키마
+
+    Returns:
+        DataFrame: dtype이 적용된 DataFrame
+    """
+    if df.empty or not schema:
+        return df
+
+    converted: dict[str, Any] = {}
+    for column, kind in schema.items():
+        if column not in df.columns:
+            continue
+        try:
+            converted[column] = convert_column(df[column], kind)
+        except (TypeError, ValueError, pa.ArrowException) as e:
+            print(f"Warning: could not convert column {column} to {kind}: {e}")
+
+    if not converted:
+        return df
+    return df.assign(**converted)
@@ -0,0 +1,182 @@
+"""
+Excel exporter for filtered resource data.
+
+Two workbook layouts are supported:
+
+- ``region``: one sheet per (resource, region), e.g. ``EC2_ap-northeast-2``.
+- ``resource``: one sheet per resource type with ``Region`` and ``AccountId``
+  columns; rows are appended as each region finishes.
+
+Tables are streamed from the ``ResultStore`` in record-batch chunks, and any
+sheet that would exceed ``max_rows`` data rows continues on numbered sheets
+(``SGRules_us-east-1``, ``SGRules_us-east-1_2``, ...).
+"""
+
+import pandas as pd
+import pyarrow as pa
+
+from utils.result_store import GLOBAL_SCOPE, ResultStore
+from utils.stage_profiler import profile_stage
+
+EXCEL_LAYOUTS = ("region", "resource")
+
+# Excel 시트 이름 최대 길이
+MAX_SHEET_NAME_LENGTH = 31
+
+# Excel 시트 하나에 들어갈 수 있는 최대 데이터 행 수 (1,048,576행 - 헤더 1행)
+EXCEL_MAX_ROWS = 1_048_575
+
+# 실패한 수집 작업을 기록하는 시트 이름
+ERRORS_SHEET_NAME = "Errors"
+
+# ResultStore 테이블을 DataFrame으로 변환해 기록하는 단위 (행 수)
+EXCEL_CHUNK_ROWS = 50_000
+
+
+class ExcelExporter:
+    """
+    ResultStore에 저장된 테이블을 Excel 워크북으로 기록합니다.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        sheet_prefixes: dict[str, str],
+        layout: str = "region",
+        account_id: str | None = None,
+        max_rows: int = EXCEL_MAX_ROWS,
+        chunk_rows: int = EXCEL_CHUNK_ROWS,
+    ) -> None:
+        """
+        Args:
+            path: 생성할 Excel 파일 경로
+            sheet_prefixes: {result_key: 시트 이름 접두어}
+            layout: "region" 또는 "resource"
+            account_id: resource 레이아웃에서 AccountId 컬럼에 기록할 계정 ID
+            max_rows: 시트 하나에 기록할 최대 데이터 행 수 (초과 시 이어지는 시트 생성)
+            chunk_rows: 한 번에 DataFrame으로 변환해 기록할 행 수
+        """
+        if layout not in EXCEL_LAYOUTS:
+            raise ValueError(f"Unknown Excel layout: {layout}")
+        if not 0 < max_rows <= EXCEL_MAX_ROWS:
+            raise ValueError(f"max_rows must be between 1 and {EXCEL_MAX_ROWS}")
+        self.path = path
+        self.sheet_prefixes = sheet_prefixes
+        self.layout = layout
+        self.account_id = account_id
+        self.max_rows = max_rows
+        self.chunk_rows = chunk_rows
+        self.writer = pd.ExcelWriter(
+            path,
+            engine="openpyxl",
+            date_format="YYYY-MM-DD",
+            datetime_format="YYYY-MM-DD HH:MM:SS",
+        )
+        # (논리 이름, 시트 번호) -> 실제 시트 이름
+        self._sheet_names: dict[tuple[str, int], str] = {}
+        # 논리 이름 -> [현재 시트 번호, 현재 시트에 기록한 데이터 행 수]
+        self._shards: dict[str, list[int]] = {}
+        # 실제 시트 이름 -> 헤더
+        self._headers: dict[str, list[str]] = {}
+
+    def write_region(self, store: ResultStore, region: str) -> None:
+        """
+        region(또는 GLOBAL_SCOPE)의 수집이 끝났을 때 해당 테이블들을 기록합니다.
+
+        Args:
+            store: 필터링된 데이터가 저장된 ResultStore
+            region: 리전명 또는 GLOBAL_SCOPE
+        """
+        for resource, table in store.items(region):
+            prefix = self.sheet_prefixes.get(resource, resource)
+            with profile_stage("excel", resource, region):
+                if self.layout == "resource":
+                    extra = {"Region": region, "AccountId": self.account_id}
+                    self._write_table(prefix, table, extra)
+                elif region == GLOBAL_SCOPE:
+                    self._write_table(prefix, table)
+                else:
+                    self._write_table(f"{prefix}_{region}", table)
+
+    def write_errors(self, rows: list[dict]) -> None:
+        """
+        실패한 수집 작업 목록을 Errors 시트에 기록합니다. 목록이 비어 있으면 시트를 만들지 않습니다.
+
+        Args:
+            rows: 실패 작업 행 목록 (Service, Region, ErrorCode ...)
+        """
+        if rows:
+            self._write_table(ERRORS_SHEET_NAME, pa.Table.from_pylist(rows))
+
+    def close(self) -> None:
+        """워크북을 저장합니다."""
+        self.writer.close()
+
+    def _sheet_name(self, name: str, shard: int) -> str:
+        """
+        (논리 이름, 시트 번호)에 해당하는 실제 시트 이름을 정합니다.
+
+        이어지는 시트에는 "_2", "_3" 접미어를 붙이며, 31자 제한으로 잘린 이름이
+        다른 시트와 겹치면 "~N" 접미어를 붙입니다.
+        """
+        key = (name, shard)
+        if key in self._sheet_names:
+            return self._sheet_names[key]
+        suffix = f"_{shard}" if shard > 1 else ""
+        candidate = name[: MAX_SHEET_NAME_LENGTH - len(suffix)] + suffix
+        used = set(self._sheet_names.values())
+        counter = 2
+        while candidate in used:
+            tail = f"{suffix}~{counter}"
+            candidate = name[: MAX_SHEET_NAME_LENGTH - len(tail)] + tail
+            counter += 1
+        self._sheet_names[key] = candidate
+        return candidate
+
+    def _write_table(
+        self, name: str, table: pa.Table, extra: dict[str, str | None] | None = None
+    ) -> None:
+        """
+        테이블을 chunk_rows 단위로 나누어 시트에 이어서 기록합니다.
+        현재 시트가 max_rows에 도달하면 다음 번호의 시트로 넘어갑니다.
+
+        Args:
+            name: 논리 시트 이름
+            table: 기록할 Arrow 테이블
+            extra: 모든 행의 앞쪽에 추가할 고정 컬럼 (예: Region, AccountId)
+        """
+        shard = self._shards.setdefault(name, [1, 0])
+        for batch in table.to_batches(max_chunksize=self.chunk_rows):
+            offset = 0
+            while offset < batch.num_rows:
+                if shard[1] >= self.max_rows:
+                    shard[0] += 1
+                    shard[1] = 0
+                    print(
+                        f"  ✂️  {name}: {self.max_rows}행 초과로 "
+                        f"{self._sheet_name(name, shard[0])} 시트에 이어서 기록"
+                    )
+                piece = batch.slice(offset, self.max_rows - shard[1])
+                df = piece.to_pandas()
+                for position, (column, value) in enumerate((extra or {}).items()):
+                    df.insert(position, column, value)
+                self._append(self._sheet_name(name, shard[0]), df, shard[1] + 1)
+                shard[1] += piece.num_rows
+                offset += piece.num_rows
+
+    def _append(self, sheet_name: str, df: pd.DataFrame, startrow: int) -> None:
+        """
+        시트의 startrow(0부터 시작, 헤더 포함)에 DataFrame을 기록합니다.
+        시트에 처음 기록할 때만 헤더를 씁니다.
+        """
+        if sheet_name not in self._headers:
+            df.to_excel(self.writer, sheet_name=sheet_name, index=False)
+            self._headers[sheet_name] = list(df.columns)
+            return
+        df.reindex(columns=self._headers[sheet_name]).to_excel(
+            self.writer,
+            sheet_name=sheet_name,
+            index=False,
+            header=False,
+            startrow=startrow,
+        )
@@ -0,0 +1,179 @@
+"""
+Process-pool filter stage.
+
+``get_filtered_data`` is pure-Python CPU work, so with ``--filter-workers`` it
+runs in worker processes instead of the collecting process. Raw API responses
+are sent to the workers as pickled bytes, and the filtered result comes back
+as an Arrow IPC stream written into a shared-memory segment (or through the
+result pipe when ``/dev/shm`` is too small), never as a pickled DataFrame.
+Segments are unlinked when their result is read; ``FilterPool.shutdown()``
+unlinks the ones whose results were never read (a run aborted mid-way).
+"""
+
+import importlib
+import os
+import pickle
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import pyarrow as pa
+
+from utils.columns import select_columns
+from utils.dtypes import apply_column_schema
+from utils.result_store import dataframe_to_table
+
+# 공유 메모리 세그먼트를 만들 디렉터리 (Linux). 여유 공간이 부족하면 파이프로 전달
+SHM_DIR = "/dev/shm"
+
+
+def _shm_has_room(size: int) -> bool:
+    """공유 메모리 디렉터리에 size 바이트를 쓸 여유가 있는지 확인합니다."""
+    if not os.path.isdir(SHM_DIR):
+        return True
+    stat = os.statvfs(SHM_DIR)
+    return stat.f_bavail * stat.f_frsize > size * 2
+
+
+def filter_to_table(
+    module_name: str, raw_data, columns: set[str] | None = None
+) -> pa.Table:
+    """
+    리소스 모듈의 get_filtered_data()와 COLUMN_SCHEMA를 적용해 Arrow 테이블을 반환합니다.
+
+    Args:
+        module_name: resources 패키지 내 모듈 이름
+        raw_data: get_raw_data()가 반환한 원본 데이터
+        columns: 남길 컬럼 (None이면 모든 컬럼)
+
+    Returns:
+        Table: 필터링된 Arrow 테이블
+    """
+    module = importlib.import_module(f"resources.{module_name}")
+    df = apply_column_schema(
+        select_columns(module.get_filtered_data(raw_data), columns),
+        module.COLUMN_SCHEMA,
+    )
+    return dataframe_to_table(df)
+
+
+def _write_ipc(table: pa.Table, target: memoryview) -> None:
+    """
+    테이블을 Arrow IPC 스트림으로 target 메모리에 직접 기록합니다.
+    함수가 끝나면 target을 참조하는 Arrow 버퍼가 모두 해제되어 공유 메모리를 닫을 수 있습니다.
+    """
+    sink = pa.FixedSizeBufferWriter(pa.py_buffer(target))
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    sink.close()
+
+
+def _filter_worker(
+    module_name: str, payload: bytes, columns: set[str] | None = None
+) -> tuple[str, str | bytes, int]:
+    """
+    워커 프로세스에서 실행됩니다. 필터링 결과를 Arrow IPC 스트림으로 직렬화해
+    공유 메모리에 기록하고 ("shm", 세그먼트 이름, 크기)를 반환합니다.
+    공유 메모리를 사용할 수 없으면 ("bytes", IPC 바이트, 크기)를 반환합니다.
+    """
+    table = filter_to_table(module_name, pickle.loads(payload), columns)
+
+    sink = pa.MockOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    size = sink.size()
+
+    if size == 0 or not _shm_has_room(size):
+        buffer_sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(buffer_sink, table.schema) as writer:
+            writer.write_table(table)
+        return "bytes", buffer_sink.getvalue().to_pybytes(), size
+
+    shm = SharedMemory(create=True, size=size, track=False)
+    try:
+        _write_ipc(table, shm.buf)
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    shm.close()
+    return "shm", shm.name, size
+
+
+def _read_result(result: tuple[str, str | bytes, int]) -> pa.Table:
+    """
+    워커가 반환한 결과에서 Arrow 테이블을 읽습니다.
+    공유 메모리 세그먼트는 Arrow 버퍼로 한 번 복사한 뒤 바로 해제합니다.
+    """
+    kind, data, size = result
+    if kind == "bytes":
+        return pa.ipc.open_stream(pa.py_buffer(data)).read_all()
+
+    shm = SharedMemory(name=data, track=False)
+    try:
+        buffer = pa.py_buffer(bytes(shm.buf[:size]))
+    finally:
+        shm.close()
+        shm.unlink()
+    return pa.ipc.open_stream(buffer).read_all()
+
+
+class FilterPool:
+    """
+    get_filtered_data() 단계를 프로세스 풀에서 실행합니다.
+    """
+
+    def __init__(self, workers: int) -> None:
+        """
+        Args:
+            workers: 워커 프로세스 수
+        """
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        # 워커가 만든 공유 메모리 세그먼트 이름 (shutdown()에서 읽지 않은 세그먼트 해제)
+        self._segments: set[str] = set()
+        self._lock = threading.Lock()
+
+    def submit(
+        self, module_name: str, raw_data, columns: set[str] | None = None
+    ) -> Future:
+        """
+        원본 데이터의 필터링을 워커에 제출합니다. columns가 주어지면 그 컬럼만 남깁니다.
+
+        Returns:
+            Future: 워커 결과 (read()로 Arrow 테이블로 변환)
+        """
+        payload = pickle.dumps(raw_data, protocol=pickle.HIGHEST_PROTOCOL)
+        future = self.executor.submit(_filter_worker, module_name, payload, columns)
+        future.add_done_callback(self._track_segment)
+        return future
+
+    def _track_segment(self, future: Future) -> None:
+        """끝난 작업이 공유 메모리에 결과를 기록했다면 세그먼트 이름을 기억합니다."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        kind, data, _ = future.result()
+        if kind == "shm":
+            with self._lock:
+                self._segments.add(data)
+
+    @staticmethod
+    def read(future: Future) -> pa.Table:
+        """제출한 작업이 끝나기를 기다려 필터링된 Arrow 테이블을 반환합니다."""
+        return _read_result(future.result())
+
+    def shutdown(self) -> None:
+        """
+        워커 프로세스를 종료합니다. 아직 시작하지 않은 작업은 취소하고,
+        수집이 중단되어 읽지 않은 결과의 공유 메모리 세그먼트를 해제합니다.
+        """
+        self.executor.shutdown(cancel_futures=True)
+        with self._lock:
+            segments, self._segments = self._segments, set()
+        for name in segments:
+            # read()로 이미 해제된 세그먼트는 건너뜁니다
+            try:
+                shm = SharedMemory(name=name, track=False)
+            except FileNotFoundError:
+                continue
+            shm.close()
+            shm.unlink()
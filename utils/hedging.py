@@ -0,0 +1,299 @@
+"""
+Hedged requests and a per-(region, service) rate limiter.
+
+``RateLimiter`` is a token bucket per (region, service): every API call takes
+a token before it is sent (``--max-rps``), so a large sweep never exceeds the
+configured request rate of an endpoint.
+
+``Hedger`` cuts the tail latency of read-only calls (``Describe*``,
+``List*``, ``Get*``). It tracks the latency of every (region, operation) and,
+once enough samples exist, sends the call from a small thread pool: if no
+response arrives within the tracked p95, a duplicate request is sent and
+whichever response arrives first is returned. Hedges are limited by
+
+- the hedge budget: at most ``budget`` × (calls so far) duplicate requests,
+- the rate limiter: a hedge only takes a token if one is available right now
+  and is skipped otherwise, and
+- throttling feedback: after a throttling error in a (region, service),
+  hedging there is paused for ``cooldown`` seconds.
+
+``RateLimiter`` hooks into botocore's events like ``RegionCircuitBreaker``.
+``Hedger`` wraps the client's ``_make_request``, the single send step botocore
+runs after the ``before-call`` handlers (circuit breaker, rate limiter,
+cassette replay) and after compressing and checksumming the request; each
+attempt goes through the original method, retries and ``after-call-error``
+included. ``tests/test_hedging.py`` checks that botocore still sends every
+call through it (pinned to ``botocore<1.40`` in ``pyproject.toml``).
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any
+
+# 읽기 전용으로 보고 중복 요청을 보낼 수 있는 작업 이름 접두어
+HEDGEABLE_PREFIXES = ("Describe", "List", "Get")
+
+# botocore standard 재시도 모드가 요청 제한으로 판단하는 오류 코드
+THROTTLING_ERROR_CODES = frozenset(
+    {
+        "BandwidthLimitExceeded",
+        "EC2ThrottledException",
+        "LimitExceededException",
+        "PriorRequestNotComplete",
+        "ProvisionedThroughputExceededException",
+        "RequestLimitExceeded",
+        "RequestThrottled",
+        "RequestThrottledException",
+        "SlowDown",
+        "ThrottledException",
+        "Throttling",
+        "ThrottlingException",
+        "TooManyRequestsException",
+        "TransactionInProgressException",
+    }
+)
+
+# p95 계산에 사용하는 (리전, 작업)별 최근 응답 시간 수
+LATENCY_WINDOW = 200
+
+# 중복 요청을 시작하기 전에 필요한 최소 응답 시간 샘플 수
+MIN_SAMPLES = 20
+
+# 중복 요청을 보내기 전 최소 대기 시간 (초, 아주 빠른 호출의 흔들림으로 중복 요청하지 않도록)
+MIN_HEDGE_DELAY = 0.05
+
+# 요청 제한 오류 후 해당 (리전, 서비스)의 중복 요청을 멈추는 시간 (초)
+THROTTLE_COOLDOWN = 30.0
+
+# 요청을 보내는 스레드 수
+HEDGE_WORKERS = 32
+
+
+class RateLimiter:
+    """
+    (리전, 서비스)별 토큰 버킷입니다. 초당 rate개의 토큰이 채워지며 최대 burst개까지 쌓입니다.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None) -> None:
+        """
+        Args:
+            rate: (리전, 서비스)별 초당 최대 요청 수
+            burst: 한 번에 보낼 수 있는 최대 요청 수 (기본값: rate, 최소 1)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(burst if burst is not None else rate, 1.0)
+        self._buckets: dict[tuple[str | None, str], list[float]] = {}
+        self._lock = threading.Lock()
+
+    def _take(self, key: tuple[str | None, str]) -> float:
+        """토큰을 하나 가져오면 0, 부족하면 토큰이 찰 때까지 기다릴 시간을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._buckets.setdefault(key, [self.burst, now])
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                return 0.0
+            return (1 - bucket[0]) / self.rate
+
+    def acquire(self, key: tuple[str | None, str]) -> None:
+        """토큰을 하나 가져옵니다 (없으면 찰 때까지 기다림)."""
+        while True:
+            delay = self._take(key)
+            if not delay:
+                return
+            time.sleep(delay)
+
+    def try_acquire(self, key: tuple[str | None, str]) -> bool:
+        """지금 토큰이 있으면 가져오고 True, 없으면 기다리지 않고 False를 반환합니다."""
+        return not self._take(key)
+
+    def attach(self, client: Any) -> None:
+        """클라이언트의 모든 호출이 보내기 전에 토큰을 가져오도록 연결합니다."""
+        key = (client.meta.region_name, client.meta.service_model.service_name)
+
+        def before_call(**kwargs):
+            self.acquire(key)
+
+        client.meta.events.register("before-call", before_call)
+
+
+class LatencyTracker:
+    """(리전, 작업)별 최근 응답 시간으로 p95를 계산합니다."""
+
+    def __init__(self, window: int = LATENCY_WINDOW, min_samples: int = MIN_SAMPLES):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: dict[tuple[str | None, str], deque] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: tuple[str | None, str], seconds: float) -> None:
+        with self._lock:
+            self._samples.setdefault(key, deque(maxlen=self.window)).append(seconds)
+
+    def p95(self, key: tuple[str | None, str]) -> float | None:
+        """샘플이 min_samples보다 적으면 None을 반환합니다."""
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+
+
+class Hedger:
+    """
+    읽기 전용 호출이 p95를 넘기면 중복 요청을 보내고 먼저 도착한 응답을 사용합니다.
+
+    Attributes:
+        calls: 중복 요청 대상(읽기 전용) 호출 수
+        hedged: 보낸 중복 요청 수
+        wins: 중복 요청이 먼저 도착한 호출 수
+        skipped: 예산/요청 제한으로 보내지 않은 중복 요청 수
+    """
+
+    def __init__(
+        self,
+        budget: float,
+        limiter: RateLimiter | None = None,
+        min_delay: float = MIN_HEDGE_DELAY,
+        cooldown: float = THROTTLE_COOLDOWN,
+        workers: int = HEDGE_WORKERS,
+    ) -> None:
+        """
+        Args:
+            budget: 호출 수 대비 중복 요청 비율의 상한 (예: 0.05)
+            limiter: 중복 요청이 토큰을 가져올 요청 제한기
+            min_delay: 중복 요청을 보내기 전 최소 대기 시간 (초)
+            cooldown: 요청 제한 오류 후 중복 요청을 멈추는 시간 (초)
+            workers: 요청을 보내는 스레드 수
+        """
+        self.budget = budget
+        self.limiter = limiter
+        self.min_delay = min_delay
+        self.cooldown = cooldown
+        self.latency = LatencyTracker()
+        self.calls = 0
+        self.hedged = 0
+        self.wins = 0
+        self.skipped = 0
+        self._throttled_until: dict[tuple[str | None, str], float] = {}
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="hedge")
+        self._lock = threading.Lock()
+
+    def shutdown(self) -> None:
+        """요청 스레드를 정리합니다 (진행 중인 늦은 응답은 기다리지 않음)."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def record_throttle(self, key: tuple[str | None, str]) -> None:
+        """(리전, 서비스)의 중복 요청을 cooldown 동안 멈춥니다."""
+        with self._lock:
+            self._throttled_until[key] = time.monotonic() + self.cooldown
+
+    def _allow_hedge(self, service_key: tuple[str | None, str]) -> bool:
+        with self._lock:
+            if time.monotonic() < self._throttled_until.get(service_key, 0.0):
+                allowed = False
+            else:
+                allowed = self.hedged + 1 <= self.budget * self.calls
+            if allowed and self.limiter is not None:
+                allowed = self.limiter.try_acquire(service_key)
+            if allowed:
+                self.hedged += 1
+            else:
+                self.skipped += 1
+            return allowed
+
+    def _send(
+        self, make_request: Any, model: Any, request_dict: dict, context: dict, key
+    ) -> tuple:
+        started = time.perf_counter()
+        response = make_request(model, request_dict, context)
+        if response[0].status_code < 300:
+            self.latency.record(key, time.perf_counter() - started)
+        return response
+
+    def call(
+        self,
+        client: Any,
+        make_request: Any,
+        model: Any,
+        request_dict: dict,
+        context: dict,
+    ) -> tuple:
+        """
+        클라이언트의 _make_request 대신 호출되어 (http, parsed)를 반환합니다.
+        읽기 전용 호출이 p95 안에 끝나지 않으면 요청 사본을 한 번 더 보내고
+        먼저 도착한 응답을 사용합니다. 각 요청은 원래의 make_request로 보냅니다.
+        """
+        region = client.meta.region_name
+        service = client.meta.service_model.service_name
+        if not model.name.startswith(HEDGEABLE_PREFIXES) or (
+            model.has_streaming_input or model.has_streaming_output
+        ):
+            return make_request(model, request_dict, context)
+        key = (region, f"{service}.{model.name}")
+        with self._lock:
+            self.calls += 1
+        threshold = self.latency.p95(key)
+        if threshold is None:
+            # 샘플이 쌓이기 전에는 평소처럼 호출하고 응답 시간만 기록합니다
+            return self._send(make_request, model, request_dict, context, key)
+
+        hedge_dict = {
+            **request_dict,
+            "headers": dict(request_dict["headers"]),
+            "context": dict(request_dict["context"]),
+        }
+        pending = {
+            self._executor.submit(
+                self._send, make_request, model, request_dict, context, key
+            )
+        }
+        done, _ = wait(pending, timeout=max(threshold, self.min_delay))
+        hedge = None
+        if not done and self._allow_hedge((region, service)):
+            hedge = self._executor.submit(
+                self._send, make_request, model, hedge_dict, context, key
+            )
+            pending.add(hedge)
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        with self._lock:
+                            self.wins += 1
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def attach(self, client: Any) -> None:
+        """
+        클라이언트의 _make_request를 감싸 중복 요청을 처리하고,
+        요청 제한 응답을 받으면 해당 (리전, 서비스)의 중복 요청을 멈춥니다.
+        """
+        region = client.meta.region_name
+        service = client.meta.service_model.service_name
+        make_request = client._make_request
+
+        def hedged_make_request(operation_model, request_dict, request_context):
+            return self.call(
+                client, make_request, operation_model, request_dict, request_context
+            )
+
+        def needs_retry(response=None, **kwargs):
+            if response is not None:
+                code = response[1].get("Error", {}).get("Code")
+                if code in THROTTLING_ERROR_CODES:
+                    self.record_throttle((region, service))
+
+        client._make_request = hedged_make_request
+        client.meta.events.register("needs-retry", needs_retry)
@@ -0,0 +1,276 @@
+"""
+Append-only inventory history with validity intervals.
+
+Each recorded run upserts its filtered rows keyed by
+``(account_id, resource, region, resource_id)`` into an SQLite database.
+Every version of a resource is one ``history`` row with ``valid_from`` and
+``valid_to`` (``NULL`` while current), like a slowly changing dimension.
+Row contents are stored once per content hash in ``contents``, and a row
+whose hash did not change keeps its open interval, so storage grows with the
+volume of change rather than with the number of runs.
+
+Point-in-time queries use two indexes: a partial index over the open rows and
+an index over ``valid_to`` for closed rows.
+"""
+
+import hashlib
+import json
+import sqlite3
+from collections.abc import Iterable
+from datetime import date, datetime, time, timezone
+from typing import Any
+
+import pyarrow as pa
+
+from resources import ResourceSpec
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS contents (
+    hash TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS history (
+    account_id TEXT NOT NULL,
+    resource TEXT NOT NULL,
+    region TEXT NOT NULL,
+    resource_id TEXT NOT NULL,
+    content_hash TEXT NOT NULL REFERENCES contents (hash),
+    valid_from TEXT NOT NULL,
+    valid_to TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_history_open
+    ON history (account_id, resource, region, resource_id) WHERE valid_to IS NULL;
+CREATE INDEX IF NOT EXISTS idx_history_closed
+    ON history (account_id, resource, valid_to) WHERE valid_to IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_history_resource_id ON history (resource_id);
+CREATE TABLE IF NOT EXISTS runs (
+    recorded_at TEXT NOT NULL,
+    account_id TEXT NOT NULL,
+    added INTEGER NOT NULL,
+    changed INTEGER NOT NULL,
+    removed INTEGER NOT NULL,
+    unchanged INTEGER NOT NULL,
+    PRIMARY KEY (account_id, recorded_at)
+);
+"""
+
+# 계정 ID를 조회하지 못했을 때 사용하는 값
+UNKNOWN_ACCOUNT = "unknown"
+
+
+def to_timestamp(value: datetime | date | str) -> str:
+    """
+    시각을 정렬 가능한 UTC ISO 문자열로 변환합니다.
+    날짜만 주어지면 그날의 마지막 시각(해당 날짜 종료 시점의 상태)으로 봅니다.
+
+    Raises:
+        ValueError: 문자열 형식이 잘못된 경우
+    """
+    if isinstance(value, str):
+        value = (
+            date.fromisoformat(value)
+            if len(value) == 10
+            else datetime.fromisoformat(value)
+        )
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time.max)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat(timespec="microseconds")
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    return str(value)
+
+
+def content_hash(text: str) -> str:
+    """행 JSON 문자열의 SHA-256 해시를 반환합니다."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class HistoryStore:
+    """
+    실행별 필터링 결과를 유효 기간(valid_from/valid_to)이 있는 이력으로 기록합니다.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path: SQLite 데이터베이스 파일 경로 (":memory:" 가능)
+        """
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다."""
+        self.conn.close()
+
+    def record_run(
+        self,
+        recorded_at: datetime | str,
+        account_id: str | None,
+        tables: Iterable[tuple[ResourceSpec, str, pa.Table | None]],
+    ) -> dict[str, int]:
+        """
+        실행 결과 하나를 한 트랜잭션으로 기록합니다.
+
+        조회한 (리소스, 리전)마다 ID별로 내용 해시를 비교해 새 행은 추가하고,
+        내용이 바뀐 행은 이전 버전을 닫은 뒤 새 버전을 추가하며,
+        더 이상 보이지 않는 행은 닫습니다. 조회하지 않은 리소스의 이력은 건드리지 않습니다.
+
+        Args:
+            recorded_at: 실행 시각
+            account_id: AWS 계정 ID (None이면 UNKNOWN_ACCOUNT)
+            tables: (리소스 정의, 리전 또는 GLOBAL_SCOPE, 필터링된 테이블) 목록.
+                결과가 없던 리소스는 테이블 대신 None
+
+        Returns:
+            dict: added/changed/removed/unchanged 행 수
+        """
+        timestamp = to_timestamp(recorded_at)
+        account = account_id or UNKNOWN_ACCOUNT
+        counts = {"added": 0, "changed": 0, "removed": 0, "unchanged": 0}
+        with self.conn:
+            for spec, region, table in tables:
+                self._record_table(timestamp, account, spec, region, table, counts)
+            self.conn.execute(
+                "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    timestamp,
+                    account,
+                    counts["added"],
+                    counts["changed"],
+                    counts["removed"],
+                    counts["unchanged"],
+                ),
+            )
+        return counts
+
+    def _record_table(
+        self,
+        timestamp: str,
+        account: str,
+        spec: ResourceSpec,
+        region: str,
+        table: pa.Table | None,
+        counts: dict[str, int],
+    ) -> None:
+        rows: dict[str, tuple[str, str]] = {}
+        for record in table.to_pylist() if table is not None else []:
+            text = json.dumps(
+                record, ensure_ascii=False, sort_keys=True, default=_json_default
+            )
+            digest = content_hash(text)
+            resource_id = record.get(spec.id_column) if spec.id_column else None
+            rows[str(resource_id) if resource_id else digest] = (digest, text)
+
+        current = dict(
+            self.conn.execute(
+                "SELECT resource_id, content_hash FROM history "
+                "WHERE account_id = ? AND resource = ? AND region = ? "
+                "AND valid_to IS NULL",
+                (account, spec.key, region),
+            )
+        )
+
+        closed = [
+            resource_id
+            for resource_id, digest in current.items()
+            if rows.get(resource_id, (None,))[0] != digest
+        ]
+        self.conn.executemany(
+            "UPDATE history SET valid_to = ? WHERE account_id = ? AND resource = ? "
+            "AND region = ? AND resource_id = ? AND valid_to IS NULL",
+            [(timestamp, account, spec.key, region, rid) for rid in closed],
+        )
+        inserted = [
+            (resource_id, digest, text)
+            for resource_id, (digest, text) in rows.items()
+            if current.get(resource_id) != digest
+        ]
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO contents (hash, data) VALUES (?, ?)",
+            [(digest, text) for _, digest, text in inserted],
+        )
+        self.conn.executemany(
+            "INSERT INTO history (account_id, resource, region, resource_id, "
+            "content_hash, valid_from) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (account, spec.key, region, resource_id, digest, timestamp)
+                for resource_id, digest, _ in inserted
+            ],
+        )
+
+        changed = sum(1 for resource_id, _, _ in inserted if resource_id in current)
+        counts["added"] += len(inserted) - changed
+        counts["changed"] += changed
+        counts["removed"] += len(closed) - changed
+        counts["unchanged"] += len(rows) - len(inserted)
+
+    def as_of(
+        self,
+        when: datetime | date | str,
+        account_id: str | None = None,
+        resource: str | None = None,
+        region: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        지정한 시점에 유효했던 행 목록을 반환합니다.
+
+        Args:
+            when: 조회 시점 (날짜만 주어지면 그날 종료 시점)
+            account_id: AWS 계정 ID (None이면 모든 계정)
+            resource: 리소스 이름 (예: "ec2")
+            region: 리전명 또는 GLOBAL_SCOPE
+
+        Returns:
+            list: {account_id, resource, region, resource_id, valid_from, valid_to, data}
+        """
+        timestamp = to_timestamp(when)
+        conditions = ["h.valid_from <= ?"]
+        params: list[Any] = [timestamp]
+        for column, value in (
+            ("account_id", account_id),
+            ("resource", resource),
+            ("region", region),
+        ):
+            if value is not None:
+                conditions.append(f"h.{column} = ?")
+                params.append(value)
+        where = " AND ".join(conditions)
+        # 현재 유효한 행(부분 인덱스)과 시점 이후에 닫힌 행(valid_to 인덱스)을 나누어 조회
+        sql = (
+            f"{self._select()} WHERE {where} AND h.valid_to IS NULL "
+            f"UNION ALL {self._select()} WHERE {where} AND h.valid_to > ? "
+            "ORDER BY 2, 3, 4"
+        )
+        return self._rows(sql, [*params, *params, timestamp])
+
+    def versions(
+        self, resource_id: str, account_id: str | None = None
+    ) -> list[dict[str, Any]]:
+        """리소스 ID의 모든 버전을 valid_from 순서로 반환합니다."""
+        sql = f"{self._select()} WHERE h.resource_id = ?"
+        params = [resource_id]
+        if account_id is not None:
+            sql += " AND h.account_id = ?"
+            params.append(account_id)
+        return self._rows(sql + " ORDER BY h.valid_from", params)
+
+    @staticmethod
+    def _select() -> str:
+        return (
+            "SELECT h.account_id, h.resource, h.region, h.resource_id, "
+            "h.valid_from, h.valid_to, c.data FROM history h "
+            "JOIN contents c ON c.hash = h.content_hash"
+        )
+
+    def _rows(self, sql: str, params: list[Any]) -> list[dict[str, Any]]:
+        keys = ["account_id", "resource", "region", "resource_id"]
+        keys += ["valid_from", "valid_to"]
+        return [
+            {**dict(zip(keys, row[:-1], strict=True)), "data": json.loads(row[-1])}
+            for row in self.conn.execute(sql, params)
+        ]
@@ -0,0 +1,450 @@
+"""
+CloudTrail-driven incremental refresh (``--incremental``).
+
+A full inventory describes every resource even when almost nothing changed.
+An incremental run starts from the tables of a previous run's checkpoint and
+reads the write (``ReadOnly=false``) management events recorded since that
+run with ``cloudtrail.lookup_events`` (or from a saved events file with
+``--events-file``). Every resource module declares a ``TRAIL_SOURCE``: the
+events that change its resources and where the resource keys are in the
+event record. For each task the events decide between
+
+- no change: the previous table is reused without any API call,
+- changed keys: only those resources are described by ID
+  (``get_raw_data_by_ids``) and replace their rows in the previous table
+  (resources that no longer exist drop out), or
+- a full re-collect, for events without usable keys, modules that cannot
+  describe by ID, too many changed keys, tasks missing from the previous run
+  and regions whose events could not be read.
+
+Events are read from ``WATERMARK_OVERLAP`` before the previous run started,
+since CloudTrail delivers events a few minutes late; the new run's start
+becomes the next watermark.
+"""
+
+import json
+import math
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import jmespath
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from resources import ResourceSpec, TrailSource
+from utils.checkpoint import RunCheckpoint
+from utils.columns import select_columns
+from utils.dtypes import apply_column_schema
+from utils.result_store import GLOBAL_SCOPE, dataframe_to_table
+from utils.scheduler import CollectionTask
+
+# --incremental 에 실행 ID를 지정하지 않았을 때 사용할 값 (가장 최근 실행)
+LATEST_RUN = "latest"
+
+# CloudTrail 이벤트 전달 지연을 고려해 이전 실행 시작 시각보다 앞서 조회하는 시간
+WATERMARK_OVERLAP = timedelta(minutes=15)
+
+# lookup_events로 조회할 수 있는 기간 (이보다 오래된 실행은 전체를 다시 수집)
+LOOKUP_RETENTION = timedelta(days=90)
+
+# 이보다 많은 리소스가 바뀐 작업은 ID로 조회하지 않고 전체를 다시 수집합니다
+# (EC2 필터 하나에 지정할 수 있는 값의 수)
+MAX_REFRESH_IDS = 200
+
+# 이벤트가 없는 글로벌 리소스(Route53 등)의 이벤트를 조회할 리전
+GLOBAL_EVENT_REGION = "us-east-1"
+
+# 리전별 이벤트 조회를 동시에 실행할 스레드 수
+LOOKUP_WORKERS = 8
+
+# lookup_events 한 페이지의 최대 이벤트 수
+LOOKUP_PAGE_SIZE = 50
+
+
+@dataclass
+class TrailEvent:
+    """
+    CloudTrail 관리 이벤트 하나입니다.
+
+    Attributes:
+        name: 이벤트 이름 (예: "RunInstances")
+        source: 이벤트 소스 (예: "ec2.amazonaws.com")
+        region: 이벤트가 기록된 리전
+        time: 이벤트 시각 (UTC)
+        record: CloudTrail 레코드 (requestParameters, responseElements ...)
+        resources: (리소스 유형, 리소스 이름) 목록
+    """
+
+    name: str
+    source: str
+    region: str | None
+    time: datetime | None
+    record: dict[str, Any]
+    resources: list[tuple[str, str]] = field(default_factory=list)
+
+
+@dataclass
+class ChangeSet:
+    """
+    이전 실행 이후 바뀐 작업입니다.
+
+    Attributes:
+        refresh: {(scope, 리소스 키): 다시 조회할 리소스 키 집합, None이면 전체 다시 수집}.
+            없는 작업은 바뀌지 않은 작업입니다
+        events: 읽은 이벤트 수
+        failed_regions: 이벤트를 읽지 못한 리전 {리전: 오류}
+        lookups: 리전별 lookup_events 호출 수 (읽은 이벤트 수로 추정, --api-budget 에 포함)
+    """
+
+    refresh: dict[tuple[str, str], set[str] | None] = field(default_factory=dict)
+    events: int = 0
+    failed_regions: dict[str, str] = field(default_factory=dict)
+    lookups: dict[str, int] = field(default_factory=dict)
+
+    def changed(self, task: CollectionTask) -> bool:
+        return (task.scope, task.spec.key) in self.refresh
+
+    def keys(self, task: CollectionTask) -> set[str] | None:
+        return self.refresh[(task.scope, task.spec.key)]
+
+
+def _parse_time(value: Any) -> datetime | None:
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    if isinstance(value, str) and value:
+        return _parse_time(datetime.fromisoformat(value.replace("Z", "+00:00")))
+    return None
+
+
+def _resource_name(resource: dict[str, Any]) -> str | None:
+    """LookupEvents의 ResourceName 또는 로그 레코드의 ARN에서 리소스 이름을 읽습니다."""
+    if resource.get("ResourceName"):
+        return resource["ResourceName"]
+    arn = resource.get("ARN") or resource.get("arn")
+    if not arn:
+        return None
+    return arn.rsplit("/", 1)[-1].rsplit(":", 1)[-1]
+
+
+def normalize_event(item: dict[str, Any], region: str | None = None) -> TrailEvent:
+    """
+    LookupEvents 응답 항목 또는 CloudTrail 로그 레코드를 TrailEvent로 변환합니다.
+
+    Args:
+        item: {"EventName", "CloudTrailEvent": JSON 문자열, "Resources", ...}
+            또는 로그 레코드 {"eventName", "eventSource", "awsRegion", ...}
+        region: 이벤트를 조회한 리전 (레코드에 awsRegion이 없을 때 사용)
+    """
+    if "CloudTrailEvent" in item:
+        record = item["CloudTrailEvent"]
+        record = json.loads(record) if isinstance(record, str) else dict(record)
+        resources = [
+            (resource.get("ResourceType"), _resource_name(resource))
+            for resource in item.get("Resources") or []
+        ]
+        event_time = item.get("EventTime") or record.get("eventTime")
+    else:
+        record = item
+        resources = [
+            (resource.get("type"), _resource_name(resource))
+            for resource in item.get("resources") or []
+        ]
+        event_time = item.get("eventTime")
+    return TrailEvent(
+        name=record.get("eventName") or item.get("EventName", ""),
+        source=record.get("eventSource") or item.get("EventSource", ""),
+        region=record.get("awsRegion") or region,
+        time=_parse_time(event_time),
+        record=record,
+        resources=[(rtype, name) for rtype, name in resources if rtype and name],
+    )
+
+
+def is_write_event(event: TrailEvent) -> bool:
+    """리소스를 바꾼 이벤트인지 확인합니다 (읽기 전용/실패한 호출 제외)."""
+    read_only = event.record.get("readOnly")
+    if read_only is True or str(read_only).lower() == "true":
+        return False
+    return not event.record.get("errorCode")
+
+
+def lookup_events(session: Any, region: str, start_time: datetime) -> list[TrailEvent]:
+    """
+    리전에 기록된 start_time 이후의 쓰기 관리 이벤트를 lookup_events로 모두 조회합니다.
+
+    Args:
+        session: boto3 세션 객체
+        region: AWS 리전명
+        start_time: 조회 시작 시각
+
+    Returns:
+        list: 리소스를 바꾼 TrailEvent 목록
+    """
+    client = session.client("cloudtrail", region_name=region)
+    paginator = client.get_paginator("lookup_events")
+    pages = paginator.paginate(
+        LookupAttributes=[{"AttributeKey": "ReadOnly", "AttributeValue": "false"}],
+        StartTime=start_time,
+    )
+    events = [
+        normalize_event(item, region)
+        for page in pages
+        for item in page.get("Events", [])
+    ]
+    return [event for event in events if is_write_event(event)]
+
+
+def load_events_file(path: str, start_time: datetime | None = None) -> list[TrailEvent]:
+    """
+    저장된 이벤트 파일을 읽습니다 (--events-file).
+    lookup-events 출력({"Events": [...]}), CloudTrail 로그 파일({"Records": [...]})
+    또는 두 형식 항목의 목록을 받습니다.
+
+    Args:
+        path: JSON 파일 경로
+        start_time: 이 시각 이전의 이벤트는 제외 (None이면 모두 사용)
+    """
+    with open(path, encoding="utf-8") as f:
+        document = json.load(f)
+    if isinstance(document, dict):
+        document = document.get("Events") or document.get("Records") or []
+    events = [normalize_event(item) for item in document]
+    return [
+        event
+        for event in events
+        if is_write_event(event)
+        and (start_time is None or event.time is None or event.time >= start_time)
+    ]
+
+
+def _flatten(value: Any) -> list[str]:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [item for element in value for item in _flatten(element)]
+    return [str(value)]
+
+
+def event_keys(source: TrailSource, event: TrailEvent) -> set[str] | None:
+    """
+    이벤트가 바꾼 이 리소스의 키를 찾습니다.
+
+    Returns:
+        set | None: 바뀐 리소스 키 (관련 없는 이벤트면 빈 집합),
+            키를 알 수 없어 작업 전체를 다시 수집해야 하면 None
+    """
+    if event.source != source.event_source:
+        return set()
+    if event.name in source.task_events:
+        return None
+    keys = set()
+    if event.name in source.id_events:
+        found = _flatten(jmespath.search(source.id_events[event.name], event.record))
+        if not found:
+            # 레코드에 키가 없으면(응답 생략 등) 무엇이 바뀌었는지 알 수 없습니다
+            return None
+        keys.update(found)
+    if source.resource_type:
+        keys.update(
+            name for rtype, name in event.resources if rtype == source.resource_type
+        )
+    # CreateTags처럼 여러 유형의 ID를 받는 이벤트는 이 리소스의 ID만 남깁니다
+    return {key for key in keys if key.startswith(source.id_prefix)}
+
+
+def task_keys(spec: ResourceSpec, events: Iterable[TrailEvent]) -> set[str] | None:
+    """
+    작업 하나의 이벤트를 모아 다시 조회할 리소스 키를 정합니다.
+
+    Returns:
+        set | None: 다시 조회할 키 (빈 집합이면 바뀌지 않음), None이면 전체 다시 수집
+    """
+    source = getattr(spec.module, "TRAIL_SOURCE", None)
+    if source is None:
+        return None
+    keys: set[str] = set()
+    for event in events:
+        found = event_keys(source, event)
+        if found is None:
+            return None
+        keys |= found
+    if keys and (
+        not hasattr(spec.module, "get_raw_data_by_ids") or len(keys) > MAX_REFRESH_IDS
+    ):
+        return None
+    return keys
+
+
+def event_regions(regions: list[str], specs: Iterable[ResourceSpec]) -> list[str]:
+    """이벤트를 조회할 리전: 조회 리전과 글로벌 리소스의 리전 (리전이 없으면 us-east-1)"""
+    lookup_regions = list(regions)
+    for spec in specs:
+        region = spec.global_region or GLOBAL_EVENT_REGION
+        if spec.is_global and region not in lookup_regions:
+            lookup_regions.append(region)
+    return lookup_regions
+
+
+def find_changes(
+    tasks: list[CollectionTask],
+    base: RunCheckpoint,
+    since: datetime,
+    session_factory: Callable[[str | None], Any] | None = None,
+    events_file: str | None = None,
+) -> ChangeSet:
+    """
+    이전 실행 이후의 이벤트를 읽어 작업별로 무엇을 다시 조회할지 정합니다.
+
+    Args:
+        tasks: 이번 실행의 작업 목록
+        base: 이전 실행의 체크포인트
+        since: 이전 실행의 시작 시각 (watermark)
+        session_factory: 리전명을 받아 boto3 세션을 만드는 함수 (lookup_events 조회)
+        events_file: 저장된 이벤트 파일 (지정하면 lookup_events를 호출하지 않음)
+
+    Returns:
+        ChangeSet: 바뀐 작업과 다시 조회할 리소스 키
+    """
+    changes = ChangeSet()
+    start_time = since - WATERMARK_OVERLAP
+    regions = sorted({task.region for task in tasks if task.scope != GLOBAL_SCOPE})
+    specs = {task.spec.key: task.spec for task in tasks}.values()
+
+    by_region: dict[str | None, list[TrailEvent]] = defaultdict(list)
+    if events_file is not None:
+        for event in load_events_file(events_file, start_time):
+            by_region[event.region].append(event)
+    elif datetime.now(timezone.utc) - start_time > LOOKUP_RETENTION:
+        changes.failed_regions = dict.fromkeys(
+            event_regions(regions, specs),
+            "이전 실행이 lookup_events 조회 기간(90일)보다 오래되었습니다",
+        )
+    else:
+        lookup_regions = event_regions(regions, specs)
+        with ThreadPoolExecutor(
+            max_workers=min(len(lookup_regions), LOOKUP_WORKERS),
+            thread_name_prefix="cloudtrail",
+        ) as executor:
+            futures = {
+                region: executor.submit(
+                    lookup_events, session_factory(region), region, start_time
+                )
+                for region in lookup_regions
+            }
+            for region, future in futures.items():
+                try:
+                    by_region[region].extend(future.result())
+                except Exception as e:
+                    changes.failed_regions[region] = str(e)
+                pages = math.ceil(len(by_region[region]) / LOOKUP_PAGE_SIZE)
+                changes.lookups[region] = max(pages, 1)
+    changes.events = sum(len(events) for events in by_region.values())
+
+    for task in tasks:
+        key = (task.scope, task.spec.key)
+        if not base.has_task(task.scope, task.spec.key):
+            changes.refresh[key] = None
+            continue
+        if task.scope == GLOBAL_SCOPE:
+            # 글로벌 리소스의 이벤트는 리소스가 있는 리전에 기록됩니다
+            if changes.failed_regions:
+                changes.refresh[key] = None
+                continue
+            events = [event for group in by_region.values() for event in group]
+        else:
+            if task.region in changes.failed_regions:
+                changes.refresh[key] = None
+                continue
+            events = by_region.get(task.region, [])
+        keys = task_keys(task.spec, events)
+        if keys is None or keys:
+            changes.refresh[key] = keys
+    return changes
+
+
+def patch_table(
+    base_table: pa.Table, key_column: str, keys: set[str], rows: pa.Table | None
+) -> pa.Table:
+    """
+    이전 테이블에서 keys 행을 지우고 다시 조회한 행을 덧붙입니다.
+
+    Raises:
+        pa.ArrowInvalid, pa.ArrowTypeError: 다시 조회한 행의 컬럼 타입을 합칠 수 없는 경우
+    """
+    values = pa.array(sorted(keys), pa.string())
+    stale = pc.is_in(base_table.column(key_column).cast(pa.string()), value_set=values)
+    kept = base_table.filter(pc.invert(pc.fill_null(stale, False)))
+    if rows is None or rows.num_rows == 0:
+        return kept
+    patched = pa.concat_tables([kept, rows], promote_options="permissive")
+    # 범주형 컬럼의 사전이 청크마다 다르면 Arrow IPC 체크포인트에 기록할 수 없습니다
+    return patched.unify_dictionaries().combine_chunks()
+
+
+class IncrementalCollector:
+    """
+    collect_resource() 자리에서 바뀐 리소스만 ID로 다시 조회해 이전 테이블에 반영하고,
+    키를 알 수 없는 작업은 collect로 전체를 다시 수집합니다.
+    """
+
+    def __init__(
+        self,
+        collect: Callable[..., tuple],
+        base: RunCheckpoint,
+        changes: ChangeSet,
+        columns: dict[str, set[str]] | None = None,
+    ) -> None:
+        """
+        Args:
+            collect: 전체 수집 함수 (collect_resource와 같은 인자)
+            base: 이전 실행의 체크포인트
+            changes: find_changes()의 결과
+            columns: {리소스 이름: 조회할 컬럼} (--columns)
+        """
+        self.collect = collect
+        self.base = base
+        self.changes = changes
+        self.columns = columns or {}
+
+    def __call__(
+        self,
+        spec: ResourceSpec,
+        session: Any,
+        region: str | None,
+        filter_pool: Any = None,
+        raw_mode: str = "none",
+    ) -> tuple:
+        scope = region if not spec.is_global else GLOBAL_SCOPE
+        keys = self.changes.refresh.get((scope, spec.key))
+        source = getattr(spec.module, "TRAIL_SOURCE", None)
+        if keys and source is not None:
+            key_column = source.key_column or spec.id_column
+            base_table = self.base.load_table(scope, spec.key)
+            if key_column in base_table.column_names:
+                rows = self._describe(spec, session, region, sorted(keys))
+                try:
+                    return None, patch_table(base_table, key_column, keys, rows)
+                except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                    print(
+                        f"  ⚠️  {spec.result_key} [{scope}] 변경 반영 실패 "
+                        f"(전체 다시 수집): {e}"
+                    )
+        return self.collect(spec, session, region, filter_pool, raw_mode)
+
+    def _describe(
+        self, spec: ResourceSpec, session: Any, region: str | None, ids: list[str]
+    ) -> pa.Table | None:
+        """ID로 다시 조회한 리소스를 collect_resource()와 같은 컬럼으로 필터링합니다."""
+        module = spec.module
+        raw_data = module.get_raw_data_by_ids(session, region, ids)
+        df = apply_column_schema(
+            select_columns(
+                module.get_filtered_data(raw_data), self.columns.get(spec.key)
+            ),
+            module.COLUMN_SCHEMA,
+        )
+        return dataframe_to_table(df) if not df.empty else None
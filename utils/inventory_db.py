@@ -0,0 +1,324 @@
+"""
+Embedded SQL query layer over collected inventories (``query`` mode).
+
+Filtered JSON outputs under ``data/`` are loaded once into an SQLite database
+with one table per resource module (``ec2``, ``security_groups``, ...). Every
+table carries ``run_id`` and ``region`` columns plus the module's filtered
+columns. A ``runs`` table records which files were loaded, so later queries
+skip re-parsing JSON and reuse the persisted indexes.
+
+Empty results are not written to the filtered JSON, so ``run_resources``
+records the (resource, region) pairs each run actually collected, taken from
+the run's manifest: its regions and resources minus failed and
+``--deadline``-skipped tasks. ``<resource>_latest`` views return, per region,
+the rows of the most recent run that collected that resource there. They are
+empty once such a run found none, and a partial run (a failure,
+``--deadline`` or a narrower ``--resources``) leaves the previous rows visible.
+"""
+
+import glob
+import json
+import os
+import re
+import sqlite3
+from collections.abc import Iterable
+from typing import Any
+
+from resources import RESOURCE_SPECS, ResourceSpec
+
+# filtered JSON 파일 이름에서 실행 ID(타임스탬프)를 추출하는 패턴
+FILTERED_JSON_PATTERN = re.compile(r"aws_resources_filtered_(\d{8}_\d{6}_\d{3})\.json$")
+
+# COLUMN_SCHEMA 종류별 SQLite 컬럼 타입 (그 밖의 종류는 TEXT)
+SQLITE_TYPES = {"int": "INTEGER", "bool": "INTEGER"}
+
+# 그룹화/조건에 자주 쓰이는 COLUMN_SCHEMA 종류 (인덱스 생성 대상)
+INDEXED_KINDS = ("category",)
+
+# 리소스 테이블이 아닌 내부 테이블
+INTERNAL_TABLES = ("runs", "run_resources")
+
+# filtered JSON과 같은 디렉터리에 있는 실행 manifest 파일 이름
+MANIFEST_NAME = "aws_resources_manifest_{run_id}.json"
+
+# 글로벌 리소스 행의 region 값
+GLOBAL_REGION = "global"
+
+
+def quote(identifier: str) -> str:
+    """SQL 식별자를 큰따옴표로 감쌉니다."""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def run_id_from_path(path: str) -> str | None:
+    """filtered JSON 파일 경로에서 실행 ID를 반환합니다 (형식이 다르면 None)."""
+    match = FILTERED_JSON_PATTERN.search(os.path.basename(path))
+    return match.group(1) if match else None
+
+
+def column_definition(schema: dict[str, str], column: str) -> str:
+    """
+    컬럼 정의를 반환합니다. COLUMN_SCHEMA에 없는 컬럼은 타입을 지정하지 않아
+    값이 그대로 저장됩니다.
+    """
+    if column not in schema:
+        return quote(column)
+    return f"{quote(column)} {SQLITE_TYPES.get(schema[column], 'TEXT')}"
+
+
+def collected_from_manifest(
+    manifest: dict[str, Any], specs: list[ResourceSpec] = RESOURCE_SPECS
+) -> set[tuple[str, str]]:
+    """
+    실행 manifest에서 실제로 수집을 마친 (리소스 이름, 리전) 목록을 반환합니다.
+    실패/중단되었거나 --deadline 으로 건너뛴 작업은 제외합니다.
+    """
+    resources = set(manifest.get("resources") or [])
+    collected = {
+        (spec.key, GLOBAL_REGION if spec.is_global else region)
+        for spec in specs
+        if spec.key in resources
+        for region in (manifest.get("regions") or [])
+    }
+    for task in [*manifest.get("failures", []), *manifest.get("skipped", [])]:
+        collected.discard((task["resource"], task["region"]))
+    return collected
+
+
+def _sql_value(value: Any) -> Any:
+    """목록/딕셔너리 값은 JSON 문자열로 저장합니다."""
+    if isinstance(value, list | dict):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+class InventoryDatabase:
+    """
+    filtered JSON 실행 결과를 리소스별 테이블로 적재하고 SQL로 조회합니다.
+    """
+
+    def __init__(self, path: str, specs: list[ResourceSpec] = RESOURCE_SPECS) -> None:
+        """
+        Args:
+            path: SQLite 데이터베이스 파일 경로 (":memory:" 가능)
+            specs: 테이블로 만들 리소스 정의 목록
+        """
+        self.path = path
+        self.specs = specs
+        self._specs_by_result_key = {spec.result_key: spec for spec in specs}
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            "run_id TEXT PRIMARY KEY, source TEXT NOT NULL, "
+            "rows INTEGER NOT NULL, loaded_at TEXT DEFAULT CURRENT_TIMESTAMP)"
+        )
+        has_run_resources = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'run_resources'"
+        ).fetchone()
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS run_resources ("
+            "run_id TEXT NOT NULL, resource TEXT NOT NULL, region TEXT NOT NULL, "
+            "PRIMARY KEY (resource, region, run_id))"
+        )
+        for name, _ in self.tables():
+            # 이전 버전이 적재한 실행은 행이 있는 (리소스, 리전)만 수집된 것으로 봅니다
+            if not has_run_resources:
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO run_resources "
+                    f"SELECT DISTINCT run_id, ?, region FROM {quote(name)}",
+                    (name,),
+                )
+            # 이전 버전이 만든 latest 뷰를 현재 기준으로 다시 만듭니다
+            self._create_latest_view(name)
+        self.conn.commit()
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다."""
+        self.conn.close()
+
+    def loaded_runs(self) -> set[str]:
+        """이미 적재된 실행 ID 목록을 반환합니다."""
+        return {row[0] for row in self.conn.execute("SELECT run_id FROM runs")}
+
+    def load_directory(self, data_dir: str) -> list[str]:
+        """
+        data_dir의 filtered JSON 중 아직 적재하지 않은 실행만 적재합니다.
+
+        Returns:
+            list: 새로 적재한 실행 ID 목록
+        """
+        paths = glob.glob(os.path.join(data_dir, "aws_resources_filtered_*.json"))
+        return self.load_files(sorted(paths))
+
+    def load_files(self, paths: Iterable[str]) -> list[str]:
+        """
+        주어진 filtered JSON 파일 중 아직 적재하지 않은 실행만 적재합니다.
+
+        Returns:
+            list: 새로 적재한 실행 ID 목록
+        """
+        loaded = self.loaded_runs()
+        new_runs = []
+        for path in paths:
+            run_id = run_id_from_path(path) or os.path.basename(path)
+            if run_id in loaded:
+                continue
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            collected = None
+            manifest_path = os.path.join(
+                os.path.dirname(path), MANIFEST_NAME.format(run_id=run_id)
+            )
+            if os.path.exists(manifest_path):
+                with open(manifest_path, encoding="utf-8") as f:
+                    collected = collected_from_manifest(json.load(f), self.specs)
+            self.load_run(run_id, data, source=path, collected=collected)
+            loaded.add(run_id)
+            new_runs.append(run_id)
+        return new_runs
+
+    def load_run(
+        self,
+        run_id: str,
+        data: dict[str, Any],
+        source: str = "",
+        collected: Iterable[tuple[str, str]] | None = None,
+    ) -> int:
+        """
+        filtered JSON 구조({region: {result_key: [행]}, 글로벌 result_key: [행]})의
+        실행 결과 하나를 한 트랜잭션으로 적재합니다.
+
+        Args:
+            run_id: 실행 ID
+            data: filtered JSON 데이터
+            source: 적재한 파일 경로
+            collected: 실행이 수집을 마친 (리소스 이름, 리전) 목록 (manifest 기준).
+                None이면 data에 있는 (리소스, 리전)만 수집된 것으로 봅니다.
+
+        Returns:
+            int: 적재한 행 수
+        """
+        total = 0
+        present = set()
+        with self.conn:
+            for key, value in data.items():
+                scoped = {key: value} if isinstance(value, list) else value
+                region = GLOBAL_REGION if isinstance(value, list) else key
+                for result_key, rows in scoped.items():
+                    total += self._insert(run_id, region, result_key, rows)
+                    if result_key in self._specs_by_result_key:
+                        present.add((self._specs_by_result_key[result_key].key, region))
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO run_resources (run_id, resource, region) "
+                "VALUES (?, ?, ?)",
+                (
+                    (run_id, resource, region)
+                    for resource, region in (
+                        present if collected is None else set(collected)
+                    )
+                ),
+            )
+            self.conn.execute(
+                "INSERT INTO runs (run_id, source, rows) VALUES (?, ?, ?)",
+                (run_id, source, total),
+            )
+        return total
+
+    def query(self, sql: str, params: Iterable[Any] = ()) -> tuple[list[str], list]:
+        """
+        SQL을 실행합니다.
+
+        Returns:
+            tuple: (컬럼 이름 목록, 행 목록)
+        """
+        cursor = self.conn.execute(sql, tuple(params))
+        columns = [column[0] for column in cursor.description or []]
+        return columns, cursor.fetchall()
+
+    def tables(self) -> list[tuple[str, int]]:
+        """적재된 리소스 테이블과 행 수 목록을 반환합니다."""
+        names = [
+            row[0]
+            for row in self.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' "
+                f"AND name NOT IN {INTERNAL_TABLES} ORDER BY name"
+            )
+        ]
+        return [
+            (
+                name,
+                self.conn.execute(f"SELECT count(*) FROM {quote(name)}").fetchone()[0],
+            )
+            for name in names
+        ]
+
+    def _insert(
+        self, run_id: str, region: str, result_key: str, rows: list[dict[str, Any]]
+    ) -> int:
+        spec = self._specs_by_result_key.get(result_key)
+        if spec is None or not rows:
+            return 0
+        columns = list(dict.fromkeys(column for row in rows for column in row))
+        self._ensure_table(spec, columns)
+        names = ["run_id", "region", *columns]
+        sql = (
+            f"INSERT INTO {quote(spec.key)} ({', '.join(map(quote, names))}) "
+            f"VALUES ({', '.join('?' * len(names))})"
+        )
+        self.conn.executemany(
+            sql,
+            (
+                [run_id, region, *(_sql_value(row.get(column)) for column in columns)]
+                for row in rows
+            ),
+        )
+        return len(rows)
+
+    def _ensure_table(self, spec: ResourceSpec, columns: list[str]) -> None:
+        """
+        리소스 테이블, 인덱스, latest 뷰를 만들고 새로 나타난 컬럼을 추가합니다.
+        """
+        schema = spec.module.COLUMN_SCHEMA
+        table = quote(spec.key)
+        existing = [row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")]
+        if not existing:
+            definitions = ["run_id TEXT NOT NULL", "region TEXT NOT NULL"] + [
+                column_definition(schema, column) for column in schema
+            ]
+            self.conn.execute(f"CREATE TABLE {table} ({', '.join(definitions)})")
+            self._create_index(spec.key, ["run_id", "region"])
+            if spec.id_column:
+                self._create_index(spec.key, [spec.id_column])
+            for column, kind in schema.items():
+                if kind in INDEXED_KINDS:
+                    self._create_index(spec.key, [column])
+            self._create_latest_view(spec.key)
+            existing = ["run_id", "region", *schema]
+        for column in columns:
+            if column not in existing:
+                self.conn.execute(
+                    f"ALTER TABLE {table} ADD COLUMN "
+                    f"{column_definition(schema, column)}"
+                )
+
+    def _create_latest_view(self, table: str) -> None:
+        """
+        <table>_latest 뷰를 만듭니다. 리전마다 그 리소스를 수집한 가장 최근 실행
+        (run_resources 기준)의 행을 반환합니다. 결과가 없던 리소스의 행은 적재되지
+        않으므로, 리소스가 0개가 되면 이전 실행의 행도 반환하지 않습니다.
+        """
+        view = quote(table + "_latest")
+        resource = table.replace("'", "''")
+        self.conn.execute(f"DROP VIEW IF EXISTS {view}")
+        self.conn.execute(
+            f"CREATE VIEW {view} AS SELECT * FROM {quote(table)} AS t "
+            "WHERE t.run_id = (SELECT max(r.run_id) FROM run_resources AS r "
+            f"WHERE r.resource = '{resource}' AND r.region = t.region)"
+        )
+
+    def _create_index(self, table: str, columns: list[str]) -> None:
+        name = f"idx_{table}_{'_'.join(columns)}"
+        self.conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {quote(name)} "
+            f"ON {quote(table)} ({', '.join(map(quote, columns))})"
+        )
@@ -0,0 +1,364 @@
+"""
+Long-running inventory server (``serve`` mode).
+
+Sessions, boto3 clients and the latest filtered tables stay in memory. Each
+(resource, region) pair is refreshed in the background on its own interval,
+and an HTTP/JSON API answers queries by region, resource, tag and ID from
+per-table indexes built when a refresh lands:
+
+- ``GET /status``: refresh time, row count and last error per table
+- ``GET /inventory?resource=ec2&region=ap-northeast-2&tag=env=prod&id=i-123``:
+  matching rows (every filter is optional and filters combine)
+"""
+
+import heapq
+import json
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pyarrow as pa
+
+from resources import ResourceSpec
+from utils.clients import ClientPoolSession
+from utils.name_tag import parse_tag_string
+from utils.result_store import GLOBAL_SCOPE, dataframe_to_table
+
+# 리소스별 기본 갱신 주기 (초). 자주 바뀌지 않는 리소스는 더 길게 둡니다
+DEFAULT_REFRESH_INTERVAL = 300
+REFRESH_INTERVALS = {
+    "amis": 1800,
+    "ebs_snapshot": 1800,
+    "ecr": 1800,
+    "ses_identity": 1800,
+    "s3": 900,
+    "global_accelerator": 900,
+    "route53": 900,
+}
+
+# 조회 결과 한 번에 반환할 최대 행 수 (기본값)
+DEFAULT_QUERY_LIMIT = 1000
+
+
+@dataclass
+class InventoryEntry:
+    """
+    (region, 리소스) 하나의 최신 테이블과 인덱스입니다.
+
+    Attributes:
+        table: 필터링된 Arrow 테이블
+        ids: {리소스 ID: 행 번호}
+        tags: {(태그 키, 태그 값): [행 번호, ...]}
+        refreshed_at: 마지막으로 갱신에 성공한 시각 (UTC)
+        error: 마지막 갱신 실패 메시지 (성공하면 None)
+    """
+
+    table: pa.Table
+    ids: dict[str, int] = field(default_factory=dict)
+    tags: dict[tuple[str, str], list[int]] = field(default_factory=dict)
+    refreshed_at: datetime | None = None
+    error: str | None = None
+
+
+def build_entry(spec: ResourceSpec, table: pa.Table) -> InventoryEntry:
+    """
+    테이블의 ID 컬럼과 Name/Tags 컬럼으로 조회용 인덱스를 만듭니다.
+    Name 컬럼은 "Name" 태그로 인덱싱합니다.
+    """
+    entry = InventoryEntry(table=table, refreshed_at=datetime.now(timezone.utc))
+    columns = table.column_names
+    if spec.id_column in columns:
+        for row, value in enumerate(table.column(spec.id_column).to_pylist()):
+            if value:
+                entry.ids[str(value)] = row
+    if "Name" in columns:
+        for row, value in enumerate(table.column("Name").to_pylist()):
+            if value and value != "N/A":
+                entry.tags.setdefault(("Name", str(value)), []).append(row)
+    if "Tags" in columns:
+        for row, value in enumerate(table.column("Tags").to_pylist()):
+            for key, tag_value in parse_tag_string(value).items():
+                rows = entry.tags.setdefault((key, tag_value), [])
+                if not rows or rows[-1] != row:
+                    rows.append(row)
+    return entry
+
+
+class Inventory:
+    """
+    serve 모드의 메모리 내 인벤토리입니다. 갱신은 테이블 단위로 원자적으로 교체됩니다.
+    """
+
+    def __init__(self, specs: list[ResourceSpec]) -> None:
+        self.specs = {spec.key: spec for spec in specs}
+        self._entries: dict[tuple[str, str], InventoryEntry] = {}
+        self._lock = threading.Lock()
+
+    def update(self, spec: ResourceSpec, region: str, data: pd.DataFrame) -> None:
+        """갱신된 필터링 결과로 (region, 리소스) 테이블과 인덱스를 교체합니다."""
+        entry = build_entry(spec, dataframe_to_table(data))
+        with self._lock:
+            self._entries[(region, spec.key)] = entry
+
+    def mark_error(self, spec: ResourceSpec, region: str, error: str) -> None:
+        """
+        갱신 실패를 기록합니다. 이전에 조회한 테이블은 그대로 유지합니다.
+        """
+        with self._lock:
+            entry = self._entries.get((region, spec.key))
+            if entry is None:
+                entry = InventoryEntry(table=pa.table({}))
+                self._entries[(region, spec.key)] = entry
+            entry.error = error
+
+    def status(self) -> list[dict[str, Any]]:
+        """테이블별 행 수, 갱신 시각, 마지막 오류를 반환합니다."""
+        with self._lock:
+            entries = sorted(self._entries.items())
+        return [
+            {
+                "region": region,
+                "resource": key,
+                "count": entry.table.num_rows,
+                "refreshed_at": entry.refreshed_at,
+                "error": entry.error,
+            }
+            for (region, key), entry in entries
+        ]
+
+    def query(
+        self,
+        resource: str | None = None,
+        region: str | None = None,
+        tag: tuple[str, str] | None = None,
+        resource_id: str | None = None,
+        limit: int = DEFAULT_QUERY_LIMIT,
+    ) -> list[dict[str, Any]]:
+        """
+        조건에 맞는 행을 반환합니다. 각 행에는 Region, Resource 컬럼이 추가됩니다.
+
+        Args:
+            resource: 리소스 이름 (예: "ec2")
+            region: 리전명 또는 GLOBAL_SCOPE
+            tag: (태그 키, 태그 값)
+            resource_id: 리소스 ID (ResourceSpec.id_column 값)
+            limit: 반환할 최대 행 수
+
+        Returns:
+            list: 조건에 맞는 행 목록
+        """
+        with self._lock:
+            entries = [
+                (entry_region, key, entry)
+                for (entry_region, key), entry in self._entries.items()
+                if (resource is None or key == resource)
+                and (region is None or entry_region == region)
+            ]
+
+        results = []
+        for entry_region, key, entry in entries:
+            rows = None
+            if resource_id is not None:
+                row = entry.ids.get(resource_id)
+                rows = [] if row is None else [row]
+            if tag is not None:
+                tagged = entry.tags.get(tag, [])
+                rows = tagged if rows is None else [r for r in rows if r in tagged]
+            if rows is None:
+                table = entry.table
+            elif rows:
+                table = entry.table.take(pa.array(rows, type=pa.int64()))
+            else:
+                continue
+            if table.num_rows == 0:
+                continue
+            for record in table.slice(0, limit - len(results)).to_pylist():
+                results.append({"Region": entry_region, "Resource": key, **record})
+            if len(results) >= limit:
+                break
+        return results
+
+
+@dataclass(order=True)
+class RefreshTask:
+    """다음 갱신 예정 시각 순으로 정렬되는 (리소스, 리전) 갱신 작업입니다."""
+
+    due: float
+    key: str = field(compare=False)
+    region: str = field(compare=False)
+
+
+class InventoryRefresher:
+    """
+    (리소스, 리전)별 갱신 주기에 맞춰 백그라운드 스레드에서 인벤토리를 갱신합니다.
+    한 작업의 다음 갱신은 이전 갱신이 끝난 뒤에 예약되므로 같은 작업이 겹쳐 실행되지 않습니다.
+    """
+
+    def __init__(
+        self,
+        inventory: Inventory,
+        regions: list[str],
+        collect: Callable[[ResourceSpec, Any, str | None], pd.DataFrame],
+        session_factory: Callable[[str | None], Any],
+        intervals: dict[str, int] | None = None,
+        workers: int = 4,
+    ) -> None:
+        """
+        Args:
+            inventory: 갱신 결과를 저장할 Inventory
+            regions: 조회할 리전 목록
+            collect: (spec, session, region) -> 필터링된 DataFrame
+            session_factory: region -> boto3 세션 (리전별로 한 번만 호출)
+            intervals: {리소스 이름: 갱신 주기(초)} (없으면 REFRESH_INTERVALS/기본값)
+            workers: 동시에 실행할 갱신 작업 수
+        """
+        self.inventory = inventory
+        self.collect = collect
+        self.intervals = {**REFRESH_INTERVALS, **(intervals or {})}
+        self._session_factory = session_factory
+        self._sessions: dict[str | None, ClientPoolSession] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="refresh"
+        )
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._queue: list[RefreshTask] = []
+        self._thread = threading.Thread(
+            target=self._run, name="refresh-scheduler", daemon=True
+        )
+
+        now = time.monotonic()
+        for spec in inventory.specs.values():
+            for region in [GLOBAL_SCOPE] if spec.is_global else regions:
+                self._queue.append(RefreshTask(now, spec.key, region))
+        heapq.heapify(self._queue)
+
+    def interval(self, key: str) -> int:
+        """리소스의 갱신 주기(초)를 반환합니다."""
+        return self.intervals.get(key, DEFAULT_REFRESH_INTERVAL)
+
+    def session(self, region: str | None) -> ClientPoolSession:
+        """리전별 클라이언트 풀 세션을 반환합니다 (처음 요청될 때 생성)."""
+        with self._lock:
+            if region not in self._sessions:
+                self._sessions[region] = ClientPoolSession(
+                    self._session_factory(region)
+                )
+            return self._sessions[region]
+
+    def start(self) -> None:
+        """스케줄러 스레드를 시작합니다."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """스케줄러를 멈추고 실행 중인 갱신이 끝나기를 기다립니다."""
+        self._stop.set()
+        self._thread.join()
+        self._executor.shutdown()
+
+    def refresh(self, task: RefreshTask) -> None:
+        """작업 하나를 실행하고 다음 갱신을 예약합니다."""
+        spec = self.inventory.specs[task.key]
+        region = spec.global_region if task.region == GLOBAL_SCOPE else task.region
+        try:
+            data = self.collect(spec, self.session(region), region)
+            self.inventory.update(spec, task.region, data)
+        except Exception as e:
+            print(f"Error refreshing {spec.key} in {task.region}: {e}")
+            self.inventory.mark_error(spec, task.region, str(e))
+        finally:
+            due = time.monotonic() + self.interval(task.key)
+            with self._lock:
+                heapq.heappush(self._queue, RefreshTask(due, task.key, task.region))
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            now = time.monotonic()
+            due_tasks = []
+            with self._lock:
+                while self._queue and self._queue[0].due <= now:
+                    due_tasks.append(heapq.heappop(self._queue))
+                wait = self._queue[0].due - now if self._queue else 1.0
+            for task in due_tasks:
+                self._executor.submit(self.refresh, task)
+            self._stop.wait(min(max(wait, 0.05), 1.0))
+
+
+def make_handler(
+    inventory: Inventory, encoder: type[json.JSONEncoder]
+) -> type[BaseHTTPRequestHandler]:
+    """
+    inventory를 조회하는 HTTP 요청 핸들러 클래스를 만듭니다.
+
+    Args:
+        inventory: 조회할 Inventory
+        encoder: 날짜 등을 직렬화할 JSONEncoder 클래스
+    """
+
+    class InventoryHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            if url.path == "/status":
+                self._send(200, {"tables": inventory.status()})
+            elif url.path == "/inventory":
+                self._inventory(params)
+            else:
+                self._send(404, {"error": f"Unknown path: {url.path}"})
+
+        def _inventory(self, params: dict[str, str]) -> None:
+            resource = params.get("resource")
+            if resource is not None and resource not in inventory.specs:
+                self._send(400, {"error": f"Unknown resource: {resource}"})
+                return
+            tag = None
+            if "tag" in params:
+                key, found, value = params["tag"].partition("=")
+                if not found:
+                    self._send(400, {"error": "tag must be in Key=Value form"})
+                    return
+                tag = (key, value)
+            try:
+                limit = int(params.get("limit", DEFAULT_QUERY_LIMIT))
+            except ValueError:
+                self._send(400, {"error": "limit must be an integer"})
+                return
+            items = inventory.query(
+                resource=resource,
+                region=params.get("region"),
+                tag=tag,
+                resource_id=params.get("id"),
+                limit=limit,
+            )
+            self._send(200, {"count": len(items), "items": items})
+
+        def _send(self, status: int, body: dict[str, Any]) -> None:
+            payload = json.dumps(body, ensure_ascii=False, cls=encoder).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            # 포털이 계속 폴링하므로 요청 로그는 출력하지 않습니다
+            return
+
+    return InventoryHandler
+
+
+def create_server(
+    inventory: Inventory,
+    host: str,
+    port: int,
+    encoder: type[json.JSONEncoder],
+) -> ThreadingHTTPServer:
+    """inventory를 조회하는 HTTP 서버를 만듭니다 (serve_forever()로 실행)."""
+    return ThreadingHTTPServer((host, port), make_handler(inventory, encoder))
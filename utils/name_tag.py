@@ -9,3 +9,22 @@ def extract_name_tag(tags):
         if tag.get("Key") == "Name":
             return tag.get("Value")
     return None
+
+
+def parse_tag_string(text):
+    """
+    필터링된 데이터의 Tags 문자열("Key=Value;Key2=Value2", "Key=Value, Key2=Value2",
+    "Key:Value" 등)을 {Key: Value} 딕셔너리로 변환합니다.
+    형식에 맞지 않는 항목(예: "No tags")은 무시합니다.
+    """
+    tags = {}
+    if not text:
+        return tags
+    separator = ";" if ";" in text else ", "
+    for item in text.split(separator):
+        for delimiter in ("=", ":"):
+            key, found, value = item.partition(delimiter)
+            if found and key.strip():
+                tags[key.strip()] = value.strip()
+                break
+    return tags
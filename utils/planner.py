@@ -0,0 +1,286 @@
+"""
+Dry-run execution planner (``plan`` subcommand and ``--api-budget``).
+
+A plan expands accounts × regions × resources into the same ``CollectionTask``
+list a run would execute and estimates, without calling any collection API:
+
+- API calls per task from the cardinality of the previous run (``rows`` in
+  ``task_timings.json``, recorded by full and ``--count-only`` runs): listing
+  pages of the module's ``COUNT_QUERIES`` plus the detail calls of its
+  ``DETAIL_CALLS`` (one per listed resource for the N+1 modules), skipping
+  those ``--columns`` does not need,
+- wall time by replaying longest-first scheduling over ``workers`` with the
+  expected durations of past runs, and
+- throttling: the calls of every (account, region, service) are compared with
+  the rate the service sustains (or ``--max-rps`` when lower). When the
+  schedule would send them faster, the excess is reported as throttled calls
+  and the service becomes the bottleneck of the wall time.
+
+Calls that belong to no single task are added to the total as well: the
+``--tags`` sweep (``get_resources`` pages per tag region) and the CloudTrail
+``lookup_events`` pages an ``--incremental`` run has already read.
+"""
+
+import heapq
+import math
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from resources import ResourceSpec
+from utils.columns import needs_detail
+from utils.scheduler import CollectionTask, TaskTimings, order_tasks
+from utils.tagging import GLOBAL_TAG_REGION, TAG_PAGE_SIZE
+
+# 서비스별로 가정하는 (계정, 리전)당 초당 요청 수.
+# AWS 문서의 기본 요청 제한(읽기 작업)을 보수적으로 잡은 값입니다
+SERVICE_RPS = {
+    "ec2": 20.0,
+    "kinesis": 10.0,
+    "route53": 5.0,
+    "sts": 10.0,
+}
+
+# SERVICE_RPS에 없는 서비스의 초당 요청 수
+DEFAULT_SERVICE_RPS = 10.0
+
+
+@dataclass
+class TaskPlan:
+    """
+    작업 하나의 추정치입니다.
+
+    Attributes:
+        account: AWS 계정 ID (확인하지 못하면 "unknown")
+        task: 수집 작업 (expected는 이전 실행의 소요 시간)
+        rows: 이전 실행에서 찾은 리소스 수 (기록이 없으면 None)
+        calls: 서비스별 예상 API 호출 수
+        start: 계획상 시작 시각 (초, 실행 시작 기준)
+    """
+
+    account: str
+    task: CollectionTask
+    rows: float | None
+    calls: dict[str, int]
+    start: float = 0.0
+
+    @property
+    def end(self) -> float:
+        return self.start + self.task.expected
+
+
+@dataclass
+class ExecutionPlan:
+    """
+    전체 실행의 추정치입니다.
+
+    Attributes:
+        tasks: 작업별 추정치
+        workers: 동시에 실행하는 작업 수
+        schedule_seconds: 요청 제한 없이 작업을 실행하는 데 걸리는 시간 (초)
+        wall_seconds: 요청 제한까지 고려한 예상 소요 시간 (초)
+        throttled: (계정, 리전, 서비스)별 요청 제한을 넘는 예상 호출 수
+        extra_calls: 작업에 속하지 않는 (계정, 리전, 서비스)별 호출 수
+            (--tags 의 태그 조회, --incremental 의 이벤트 조회)
+    """
+
+    tasks: list[TaskPlan]
+    workers: int
+    schedule_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    throttled: dict[tuple[str, str, str], int] = field(default_factory=dict)
+    extra_calls: dict[tuple[str, str, str], int] = field(default_factory=dict)
+
+    @property
+    def total_calls(self) -> int:
+        return sum(sum(plan.calls.values()) for plan in self.tasks) + sum(
+            self.extra_calls.values()
+        )
+
+    @property
+    def unknown_rows(self) -> int:
+        """리소스 수 기록이 없어 목록 조회 한 페이지로 추정한 작업 수"""
+        return sum(plan.rows is None for plan in self.tasks)
+
+
+def estimate_calls(
+    spec: ResourceSpec, rows: float | None, columns: set[str] | None = None
+) -> dict[str, int]:
+    """
+    리소스 하나를 수집하는 데 필요한 서비스별 API 호출 수를 추정합니다.
+
+    Args:
+        spec: 수집할 리소스 정의
+        rows: 리소스 수 (None이면 0개로 보고 목록 조회 한 페이지만 계산)
+        columns: --columns 로 요청된 컬럼 (None이면 모든 컬럼)
+
+    Returns:
+        dict: {서비스 이름: 호출 수}
+    """
+    rows = rows or 0
+    calls: dict[str, int] = defaultdict(int)
+    for query in spec.module.COUNT_QUERIES:
+        pages = math.ceil(rows / query.page_size) if query.page_size else 1
+        calls[query.service] += max(pages, 1)
+    detail_columns = getattr(spec.module, "DETAIL_COLUMNS", {})
+    for name, detail_calls in getattr(spec.module, "DETAIL_CALLS", {}).items():
+        if not rows or not needs_detail(columns, detail_columns[name]):
+            continue
+        for call in detail_calls:
+            calls[call.service] += math.ceil(rows) if call.per_resource else 1
+    return dict(calls)
+
+
+def estimate_tag_calls(
+    timings: TaskTimings, tasks: list[CollectionTask]
+) -> dict[str, int]:
+    """
+    --tags 의 리전별 get_resources 호출 수를 추정합니다. 리전마다 태그를 붙일 리소스 수를
+    한 페이지 크기로 나눈 만큼 조회하며, 글로벌 리소스는 리소스의 리전에서 조회합니다.
+
+    Args:
+        timings: 리소스 수를 기록한 TaskTimings
+        tasks: 태그를 붙일 작업 목록
+
+    Returns:
+        dict: {리전: 호출 수}
+    """
+    rows: dict[str, float] = defaultdict(float)
+    for task in tasks:
+        if getattr(task.spec.module, "TAG_SOURCE", None) is None:
+            continue
+        if task.spec.is_global:
+            region = task.spec.global_region or GLOBAL_TAG_REGION
+        else:
+            region = task.scope
+        rows[region] += timings.rows(task.scope, task.spec.key) or 0
+    return {
+        region: max(math.ceil(count / TAG_PAGE_SIZE), 1)
+        for region, count in rows.items()
+    }
+
+
+def service_rps(service: str, max_rps: float | None = None) -> float:
+    """(계정, 리전)에서 서비스에 보낼 수 있는 초당 요청 수를 반환합니다."""
+    rate = SERVICE_RPS.get(service, DEFAULT_SERVICE_RPS)
+    return rate if max_rps is None else min(rate, max_rps)
+
+
+def _schedule(plans: list[TaskPlan], workers: int) -> float:
+    """작업을 예상 소요 시간이 긴 순서로 workers개 슬롯에 배치하고 끝나는 시각을 반환합니다."""
+    slots = [0.0] * max(workers, 1)
+    by_task = {id(plan.task): plan for plan in plans}
+    for task in order_tasks([plan.task for plan in plans]):
+        start = heapq.heappop(slots)
+        by_task[id(task)].start = start
+        heapq.heappush(slots, start + task.expected)
+    return max(slots)
+
+
+def build_plan(
+    accounts: dict[str, TaskTimings],
+    tasks: list[CollectionTask],
+    workers: int = 1,
+    columns: dict[str, set[str]] | None = None,
+    max_rps: float | None = None,
+    tag_tasks: list[CollectionTask] | None = None,
+    lookups: dict[str, int] | None = None,
+) -> ExecutionPlan:
+    """
+    계정마다 같은 작업 목록을 실행하는 계획을 만들고 호출 수와 소요 시간을 추정합니다.
+
+    Args:
+        accounts: {계정 ID: 그 계정의 기록을 불러온 TaskTimings}
+        tasks: 한 계정에서 실행할 작업 목록
+        workers: 동시에 실행할 작업 수 (모든 계정의 작업이 함께 사용)
+        columns: --columns 선택 ({리소스 키: 컬럼 집합})
+        max_rps: --max-rps 로 설정한 (리전, 서비스)별 초당 최대 요청 수
+        tag_tasks: --tags 로 태그를 붙일 작업 목록 (체크포인트에서 불러온 작업 포함)
+        lookups: --incremental 이 계정마다 읽은 리전별 lookup_events 호출 수
+
+    Returns:
+        ExecutionPlan: 작업별/전체 추정치
+    """
+    columns = columns or {}
+    plans = []
+    for account, timings in accounts.items():
+        for task in tasks:
+            rows = timings.rows(task.scope, task.spec.key)
+            planned = CollectionTask(
+                task.spec,
+                task.scope,
+                task.region,
+                expected=timings.expected(task.scope, task.spec.key),
+            )
+            calls = estimate_calls(task.spec, rows, columns.get(task.spec.key))
+            plans.append(TaskPlan(account, planned, rows, calls))
+
+    plan = ExecutionPlan(plans, max(workers, 1))
+    for account, timings in accounts.items():
+        if tag_tasks:
+            for region, calls in estimate_tag_calls(timings, tag_tasks).items():
+                plan.extra_calls[(account, region, "resourcegroupstaggingapi")] = calls
+        for region, calls in (lookups or {}).items():
+            plan.extra_calls[(account, region, "cloudtrail")] = calls
+    plan.schedule_seconds = _schedule(plans, plan.workers) if plans else 0.0
+    plan.wall_seconds = plan.schedule_seconds
+
+    # (계정, 리전, 서비스)마다 계획상 호출 구간에 보낼 수 있는 요청 수와 비교합니다
+    buckets: dict[tuple[str, str, str], list[TaskPlan]] = defaultdict(list)
+    for task_plan in plans:
+        for service in task_plan.calls:
+            region = task_plan.task.region or task_plan.task.scope
+            buckets[(task_plan.account, region, service)].append(task_plan)
+    for key, bucket in buckets.items():
+        service = key[2]
+        calls = sum(task_plan.calls[service] for task_plan in bucket)
+        start = min(task_plan.start for task_plan in bucket)
+        window = max(task_plan.end for task_plan in bucket) - start
+        limit = SERVICE_RPS.get(service, DEFAULT_SERVICE_RPS)
+        if max_rps is None or max_rps > limit:
+            excess = calls - math.floor(limit * window)
+            if excess > 0:
+                plan.throttled[key] = excess
+        plan.wall_seconds = max(
+            plan.wall_seconds, start + calls / service_rps(service, max_rps)
+        )
+    return plan
+
+
+def print_plan(plan: ExecutionPlan) -> None:
+    """리소스별 작업/호출 수와 요청 제한, 예상 소요 시간을 출력합니다."""
+    by_resource: dict[str, list[TaskPlan]] = defaultdict(list)
+    for task_plan in plan.tasks:
+        by_resource[task_plan.task.spec.key].append(task_plan)
+    for key, task_plans in by_resource.items():
+        rows = sum(task_plan.rows or 0 for task_plan in task_plans)
+        calls = sum(sum(task_plan.calls.values()) for task_plan in task_plans)
+        print(
+            f"  - {key:<20} 작업 {len(task_plans):>4}개, "
+            f"리소스 ~{round(rows):>6}개, API 호출 ~{calls}회"
+        )
+    extra: dict[str, int] = defaultdict(int)
+    for (_, _, service), calls in plan.extra_calls.items():
+        extra[service] += calls
+    for service, calls in extra.items():
+        print(f"  - {service:<20} 작업 외 API 호출 ~{calls}회")
+    accounts = len({task_plan.account for task_plan in plan.tasks})
+    print(
+        f"📊 계정 {accounts}개, 작업 {len(plan.tasks)}개, "
+        f"예상 API 호출 {plan.total_calls}회"
+    )
+    if plan.unknown_rows:
+        print(
+            f"❔ 리소스 수 기록이 없는 작업 {plan.unknown_rows}개는 목록 조회 한 "
+            "페이지로 계산했습니다 (--count-only 로 먼저 세면 기록됩니다)."
+        )
+    for (account, region, service), excess in sorted(
+        plan.throttled.items(), key=lambda item: -item[1]
+    ):
+        print(
+            f"🐢 요청 제한 예상: {account} {region} {service} 약 {excess}회 "
+            f"(초당 {service_rps(service):g}회 초과)"
+        )
+    print(
+        f"⏱️  예상 소요 시간: {plan.wall_seconds:.0f}초 "
+        f"(동시 작업 {plan.workers}개, 요청 제한 없이 {plan.schedule_seconds:.0f}초)"
+    )
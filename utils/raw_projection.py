@@ -0,0 +1,65 @@
+"""
+Raw-response projection for the retained raw JSON.
+
+Every resource module declares a ``RAW_PROJECTION`` that mirrors the shape of
+its ``get_raw_data`` result: a dict maps a key to the projection of its value,
+and a list names the keys to keep whole. Lists in the data are projected item
+by item, and ``ResponseMetadata`` and every field not named are dropped.
+
+``--raw`` decides what is kept for the raw JSON output once a task has been
+filtered: ``full`` (everything botocore returned), ``projected`` or ``none``.
+"""
+
+from typing import Any
+
+RAW_MODES = ("full", "projected", "none")
+
+
+def project_raw(data: Any, projection: dict[str, Any] | list[str] | None) -> Any:
+    """
+    원본 데이터에서 projection에 지정된 필드만 남긴 복사본을 반환합니다.
+
+    Args:
+        data: get_raw_data()가 반환한 원본 데이터 (또는 그 일부)
+        projection: {키: 하위 projection} 또는 그대로 남길 키 목록 (None이면 전체)
+
+    Returns:
+        지정된 필드만 남은 데이터 (리스트는 항목마다 적용)
+    """
+    if projection is None:
+        return data
+    if isinstance(data, list):
+        return [project_raw(item, projection) for item in data]
+    if not isinstance(data, dict):
+        return data
+    if isinstance(projection, dict):
+        return {
+            key: project_raw(data[key], sub_projection)
+            for key, sub_projection in projection.items()
+            if key in data
+        }
+    return {key: data[key] for key in projection if key in data}
+
+
+def retain_raw(raw_data: Any, module: Any, mode: str) -> Any:
+    """
+    --raw 모드에 따라 출력용으로 보관할 원본 데이터를 반환합니다.
+
+    Args:
+        raw_data: get_raw_data()가 반환한 원본 데이터
+        module: 리소스 모듈 (RAW_PROJECTION이 없으면 projected에서도 전체 보관)
+        mode: RAW_MODES 중 하나
+
+    Returns:
+        보관할 원본 데이터 (none이면 None)
+
+    Raises:
+        ValueError: 알 수 없는 mode인 경우
+    """
+    if mode == "full":
+        return raw_data
+    if mode == "projected":
+        return project_raw(raw_data, getattr(module, "RAW_PROJECTION", None))
+    if mode == "none":
+        return None
+    raise ValueError(f"Unknown raw mode: {mode}")
@@ -0,0 +1,327 @@
+"""
+Multi-process region sharding.
+
+botocore parses EC2's query-protocol XML in pure Python, so for parse-bound
+calls such as ``describe_instances`` or ``describe_snapshots`` threads in one
+process stop scaling once the GIL is saturated. With
+``--region-processes N`` the (region, resource) tasks are grouped by scope
+(each region, plus the global resources), the scopes are spread over ``N``
+worker processes by expected duration, and every worker collects and filters
+its scopes with its own sessions, client pool and circuit breaker.
+
+Each finished task is streamed back to the parent through a queue as the
+retained raw data plus an Arrow table, so the parent keeps owning the
+checkpoint, the ``ResultStore`` and the Excel/JSON exporters.
+"""
+
+import multiprocessing
+import pickle
+import queue
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from typing import Any
+
+from resources import RESOURCE_SPECS_BY_KEY
+from utils.clients import ClientPoolSession, RegionCircuitBreaker, operation_deadline
+from utils.hedging import Hedger, RateLimiter
+from utils.result_store import dataframe_to_table
+from utils.scheduler import CollectionTask, DeadlineScheduler, TaskTimings
+
+# 워커 프로세스의 메시지를 기다리다가 프로세스 상태를 확인하는 간격 (초)
+POLL_INTERVAL = 1.0
+
+
+class TaskRunner:
+    """
+    수집 작업 하나를 실행합니다. scope(리전 또는 글로벌)별 세션과 회로 차단기를 보관하며,
+    워커 프로세스에 전달되면 세션은 해당 프로세스에서 새로 만듭니다.
+    """
+
+    def __init__(
+        self,
+        collect: Callable[..., tuple],
+        session_factory: Callable[[str | None], Any],
+        circuit_breaker: int = 3,
+        task_timeout: float | None = None,
+        raw_mode: str = "full",
+        filter_pool: Any = None,
+        max_rps: float | None = None,
+        hedge_budget: float = 0.0,
+    ) -> None:
+        """
+        Args:
+            collect: collect_resource(spec, session, region, filter_pool, raw_mode)
+            session_factory: 리전명을 받아 boto3 세션을 만드는 함수
+            circuit_breaker: 리전 회로 차단기의 연속 실패 기준 (0이면 사용 안 함)
+            task_timeout: 작업 하나의 최대 실행 시간 (초)
+            raw_mode: 보관할 원본 데이터 (--raw)
+            filter_pool: 필터링을 실행할 프로세스 풀
+            max_rps: (리전, 서비스)별 초당 최대 요청 수 (None이면 제한 없음)
+            hedge_budget: 호출 수 대비 중복 요청 비율의 상한 (0이면 사용 안 함)
+        """
+        self.collect = collect
+        self.session_factory = session_factory
+        self.circuit_breaker = circuit_breaker
+        self.task_timeout = task_timeout
+        self.raw_mode = raw_mode
+        self.filter_pool = filter_pool
+        self.max_rps = max_rps
+        self.hedge_budget = hedge_budget
+        self._create_policies()
+        self.sessions: dict[str, ClientPoolSession] = {}
+        self._lock = threading.Lock()
+
+    def _create_policies(self) -> None:
+        """회로 차단기, 요청 제한기, 중복 요청 처리기를 만듭니다 (프로세스마다 새로 만듦)."""
+        self.breaker = RegionCircuitBreaker(self.circuit_breaker)
+        self.limiter = RateLimiter(self.max_rps) if self.max_rps else None
+        self.hedger = (
+            Hedger(self.hedge_budget, self.limiter) if self.hedge_budget > 0 else None
+        )
+
+    def session(self, scope: str, region: str | None) -> ClientPoolSession:
+        """
+        scope의 세션을 반환하며, 없으면 만듭니다. 글로벌 리소스는 호출 리전(us-east-1)이
+        같아도 리전 작업과 세션을 나눠, 회로 차단기가 scope별로 실패를 셉니다.
+        """
+        with self._lock:
+            if scope not in self.sessions:
+                self.sessions[scope] = ClientPoolSession(
+                    self.session_factory(region),
+                    self.breaker,
+                    self.limiter,
+                    self.hedger,
+                    scope=scope,
+                )
+            return self.sessions[scope]
+
+    def prepare(self, tasks: list[CollectionTask]) -> None:
+        """
+        작업 스레드가 시작되기 전에 리전별 세션을 만듭니다.
+        클라이언트는 스레드 간에 재사용합니다.
+        """
+        for task in tasks:
+            self.session(task.scope, task.region)
+
+    def __call__(self, task: CollectionTask) -> tuple:
+        # 장애로 차단된 리전의 남은 작업은 시작하지 않습니다
+        self.breaker.check(task.scope)
+        print(f"  {task.spec.label} 조회 중... [{task.scope}]")
+        with operation_deadline(self.task_timeout):
+            return self.collect(
+                task.spec,
+                self.session(task.scope, task.region),
+                task.region,
+                self.filter_pool,
+                self.raw_mode,
+            )
+
+    def __getstate__(self) -> dict[str, Any]:
+        # 세션, 회로 차단기, 요청 제한기와 중복 요청 처리기는 프로세스마다 새로 만들고,
+        # 필터링 프로세스 풀은 전달하지 않습니다
+        state = {**self.__dict__, "sessions": {}, "filter_pool": None}
+        del state["breaker"], state["limiter"], state["hedger"], state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._create_policies()
+        self._lock = threading.Lock()
+
+
+def shard_scopes(tasks: list[CollectionTask], processes: int) -> list[list[str]]:
+    """
+    작업을 scope(리전 또는 글로벌)별로 묶고, 예상 소요 시간 합이 큰 scope부터
+    가장 여유 있는 프로세스에 배정합니다.
+
+    Returns:
+        list: 프로세스별 scope 목록 (빈 프로세스는 제외)
+    """
+    totals: dict[str, float] = {}
+    for task in tasks:
+        totals[task.scope] = totals.get(task.scope, 0.0) + task.expected
+    shards: list[list[str]] = [[] for _ in range(max(processes, 1))]
+    loads = [0.0] * len(shards)
+    for scope in sorted(totals, key=lambda scope: -totals[scope]):
+        index = loads.index(min(loads))
+        shards[index].append(scope)
+        loads[index] += totals[scope]
+    return [shard for shard in shards if shard]
+
+
+def _picklable(error: BaseException) -> BaseException:
+    """큐로 보낼 수 없는 예외는 메시지를 담은 RuntimeError로 바꿉니다."""
+    try:
+        pickle.dumps(error)
+        return error
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
+
+
+def _shard_worker(
+    tasks: list[tuple[int, str, str, str | None, float]],
+    runner: TaskRunner,
+    workers: int,
+    deadline: float | None,
+    results: Any,
+) -> None:
+    """
+    워커 프로세스에서 실행됩니다. 배정된 작업을 스레드 풀에서 실행하고,
+    끝나는 대로 결과를 큐로 보냅니다.
+
+    Args:
+        tasks: (작업 번호, 리소스 이름, scope, 리전, 예상 소요 시간) 목록
+        runner: 작업을 실행할 TaskRunner
+        workers: 프로세스 안에서 동시에 실행할 작업 수
+        deadline: 전체 실행 제한 시간 (초)
+        results: 결과를 보낼 multiprocessing 큐
+    """
+    local_tasks = [
+        CollectionTask(RESOURCE_SPECS_BY_KEY[key], scope, region, expected)
+        for _, key, scope, region, expected in tasks
+    ]
+    indexes = {(scope, key): index for index, key, scope, _, _ in tasks}
+    runner.prepare(local_tasks)
+    scheduler = DeadlineScheduler(local_tasks, runner, workers, deadline)
+    for task, future in scheduler.run():
+        index = indexes[(task.scope, task.spec.key)]
+        if future is None:
+            results.put(("skipped", index, None, None, None))
+            continue
+        try:
+            data_raw, data_filtered = future.result()
+            table = dataframe_to_table(data_filtered)
+        except Exception as e:
+            results.put(("error", index, _picklable(e), None, task.duration))
+            continue
+        results.put(("result", index, data_raw, table, task.duration))
+
+
+class RegionShardScheduler:
+    """
+    scope별로 묶은 작업을 여러 워커 프로세스에서 실행합니다.
+    DeadlineScheduler와 같이 run()이 끝난 순서대로 (작업, Future)를 반환합니다.
+    """
+
+    def __init__(
+        self,
+        tasks: list[CollectionTask],
+        runner: TaskRunner,
+        processes: int,
+        workers: int = 1,
+        deadline: float | None = None,
+        timings: TaskTimings | None = None,
+    ) -> None:
+        """
+        Args:
+            tasks: 실행할 작업 목록 (expected는 timings로 채워짐)
+            runner: 워커 프로세스에서 작업을 실행할 TaskRunner
+            processes: 워커 프로세스 수
+            workers: 프로세스마다 동시에 실행할 작업 수
+            deadline: 전체 실행 제한 시간 (초)
+            timings: 예상 시간을 제공하고 소요 시간을 기록할 TaskTimings
+        """
+        self.tasks = tasks
+        self.runner = runner
+        self.workers = workers
+        self.deadline = deadline
+        self.timings = timings
+        self.skipped: list[CollectionTask] = []
+        if timings is not None:
+            for task in tasks:
+                task.expected = timings.expected(task.scope, task.spec.key)
+        self.shards = shard_scopes(tasks, processes)
+
+    def run(self) -> Iterator[tuple[CollectionTask, Future | None]]:
+        """
+        워커 프로세스를 시작하고 결과가 도착하는 순서대로 (작업, Future)를 반환합니다.
+        건너뛴 작업은 (작업, None)으로 반환하고 skipped에 기록합니다.
+        결과를 보내지 못하고 종료된 프로세스의 남은 작업은 실패로 반환합니다.
+        """
+        context = multiprocessing.get_context("spawn")
+        results = context.Queue()
+        processes = []
+        pending: dict[int, set[int]] = {}
+        for shard in self.shards:
+            payload = [
+                (index, task.spec.key, task.scope, task.region, task.expected)
+                for index, task in enumerate(self.tasks)
+                if task.scope in shard
+            ]
+            process = context.Process(
+                target=_shard_worker,
+                args=(payload, self.runner, self.workers, self.deadline, results),
+                name=f"collect-{'-'.join(shard)}",
+            )
+            process.start()
+            processes.append(process)
+            pending[len(processes) - 1] = {index for index, *_ in payload}
+        owner = {
+            index: number for number, indexes in pending.items() for index in indexes
+        }
+
+        try:
+            while any(pending.values()):
+                try:
+                    message = results.get(timeout=POLL_INTERVAL)
+                except queue.Empty:
+                    if all(
+                        process.is_alive()
+                        for number, process in enumerate(processes)
+                        if pending[number]
+                    ):
+                        continue
+                    # 종료된 프로세스가 남긴 결과를 먼저 처리한 뒤 남은 작업을 실패로 기록
+                    while True:
+                        try:
+                            message = results.get(timeout=POLL_INTERVAL)
+                        except queue.Empty:
+                            break
+                        yield self._receive(message, owner, pending)
+                    yield from self._fail_exited(processes, pending)
+                    continue
+                yield self._receive(message, owner, pending)
+        finally:
+            for process in processes:
+                process.join(timeout=POLL_INTERVAL)
+                if process.is_alive():
+                    process.terminate()
+
+    def _receive(
+        self, message: tuple, owner: dict[int, int], pending: dict[int, set[int]]
+    ) -> tuple[CollectionTask, Future | None]:
+        """워커 프로세스의 메시지를 (작업, Future)로 변환합니다."""
+        kind, index, first, second, duration = message
+        pending[owner[index]].discard(index)
+        task = self.tasks[index]
+        task.duration = duration
+        if kind == "skipped":
+            self.skipped.append(task)
+            return task, None
+        future: Future = Future()
+        if kind == "error":
+            future.set_exception(first)
+        else:
+            future.set_result((first, second))
+            if self.timings is not None:
+                self.timings.record(task.scope, task.spec.key, duration)
+        return task, future
+
+    def _fail_exited(
+        self, processes: list[Any], pending: dict[int, set[int]]
+    ) -> Iterator[tuple[CollectionTask, Future]]:
+        """결과를 보내지 못하고 종료된 프로세스의 남은 작업을 실패로 반환합니다."""
+        for number, process in enumerate(processes):
+            if not pending[number] or process.is_alive():
+                continue
+            for index in sorted(pending[number]):
+                future: Future = Future()
+                future.set_exception(
+                    RuntimeError(
+                        f"Region process {process.name} exited with code "
+                        f"{process.exitcode}"
+                    )
+                )
+                yield self.tasks[index], future
+            pending[number].clear()
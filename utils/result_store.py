@@ -0,0 +1,179 @@
+"""
+Run-scoped columnar store for filtered resource data.
+
+Filtered DataFrames are converted once to Arrow tables keyed by
+``(region, result_key)``; Excel/JSON exporters and summaries read from the
+tables instead of keeping per-row dict copies around.
+"""
+
+import json
+from collections.abc import Iterator
+from typing import IO, Any
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from utils.stage_profiler import profile_stage
+
+# 글로벌 리소스(S3, Route53 등)를 저장할 때 사용하는 region 키
+GLOBAL_SCOPE = "global"
+
+# JSON 직렬화 시 한 번에 Python 객체로 변환할 최대 행 수
+JSON_BATCH_SIZE = 10_000
+
+
+def dataframe_to_table(df: pd.DataFrame) -> pa.Table:
+    """
+    필터링된 DataFrame을 Arrow 테이블로 변환합니다.
+
+    타입이 섞인 object 컬럼처럼 Arrow가 추론할 수 없는 컬럼은 문자열로 변환합니다.
+
+    Args:
+        df: 필터링된 DataFrame
+
+    Returns:
+        Table: 변환된 Arrow 테이블
+    """
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        fixed = df.copy()
+        for column in fixed.columns:
+            if fixed[column].dtype == object:
+                try:
+                    pa.array(fixed[column], from_pandas=True)
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    fixed[column] = fixed[column].map(
+                        lambda v: None if v is None else str(v)
+                    )
+        return pa.Table.from_pandas(fixed, preserve_index=False)
+
+
+class ResultStore:
+    """
+    (region, result_key) 단위로 필터링된 데이터를 Arrow 테이블로 보관합니다.
+    """
+
+    def __init__(self) -> None:
+        self._regions: dict[str, dict[str, pa.Table]] = {}
+
+    def add_region(self, region: str) -> None:
+        """결과가 없더라도 출력에 포함될 region을 등록합니다."""
+        self._regions.setdefault(region, {})
+
+    def put(self, region: str, resource: str, data: pd.DataFrame | pa.Table) -> None:
+        """
+        필터링된 데이터를 저장합니다. 비어 있는 데이터는 저장하지 않습니다.
+
+        Args:
+            region: 리전명 또는 GLOBAL_SCOPE
+            resource: 결과 키 (예: "EC2")
+            data: 필터링된 DataFrame 또는 Arrow 테이블
+        """
+        self.add_region(region)
+        table = data if isinstance(data, pa.Table) else dataframe_to_table(data)
+        if table.num_rows == 0:
+            return
+        self._regions[region][resource] = table
+
+    def get(self, region: str, resource: str) -> pa.Table | None:
+        """저장된 테이블을 반환하며, 없으면 None을 반환합니다."""
+        return self._regions.get(region, {}).get(resource)
+
+    def regions(self, include_global: bool = False) -> list[str]:
+        """등록된 region 목록을 등록 순서대로 반환합니다."""
+        return [
+            region
+            for region in self._regions
+            if include_global or region != GLOBAL_SCOPE
+        ]
+
+    def items(self, region: str) -> Iterator[tuple[str, pa.Table]]:
+        """region에 저장된 (result_key, 테이블) 쌍을 저장 순서대로 반환합니다."""
+        yield from self._regions.get(region, {}).items()
+
+    def count(self, region: str, resource: str | None = None) -> int:
+        """region (또는 region의 특정 리소스)에 저장된 행 수를 반환합니다."""
+        if resource is not None:
+            table = self.get(region, resource)
+            return table.num_rows if table is not None else 0
+        return sum(table.num_rows for table in self._regions.get(region, {}).values())
+
+    def to_pandas(self, region: str, resource: str) -> pd.DataFrame:
+        """저장된 테이블을 DataFrame으로 변환합니다 (컬럼 dtype은 보존됨)."""
+        table = self.get(region, resource)
+        return table.to_pandas() if table is not None else pd.DataFrame()
+
+    def filter_equal(
+        self, region: str, resource: str, column: str, value: Any
+    ) -> pa.Table | None:
+        """
+        column 값이 value와 같은 행만 남긴 테이블을 반환합니다.
+
+        Returns:
+            Table | None: 필터링된 테이블 (저장된 테이블이나 컬럼이 없으면 None)
+        """
+        table = self.get(region, resource)
+        if table is None or column not in table.column_names:
+            return None
+        values = table.column(column)
+        if pa.types.is_dictionary(values.type):
+            values = values.cast(values.type.value_type)
+        return table.filter(pc.equal(values, value))
+
+    def write_json(
+        self, fp: IO[str], cls: type[json.JSONEncoder] | None = None
+    ) -> None:
+        """
+        저장된 데이터를 {region: {result_key: [행, ...]}, 글로벌 result_key: [행, ...]}
+        형태의 JSON으로 기록합니다. 행은 배치 단위로 Python 객체로 변환해 바로 씁니다.
+
+        Args:
+            fp: 출력 파일 객체
+            cls: 날짜 등을 직렬화할 JSONEncoder 클래스
+        """
+        entries: list[tuple[str, int, Any]] = []
+        for region in self.regions():
+            entries.append((region, 1, self._regions[region]))
+        for resource, table in self.items(GLOBAL_SCOPE):
+            entries.append((resource, 0, table))
+
+        fp.write("{")
+        for index, (key, depth, value) in enumerate(entries):
+            fp.write("," if index else "")
+            fp.write(f"\n  {json.dumps(key, ensure_ascii=False)}: ")
+            if depth == 0:
+                with profile_stage("filtered_json", key, GLOBAL_SCOPE):
+                    self._write_table(fp, value, 2, cls)
+                continue
+            if not value:
+                fp.write("{}")
+                continue
+            fp.write("{")
+            for res_index, (resource, table) in enumerate(value.items()):
+                fp.write("," if res_index else "")
+                fp.write(f"\n    {json.dumps(resource, ensure_ascii=False)}: ")
+                with profile_stage("filtered_json", resource, key):
+                    self._write_table(fp, table, 3, cls)
+            fp.write("\n  }")
+        fp.write("\n}" if entries else "}")
+
+    @staticmethod
+    def _write_table(
+        fp: IO[str],
+        table: pa.Table,
+        depth: int,
+        cls: type[json.JSONEncoder] | None,
+    ) -> None:
+        """테이블 하나를 들여쓰기된 JSON 배열로 기록합니다."""
+        indent = "  " * depth
+        fp.write("[")
+        first = True
+        for batch in table.to_batches(max_chunksize=JSON_BATCH_SIZE):
+            for record in batch.to_pylist():
+                text = json.dumps(record, ensure_ascii=False, indent=2, cls=cls)
+                fp.write("" if first else ",")
+                fp.write(f"\n{indent}" + text.replace("\n", f"\n{indent}"))
+                first = False
+        fp.write("]" if first else f"\n{indent[:-2]}]")
@@ -0,0 +1,128 @@
+"""
+Task failure records and the per-run JSON manifest.
+
+Every collection task runs inside an isolation boundary: an exception in one
+(region, resource) task is recorded as a ``TaskFailure`` instead of aborting
+the run, and the remaining results are still exported. Failures go to the
+``Errors`` Excel sheet and, together with the task counts and output paths,
+to ``aws_resources_manifest_<timestamp>.json``.
+"""
+
+import json
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+from utils.clients import RegionUnavailableError
+
+
+@dataclass
+class TaskFailure:
+    """
+    실패하거나 중단된 수집 작업 하나의 기록입니다.
+
+    Attributes:
+        service: 결과 키 (예: "EC2")
+        resource: 리소스 이름 (예: "ec2")
+        region: 리전명 또는 GLOBAL_SCOPE
+        status: "failed" (오류) 또는 "cancelled" (리전 장애/제한 시간 초과)
+        error_code: AWS 오류 코드 (예: "AccessDenied") 또는 예외 클래스 이름
+        operation: 실패한 API 작업 이름 (알 수 없으면 None)
+        message: 오류 메시지
+        duration_seconds: 실패까지 걸린 시간 (초)
+    """
+
+    service: str
+    resource: str
+    region: str
+    status: str
+    error_code: str
+    operation: str | None
+    message: str
+    duration_seconds: float | None = None
+
+
+def failure_from_exception(
+    service: str,
+    resource: str,
+    region: str,
+    error: BaseException,
+    duration: float | None = None,
+) -> TaskFailure:
+    """예외에서 오류 코드와 API 작업 이름을 추출해 TaskFailure를 만듭니다."""
+    if isinstance(error, ClientError):
+        error_code = error.response.get("Error", {}).get("Code") or "ClientError"
+    else:
+        error_code = type(error).__name__
+    return TaskFailure(
+        service=service,
+        resource=resource,
+        region=region,
+        status="cancelled" if isinstance(error, RegionUnavailableError) else "failed",
+        error_code=error_code,
+        operation=getattr(error, "operation_name", None),
+        message=str(error),
+        duration_seconds=None if duration is None else round(duration, 3),
+    )
+
+
+def failure_rows(failures: list[TaskFailure]) -> list[dict[str, Any]]:
+    """Errors 시트에 기록할 행 목록을 반환합니다."""
+    return [
+        {
+            "Service": failure.service,
+            "Region": failure.region,
+            "Status": failure.status,
+            "ErrorCode": failure.error_code,
+            "Operation": failure.operation,
+            "DurationSeconds": failure.duration_seconds,
+            "Message": failure.message,
+        }
+        for failure in failures
+    ]
+
+
+def write_manifest(
+    path: str,
+    *,
+    run_id: str,
+    started_at: datetime,
+    finished_at: datetime,
+    account_id: str | None,
+    regions: list[str],
+    resources: list[str],
+    total_tasks: int,
+    resumed_tasks: int = 0,
+    failures: list[TaskFailure],
+    skipped: list[dict[str, Any]],
+    outputs: dict[str, str],
+) -> None:
+    """
+    실행 결과 요약(작업 수, 실패/중단/건너뛴 작업, 출력 파일)을 JSON으로 기록합니다.
+    resumed_tasks는 --resume 으로 체크포인트에서 불러온 작업 수입니다 (성공에 포함).
+    """
+    failed = sum(1 for failure in failures if failure.status == "failed")
+    cancelled = len(failures) - failed
+    manifest = {
+        "run_id": run_id,
+        "started_at": started_at.isoformat(),
+        "finished_at": finished_at.isoformat(),
+        "account_id": account_id,
+        "regions": regions,
+        "resources": resources,
+        "tasks": {
+            "total": total_tasks,
+            "succeeded": total_tasks - len(failures) - len(skipped),
+            "failed": failed,
+            "cancelled": cancelled,
+            "skipped": len(skipped),
+            "resumed": resumed_tasks,
+        },
+        "failures": [asdict(failure) for failure in failures],
+        "skipped": skipped,
+        "outputs": outputs,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,232 @@
+"""
+Deadline-aware collection scheduler.
+
+Every (region, resource) collection is a ``CollectionTask``. Durations (and
+the number of resources found) of past runs are kept per (account, region,
+resource) in ``data/task_timings.json``, and tasks are started
+longest-expected first so a slow task such as ``ebs_snapshot`` in a large
+region does not land at the end of the queue.
+
+With a deadline, low-priority resource types are deferred behind the others
+and skipped when the remaining budget can no longer cover their expected
+duration; skipped tasks are reported back to the caller.
+"""
+
+import json
+import os
+import re
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+from resources import ResourceSpec
+
+# 이전 기록이 없는 작업의 예상 소요 시간 (초)
+DEFAULT_EXPECTED_SECONDS = 5.0
+
+# 새 소요 시간을 반영하는 비율 (지수 이동 평균)
+TIMING_SMOOTHING = 0.5
+
+DURATION_PATTERN = re.compile(r"^(\d+(?:\.\d+)?)\s*(s|m|h)?$")
+DURATION_UNITS = {"s": 1, "m": 60, "h": 3600}
+
+
+def parse_duration(value: str) -> float:
+    """
+    "300", "300s", "5m", "1h" 형태의 기간을 초 단위로 변환합니다.
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    match = DURATION_PATTERN.match(value.strip().lower())
+    if not match:
+        raise ValueError(f"Invalid duration: {value} (예: 300s, 5m)")
+    return float(match.group(1)) * DURATION_UNITS[match.group(2) or "s"]
+
+
+@dataclass
+class CollectionTask:
+    """
+    리소스 하나를 한 리전(또는 글로벌)에서 수집하는 작업입니다.
+
+    Attributes:
+        spec: 수집할 리소스 정의
+        scope: 결과를 저장할 리전명 또는 GLOBAL_SCOPE
+        region: API 호출에 사용할 리전 (글로벌 리소스는 spec.global_region)
+        expected: 예상 소요 시간 (초)
+        duration: 실제 소요 시간 (초, 실행이 끝난 뒤 기록)
+    """
+
+    spec: ResourceSpec
+    scope: str
+    region: str | None
+    expected: float = DEFAULT_EXPECTED_SECONDS
+    duration: float | None = None
+
+
+class TaskTimings:
+    """
+    (계정, 리전, 리소스)별 작업 소요 시간을 JSON 파일에 기록하고 예상 시간을 제공합니다.
+    """
+
+    def __init__(self, path: str, account_id: str | None) -> None:
+        """
+        Args:
+            path: 소요 시간 기록 파일 경로
+            account_id: AWS 계정 ID (None이면 "unknown")
+        """
+        self.path = path
+        self.account = account_id or "unknown"
+        self.timings: dict[str, dict[str, float]] = {}
+        if os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self.timings = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Error loading task timings from {path}: {e}")
+
+    def _key(self, scope: str, resource: str) -> str:
+        return f"{self.account}/{scope}/{resource}"
+
+    def expected(self, scope: str, resource: str) -> float:
+        """
+        작업의 예상 소요 시간을 반환합니다. 기록이 없으면 다른 리전/계정에서 같은 리소스의
+        평균을, 그것도 없으면 DEFAULT_EXPECTED_SECONDS를 사용합니다.
+        """
+        value = self._lookup(scope, resource, "seconds")
+        return DEFAULT_EXPECTED_SECONDS if value is None else value
+
+    def rows(self, scope: str, resource: str) -> float | None:
+        """
+        작업이 마지막으로 찾은 리소스 수를 반환합니다. 기록이 없으면 다른 리전/계정에서
+        같은 리소스의 평균을, 그것도 없으면 None을 반환합니다.
+        """
+        return self._lookup(scope, resource, "rows")
+
+    def _lookup(self, scope: str, resource: str, field: str) -> float | None:
+        timing = self.timings.get(self._key(scope, resource), {})
+        if field in timing:
+            return timing[field]
+        others = [
+            value[field]
+            for key, value in self.timings.items()
+            if key.rsplit("/", 1)[-1] == resource and field in value
+        ]
+        return sum(others) / len(others) if others else None
+
+    def record(self, scope: str, resource: str, seconds: float) -> None:
+        """작업 소요 시간을 지수 이동 평균으로 반영합니다."""
+        timing = self.timings.setdefault(self._key(scope, resource), {})
+        if "seconds" not in timing:
+            timing.update(seconds=round(seconds, 3), runs=1)
+            return
+        smoothed = timing["seconds"] + TIMING_SMOOTHING * (seconds - timing["seconds"])
+        timing.update(seconds=round(smoothed, 3), runs=timing["runs"] + 1)
+
+    def record_rows(self, scope: str, resource: str, rows: int) -> None:
+        """작업이 찾은 리소스 수를 기록합니다 (plan 의 API 호출 수 추정에 사용)."""
+        self.timings.setdefault(self._key(scope, resource), {})["rows"] = rows
+
+    def save(self) -> None:
+        """기록을 파일에 저장합니다."""
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.timings, f, indent=2, sort_keys=True)
+
+
+def order_tasks(
+    tasks: list[CollectionTask], defer_low_priority: bool = False
+) -> list[CollectionTask]:
+    """
+    예상 소요 시간이 긴 작업부터 정렬합니다.
+    defer_low_priority이면 우선순위가 낮은 리소스를 나머지 작업 뒤로 미룹니다.
+    """
+    if defer_low_priority:
+        return sorted(tasks, key=lambda task: (task.spec.low_priority, -task.expected))
+    return sorted(tasks, key=lambda task: -task.expected)
+
+
+class DeadlineScheduler:
+    """
+    작업을 스레드 풀에서 예상 소요 시간이 긴 순서로 실행합니다.
+
+    deadline이 주어지면 우선순위가 낮은 작업은 시작 시점에 남은 시간이
+    예상 소요 시간보다 짧을 때 건너뜁니다. 우선순위가 보통인 작업은 건너뛰지 않습니다.
+    """
+
+    def __init__(
+        self,
+        tasks: list[CollectionTask],
+        run_task: Callable[[CollectionTask], Any],
+        workers: int = 1,
+        deadline: float | None = None,
+        timings: TaskTimings | None = None,
+    ) -> None:
+        """
+        Args:
+            tasks: 실행할 작업 목록 (expected는 timings로 채워짐)
+            run_task: 작업 하나를 실행하는 함수
+            workers: 동시에 실행할 작업 수
+            deadline: 전체 실행 제한 시간 (초, 생성 시점부터)
+            timings: 예상 시간을 제공하고 소요 시간을 기록할 TaskTimings
+        """
+        self.run_task = run_task
+        self.workers = max(workers, 1)
+        self.deadline = deadline
+        self.timings = timings
+        self.started = time.monotonic()
+        self.skipped: list[CollectionTask] = []
+        if timings is not None:
+            for task in tasks:
+                task.expected = timings.expected(task.scope, task.spec.key)
+        self.tasks = order_tasks(tasks, defer_low_priority=deadline is not None)
+
+    def remaining(self) -> float | None:
+        """deadline까지 남은 시간(초)을 반환합니다 (deadline이 없으면 None)."""
+        if self.deadline is None:
+            return None
+        return self.deadline - (time.monotonic() - self.started)
+
+    def should_skip(self, task: CollectionTask) -> bool:
+        """남은 시간으로 작업을 끝낼 수 없는 낮은 우선순위 작업인지 확인합니다."""
+        remaining = self.remaining()
+        return (
+            remaining is not None
+            and task.spec.low_priority
+            and task.expected > remaining
+        )
+
+    def _timed(self, task: CollectionTask) -> Any:
+        start = time.perf_counter()
+        try:
+            result = self.run_task(task)
+        finally:
+            task.duration = time.perf_counter() - start
+        if self.timings is not None:
+            self.timings.record(task.scope, task.spec.key, task.duration)
+        return result
+
+    def run(self) -> Iterator[tuple[CollectionTask, Future | None]]:
+        """
+        작업을 실행하면서 끝난 순서대로 (작업, Future)를 반환합니다.
+        건너뛴 작업은 (작업, None)으로 반환하고 skipped에 기록합니다.
+        """
+        queue = list(self.tasks)
+        running: dict[Future, CollectionTask] = {}
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="collect"
+        ) as executor:
+            while queue or running:
+                while queue and len(running) < self.workers:
+                    task = queue.pop(0)
+                    if self.should_skip(task):
+                        self.skipped.append(task)
+                        yield task, None
+                        continue
+                    running[executor.submit(self._timed, task)] = task
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield running.pop(future), future
@@ -0,0 +1,358 @@
+"""
+Per-stage CPU and memory profiling of a collection run (``--profile-stages``).
+
+Pipeline code marks its stages with ``profile_stage(stage, resource, scope)``:
+API calls and botocore parsing (``api``), ``get_filtered_data()`` (``filter``),
+raw retention, Arrow conversion, checkpoints, Excel and JSON writing. Without
+an active ``StageProfiler`` the context manager does nothing.
+
+While a profiler is active every stage execution records its wall time, the
+CPU time of its thread (``time.thread_time``) and its peak traced memory
+above the level at which it started (``tracemalloc``; the peak is read and
+reset at every stage boundary and sampling tick, so overlapping stages in
+other threads share the peaks of the windows they overlap). A sampler thread
+takes the Python stacks of all threads inside a stage every ``interval``
+seconds and counts, per stage, the functions on top of the stack (self) and
+anywhere on it (total). cProfile is not used because only one deterministic
+profiler can be active per process, while stages run in many threads.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+PROFILE_MODES = ("all", "cpu", "memory")
+
+# 스택 샘플링 간격 (초)
+DEFAULT_INTERVAL = 0.005
+
+# 보고서에 기록할 단계별 상위 함수 수
+DEFAULT_TOP = 15
+
+# 샘플링할 최대 스택 깊이
+MAX_STACK_DEPTH = 128
+
+_MIB = 1024 * 1024
+
+# 현재 활성화된 프로파일러 (없으면 profile_stage()는 아무것도 하지 않습니다)
+_active: "StageProfiler | None" = None
+
+
+@dataclass
+class StageStats:
+    """
+    (단계, 리소스)별 누적 측정값입니다.
+
+    Attributes:
+        calls: 실행 횟수
+        wall_seconds: 실행 시간 합계
+        cpu_seconds: 실행한 스레드의 CPU 시간 합계
+        peak_mb: 실행 하나의 최대 추가 메모리 (MiB, 시작 시점 대비)
+        samples: 이 단계에서 수집된 스택 샘플 수
+    """
+
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_mb: float = 0.0
+    samples: int = 0
+
+
+@dataclass
+class _Running:
+    key: tuple[str, str | None]
+    started: float
+    cpu_started: float
+    memory_started: int
+    peak: int = 0
+
+
+@dataclass
+class _FunctionSamples:
+    self_samples: Counter = field(default_factory=Counter)
+    total_samples: Counter = field(default_factory=Counter)
+
+
+def _function_name(code) -> str:
+    """코드 객체를 "함수 (파일:줄)" 형태로 표시합니다 (site-packages 이하 경로만 사용)."""
+    path = code.co_filename
+    marker = f"site-packages{os.sep}"
+    if marker in path:
+        path = path.split(marker, 1)[1]
+    else:
+        try:
+            path = os.path.relpath(path)
+        except ValueError:
+            pass
+    return f"{code.co_name} ({path}:{code.co_firstlineno})"
+
+
+class StageProfiler:
+    """
+    단계별 CPU 시간, 메모리, 함수별 스택 샘플을 수집합니다.
+    start()부터 stop()까지 profile_stage()로 표시한 단계가 측정됩니다.
+    """
+
+    def __init__(
+        self,
+        mode: str = "all",
+        interval: float = DEFAULT_INTERVAL,
+        top: int = DEFAULT_TOP,
+    ) -> None:
+        """
+        Args:
+            mode: "all", "cpu" (스택 샘플링만) 또는 "memory" (tracemalloc만)
+            interval: 스택 샘플링 간격 (초)
+            top: 보고서에 기록할 단계별 상위 함수 수
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode: {mode}")
+        self.mode = mode
+        self.interval = interval
+        self.top = top
+        self.stats: dict[tuple[str, str | None], StageStats] = {}
+        self.functions: dict[str, _FunctionSamples] = {}
+        self.total_samples = 0
+        self._threads: dict[int, list[_Running]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+        self._started_tracemalloc = False
+        self._started_at: float | None = None
+        self._elapsed = 0.0
+
+    @property
+    def sampling(self) -> bool:
+        return self.mode in ("all", "cpu")
+
+    @property
+    def tracing(self) -> bool:
+        return self.mode in ("all", "memory")
+
+    def start(self) -> "StageProfiler":
+        """프로파일러를 활성화하고 샘플링 스레드를 시작합니다."""
+        global _active
+        if self.tracing and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._started_at = time.perf_counter()
+        self._stop.clear()
+        self._sampler = threading.Thread(
+            target=self._sample_loop, name="stage-profiler", daemon=True
+        )
+        self._sampler.start()
+        _active = self
+        return self
+
+    def stop(self) -> None:
+        """프로파일러를 비활성화합니다."""
+        global _active
+        if _active is self:
+            _active = None
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        if self._started_at is not None:
+            self._elapsed += time.perf_counter() - self._started_at
+            self._started_at = None
+
+    @contextmanager
+    def stage(
+        self, stage: str, resource: str | None = None, scope: str | None = None
+    ) -> Iterator[None]:
+        """
+        현재 스레드에서 실행되는 단계 하나를 측정합니다.
+
+        Args:
+            stage: 단계 이름 (예: "api", "filter", "excel")
+            resource: 리소스(result_key) 이름
+            scope: 리전명 또는 GLOBAL_SCOPE (보고서에서는 리소스별로 합산)
+        """
+        thread_id = threading.get_ident()
+        with self._lock:
+            self._flush_peak()
+            running = _Running(
+                key=(stage, resource),
+                started=time.perf_counter(),
+                cpu_started=time.thread_time(),
+                memory_started=(
+                    tracemalloc.get_traced_memory()[0] if self.tracing else 0
+                ),
+            )
+            running.peak = running.memory_started
+            self._threads.setdefault(thread_id, []).append(running)
+        try:
+            yield
+        finally:
+            cpu = time.thread_time() - running.cpu_started
+            wall = time.perf_counter() - running.started
+            with self._lock:
+                self._flush_peak()
+                stack = self._threads[thread_id]
+                stack.remove(running)
+                if not stack:
+                    del self._threads[thread_id]
+                stats = self.stats.setdefault(running.key, StageStats())
+                stats.calls += 1
+                stats.wall_seconds += wall
+                stats.cpu_seconds += cpu
+                stats.peak_mb = max(
+                    stats.peak_mb, (running.peak - running.memory_started) / _MIB
+                )
+
+    def _flush_peak(self) -> None:
+        """마지막 확인 이후의 최대 메모리를 실행 중인 모든 단계에 반영합니다 (잠금 안에서 호출)."""
+        if not self.tracing or not tracemalloc.is_tracing():
+            return
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for stack in self._threads.values():
+            for running in stack:
+                running.peak = max(running.peak, peak)
+
+    def _sample_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                self._flush_peak()
+                if self.sampling and self._threads:
+                    self._sample()
+
+    def _sample(self) -> None:
+        """단계를 실행 중인 스레드의 스택을 가장 안쪽 단계에 기록합니다 (잠금 안에서 호출)."""
+        frames = sys._current_frames()
+        for thread_id, stack in self._threads.items():
+            frame = frames.get(thread_id)
+            if frame is None or not stack:
+                continue
+            running = stack[-1]
+            stage = running.key[0]
+            functions = self.functions.setdefault(stage, _FunctionSamples())
+            seen = set()
+            depth = 0
+            while frame is not None and depth < MAX_STACK_DEPTH:
+                name = _function_name(frame.f_code)
+                if depth == 0:
+                    functions.self_samples[name] += 1
+                if name not in seen:
+                    functions.total_samples[name] += 1
+                    seen.add(name)
+                frame = frame.f_back
+                depth += 1
+            self.stats.setdefault(running.key, StageStats()).samples += 1
+            self.total_samples += 1
+
+    def report(self) -> dict[str, Any]:
+        """단계별 합계, (단계, 리소스)별 측정값, 단계별 상위 함수를 반환합니다."""
+        stages: dict[str, StageStats] = {}
+        for (stage, _), stats in self.stats.items():
+            total = stages.setdefault(stage, StageStats())
+            total.calls += stats.calls
+            total.wall_seconds += stats.wall_seconds
+            total.cpu_seconds += stats.cpu_seconds
+            total.peak_mb = max(total.peak_mb, stats.peak_mb)
+            total.samples += stats.samples
+
+        def top(counter: Counter, samples: int) -> list[dict[str, Any]]:
+            return [
+                {
+                    "function": name,
+                    "samples": count,
+                    "percent": round(100 * count / samples, 1) if samples else 0.0,
+                }
+                for name, count in counter.most_common(self.top)
+            ]
+
+        return {
+            "mode": self.mode,
+            "interval_seconds": self.interval,
+            "elapsed_seconds": round(self._elapsed, 3),
+            "samples": self.total_samples,
+            "stages": {
+                stage: {
+                    "calls": stats.calls,
+                    "wall_seconds": round(stats.wall_seconds, 3),
+                    "cpu_seconds": round(stats.cpu_seconds, 3),
+                    "peak_mb": round(stats.peak_mb, 2),
+                    "samples": stats.samples,
+                    "top_self": top(
+                        self.functions.get(stage, _FunctionSamples()).self_samples,
+                        stats.samples,
+                    ),
+                    "top_total": top(
+                        self.functions.get(stage, _FunctionSamples()).total_samples,
+                        stats.samples,
+                    ),
+                }
+                for stage, stats in sorted(
+                    stages.items(), key=lambda item: -item[1].cpu_seconds
+                )
+            },
+            "resources": [
+                {
+                    "stage": stage,
+                    "resource": resource,
+                    "calls": stats.calls,
+                    "wall_seconds": round(stats.wall_seconds, 3),
+                    "cpu_seconds": round(stats.cpu_seconds, 3),
+                    "peak_mb": round(stats.peak_mb, 2),
+                }
+                for (stage, resource), stats in sorted(
+                    self.stats.items(), key=lambda item: -item[1].cpu_seconds
+                )
+            ],
+        }
+
+    def write(self, path: str) -> dict[str, Any]:
+        """보고서를 JSON 파일로 기록하고 반환합니다."""
+        report = self.report()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        return report
+
+
+def print_report(report: dict[str, Any], functions: int = 3) -> None:
+    """단계별 CPU/메모리 합계와 상위 함수를 출력합니다."""
+    print(
+        f"{'stage':<16}{'calls':>7}{'wall s':>10}{'cpu s':>10}{'peak MiB':>10}"
+        "  top functions (self)"
+    )
+    for stage, stats in report["stages"].items():
+        top = ", ".join(
+            f"{entry['function'].split(' (')[0]} {entry['percent']}%"
+            for entry in stats["top_self"][:functions]
+        )
+        print(
+            f"{stage:<16}{stats['calls']:>7}{stats['wall_seconds']:>10.2f}"
+            f"{stats['cpu_seconds']:>10.2f}{stats['peak_mb']:>10.1f}  {top}"
+        )
+
+
+@contextmanager
+def profile_stage(
+    stage: str, resource: str | None = None, scope: str | None = None
+) -> Iterator[None]:
+    """
+    활성화된 StageProfiler가 있으면 단계를 측정하고, 없으면 아무것도 하지 않습니다.
+
+    Args:
+        stage: 단계 이름
+        resource: 리소스(result_key) 이름
+        scope: 리전명 또는 GLOBAL_SCOPE
+    """
+    profiler = _active
+    if profiler is None:
+        yield
+        return
+    with profiler.stage(stage, resource, scope):
+        yield
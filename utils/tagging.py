@@ -0,0 +1,217 @@
+"""
+Bulk tag enrichment through the Resource Groups Tagging API (``--tags``).
+
+Instead of a tag call per resource, ``TagEnricher`` pages through
+``resourcegroupstaggingapi.get_resources`` once per region (in the background,
+while the collection runs) and keeps an ARN → tags map. Every resource module
+declares a ``TAG_SOURCE``: the tagging API resource type and how to read its
+``id_column`` value from the ARN. When a region's tables are flushed, the map
+is joined onto each table as a ``Tags`` column (``Key=Value;...``), replacing
+the value of resources the API knows and keeping the module's own tags for the
+rest.
+
+Global resources are joined against the maps of all regions, since S3 bucket
+ARNs carry no region and each region only returns its own buckets.
+"""
+
+import re
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+import pyarrow as pa
+
+from resources import ResourceSpec, TagSource
+from utils.result_store import GLOBAL_SCOPE
+
+# 태그를 기록하는 컬럼 이름
+TAGS_COLUMN = "Tags"
+
+# get_resources 한 페이지의 최대 리소스 수
+TAG_PAGE_SIZE = 100
+
+# ResourceTypeFilters 한 번에 지정할 수 있는 최대 유형 수
+MAX_RESOURCE_TYPES = 100
+
+# 조회 리전이 없는 글로벌 리소스의 태그를 조회할 리전
+GLOBAL_TAG_REGION = "us-east-1"
+
+# 리전별 태그 조회를 동시에 실행할 스레드 수
+TAG_WORKERS = 8
+
+
+def format_tags(tags: Iterable[dict[str, str]]) -> str | None:
+    """태그 목록을 "Key=Value;Key=Value" 문자열로 변환합니다 (태그가 없으면 None)."""
+    pairs = [f"{tag['Key']}={tag.get('Value', '')}" for tag in tags if "Key" in tag]
+    return ";".join(pairs) if pairs else None
+
+
+def fetch_tags(session: Any, region: str, resource_types: list[str]) -> dict[str, str]:
+    """
+    리전의 태그가 있는 리소스를 get_resources로 모두 조회합니다.
+
+    Args:
+        session: boto3 세션 객체
+        region: AWS 리전명
+        resource_types: ResourceTypeFilters 값 (예: ["ec2:instance", "s3"])
+
+    Returns:
+        dict: {ARN: "Key=Value;..."}
+    """
+    client = session.client("resourcegroupstaggingapi", region_name=region)
+    paginator = client.get_paginator("get_resources")
+    tags: dict[str, str] = {}
+    for start in range(0, len(resource_types), MAX_RESOURCE_TYPES):
+        pages = paginator.paginate(
+            ResourceTypeFilters=resource_types[start : start + MAX_RESOURCE_TYPES],
+            ResourcesPerPage=TAG_PAGE_SIZE,
+        )
+        for page in pages:
+            for mapping in page.get("ResourceTagMappingList", []):
+                formatted = format_tags(mapping.get("Tags", []))
+                if formatted:
+                    tags[mapping["ResourceARN"]] = formatted
+    return tags
+
+
+def source_matches(source: TagSource, arn: str) -> bool:
+    """ARN이 source의 리소스 유형(서비스[:유형])인지 확인합니다."""
+    parts = arn.split(":", 5)
+    if len(parts) < 6:
+        return False
+    service, _, resource_type = source.resource_type.partition(":")
+    if parts[2] != service:
+        return False
+    if not resource_type:
+        return True
+    return re.match(rf"{re.escape(resource_type)}[/:]", parts[5]) is not None
+
+
+def tags_by_id(source: TagSource, tags: dict[str, str]) -> dict[str, str]:
+    """ARN별 태그를 source의 ID 컬럼 값별 태그로 바꿉니다."""
+    pattern = re.compile(source.id_pattern) if source.id_pattern else None
+    by_id = {}
+    for arn, formatted in tags.items():
+        if not source_matches(source, arn):
+            continue
+        if pattern is None:
+            by_id[arn] = formatted
+        elif match := pattern.search(arn):
+            by_id[source.id_prefix + match.group(1)] = formatted
+    return by_id
+
+
+def join_tags(table: pa.Table, id_column: str, by_id: dict[str, str]) -> pa.Table:
+    """
+    ID 컬럼으로 태그를 찾아 Tags 컬럼에 기록합니다.
+    태그를 찾지 못한 행은 기존 Tags 값(없으면 null)을 유지합니다.
+    """
+    if id_column not in table.column_names:
+        return table
+    found = [
+        by_id.get(str(value)) if value is not None else None
+        for value in table.column(id_column).to_pylist()
+    ]
+    if TAGS_COLUMN in table.column_names:
+        index = table.column_names.index(TAGS_COLUMN)
+        current = table.column(index).cast(pa.string()).to_pylist()
+        values = [
+            new if new is not None else old
+            for new, old in zip(found, current, strict=True)
+        ]
+        return table.set_column(index, TAGS_COLUMN, pa.array(values, pa.string()))
+    return table.append_column(TAGS_COLUMN, pa.array(found, pa.string()))
+
+
+def raw_columns_without_tags(module: Any, columns: set[str] | None) -> set[str] | None:
+    """
+    모듈이 태그만 채우는 상세 조회(예: SES list_tags_for_resource)를 선언했으면
+    get_raw_data()에 전달할 컬럼에서 Tags를 뺍니다. --tags 가 태그를 한 번에 조회하므로
+    리소스마다 태그를 조회할 필요가 없습니다.
+
+    Args:
+        module: 리소스 모듈
+        columns: 요청된 컬럼 (None이면 모든 컬럼)
+    """
+    detail_columns = getattr(module, "DETAIL_COLUMNS", {})
+    if not any(tuple(cols) == (TAGS_COLUMN,) for cols in detail_columns.values()):
+        return columns
+    return (set(module.COLUMN_SCHEMA) if columns is None else columns) - {TAGS_COLUMN}
+
+
+class TagEnricher:
+    """
+    리전별 태그 맵을 백그라운드 스레드에서 조회하고, 리소스 테이블에 Tags 컬럼으로 붙입니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[str | None], Any],
+        regions: list[str],
+        specs: list[ResourceSpec],
+    ) -> None:
+        """
+        Args:
+            session_factory: 리전명을 받아 boto3 세션을 만드는 함수
+            regions: 조회 리전 목록
+            specs: 수집할 리소스 정의 (TAG_SOURCE가 있는 리소스의 태그만 조회)
+        """
+        sources = [
+            spec.module.TAG_SOURCE
+            for spec in specs
+            if getattr(spec.module, "TAG_SOURCE", None) is not None
+        ]
+        self.resource_types = sorted({source.resource_type for source in sources})
+        # 글로벌 리소스는 조회 리전의 태그 맵도 필요합니다
+        # (리전이 없는 Route53은 태그 API가 us-east-1에서 제공)
+        tag_regions = list(regions)
+        for spec in specs:
+            region = spec.global_region or GLOBAL_TAG_REGION
+            if spec.is_global and region not in tag_regions:
+                tag_regions.append(region)
+        self.failed: dict[str, str] = {}
+        self.futures: dict[str, Future] = {}
+        self._executor = None
+        if self.resource_types:
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(len(tag_regions), TAG_WORKERS),
+                thread_name_prefix="tags",
+            )
+            for region in tag_regions:
+                self.futures[region] = self._executor.submit(
+                    fetch_tags, session_factory(region), region, self.resource_types
+                )
+
+    def tags(self, region: str) -> dict[str, str]:
+        """
+        리전의 ARN별 태그를 반환합니다 (조회가 끝날 때까지 기다림).
+        조회에 실패한 리전은 한 번만 경고하고 빈 맵을 반환합니다.
+        """
+        future = self.futures.get(region)
+        if future is None:
+            return {}
+        try:
+            return future.result()
+        except Exception as e:
+            if region not in self.failed:
+                self.failed[region] = str(e)
+                print(f"  ⚠️  [{region}] 태그 조회 실패 (태그 없이 기록): {e}")
+            return {}
+
+    def join(self, spec: ResourceSpec, scope: str, table: pa.Table) -> pa.Table:
+        """리소스 테이블 하나에 scope의 태그를 붙입니다 (TAG_SOURCE가 없으면 그대로 반환)."""
+        source = getattr(spec.module, "TAG_SOURCE", None)
+        if source is None or spec.id_column is None or table.num_rows == 0:
+            return table
+        if scope == GLOBAL_SCOPE:
+            tags: dict[str, str] = {}
+            for region in self.futures:
+                tags.update(self.tags(region))
+        else:
+            tags = self.tags(scope)
+        return join_tags(table, spec.id_column, tags_by_id(source, tags))
+
+    def shutdown(self) -> None:
+        """조회 스레드를 정리합니다."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,528 @@
+"""
+Shared work queue for sweeps distributed across hosts.
+
+A coordinator puts every ``(profile, region, resource)`` task of a run into a
+queue; workers on any number of hosts claim tasks with time-limited leases,
+collect them and write the results as ``RunCheckpoint`` task files under a
+shared directory. A worker that dies stops renewing its leases, so its tasks
+become claimable again once the lease expires. The ``merge`` step then builds
+the usual outputs from the shared directory.
+
+``SQLiteTaskQueue`` keeps the queue in one SQLite file and is enough for a
+shared filesystem or tests; other backends can be registered in
+``QUEUE_BACKENDS`` with the same methods.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from resources import RESOURCE_SPECS_BY_KEY
+from utils.checkpoint import RunCheckpoint
+from utils.run_manifest import TaskFailure, failure_from_exception
+from utils.scheduler import CollectionTask
+
+# 작업 임대(lease) 기본 시간 (초). 워커는 이 시간의 1/3마다 임대를 갱신
+DEFAULT_LEASE_SECONDS = 300
+
+# 중단(cancelled)되거나 임대가 만료된 작업을 다시 시도하는 최대 횟수
+MAX_ATTEMPTS = 3
+
+# 다른 워커가 임대한 작업이 끝나기를 기다릴 때의 확인 간격 (초)
+IDLE_POLL_SECONDS = 5
+
+# 기본 자격 증명을 사용하는 작업의 프로필 값
+DEFAULT_PROFILE = ""
+
+# 공유 디렉터리에서 프로필별 결과를 기록하는 디렉터리
+ACCOUNTS_DIR_NAME = "accounts"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    info TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    profile TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    region TEXT,
+    resource TEXT NOT NULL,
+    expected REAL NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,
+    account_id TEXT,
+    duration REAL,
+    failure TEXT,
+    UNIQUE (run_id, profile, scope, resource)
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_claim ON tasks (run_id, status, expected);
+"""
+
+
+@dataclass
+class QueuedTask:
+    """
+    큐에서 임대한 작업입니다.
+
+    Attributes:
+        id: 큐의 작업 번호
+        run_id: 실행 ID
+        profile: AWS 프로필 (DEFAULT_PROFILE이면 기본 자격 증명)
+        task: 수집 작업
+        attempts: 이번 임대를 포함한 시도 횟수
+    """
+
+    id: int
+    run_id: str
+    profile: str
+    task: CollectionTask
+    attempts: int
+
+
+class SQLiteTaskQueue:
+    """
+    SQLite 파일 하나에 작업 큐를 보관합니다. 연산마다 연결을 새로 열어
+    여러 스레드와 프로세스(호스트)에서 함께 사용할 수 있습니다.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path: SQLite 데이터베이스 파일 경로 (공유 디렉터리)
+        """
+        self.path = path
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _transaction(self, operation: Callable[[sqlite3.Connection], Any]) -> Any:
+        """쓰기 잠금(BEGIN IMMEDIATE)을 잡은 트랜잭션에서 operation을 실행합니다."""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = operation(conn)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            return result
+        finally:
+            conn.close()
+
+    def enqueue(
+        self,
+        run_id: str,
+        info: dict[str, Any],
+        tasks: list[tuple[str, CollectionTask]],
+    ) -> int:
+        """
+        실행 정보와 (프로필, 작업) 목록을 큐에 넣습니다. 이미 있는 작업은 건너뜁니다.
+
+        Returns:
+            int: 새로 추가된 작업 수
+        """
+
+        def operation(conn: sqlite3.Connection) -> int:
+            conn.execute(
+                "INSERT OR IGNORE INTO runs VALUES (?, ?, ?)",
+                (
+                    run_id,
+                    datetime.now(timezone.utc).isoformat(),
+                    json.dumps(info, ensure_ascii=False),
+                ),
+            )
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO tasks "
+                "(run_id, profile, scope, region, resource, expected) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id,
+                        profile,
+                        task.scope,
+                        task.region,
+                        task.spec.key,
+                        task.expected,
+                    )
+                    for profile, task in tasks
+                ],
+            )
+            return conn.total_changes - before
+
+        return self._transaction(operation)
+
+    def run_info(self, run_id: str) -> dict[str, Any] | None:
+        """실행 정보를 반환합니다 (없으면 None)."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT info FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        return json.loads(row["info"]) if row else None
+
+    def latest_run(self) -> str | None:
+        """가장 최근에 만든 실행 ID를 반환합니다."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT run_id FROM runs ORDER BY created_at DESC LIMIT 1"
+            ).fetchone()
+        return row["run_id"] if row else None
+
+    def claim(
+        self,
+        run_id: str,
+        worker_id: str,
+        lease_seconds: float,
+        max_attempts: int = MAX_ATTEMPTS,
+    ) -> QueuedTask | None:
+        """
+        대기 중이거나 임대가 만료된 작업 중 예상 소요 시간이 가장 긴 작업을 임대합니다.
+        임대가 만료된 작업도 시도 횟수에 포함해, max_attempts번 임대한 작업은
+        (워커를 매번 중단시키는 작업이므로) 다시 임대하지 않고 실패로 기록합니다.
+
+        Returns:
+            QueuedTask | None: 임대한 작업 (가져갈 작업이 없으면 None)
+        """
+
+        def operation(conn: sqlite3.Connection) -> QueuedTask | None:
+            now = time.time()
+            exhausted = conn.execute(
+                "SELECT * FROM tasks WHERE run_id = ? AND status = 'leased' "
+                "AND lease_expires < ? AND attempts >= ?",
+                (run_id, now, max_attempts),
+            ).fetchall()
+            for row in exhausted:
+                spec = RESOURCE_SPECS_BY_KEY[row["resource"]]
+                failure = TaskFailure(
+                    spec.result_key,
+                    spec.key,
+                    row["scope"],
+                    "cancelled",
+                    "LeaseExpired",
+                    None,
+                    f"{row['attempts']}번 임대한 워커가 모두 작업을 끝내지 못했습니다.",
+                )
+                conn.execute(
+                    "UPDATE tasks SET status = 'failed', failure = ?, "
+                    "lease_owner = NULL, lease_expires = NULL WHERE id = ?",
+                    (json.dumps(asdict(failure), ensure_ascii=False), row["id"]),
+                )
+            row = conn.execute(
+                "SELECT * FROM tasks WHERE run_id = ? AND (status = 'pending' "
+                "OR (status = 'leased' AND lease_expires < ?)) "
+                "ORDER BY expected DESC, id LIMIT 1",
+                (run_id, now),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE tasks SET status = 'leased', lease_owner = ?, "
+                "lease_expires = ?, attempts = attempts + 1 WHERE id = ?",
+                (worker_id, now + lease_seconds, row["id"]),
+            )
+            spec = RESOURCE_SPECS_BY_KEY[row["resource"]]
+            return QueuedTask(
+                id=row["id"],
+                run_id=run_id,
+                profile=row["profile"],
+                task=CollectionTask(spec, row["scope"], row["region"], row["expected"]),
+                attempts=row["attempts"] + 1,
+            )
+
+        return self._transaction(operation)
+
+    def renew(self, task_ids: list[int], worker_id: str, lease_seconds: float) -> None:
+        """임대 중인 작업의 임대 만료 시각을 연장합니다."""
+        if not task_ids:
+            return
+
+        def operation(conn: sqlite3.Connection) -> None:
+            conn.executemany(
+                "UPDATE tasks SET lease_expires = ? WHERE id = ? "
+                "AND status = 'leased' AND lease_owner = ?",
+                [
+                    (time.time() + lease_seconds, task_id, worker_id)
+                    for task_id in task_ids
+                ],
+            )
+
+        self._transaction(operation)
+
+    def complete(
+        self,
+        task_id: int,
+        worker_id: str,
+        account_id: str | None,
+        duration: float | None,
+    ) -> bool:
+        """
+        작업을 완료로 기록합니다.
+
+        Returns:
+            bool: 임대가 유효해 기록했으면 True (다른 워커가 다시 임대했으면 False)
+        """
+
+        def operation(conn: sqlite3.Connection) -> bool:
+            cursor = conn.execute(
+                "UPDATE tasks SET status = 'done', account_id = ?, duration = ?, "
+                "failure = NULL, lease_expires = NULL "
+                "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (account_id, duration, task_id, worker_id),
+            )
+            return cursor.rowcount == 1
+
+        return self._transaction(operation)
+
+    def fail(
+        self,
+        task_id: int,
+        worker_id: str,
+        failure: TaskFailure,
+        account_id: str | None = None,
+        max_attempts: int = MAX_ATTEMPTS,
+    ) -> str | None:
+        """
+        실패한 작업을 기록합니다. 중단(cancelled)된 작업은 max_attempts까지 다시 대기시킵니다.
+
+        Returns:
+            str | None: 기록된 상태 ("pending" 또는 "failed").
+                임대가 만료되어 다른 워커가 가져갔으면 기록하지 않고 None
+        """
+
+        def operation(conn: sqlite3.Connection) -> str:
+            row = conn.execute(
+                "SELECT attempts FROM tasks WHERE id = ?", (task_id,)
+            ).fetchone()
+            retry = failure.status == "cancelled" and row["attempts"] < max_attempts
+            status = "pending" if retry else "failed"
+            cursor = conn.execute(
+                "UPDATE tasks SET status = ?, failure = ?, account_id = ?, "
+                "duration = ?, lease_owner = NULL, lease_expires = NULL "
+                "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (
+                    status,
+                    json.dumps(asdict(failure), ensure_ascii=False),
+                    account_id,
+                    failure.duration_seconds,
+                    task_id,
+                    worker_id,
+                ),
+            )
+            return status if cursor.rowcount == 1 else None
+
+        return self._transaction(operation)
+
+    def counts(self, run_id: str) -> dict[str, int]:
+        """상태별 작업 수를 반환합니다."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT status, count(*) AS n FROM tasks WHERE run_id = ? "
+                "GROUP BY status",
+                (run_id,),
+            ).fetchall()
+        counts = {"pending": 0, "leased": 0, "done": 0, "failed": 0}
+        counts.update({row["status"]: row["n"] for row in rows})
+        return counts
+
+    def tasks(self, run_id: str, status: str | None = None) -> list[dict[str, Any]]:
+        """실행의 작업 목록을 반환합니다 (status로 필터링 가능)."""
+        sql = "SELECT * FROM tasks WHERE run_id = ?"
+        params: list[Any] = [run_id]
+        if status is not None:
+            sql += " AND status = ?"
+            params.append(status)
+        with self._connect() as conn:
+            return [dict(row) for row in conn.execute(sql + " ORDER BY id", params)]
+
+    def failures(self, run_id: str) -> dict[str, list[TaskFailure]]:
+        """실패로 끝난 작업의 TaskFailure를 프로필별로 반환합니다."""
+        failures: dict[str, list[TaskFailure]] = {}
+        for row in self.tasks(run_id, "failed"):
+            failures.setdefault(row["profile"], []).append(
+                TaskFailure(**json.loads(row["failure"]))
+            )
+        return failures
+
+
+QUEUE_BACKENDS = {"sqlite": SQLiteTaskQueue}
+
+
+def open_queue(url: str) -> SQLiteTaskQueue:
+    """
+    "backend:위치" 형태(예: "sqlite:/shared/queue.sqlite")로 작업 큐를 엽니다.
+    backend를 생략하면 SQLite 파일 경로로 봅니다.
+
+    Raises:
+        ValueError: 알 수 없는 backend인 경우
+    """
+    backend, found, location = url.partition(":")
+    if not found or len(backend) == 1:  # Windows 드라이브 문자 (C:\...)
+        backend, location = "sqlite", url
+    if backend not in QUEUE_BACKENDS:
+        raise ValueError(f"Unknown queue backend: {backend}")
+    return QUEUE_BACKENDS[backend](location)
+
+
+def default_worker_id() -> str:
+    """호스트 이름과 임의 값으로 워커 ID를 만듭니다."""
+    return f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}"
+
+
+def profile_checkpoint(shared_dir: str, profile: str, run_id: str) -> RunCheckpoint:
+    """프로필별 결과를 기록할 공유 디렉터리의 체크포인트를 반환합니다."""
+    return RunCheckpoint(
+        os.path.join(shared_dir, ACCOUNTS_DIR_NAME, profile or "default"), run_id
+    )
+
+
+class QueueWorker:
+    """
+    큐에서 작업을 임대해 실행하고 결과를 공유 디렉터리에 기록합니다.
+    임대 중인 작업은 백그라운드 스레드가 주기적으로 갱신합니다.
+    """
+
+    def __init__(
+        self,
+        task_queue: SQLiteTaskQueue,
+        run_id: str,
+        shared_dir: str,
+        runner_for: Callable[[str], Callable[[CollectionTask], tuple]],
+        account_for: Callable[[str], str | None],
+        resolve: Callable[[Any], Any],
+        worker_id: str | None = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        encoder: type[json.JSONEncoder] | None = None,
+    ) -> None:
+        """
+        Args:
+            task_queue: 작업 큐
+            run_id: 실행 ID
+            shared_dir: 결과를 기록할 공유 디렉터리
+            runner_for: 프로필을 받아 작업 실행 함수(TaskRunner)를 반환하는 함수
+            account_for: 프로필을 받아 AWS 계정 ID를 반환하는 함수
+            resolve: 작업 실행 결과의 필터링 데이터를 Arrow 테이블로 변환하는 함수
+            worker_id: 워커 ID (None이면 호스트 이름 기반)
+            lease_seconds: 작업 임대 시간 (초)
+            encoder: 원본 데이터의 날짜 등을 직렬화할 JSONEncoder 클래스
+        """
+        self.queue = task_queue
+        self.run_id = run_id
+        self.shared_dir = shared_dir
+        self.runner_for = runner_for
+        self.account_for = account_for
+        self.resolve = resolve
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self.encoder = encoder
+        self.completed = 0
+        self.failed = 0
+        self.lost = 0
+        self._held: set[int] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def _heartbeat(self) -> None:
+        while not self._stop.wait(self.lease_seconds / 3):
+            with self._lock:
+                held = list(self._held)
+            self.queue.renew(held, self.worker_id, self.lease_seconds)
+
+    def run_one(self, queued: QueuedTask) -> None:
+        """임대한 작업 하나를 실행하고 결과를 기록합니다."""
+        task = queued.task
+        account_id = self.account_for(queued.profile)
+        start = time.perf_counter()
+        try:
+            data_raw, data_filtered = self.runner_for(queued.profile)(task)
+            table = self.resolve(data_filtered)
+            profile_checkpoint(self.shared_dir, queued.profile, self.run_id).save_task(
+                task.scope, task.spec.key, data_raw, table, cls=self.encoder
+            )
+        except Exception as e:
+            failure = failure_from_exception(
+                task.spec.result_key,
+                task.spec.key,
+                task.scope,
+                e,
+                time.perf_counter() - start,
+            )
+            status = self.queue.fail(queued.id, self.worker_id, failure, account_id)
+            if status is None:
+                self._lease_lost(queued)
+                return
+            print(
+                f"  ❌ {task.spec.result_key} [{queued.profile or 'default'}/"
+                f"{task.scope}] 실패: {failure.error_code} ({status})"
+            )
+            self.failed += status == "failed"
+            return
+        if not self.queue.complete(
+            queued.id, self.worker_id, account_id, time.perf_counter() - start
+        ):
+            self._lease_lost(queued)
+            return
+        self.completed += 1
+
+    def _lease_lost(self, queued: QueuedTask) -> None:
+        """임대가 만료되어 결과를 기록하지 못한 작업을 알립니다."""
+        task = queued.task
+        self.lost += 1
+        print(
+            f"  ⚠️  {task.spec.result_key} [{queued.profile or 'default'}/"
+            f"{task.scope}] 임대가 만료되어 결과를 큐에 기록하지 못했습니다."
+        )
+
+    def _work(self) -> None:
+        while True:
+            queued = self.queue.claim(self.run_id, self.worker_id, self.lease_seconds)
+            if queued is None:
+                counts = self.queue.counts(self.run_id)
+                if not counts["pending"] and not counts["leased"]:
+                    return
+                # 다른 워커가 임대한 작업이 남아 있으면 임대 만료에 대비해 기다립니다
+                time.sleep(IDLE_POLL_SECONDS)
+                continue
+            with self._lock:
+                self._held.add(queued.id)
+            try:
+                self.run_one(queued)
+            finally:
+                with self._lock:
+                    self._held.discard(queued.id)
+
+    def run(self, threads: int = 1) -> None:
+        """
+        큐에 실행할 작업이 남지 않을 때까지 threads개의 스레드로 작업을 실행합니다.
+        """
+        heartbeat = threading.Thread(target=self._heartbeat, daemon=True)
+        heartbeat.start()
+        workers = [
+            threading.Thread(target=self._work, name=f"queue-worker-{index}")
+            for index in range(max(threads, 1))
+        ]
+        try:
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        finally:
+            self._stop.set()
+            heartbeat.join()